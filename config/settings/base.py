@@ -205,6 +205,10 @@ CONTENT_SECURITY_POLICY = {
     }
 }
 
+# 問い合わせフォームへ埋め込む署名付きトークンの鍵（render_static が使用。空の場合は
+# 埋め込まない）。Contact_Function の CONTACT_FORM_TOKEN_KEY と同じ値を設定する。
+CONTACT_FORM_TOKEN_KEY = os.environ.get("CONTACT_FORM_TOKEN_KEY", "")
+
 # Logging configuration
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
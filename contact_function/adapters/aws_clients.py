@@ -0,0 +1,188 @@
+"""AWS クライアント生成（botocore の接続・タイムアウト・再試行設定）モジュール.
+
+アダプタ（`SsmConfigProvider`・`SesEmailSender`・`SqsContactQueue`）が用いる boto3
+クライアントを、明示的な `botocore.config.Config` 付きで生成する共通ファクトリを
+提供する。boto3 の既定値（接続 60 秒・読み取り 60 秒のタイムアウト、legacy/standard
+の再試行）のままでは、応答の遅い SES エンドポイントが API Gateway の統合タイムアウト
+（29 秒）まで 1 回の呼び出しを占有しうるため、上限を明示する。
+
+設定値（いずれも環境変数。未設定・空は既定値、不正値は `ConfigurationError`）:
+    - `CONTACT_AWS_CONNECT_TIMEOUT_SECONDS`（既定 2）: 接続確立のタイムアウト秒数。
+    - `CONTACT_AWS_READ_TIMEOUT_SECONDS`（既定 5）: 応答読み取りのタイムアウト秒数。
+    - `CONTACT_AWS_RETRY_MODE`（既定 `standard`）: botocore の再試行モード
+      （`legacy` / `standard` / `adaptive`）。
+    - `CONTACT_AWS_MAX_ATTEMPTS`（既定 2）: botocore の最大試行回数（初回を含む）。
+      SES 送信は `ResilientEmailSender` が期限付きで再試行するため、SDK 側の再試行は
+      少なく保つ（両者の試行回数は掛け合わされる）。
+    - `CONTACT_AWS_TCP_KEEPALIVE`（既定 有効）: TCP キープアライブ。ウォームな
+      コンテナで再利用する接続が NAT 等で黙って切断されるのを防ぐ。
+    - `CONTACT_AWS_MAX_POOL_CONNECTIONS`（既定 10）: 接続プールの最大接続数。
+
+フォールバック禁止（出典: 第三原則3、requirements.md R6-7）:
+    - 設定値は生成時に検証し、不正値を既定値で埋めない。
+
+外部ライセンス（第二原則6・実行前原則の遵守）:
+  - 本モジュールは AWS SDK for Python（boto3 / botocore、Apache License 2.0）を使用する。
+  - boto3 / botocore の import はクライアント生成の直前まで遅延する（handler の import で
+    botocore 全体をロードしないため、予算は `scripts/measurement/import_time_budget.json`）。
+"""
+
+from dataclasses import dataclass
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.environment import (
+    read_choice,
+    read_flag,
+    read_positive_float,
+    read_positive_int,
+)
+
+_ENV_CONNECT_TIMEOUT_SECONDS = "CONTACT_AWS_CONNECT_TIMEOUT_SECONDS"
+_ENV_READ_TIMEOUT_SECONDS = "CONTACT_AWS_READ_TIMEOUT_SECONDS"
+_ENV_RETRY_MODE = "CONTACT_AWS_RETRY_MODE"
+_ENV_MAX_ATTEMPTS = "CONTACT_AWS_MAX_ATTEMPTS"
+_ENV_TCP_KEEPALIVE = "CONTACT_AWS_TCP_KEEPALIVE"
+_ENV_MAX_POOL_CONNECTIONS = "CONTACT_AWS_MAX_POOL_CONNECTIONS"
+
+_DEFAULT_CONNECT_TIMEOUT_SECONDS = 2.0
+_DEFAULT_READ_TIMEOUT_SECONDS = 5.0
+_DEFAULT_RETRY_MODE = "standard"
+_DEFAULT_MAX_ATTEMPTS = 2
+_DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+# botocore が受け付ける再試行モード（SDK の契約であり設定値ではない）。
+_RETRY_MODES = ("legacy", "standard", "adaptive")
+
+# 接続・読み取りタイムアウトの上限。これを超える値は API Gateway の統合タイムアウト
+# （29 秒）内に 1 回の呼び出しすら収まらないため、設定誤りとして拒否する。
+_MAX_TIMEOUT_SECONDS = 29.0
+
+
+@dataclass(frozen=True, slots=True)
+class ClientSettings:
+    """AWS クライアントの接続・タイムアウト・再試行設定.
+
+    Attributes:
+        connect_timeout_seconds: 接続確立のタイムアウト秒数。
+        read_timeout_seconds: 応答読み取りのタイムアウト秒数。
+        retry_mode: botocore の再試行モード。
+        max_attempts: botocore の最大試行回数（初回を含む）。
+        tcp_keepalive: TCP キープアライブを有効にするか。
+        max_pool_connections: 接続プールの最大接続数。
+    """
+
+    connect_timeout_seconds: float = _DEFAULT_CONNECT_TIMEOUT_SECONDS
+    read_timeout_seconds: float = _DEFAULT_READ_TIMEOUT_SECONDS
+    retry_mode: str = _DEFAULT_RETRY_MODE
+    max_attempts: int = _DEFAULT_MAX_ATTEMPTS
+    tcp_keepalive: bool = True
+    max_pool_connections: int = _DEFAULT_MAX_POOL_CONNECTIONS
+
+    @property
+    def worst_case_call_seconds(self) -> float:
+        """1 回の API 呼び出しが占有し得る最長秒数（botocore の再試行を含む）.
+
+        各試行が接続・読み取りのタイムアウトまで待つ場合の合計であり、呼び出し側の
+        再試行がこの時間を期限内に確保できるかの判定に用いる。
+        """
+        return (self.connect_timeout_seconds + self.read_timeout_seconds) * self.max_attempts
+
+
+def read_client_settings() -> ClientSettings:
+    """環境変数から AWS クライアント設定を読み取り、検証する.
+
+    Returns:
+        ClientSettings: 読み取った設定（未設定の項目は既定値）。
+
+    Raises:
+        ConfigurationError: いずれかの値が不正、またはタイムアウトが上限を超える場合。
+    """
+    settings = ClientSettings(
+        connect_timeout_seconds=read_positive_float(
+            _ENV_CONNECT_TIMEOUT_SECONDS, _DEFAULT_CONNECT_TIMEOUT_SECONDS
+        ),
+        read_timeout_seconds=read_positive_float(
+            _ENV_READ_TIMEOUT_SECONDS, _DEFAULT_READ_TIMEOUT_SECONDS
+        ),
+        retry_mode=read_choice(_ENV_RETRY_MODE, _RETRY_MODES, _DEFAULT_RETRY_MODE),
+        max_attempts=read_positive_int(_ENV_MAX_ATTEMPTS, _DEFAULT_MAX_ATTEMPTS),
+        tcp_keepalive=read_flag(_ENV_TCP_KEEPALIVE, default=True),
+        max_pool_connections=read_positive_int(
+            _ENV_MAX_POOL_CONNECTIONS, _DEFAULT_MAX_POOL_CONNECTIONS
+        ),
+    )
+    for name, value in (
+        (_ENV_CONNECT_TIMEOUT_SECONDS, settings.connect_timeout_seconds),
+        (_ENV_READ_TIMEOUT_SECONDS, settings.read_timeout_seconds),
+    ):
+        if value > _MAX_TIMEOUT_SECONDS:
+            raise ConfigurationError(
+                f"環境変数 '{name}' は {_MAX_TIMEOUT_SECONDS:g} 秒以下である必要があります"
+                f"（値: '{value:g}'）。"
+            )
+    return settings
+
+
+def build_client_config(settings: ClientSettings) -> object:
+    """設定から `botocore.config.Config` を生成する.
+
+    Args:
+        settings: AWS クライアント設定。
+
+    Returns:
+        botocore.config.Config: タイムアウト・再試行・キープアライブ・プール設定。
+    """
+    # botocore は実際にクライアントが必要になった時点で import する（import 時間削減）。
+    from botocore.config import Config
+
+    return Config(
+        connect_timeout=settings.connect_timeout_seconds,
+        read_timeout=settings.read_timeout_seconds,
+        retries={"mode": settings.retry_mode, "max_attempts": settings.max_attempts},
+        tcp_keepalive=settings.tcp_keepalive,
+        max_pool_connections=settings.max_pool_connections,
+    )
+
+
+def create_client(service_name: str, settings: ClientSettings | None = None) -> object:
+    """明示的な接続・タイムアウト・再試行設定付きで boto3 クライアントを生成する.
+
+    リージョン・認証情報は実行環境（Lambda の `AWS_REGION` 等）から boto3 が解決する
+    ため本関数では指定しない（ハードコード回避、出典: requirements.md R6-7）。
+
+    Args:
+        service_name: boto3 のサービス名（`ssm` / `sesv2` / `sqs` 等）。
+        settings: AWS クライアント設定。None の場合は環境変数から読み取る。
+
+    Returns:
+        object: boto3 クライアント。
+
+    Raises:
+        ConfigurationError: `settings` が None かつ環境変数の値が不正な場合。
+    """
+    if settings is None:
+        settings = read_client_settings()
+    config = build_client_config(settings)
+    # boto3 は実際にクライアントが必要になった時点で import する（import 時間削減）。
+    import boto3  # AWS SDK for Python（ライセンス: Apache License 2.0、着手時に確認済み）
+
+    return boto3.client(service_name, config=config)
+
+
+def client_error_code(error: BaseException) -> str | None:
+    """AWS API のエラー（botocore の `ClientError`）からエラーコードを取り出す.
+
+    `ClientError` はエラーコードを `response["Error"]["Code"]` に持つ。botocore を
+    import せずに判定するため、属性の構造で判別する。
+
+    Args:
+        error: アダプタが AWS クライアントの呼び出しで捕捉した例外。
+
+    Returns:
+        str | None: エラーコード（コードの無い応答は空文字）。`ClientError` 以外
+            （接続エラー等）は None。
+    """
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return str(response.get("Error", {}).get("Code", ""))
@@ -0,0 +1,304 @@
+"""TTL キャッシュ付き設定値プロバイダ（`ConfigProvider` デコレータ）モジュール.
+
+任意の `ConfigProvider`（本番では `SsmConfigProvider`）を包み、取得した設定値を
+実行環境（コンテナ）内で TTL の間キャッシュする。問い合わせ POST 1 件あたり
+Parameter Store を最大 3 回呼んでいた経路（`csrf_trusted_origins` は全リクエスト、
+`default_from_email` / `default_to_mail` は有効な POST ごと）を、TTL 内では 0 回に
+削減し、SSM API のスロットリングを避ける。
+
+設計上の遵守事項:
+    - キャッシュ値が 1 件も無い状態で内側の取得が失敗した場合は、内側が送出した
+      `ConfigurationError` をそのまま伝播する（フォールバック禁止、出典: design.md
+      Error Handling 設定値欠落行、requirements.md R6-7）。
+    - stale-while-revalidate モード（`stale_seconds > 0`）では、TTL 切れ後
+      `stale_seconds` 以内のキャッシュ値を即時に返しつつ、再取得を別スレッドで
+      行う。再取得の失敗は明示ログを残したうえで古い値を保持し、`stale_seconds` を
+      超えた値は返さない（同期再取得に戻り、失敗は `ConfigurationError` になる）。
+    - Lambda はハンドラが応答を返した時点で実行環境を凍結するため、再取得スレッドは
+      SSM 呼び出しの途中で停止し得る。停止した再取得は次の呼び出しで実行環境が
+      再開されるまで進まず、切断済みの接続で失敗する（古い値を保持する）か、遅れて
+      完了する。その間は同一キーの再取得を多重起動しないため、古い値は
+      `stale_seconds` を超えた時点で返さなくなり同期再取得に戻る。すなわち
+      `stale_seconds` は Lambda 上で古い値を返し得る上限でもある。
+    - 一括読み込み関数（`snapshot_loader`、本番では `SsmConfigProvider.load_snapshot`）
+      が与えられた場合は、ミス・再取得のたびに 3 値を 1 回の往復でまとめて取得し、
+      全キーを同時に更新する。
+    - `invalidate` で明示的にキャッシュを破棄できる（設定値更新の即時反映用）。
+    - `stats` でヒット・ミス等の計数を参照できる（本番でのキャッシュ効果の確認用）。
+    - Django・handler 層に依存しない（出典: design.md C3）。
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from contact_function.adapters.config_provider import ConfigSnapshot, ConfigurationError
+from contact_function.domain.ports import ConfigProvider
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md「logger = logging.getLogger(__name__)」）
+logger = logging.getLogger(__name__)
+
+# キャッシュのキー（`ConfigProvider` の各取得メソッドに 1 対 1 で対応する）。
+_KEY_FROM_ADDRESS = "from_address"
+_KEY_TO_ADDRESS = "to_address"
+_KEY_ALLOWED_ORIGINS = "allowed_origins"
+
+# 一括読み込み時に再取得の多重起動を抑止するためのキー（全キー共通）。
+_SNAPSHOT_FLIGHT_KEY = "snapshot"
+
+# 「使用可能なキャッシュ値が無い」ことを表す番兵（None と区別するため専用オブジェクト）。
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """キャッシュの計数スナップショット（不変）.
+
+    Attributes:
+        hits: TTL 内のキャッシュ値を返した回数。
+        misses: キャッシュ値が無い（または使用不可の）ため同期取得した回数。
+        stale_hits: TTL 切れだが stale 許容期間内の値を返した回数。
+        refreshes: stale-while-revalidate による再取得が成功した回数。
+        refresh_failures: stale-while-revalidate による再取得が失敗した回数。
+    """
+
+    hits: int
+    misses: int
+    stale_hits: int
+    refreshes: int
+    refresh_failures: int
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """1 キー分のキャッシュ値と取得時刻."""
+
+    # キャッシュした設定値（str または tuple[str, ...]）。
+    value: object
+    # 取得時刻（`clock` の値、単調増加時計の秒）。
+    fetched_at: float
+
+
+def _start_daemon_thread(task: Callable[[], None]) -> None:
+    """再取得タスクをデーモンスレッドで開始する（既定の再取得実行器）.
+
+    Lambda では応答後の実行環境の凍結によりスレッドが途中で停止し得る
+    （モジュール docstring 参照）。
+
+    Args:
+        task: 実行するタスク。
+    """
+    threading.Thread(target=task, name="config-cache-revalidate", daemon=True).start()
+
+
+class CachingConfigProvider(ConfigProvider):
+    """内側の `ConfigProvider` の取得結果を TTL の間キャッシュするデコレータ.
+
+    依存性逆転とテスト容易性のため、時計（`clock`）と再取得実行器
+    （`revalidate_executor`）はコンストラクタで注入可能とする（出典: 第二原則3）。
+    """
+
+    def __init__(
+        self,
+        inner: ConfigProvider,
+        ttl_seconds: float,
+        *,
+        stale_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        revalidate_executor: Callable[[Callable[[], None]], None] = _start_daemon_thread,
+        snapshot_loader: Callable[[], ConfigSnapshot] | None = None,
+    ) -> None:
+        """キャッシュ付きプロバイダを初期化する.
+
+        Args:
+            inner: 実際に設定値を取得する `ConfigProvider`。
+            ttl_seconds: キャッシュ値を新鮮とみなす秒数（0 以上）。
+            stale_seconds: TTL 切れ後に古い値を返しつつ再取得する許容秒数。
+                0 の場合は stale-while-revalidate を行わない。
+            clock: 現在時刻（秒）を返す単調増加時計。
+            revalidate_executor: 再取得タスクを実行する関数（既定はデーモンスレッド）。
+            snapshot_loader: 全設定値を一括取得する関数。None の場合は `inner` の
+                各取得メソッドでキーごとに取得する。
+
+        Raises:
+            ValueError: `ttl_seconds` または `stale_seconds` が負の場合。
+        """
+        if ttl_seconds < 0 or stale_seconds < 0:
+            raise ValueError("ttl_seconds と stale_seconds は 0 以上である必要があります。")
+        self._inner = inner
+        self._ttl_seconds = ttl_seconds
+        self._stale_seconds = stale_seconds
+        self._clock = clock
+        self._revalidate_executor = revalidate_executor
+        self._snapshot_loader = snapshot_loader
+        # キャッシュ本体と計数は再取得スレッドからも更新されるため Lock で保護する。
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CacheEntry] = {}
+        # 再取得中のキー（同一キーの再取得を多重起動しない）。
+        self._revalidating: set[str] = set()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+
+    def get_from_address(self) -> str:
+        """SES 送信元アドレスをキャッシュ経由で取得する.
+
+        Returns:
+            str: 送信元アドレス。
+
+        Raises:
+            ConfigurationError: 使用可能なキャッシュ値が無く、内側の取得も失敗した場合。
+        """
+        return self._get(_KEY_FROM_ADDRESS, self._inner.get_from_address)
+
+    def get_to_address(self) -> str:
+        """SES 宛先アドレスをキャッシュ経由で取得する.
+
+        Returns:
+            str: 宛先アドレス。
+
+        Raises:
+            ConfigurationError: 使用可能なキャッシュ値が無く、内側の取得も失敗した場合。
+        """
+        return self._get(_KEY_TO_ADDRESS, self._inner.get_to_address)
+
+    def get_allowed_origins(self) -> tuple[str, ...]:
+        """許可 Origin 一覧をキャッシュ経由で取得する.
+
+        Returns:
+            tuple[str, ...]: 許可 Origin の不変な列。
+
+        Raises:
+            ConfigurationError: 使用可能なキャッシュ値が無く、内側の取得も失敗した場合。
+        """
+        return self._get(_KEY_ALLOWED_ORIGINS, self._inner.get_allowed_origins)
+
+    def invalidate(self) -> None:
+        """キャッシュ値をすべて破棄する（次回取得は内側から同期取得する）."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """現在の計数スナップショットを返す.
+
+        Returns:
+            CacheStats: ヒット・ミス等の計数。
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stale_hits=self._stale_hits,
+                refreshes=self._refreshes,
+                refresh_failures=self._refresh_failures,
+            )
+
+    def _get(self, key: str, loader: Callable[[], object]):
+        """キャッシュから値を返し、無ければ内側から同期取得してキャッシュする.
+
+        Args:
+            key: キャッシュのキー。
+            loader: 内側プロバイダの対応する取得メソッド。
+
+        Returns:
+            キャッシュ値または新たに取得した値。
+
+        Raises:
+            ConfigurationError: 使用可能なキャッシュ値が無く、内側の取得も失敗した場合
+                （内側の例外をそのまま伝播する。フォールバック禁止）。
+        """
+        now = self._clock()
+        # 一括読み込み時は全キーが同時に更新されるため、再取得の多重起動をまとめて抑止する。
+        flight_key = _SNAPSHOT_FLIGHT_KEY if self._snapshot_loader is not None else key
+        with self._lock:
+            entry = self._entries.get(key)
+            age = now - entry.fetched_at if entry is not None else None
+            # TTL 内の値はそのまま返す。
+            if entry is not None and age < self._ttl_seconds:
+                self._hits += 1
+                return entry.value
+            # TTL 切れでも stale 許容期間内なら古い値を返し、再取得を予約する。
+            if entry is not None and age < self._ttl_seconds + self._stale_seconds:
+                self._stale_hits += 1
+                schedule = flight_key not in self._revalidating
+                self._revalidating.add(flight_key)
+                stale_value = entry.value
+            else:
+                self._misses += 1
+                schedule = False
+                stale_value = _MISSING
+
+        if stale_value is not _MISSING:
+            if schedule:
+                self._revalidate_executor(
+                    lambda: self._revalidate(flight_key, key, loader)
+                )
+            return stale_value
+
+        # 使用可能なキャッシュ値が無いため同期取得する。失敗は伝播する（フォールバック禁止）。
+        values = self._fetch(key, loader)
+        self._store(values)
+        return values[key]
+
+    def _fetch(self, key: str, loader: Callable[[], object]) -> dict[str, object]:
+        """内側から値を取得し、キャッシュへ格納する値をキーごとに返す.
+
+        Args:
+            key: 要求されたキャッシュのキー。
+            loader: 内側プロバイダの対応する取得メソッド（一括読み込み時は未使用）。
+
+        Returns:
+            dict[str, object]: キャッシュのキーと値の対応（一括読み込み時は全キー）。
+
+        Raises:
+            ConfigurationError: 内側の取得に失敗した場合。
+        """
+        if self._snapshot_loader is None:
+            return {key: loader()}
+        snapshot = self._snapshot_loader()
+        return {
+            _KEY_FROM_ADDRESS: snapshot.from_address,
+            _KEY_TO_ADDRESS: snapshot.to_address,
+            _KEY_ALLOWED_ORIGINS: snapshot.allowed_origins,
+        }
+
+    def _store(self, values: dict[str, object]) -> None:
+        """取得した値を同一の取得時刻でキャッシュへ格納する.
+
+        Args:
+            values: キャッシュのキーと値の対応。
+        """
+        with self._lock:
+            fetched_at = self._clock()
+            for key, value in values.items():
+                self._entries[key] = _CacheEntry(value=value, fetched_at=fetched_at)
+
+    def _revalidate(self, flight_key: str, key: str, loader: Callable[[], object]) -> None:
+        """stale-while-revalidate の再取得を行う（再取得実行器から呼ばれる）.
+
+        再取得に失敗した場合は明示ログを残し、古い値を保持する。古い値は
+        stale 許容期間を超えると使用されなくなり、同期取得の失敗として顕在化する。
+
+        Args:
+            flight_key: 再取得の多重起動抑止に用いたキー。
+            key: 再取得するキャッシュのキー。
+            loader: 内側プロバイダの対応する取得メソッド。
+        """
+        try:
+            values = self._fetch(key, loader)
+        except ConfigurationError:
+            # 内側で exc_info を記録済み。ここでは再取得失敗の事実のみを記録する。
+            logger.warning("設定値の再取得に失敗したため古い値を保持します（キー: %s）", key)
+            with self._lock:
+                self._refresh_failures += 1
+            return
+        finally:
+            with self._lock:
+                self._revalidating.discard(flight_key)
+        self._store(values)
+        with self._lock:
+            self._refreshes += 1
@@ -22,19 +22,24 @@ Contact_Function が必要とする設定値（SES 送信元／宛先アドレ
     意図だが、Contact_Function は Django 非依存のため Django は import しない
     （出典: requirements.md R4-1, R4-2）。
   - Django・handler 層に依存しない（クリーンアーキテクチャ、出典: design.md C3）。
+  - コールド起動時の往復回数を抑えるため、3 パラメータを `GetParameters` 1 回で
+    取得する一括読み込み `load_snapshot` を提供する。一括読み込みは欠落・空の
+    パスをすべて列挙した単一の `ConfigurationError` を送出する。
 
 外部ライセンス（第二原則6・実行前原則の遵守）:
   - 本モジュールは AWS SDK for Python（boto3 / botocore）を使用する。
   - boto3 のライセンスは Apache License 2.0（環境内 `importlib.metadata` により
     `License: Apache-2.0` を確認済み、boto3 1.42.63）。Apache-2.0 は本用途での
     利用・再配布を許諾する。
+  - boto3 / botocore の import はクライアント生成・API 呼び出しの直前まで遅延する。
+    handler の import（OPTIONS プリフライトや Origin 拒否のみで終わる呼び出しを
+    含む）で botocore 全体をロードしないため（コールドスタートの import 時間削減、
+    予算は `scripts/measurement/import_time_budget.json`）。
 """
 
 import logging
 import os
-
-import boto3  # AWS SDK for Python（ライセンス: Apache License 2.0、着手時に確認済み）
-from botocore.exceptions import BotoCoreError, ClientError
+from dataclasses import dataclass
 
 from contact_function.domain.ports import ConfigProvider
 
@@ -67,6 +72,37 @@ class ConfigurationError(Exception):
     """
 
 
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """一括読み込みした設定値の不変スナップショット.
+
+    Attributes:
+        from_address: SES 送信元アドレス（出典: DM4 `default_from_email`）。
+        to_address: SES 宛先アドレス（出典: DM4 `default_to_mail`）。
+        allowed_origins: 許可 Origin の不変な列（出典: DM4 `csrf_trusted_origins`）。
+    """
+
+    from_address: str
+    to_address: str
+    allowed_origins: tuple[str, ...]
+
+
+def _split_origins(raw_value: str) -> tuple[str, ...]:
+    """カンマ区切りの許可 Origin 文字列を、前後空白除去・空要素除去した tuple に整形する.
+
+    Args:
+        raw_value: `csrf_trusted_origins` の生の値。
+
+    Returns:
+        tuple[str, ...]: 許可 Origin の不変な列（空の場合もある。検証は呼び出し元で行う）。
+    """
+    return tuple(
+        origin.strip()
+        for origin in raw_value.split(_ORIGIN_DELIMITER)
+        if origin.strip()
+    )
+
+
 class SsmConfigProvider(ConfigProvider):
     """Parameter Store から設定値を取得する `ConfigProvider` 具象実装.
 
@@ -86,9 +122,10 @@ class SsmConfigProvider(ConfigProvider):
             env: 環境名（dev/prod 等）。None の場合は環境変数 `ENV` から取得する。
                 値をハードコードしないため既定のフォールバック値は設けない
                 （出典: requirements.md R6-7、第三原則3）。
-            ssm_client: SSM クライアント（依存性注入用）。None の場合は boto3 で
-                生成する。リージョンは実行環境（Lambda の `AWS_REGION` 等）から
-                boto3 が解決するため本コードでは指定しない（ハードコード回避）。
+            ssm_client: SSM クライアント（依存性注入用）。None の場合は
+                `aws_clients.create_client` で生成する（タイムアウト等は環境変数）。
+                リージョンは実行環境（Lambda の `AWS_REGION` 等）から boto3 が解決する
+                ため本コードでは指定しない（ハードコード回避）。
 
         Raises:
             ConfigurationError: `env` が None かつ環境変数 `ENV` が未設定または空の
@@ -111,7 +148,14 @@ class SsmConfigProvider(ConfigProvider):
 
         # SSM クライアントは注入値を優先し、無ければ boto3 で生成する。
         # クライアント生成自体は認証情報を要求しない（実際の API 呼び出し時に必要）。
-        self._ssm_client = ssm_client if ssm_client is not None else boto3.client("ssm")
+        if ssm_client is None:
+            # 接続・タイムアウト・再試行を明示した共通ファクトリで生成する。
+            # `aws_clients` は本モジュールの `ConfigurationError` を参照するため、
+            # 循環 import を避けて生成時に import する（boto3 の遅延 import も兼ねる）。
+            from contact_function.adapters.aws_clients import create_client
+
+            ssm_client = create_client("ssm")
+        self._ssm_client = ssm_client
 
     def get_from_address(self) -> str:
         """SES 送信元アドレスを Parameter Store から取得する.
@@ -157,11 +201,7 @@ class SsmConfigProvider(ConfigProvider):
         raw_value = self._get_required_parameter(_PARAM_NAME_TRUSTED_ORIGINS)
 
         # カンマで分割し、各要素の前後空白を除去したうえで空要素を除外する。
-        origins = tuple(
-            origin.strip()
-            for origin in raw_value.split(_ORIGIN_DELIMITER)
-            if origin.strip()
-        )
+        origins = _split_origins(raw_value)
 
         # 分割後に有効な Origin が 1 件も無い場合は既定値で埋めず明示的に失敗させる。
         if not origins:
@@ -173,6 +213,67 @@ class SsmConfigProvider(ConfigProvider):
 
         return origins
 
+    def load_snapshot(self) -> ConfigSnapshot:
+        """3 パラメータを `GetParameters` 1 回で一括取得し、スナップショットを返す.
+
+        個別取得（`get_parameter` 3 回）に比べ、コールド起動直後の Parameter Store
+        往復を 1 回に削減する。存在しない・値が空・有効な Origin が無いパスは
+        1 件ずつ失敗させず、すべてを列挙した単一の `ConfigurationError` として
+        送出する（運用者が 1 回の失敗で欠落箇所をすべて把握できるようにする）。
+
+        Returns:
+            ConfigSnapshot: 前後空白を除去した設定値のスナップショット。
+
+        Raises:
+            ConfigurationError: 取得に失敗した場合、または 1 件以上のパスが欠落・空の
+                場合（フォールバック禁止、出典: requirements.md R6-7、design.md
+                Error Handling）。
+        """
+        # 取得失敗の判定に用いる例外型は取得時に import する（import 時間削減）。
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        names = (_PARAM_NAME_FROM_EMAIL, _PARAM_NAME_TO_EMAIL, _PARAM_NAME_TRUSTED_ORIGINS)
+        paths = {name: self._build_parameter_path(name) for name in names}
+
+        try:
+            # String 型のため復号は不要（出典: `template.yaml` の型定義）。
+            response = self._ssm_client.get_parameters(Names=list(paths.values()))
+        except (ClientError, BotoCoreError) as error:
+            logger.error(
+                "Parameter Store の一括取得に失敗しました（パス: %s）",
+                ", ".join(paths.values()),
+                exc_info=True,
+            )
+            raise ConfigurationError(
+                f"設定値の一括取得に失敗しました（パス: {', '.join(paths.values())}）"
+                "（フォールバック禁止、出典: requirements.md R6-7、design.md Error Handling）。"
+            ) from error
+
+        # 応答形状は {"Parameters": [{"Name": ..., "Value": ...}], "InvalidParameters": [...]}。
+        # 未登録のパスは InvalidParameters に入り、Parameters には現れない。
+        values_by_path = {
+            parameter.get("Name"): (parameter.get("Value") or "").strip()
+            for parameter in response.get("Parameters", [])
+        }
+        values = {name: values_by_path.get(path, "") for name, path in paths.items()}
+        origins = _split_origins(values[_PARAM_NAME_TRUSTED_ORIGINS])
+
+        # 欠落・空のパスを 1 件で打ち切らず、すべて収集してから失敗させる。
+        missing_paths = [path for name, path in paths.items() if not values[name]]
+        if values[_PARAM_NAME_TRUSTED_ORIGINS] and not origins:
+            missing_paths.append(paths[_PARAM_NAME_TRUSTED_ORIGINS])
+        if missing_paths:
+            raise ConfigurationError(
+                f"設定値が欠落または空です（パス: {', '.join(missing_paths)}）。値を設定してください"
+                "（フォールバック禁止、出典: requirements.md R6-7、design.md Error Handling）。"
+            )
+
+        return ConfigSnapshot(
+            from_address=values[_PARAM_NAME_FROM_EMAIL],
+            to_address=values[_PARAM_NAME_TO_EMAIL],
+            allowed_origins=origins,
+        )
+
     def _build_parameter_path(self, name: str) -> str:
         """パラメータ名から Parameter Store の完全パスを構築する.
 
@@ -198,6 +299,9 @@ class SsmConfigProvider(ConfigProvider):
             ConfigurationError: パラメータが存在しない・値が空・取得に失敗した場合
                 （フォールバック禁止、出典: requirements.md R6-7、design.md Error Handling）。
         """
+        # 取得失敗の判定に用いる例外型は取得時に import する（import 時間削減）。
+        from botocore.exceptions import BotoCoreError, ClientError
+
         # DM4 のパス設計に従い完全パスを構築する。
         path = self._build_parameter_path(name)
 
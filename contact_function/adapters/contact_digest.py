@@ -0,0 +1,134 @@
+"""問い合わせのダイジェスト（まとめ送信）計画モジュール.
+
+スパムの波や公開直後の集中時には、短時間に多数の問い合わせがキューへ投入され、
+1 件ごとに SES `SendEmail` を呼ぶと API 呼び出し数と費用が件数に比例して増える。
+ダイジェストモードでは、ドレインワーカー（`contact_function.worker`）が受信した
+1 バッチ（SQS イベントソースマッピングのバッチウィンドウ・最大件数で集めた分）を
+送信元・宛先ごとにまとめ、1 通の集約メールとして送信する。
+
+まとめ方（`plan_digests`）:
+    - 送信元・宛先の組ごとに、受信順を保ってまとめる（組は最初に現れた順）。
+    - 1 通あたりの件数が `DigestPolicy.max_items` に達した時点、または本文の推定
+      サイズが `DigestPolicy.max_bytes` を超える時点で次の 1 通へ切り替える
+      （サイズしきい値によるフラッシュ）。単独でしきい値を超える 1 件は 1 通とする。
+
+失敗の扱い（フォールバック禁止、出典: 第三原則3、requirements.md R6-4）:
+    - 1 通の送信に失敗した場合は、その 1 通に含めたメッセージをすべて失敗として
+      報告し、再配信させる（一部だけ成功扱いにしない）。
+
+Django・handler 層に依存しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from contact_function.adapters.contact_queue import QueuedContact
+from contact_function.domain.contact_payload import ContactPayload
+
+# 本文サイズの推定に加える 1 件あたりの見出し・区切り・項目名の概算バイト数。
+_PER_ITEM_OVERHEAD_BYTES = 128
+
+
+@dataclass(frozen=True, slots=True)
+class DigestPolicy:
+    """ダイジェストの上限.
+
+    Attributes:
+        max_items: 1 通にまとめる最大件数（件数しきい値）。
+        max_bytes: 1 通の本文の推定最大バイト数（サイズしきい値）。
+    """
+
+    max_items: int
+    max_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class DigestBatch:
+    """1 通の集約メールにまとめる問い合わせ.
+
+    Attributes:
+        from_addr: 送信元アドレス。
+        to_addr: 宛先アドレス。
+        message_ids: まとめたメッセージの ID（失敗報告用、受信順）。
+        payloads: まとめた問い合わせ内容（受信順）。
+    """
+
+    from_addr: str
+    to_addr: str
+    message_ids: tuple[str, ...]
+    payloads: tuple[ContactPayload, ...]
+
+
+class DigestEmailSender(ABC):
+    """複数の問い合わせを 1 通の集約メールで送信するアダプタの抽象."""
+
+    @abstractmethod
+    def send_digest(
+        self, payloads: Sequence[ContactPayload], from_addr: str, to_addr: str
+    ) -> None:
+        """複数の問い合わせを 1 通にまとめて送信する.
+
+        Args:
+            payloads: まとめる問い合わせ内容（1 件以上、受信順）。
+            from_addr: 送信元アドレス。
+            to_addr: 宛先アドレス。
+
+        Raises:
+            Exception: 送信に失敗した場合（握りつぶさず伝播する）。
+        """
+        raise NotImplementedError
+
+
+def estimate_payload_bytes(payload: ContactPayload) -> int:
+    """集約メール本文に占める 1 件分のバイト数を推定する（UTF-8）."""
+    fields = (payload.full_name, payload.email, payload.phone_number, payload.message)
+    return sum(len(value.encode("utf-8")) for value in fields) + _PER_ITEM_OVERHEAD_BYTES
+
+
+def plan_digests(
+    messages: Sequence[tuple[str, QueuedContact]], policy: DigestPolicy
+) -> list[DigestBatch]:
+    """受信したメッセージを送信元・宛先ごとに件数・サイズの上限内でまとめる.
+
+    Args:
+        messages: （メッセージ ID, 復元済みの問い合わせ）の列（受信順）。
+        policy: 1 通あたりの上限。
+
+    Returns:
+        list[DigestBatch]: 送信する集約メールの列（組の初出順、組内は受信順）。
+    """
+    groups: dict[tuple[str, str], list[tuple[str, QueuedContact]]] = {}
+    for message_id, message in messages:
+        groups.setdefault((message.from_addr, message.to_addr), []).append(
+            (message_id, message)
+        )
+
+    batches: list[DigestBatch] = []
+    for (from_addr, to_addr), entries in groups.items():
+        current: list[tuple[str, QueuedContact]] = []
+        current_bytes = 0
+        for message_id, message in entries:
+            size = estimate_payload_bytes(message.payload)
+            if current and (
+                len(current) >= policy.max_items or current_bytes + size > policy.max_bytes
+            ):
+                batches.append(_to_batch(from_addr, to_addr, current))
+                current, current_bytes = [], 0
+            current.append((message_id, message))
+            current_bytes += size
+        if current:
+            batches.append(_to_batch(from_addr, to_addr, current))
+    return batches
+
+
+def _to_batch(
+    from_addr: str, to_addr: str, entries: list[tuple[str, QueuedContact]]
+) -> DigestBatch:
+    """まとめたメッセージを `DigestBatch` へ変換する."""
+    return DigestBatch(
+        from_addr=from_addr,
+        to_addr=to_addr,
+        message_ids=tuple(message_id for message_id, _ in entries),
+        payloads=tuple(message.payload for _, message in entries),
+    )
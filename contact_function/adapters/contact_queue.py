@@ -0,0 +1,334 @@
+"""問い合わせキュー（`ContactQueue` ポートと SQS・インメモリ・ファイル実装）モジュール.
+
+`QueueingEmailSender` が検証済みの問い合わせを投入し、ドレインワーカー
+（`contact_function.worker`）が取り出して SES で送信するためのキューを提供する。
+HTTP 経路から SES の遅延・スロットリングを切り離すための非同期化に用いる。
+
+キューのメッセージ本文は `encode_queued_contact` が生成する JSON であり、
+Contact_Payload の 4 項目・送信元・宛先・受付 ID のみを含む（GDPR データ最小化、
+出典: requirements.md R5-1, R9-5、design.md DM1）。本文の形式不正は
+`decode_queued_contact` が `ValueError` で明示的に失敗させる（フォールバック禁止）。
+
+実装:
+    - `SqsContactQueue`: 本番用（Amazon SQS。boto3 は遅延 import）。
+    - `InMemoryContactQueue`: 単体テスト用（同一プロセス内）。
+    - `FileContactQueue`: ローカル実行用（ディレクトリ内の JSON ファイル。プロセスを
+      跨いで投入・ドレインできる）。
+
+受信したメッセージは `acknowledge` するまで処理中として保持し、`release` で再配信
+可能に戻す（SQS の可視性タイムアウトに相当）。Django・handler 層に依存しない。
+"""
+
+import json
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from contact_function.adapters.aws_clients import create_client
+from contact_function.domain.contact_payload import ContactPayload
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md「logger = logging.getLogger(__name__)」）
+logger = logging.getLogger(__name__)
+
+# メッセージ本文の形式バージョン（形式を変更する場合はワーカーと同時に更新する）。
+_MESSAGE_VERSION = 1
+
+# Contact_Payload の 4 項目（本文に含める唯一の問い合わせ内容）。
+_PAYLOAD_FIELDS: tuple[str, ...] = ("full_name", "email", "phone_number", "message")
+
+# SQS `ReceiveMessage` の 1 回あたり最大件数（AWS の API 上限）。
+_SQS_MAX_RECEIVE = 10
+
+
+@dataclass(frozen=True, slots=True)
+class QueuedContact:
+    """キューへ投入する問い合わせ（受付 ID・内容・送信元・宛先）.
+
+    Attributes:
+        acceptance_id: 受付 ID（HTTP 応答で返した識別子）。
+        payload: 検証済みの問い合わせ内容。
+        from_addr: SES 送信元アドレス（投入時点の設定値）。
+        to_addr: SES 宛先アドレス（投入時点の設定値）。
+    """
+
+    acceptance_id: str
+    payload: ContactPayload
+    from_addr: str
+    to_addr: str
+
+
+@dataclass(frozen=True, slots=True)
+class QueueRecord:
+    """キューから受信した 1 メッセージ.
+
+    Attributes:
+        message_id: メッセージ ID（部分バッチ失敗の報告に用いる）。
+        receipt: 削除・再配信に用いる受領ハンドル（SQS の ReceiptHandle 相当）。
+        body: メッセージ本文（`encode_queued_contact` の出力）。
+    """
+
+    message_id: str
+    receipt: str
+    body: str
+
+
+def encode_queued_contact(message: QueuedContact) -> str:
+    """問い合わせをキューのメッセージ本文（JSON）へ変換する.
+
+    Args:
+        message: 投入する問い合わせ。
+
+    Returns:
+        str: メッセージ本文。
+    """
+    return json.dumps(
+        {
+            "version": _MESSAGE_VERSION,
+            "acceptance_id": message.acceptance_id,
+            "from_addr": message.from_addr,
+            "to_addr": message.to_addr,
+            "payload": {name: getattr(message.payload, name) for name in _PAYLOAD_FIELDS},
+        },
+        ensure_ascii=False,
+    )
+
+
+def decode_queued_contact(body: str) -> QueuedContact:
+    """キューのメッセージ本文（JSON）を問い合わせへ復元する.
+
+    Args:
+        body: メッセージ本文。
+
+    Returns:
+        QueuedContact: 復元した問い合わせ。
+
+    Raises:
+        ValueError: JSON でない、版が異なる、または必須項目が欠落・非文字列の場合
+            （形式不正を既定値で補わない）。
+    """
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError as error:
+        raise ValueError("キューのメッセージ本文が JSON ではありません。") from error
+    if not isinstance(data, dict) or data.get("version") != _MESSAGE_VERSION:
+        raise ValueError("キューのメッセージ本文の形式版が一致しません。")
+    payload = data.get("payload")
+    if not isinstance(payload, dict):
+        raise ValueError("キューのメッセージ本文に payload がありません。")
+    strings = [data.get(key) for key in ("acceptance_id", "from_addr", "to_addr")]
+    strings += [payload.get(name) for name in _PAYLOAD_FIELDS]
+    if not all(isinstance(value, str) for value in strings):
+        raise ValueError("キューのメッセージ本文に欠落または非文字列の項目があります。")
+    return QueuedContact(
+        acceptance_id=data["acceptance_id"],
+        payload=ContactPayload(**{name: payload[name] for name in _PAYLOAD_FIELDS}),
+        from_addr=data["from_addr"],
+        to_addr=data["to_addr"],
+    )
+
+
+class ContactQueue(ABC):
+    """問い合わせキューのポート（抽象）."""
+
+    @abstractmethod
+    def enqueue(self, message: QueuedContact) -> None:
+        """問い合わせをキューへ投入する.
+
+        Args:
+            message: 投入する問い合わせ。
+
+        Raises:
+            Exception: 投入に失敗した場合（握りつぶさず呼び出し元へ伝播する）。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def receive(self, max_messages: int) -> list[QueueRecord]:
+        """最大 `max_messages` 件のメッセージを受信し、処理中として保持する.
+
+        Args:
+            max_messages: 受信する最大件数。
+
+        Returns:
+            list[QueueRecord]: 受信したメッセージ（空の場合もある）。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def acknowledge(self, receipts: Iterable[str]) -> None:
+        """処理を終えたメッセージをキューから削除する.
+
+        Args:
+            receipts: 削除するメッセージの受領ハンドル。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, receipts: Iterable[str]) -> None:
+        """処理に失敗したメッセージを再配信可能な状態へ戻す.
+
+        Args:
+            receipts: 戻すメッセージの受領ハンドル。
+        """
+        raise NotImplementedError
+
+
+class InMemoryContactQueue(ContactQueue):
+    """同一プロセス内で完結するテスト用キュー（FIFO）."""
+
+    def __init__(self) -> None:
+        """空のキューを作る."""
+        self._pending: OrderedDict[str, str] = OrderedDict()
+        self._in_flight: dict[str, str] = {}
+
+    def enqueue(self, message: QueuedContact) -> None:
+        """本文を末尾へ追加する."""
+        self._pending[uuid.uuid4().hex] = encode_queued_contact(message)
+
+    def receive(self, max_messages: int) -> list[QueueRecord]:
+        """先頭から最大 `max_messages` 件を処理中へ移して返す."""
+        records: list[QueueRecord] = []
+        while self._pending and len(records) < max_messages:
+            message_id, body = self._pending.popitem(last=False)
+            self._in_flight[message_id] = body
+            records.append(QueueRecord(message_id=message_id, receipt=message_id, body=body))
+        return records
+
+    def acknowledge(self, receipts: Iterable[str]) -> None:
+        """処理中のメッセージを削除する."""
+        for receipt in receipts:
+            self._in_flight.pop(receipt, None)
+
+    def release(self, receipts: Iterable[str]) -> None:
+        """処理中のメッセージを待機列の末尾へ戻す."""
+        for receipt in receipts:
+            body = self._in_flight.pop(receipt, None)
+            if body is not None:
+                self._pending[receipt] = body
+
+    def pending_count(self) -> int:
+        """待機中（未受信）のメッセージ件数を返す."""
+        return len(self._pending)
+
+
+class FileContactQueue(ContactQueue):
+    """ディレクトリ内の JSON ファイルをメッセージとするローカル実行用キュー.
+
+    `pending/` に投入し、受信時に `in_flight/` へ移動する。ファイル名は投入順に
+    並ぶ時刻接頭辞付きの ID とし、受信は名前順（投入順）で行う。
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        """キューのディレクトリを用意する.
+
+        Args:
+            directory: キューの保存先ディレクトリ（無ければ作成する）。
+        """
+        root = Path(directory)
+        self._pending_dir = root / "pending"
+        self._in_flight_dir = root / "in_flight"
+        self._pending_dir.mkdir(parents=True, exist_ok=True)
+        self._in_flight_dir.mkdir(parents=True, exist_ok=True)
+
+    def enqueue(self, message: QueuedContact) -> None:
+        """本文を一時ファイルへ書き込み、完成後に `pending/` へ移動する（原子的な投入）."""
+        message_id = f"{uuid.uuid1().time:020d}-{uuid.uuid4().hex}"
+        temporary = self._pending_dir / f".{message_id}.tmp"
+        temporary.write_text(encode_queued_contact(message), encoding="utf-8")
+        os.replace(temporary, self._pending_dir / f"{message_id}.json")
+
+    def receive(self, max_messages: int) -> list[QueueRecord]:
+        """名前順に最大 `max_messages` 件を `in_flight/` へ移して返す."""
+        records: list[QueueRecord] = []
+        for path in sorted(self._pending_dir.glob("*.json"))[:max_messages]:
+            destination = self._in_flight_dir / path.name
+            os.replace(path, destination)
+            records.append(
+                QueueRecord(
+                    message_id=path.stem,
+                    receipt=path.name,
+                    body=destination.read_text(encoding="utf-8"),
+                )
+            )
+        return records
+
+    def acknowledge(self, receipts: Iterable[str]) -> None:
+        """`in_flight/` のファイルを削除する."""
+        for receipt in receipts:
+            (self._in_flight_dir / receipt).unlink(missing_ok=True)
+
+    def release(self, receipts: Iterable[str]) -> None:
+        """`in_flight/` のファイルを `pending/` へ戻す."""
+        for receipt in receipts:
+            path = self._in_flight_dir / receipt
+            if path.exists():
+                os.replace(path, self._pending_dir / receipt)
+
+
+class SqsContactQueue(ContactQueue):
+    """Amazon SQS を用いる本番用キュー.
+
+    依存性逆転とテスト容易性のため、SQS クライアントはコンストラクタで注入可能とする
+    （`SesEmailSender` と同じ注入方針）。既定では boto3 の SQS クライアントを生成する。
+    """
+
+    def __init__(self, queue_url: str, sqs_client: object | None = None) -> None:
+        """SQS キューを初期化する.
+
+        Args:
+            queue_url: キューの URL（環境変数 `CONTACT_QUEUE_URL` 由来）。
+            sqs_client: SQS クライアント（依存性注入用）。None の場合は
+                `aws_clients.create_client` で生成する（タイムアウト等は環境変数）。
+        """
+        if sqs_client is None:
+            # 接続・タイムアウト・再試行を明示した共通ファクトリで生成する
+            # （boto3 の import はファクトリ内で遅延する）。
+            sqs_client = create_client("sqs")
+        self._queue_url = queue_url
+        self._sqs_client = sqs_client
+
+    def enqueue(self, message: QueuedContact) -> None:
+        """`SendMessage` で本文を投入する（失敗は例外のまま伝播する）."""
+        # 投入失敗の判定に用いる例外型は投入時に import する（import 時間削減）。
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        try:
+            self._sqs_client.send_message(
+                QueueUrl=self._queue_url, MessageBody=encode_queued_contact(message)
+            )
+        except (ClientError, BotoCoreError):
+            # 個人データ（本文）はログに出力しない（GDPR、出典: requirements.md R9-5）。
+            logger.error("問い合わせのキュー投入に失敗しました", exc_info=True)
+            raise
+
+    def receive(self, max_messages: int) -> list[QueueRecord]:
+        """`ReceiveMessage` で最大 10 件（API 上限）を受信する."""
+        response = self._sqs_client.receive_message(
+            QueueUrl=self._queue_url,
+            MaxNumberOfMessages=max(1, min(max_messages, _SQS_MAX_RECEIVE)),
+        )
+        return [
+            QueueRecord(
+                message_id=message["MessageId"],
+                receipt=message["ReceiptHandle"],
+                body=message["Body"],
+            )
+            for message in response.get("Messages", [])
+        ]
+
+    def acknowledge(self, receipts: Iterable[str]) -> None:
+        """`DeleteMessage` でメッセージを削除する."""
+        for receipt in receipts:
+            self._sqs_client.delete_message(QueueUrl=self._queue_url, ReceiptHandle=receipt)
+
+    def release(self, receipts: Iterable[str]) -> None:
+        """可視性タイムアウトを 0 にして即時に再配信可能へ戻す."""
+        for receipt in receipts:
+            self._sqs_client.change_message_visibility(
+                QueueUrl=self._queue_url, ReceiptHandle=receipt, VisibilityTimeout=0
+            )
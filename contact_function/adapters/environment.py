@@ -0,0 +1,183 @@
+"""Contact_Function の環境変数読み取りヘルパーモジュール.
+
+アダプタ・composition root が参照するチューニング用環境変数（キャッシュ TTL 等）を
+型付きで読み取り、検証する。値が設定されていない場合は呼び出し元が明示した既定値を
+用い、設定されているが不正な場合は既定値で埋めずに `ConfigurationError` を送出して
+明示的に失敗させる（フォールバック禁止、出典: 第三原則3、requirements.md R6-7）。
+
+本モジュールは標準ライブラリのみを使用し、Django・boto3 に依存しない。
+"""
+
+import os
+
+from contact_function.adapters.config_provider import ConfigurationError
+
+
+def read_non_negative_float(name: str, default: float) -> float:
+    """環境変数を 0 以上の有限な実数として読み取る.
+
+    Args:
+        name: 環境変数名。
+        default: 環境変数が未設定または空の場合に用いる値（呼び出し元が明示する）。
+
+    Returns:
+        float: 読み取った値（未設定時は `default`）。
+
+    Raises:
+        ConfigurationError: 値が実数として解釈できない、負、または非有限の場合。
+    """
+    raw_value = os.environ.get(name, "").strip()
+    if raw_value == "":
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError as error:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は実数である必要があります（値: '{raw_value}'）。"
+        ) from error
+    # NaN・無限大・負値は設定誤りとして明示的に失敗させる。
+    if value != value or value in (float("inf"), float("-inf")) or value < 0:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は 0 以上の有限な実数である必要があります"
+            f"（値: '{raw_value}'）。"
+        )
+    return value
+
+
+def read_positive_float(name: str, default: float) -> float:
+    """環境変数を 0 より大きい有限な実数として読み取る.
+
+    Args:
+        name: 環境変数名。
+        default: 環境変数が未設定または空の場合に用いる値（呼び出し元が明示する）。
+
+    Returns:
+        float: 読み取った値（未設定時は `default`）。
+
+    Raises:
+        ConfigurationError: 値が実数として解釈できない、0 以下、または非有限の場合。
+    """
+    value = read_non_negative_float(name, default)
+    # タイムアウト等で 0 は「待たない」を意味せず設定誤りとなるため拒否する。
+    if value == 0:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は 0 より大きい実数である必要があります（値: '{value}'）。"
+        )
+    return value
+
+
+# 真偽値として受け付ける表記（大文字小文字は区別しない）。
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def read_flag(name: str, default: bool = False) -> bool:
+    """環境変数を真偽値フラグとして読み取る（未設定・空は `default`）.
+
+    Args:
+        name: 環境変数名。
+        default: 環境変数が未設定または空の場合に用いる値（既定は無効）。
+
+    Returns:
+        bool: `1`/`true`/`yes`/`on` の場合 True、`0`/`false`/`no`/`off` の場合 False、
+            未設定・空の場合 `default`。
+
+    Raises:
+        ConfigurationError: 上記以外の値の場合（誤記を無効扱いで黙殺しない）。
+    """
+    raw_value = os.environ.get(name, "").strip().lower()
+    if raw_value == "":
+        return default
+    if raw_value in _FALSE_VALUES:
+        return False
+    if raw_value in _TRUE_VALUES:
+        return True
+    raise ConfigurationError(
+        f"環境変数 '{name}' は真偽値（true/false）である必要があります（値: '{raw_value}'）。"
+    )
+
+
+def read_choice(name: str, choices: tuple[str, ...], default: str) -> str:
+    """環境変数を列挙値のいずれかとして読み取る（大文字小文字は区別しない）.
+
+    Args:
+        name: 環境変数名。
+        choices: 受け付ける値（小文字）。
+        default: 環境変数が未設定または空の場合に用いる値（`choices` のいずれか）。
+
+    Returns:
+        str: 読み取った値（小文字。未設定時は `default`）。
+
+    Raises:
+        ConfigurationError: `choices` 以外の値の場合。
+    """
+    raw_value = os.environ.get(name, "").strip().lower()
+    if raw_value == "":
+        return default
+    if raw_value not in choices:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は {'/'.join(choices)} のいずれかである必要があります"
+            f"（値: '{raw_value}'）。"
+        )
+    return raw_value
+
+
+def read_required_string(name: str) -> str:
+    """必須の環境変数を空でない文字列として読み取る.
+
+    Args:
+        name: 環境変数名。
+
+    Returns:
+        str: 前後の空白を除いた値。
+
+    Raises:
+        ConfigurationError: 未設定または空の場合（既定値で埋めない）。
+    """
+    raw_value = os.environ.get(name, "").strip()
+    if raw_value == "":
+        raise ConfigurationError(f"環境変数 '{name}' が設定されていません。")
+    return raw_value
+
+
+def read_string(name: str, default: str) -> str:
+    """環境変数を文字列として読み取る.
+
+    Args:
+        name: 環境変数名。
+        default: 環境変数が未設定または空の場合に用いる値（呼び出し元が明示する）。
+
+    Returns:
+        str: 前後の空白を除いた値（未設定時は `default`）。
+    """
+    raw_value = os.environ.get(name, "").strip()
+    return raw_value if raw_value != "" else default
+
+
+def read_positive_int(name: str, default: int) -> int:
+    """環境変数を 1 以上の整数として読み取る.
+
+    Args:
+        name: 環境変数名。
+        default: 環境変数が未設定または空の場合に用いる値（呼び出し元が明示する）。
+
+    Returns:
+        int: 読み取った値（未設定時は `default`）。
+
+    Raises:
+        ConfigurationError: 値が整数として解釈できない、または 1 未満の場合。
+    """
+    raw_value = os.environ.get(name, "").strip()
+    if raw_value == "":
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError as error:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は整数である必要があります（値: '{raw_value}'）。"
+        ) from error
+    if value < 1:
+        raise ConfigurationError(
+            f"環境変数 '{name}' は 1 以上の整数である必要があります（値: '{raw_value}'）。"
+        )
+    return value
@@ -0,0 +1,356 @@
+"""冪等性ストア（`IdempotencyStore` ポートのインメモリ・ファイル・DynamoDB 実装）モジュール.
+
+`domain.idempotency.send_contact_once` が重複送信の抑止に用いる状態（送信中の予約・
+完了した結果）を、キー（送信内容のハッシュ）ごとに有効期限付きで保持する。
+問い合わせ内容そのものは保存しない（GDPR データ最小化、出典: requirements.md
+R5-1, R9-5）。
+
+実装:
+    - `MemoryIdempotencyStore`: 実行環境（ウォームコンテナ）内の上限付き LRU
+      （件数上限・有効期限）。同じコンテナへの連続した重複を往復なしで抑止する。
+    - `FileIdempotencyStore`: ローカル実行用の共有ストア（ディレクトリ内の JSON
+      ファイル。プロセスを跨いで予約を共有できる）。
+    - `DynamoDbIdempotencyStore`: 本番用の共有ストア（Amazon DynamoDB の条件付き
+      書き込み。boto3 は遅延 import）。別コンテナで並行処理される重複も抑止する。
+    - `TieredIdempotencyStore`: インメモリ LRU を共有ストアの前段に置く組み合わせ。
+
+有効期限:
+    完了した結果は `ttl_seconds`、送信中の予約は `reservation_seconds` で失効する
+    （送信中にコンテナが停止しても、予約が残り続けて再送を妨げないようにする）。
+    期限切れの記録は未記録として扱う。ストアの障害は例外のまま伝播する
+    （フォールバック禁止）。Django・handler 層に依存しない。
+"""
+
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+from contact_function.adapters.aws_clients import client_error_code, create_client
+from contact_function.domain.ports import IdempotencyStore
+
+# DynamoDB テーブルの属性名（パーティションキー・状態・TTL 属性）。
+_DYNAMODB_KEY_ATTRIBUTE = "idempotency_key"
+_DYNAMODB_STATE_ATTRIBUTE = "submission_state"
+_DYNAMODB_EXPIRES_ATTRIBUTE = "expires_at"
+
+# 条件付き書き込みの条件不成立を表す DynamoDB のエラーコード。
+_CONDITIONAL_CHECK_FAILED = "ConditionalCheckFailedException"
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """実行環境内で保持する上限付き LRU の冪等性ストア.
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、排他制御を持たない。
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        reservation_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """空のストアを作る.
+
+        Args:
+            max_entries: 保持する最大件数（超えると最も長く参照されていないものを破棄）。
+            ttl_seconds: 完了した結果の有効秒数。
+            reservation_seconds: 送信中の予約の有効秒数。
+            clock: 現在時刻（秒）を返す関数（テスト用に注入可能）。
+
+        Raises:
+            ValueError: `max_entries` が 1 未満、または秒数が負の場合。
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries は 1 以上である必要があります。")
+        if ttl_seconds < 0 or reservation_seconds < 0:
+            raise ValueError("有効秒数は 0 以上である必要があります。")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._reservation_seconds = reservation_seconds
+        self._clock = clock
+        # キー → (状態, 失効時刻)。末尾ほど最近参照された記録。
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        """有効な記録を返し、最近参照された位置へ移す."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        state, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return state
+
+    def reserve(self, key: str, marker: str) -> bool:
+        """未記録・期限切れの場合のみ予約を記録する."""
+        if self.get(key) is not None:
+            return False
+        self._store(key, marker, self._reservation_seconds)
+        return True
+
+    def complete(self, key: str, outcome: str) -> None:
+        """結果を記録する."""
+        self._store(key, outcome, self._ttl_seconds)
+
+    def release(self, key: str) -> None:
+        """記録を削除する."""
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        """保持中の記録数（期限切れを含む）を返す."""
+        return len(self._entries)
+
+    def _store(self, key: str, state: str, lifetime_seconds: float) -> None:
+        """記録を末尾へ書き込み、上限を超えた分を先頭から破棄する."""
+        self._entries[key] = (state, self._clock() + lifetime_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class FileIdempotencyStore(IdempotencyStore):
+    """ディレクトリ内の JSON ファイルを記録とするローカル実行用の共有ストア.
+
+    記録はキーごとに 1 ファイル（`<key>.json`、内容は状態と失効時刻）。予約は一時
+    ファイルを書き込んだうえで `os.link` により作成する（既存の場合は原子的に失敗する
+    ため、プロセスを跨いでも予約は 1 つだけ成立する）。
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        ttl_seconds: float,
+        reservation_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """ストアのディレクトリを用意する.
+
+        Args:
+            directory: 保存先ディレクトリ（無ければ作成する）。
+            ttl_seconds: 完了した結果の有効秒数。
+            reservation_seconds: 送信中の予約の有効秒数。
+            clock: 現在時刻（UNIX 秒）を返す関数（プロセス間で共有できる時刻）。
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._ttl_seconds = ttl_seconds
+        self._reservation_seconds = reservation_seconds
+        self._clock = clock
+
+    def get(self, key: str) -> str | None:
+        """有効な記録を返す（期限切れ・未記録は None）."""
+        record = self._read(key)
+        if record is None or record[1] <= self._clock():
+            return None
+        return record[0]
+
+    def reserve(self, key: str, marker: str) -> bool:
+        """予約ファイルを原子的に作成する（期限切れの記録は削除して 1 度だけ再試行する）."""
+        for _ in range(2):
+            temporary = self._write_temporary(marker, self._reservation_seconds)
+            try:
+                os.link(temporary, self._path(key))
+                return True
+            except FileExistsError:
+                if self.get(key) is not None:
+                    return False
+                # 期限切れの記録を削除してから予約し直す。
+                self._path(key).unlink(missing_ok=True)
+            finally:
+                temporary.unlink(missing_ok=True)
+        return False
+
+    def complete(self, key: str, outcome: str) -> None:
+        """結果を書き込んだ一時ファイルで記録を置き換える."""
+        os.replace(self._write_temporary(outcome, self._ttl_seconds), self._path(key))
+
+    def release(self, key: str) -> None:
+        """記録ファイルを削除する."""
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """キーに対応する記録ファイルのパスを返す."""
+        return self._directory / f"{key}.json"
+
+    def _write_temporary(self, state: str, lifetime_seconds: float) -> Path:
+        """記録の内容を一時ファイルへ書き込み、そのパスを返す."""
+        temporary = self._directory / f".{uuid.uuid4().hex}.tmp"
+        temporary.write_text(
+            json.dumps({"state": state, "expires_at": self._clock() + lifetime_seconds}),
+            encoding="utf-8",
+        )
+        return temporary
+
+    def _read(self, key: str) -> tuple[str, float] | None:
+        """記録ファイルを読み込む.
+
+        Raises:
+            ValueError: 記録ファイルの形式が不正な場合（既定値で補わない）。
+        """
+        try:
+            text = self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as error:
+            raise ValueError("冪等性ストアの記録ファイルが JSON ではありません。") from error
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("state"), str)
+            or not isinstance(data.get("expires_at"), (int, float))
+        ):
+            raise ValueError("冪等性ストアの記録ファイルの形式が不正です。")
+        return data["state"], float(data["expires_at"])
+
+
+class DynamoDbIdempotencyStore(IdempotencyStore):
+    """Amazon DynamoDB の条件付き書き込みを用いる本番用の共有ストア.
+
+    テーブルはパーティションキー `idempotency_key`（文字列）を持ち、`expires_at`
+    （UNIX 秒の数値）を DynamoDB の TTL 属性に設定する。TTL による削除は遅延する
+    ため、読み取り・予約の条件でも失効時刻を判定する。
+
+    依存性逆転とテスト容易性のため、DynamoDB クライアントはコンストラクタで注入可能と
+    する（`SqsContactQueue` と同じ注入方針）。
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        ttl_seconds: float,
+        reservation_seconds: float,
+        dynamodb_client: object | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """DynamoDB テーブルのストアを初期化する.
+
+        Args:
+            table_name: テーブル名（環境変数 `CONTACT_IDEMPOTENCY_TABLE` 由来）。
+            ttl_seconds: 完了した結果の有効秒数。
+            reservation_seconds: 送信中の予約の有効秒数。
+            dynamodb_client: DynamoDB クライアント（依存性注入用）。None の場合は
+                `aws_clients.create_client` で生成する（タイムアウト等は環境変数）。
+            clock: 現在時刻（UNIX 秒）を返す関数。
+        """
+        if dynamodb_client is None:
+            # 接続・タイムアウト・再試行を明示した共通ファクトリで生成する
+            # （boto3 の import はファクトリ内で遅延する）。
+            dynamodb_client = create_client("dynamodb")
+        self._table_name = table_name
+        self._ttl_seconds = ttl_seconds
+        self._reservation_seconds = reservation_seconds
+        self._dynamodb_client = dynamodb_client
+        self._clock = clock
+
+    def get(self, key: str) -> str | None:
+        """強い整合性の読み取りで有効な記録を返す."""
+        response = self._dynamodb_client.get_item(
+            TableName=self._table_name,
+            Key={_DYNAMODB_KEY_ATTRIBUTE: {"S": key}},
+            ConsistentRead=True,
+        )
+        item = response.get("Item")
+        if item is None:
+            return None
+        try:
+            state = item[_DYNAMODB_STATE_ATTRIBUTE]["S"]
+            expires_at = float(item[_DYNAMODB_EXPIRES_ATTRIBUTE]["N"])
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError("冪等性ストアの DynamoDB 項目の形式が不正です。") from error
+        if expires_at <= self._clock():
+            return None
+        return state
+
+    def reserve(self, key: str, marker: str) -> bool:
+        """未記録・期限切れの場合のみ成立する条件付き書き込みで予約する."""
+        now = self._clock()
+        try:
+            self._dynamodb_client.put_item(
+                TableName=self._table_name,
+                Item=self._item(key, marker, now + self._reservation_seconds),
+                ConditionExpression=(
+                    f"attribute_not_exists({_DYNAMODB_KEY_ATTRIBUTE}) "
+                    f"OR {_DYNAMODB_EXPIRES_ATTRIBUTE} <= :now"
+                ),
+                ExpressionAttributeValues={":now": {"N": _epoch_number(now)}},
+            )
+        except Exception as error:
+            if client_error_code(error) == _CONDITIONAL_CHECK_FAILED:
+                return False
+            raise
+        return True
+
+    def complete(self, key: str, outcome: str) -> None:
+        """結果で記録を上書きする."""
+        self._dynamodb_client.put_item(
+            TableName=self._table_name,
+            Item=self._item(key, outcome, self._clock() + self._ttl_seconds),
+        )
+
+    def release(self, key: str) -> None:
+        """記録を削除する."""
+        self._dynamodb_client.delete_item(
+            TableName=self._table_name, Key={_DYNAMODB_KEY_ATTRIBUTE: {"S": key}}
+        )
+
+    @staticmethod
+    def _item(key: str, state: str, expires_at: float) -> dict[str, dict[str, str]]:
+        """DynamoDB の項目（属性値の型付き表現）を組み立てる."""
+        return {
+            _DYNAMODB_KEY_ATTRIBUTE: {"S": key},
+            _DYNAMODB_STATE_ATTRIBUTE: {"S": state},
+            _DYNAMODB_EXPIRES_ATTRIBUTE: {"N": _epoch_number(expires_at)},
+        }
+
+
+def _epoch_number(seconds: float) -> str:
+    """UNIX 秒を DynamoDB の数値（TTL 属性は整数秒）へ変換する（切り上げ）."""
+    return str(int(-(-seconds // 1)))
+
+
+class TieredIdempotencyStore(IdempotencyStore):
+    """インメモリ LRU を共有ストアの前段に置く冪等性ストア.
+
+    完了した結果はこの実行環境が記録したものをインメモリに保持し、同じコンテナへの
+    重複は共有ストアへの往復なしで応答する。予約は並行する別コンテナと競合するため、
+    常に共有ストアの条件付き書き込みで行う。
+    """
+
+    def __init__(self, local: MemoryIdempotencyStore, shared: IdempotencyStore) -> None:
+        """前段・共有ストアを保持する.
+
+        Args:
+            local: 実行環境内の LRU（完了した結果のみを保持する）。
+            shared: 実行環境を跨いで共有するストア。
+        """
+        self._local = local
+        self._shared = shared
+
+    def get(self, key: str) -> str | None:
+        """インメモリの結果を優先し、無ければ共有ストアを参照する."""
+        state = self._local.get(key)
+        if state is not None:
+            return state
+        return self._shared.get(key)
+
+    def reserve(self, key: str, marker: str) -> bool:
+        """共有ストアで予約する."""
+        return self._shared.reserve(key, marker)
+
+    def complete(self, key: str, outcome: str) -> None:
+        """共有ストアへ記録したうえでインメモリにも保持する."""
+        self._shared.complete(key, outcome)
+        self._local.complete(key, outcome)
+
+    def release(self, key: str) -> None:
+        """双方の記録を削除する."""
+        self._local.release(key)
+        self._shared.release(key)
@@ -0,0 +1,75 @@
+"""Email_Sender（キュー投入による非同期送信）実装モジュール.
+
+ドメイン層の抽象ポート `contact_function.domain.ports.EmailSender` を、SES へ直送する
+代わりに問い合わせキュー（`ContactQueue`）へ投入する形で実装する。HTTP 経路は
+キュー投入の完了をもって受付 ID を返し、ユースケースは `Accepted`（HTTP 202）を
+返す。実際の SES 送信はドレインワーカー（`contact_function.worker`）が後段で行う。
+
+設計上の遵守事項:
+    - キュー投入に失敗した場合は例外を握りつぶさず呼び出し元へ伝播する。ユースケースは
+      これを `SendFailed`（HTTP 500）として扱い、受け付けたことにしない
+      （フォールバック禁止、出典: design.md DM3, Error Handling、requirements.md R6-4）。
+    - ログには受付 ID のみを出力し、問い合わせ内容・アドレスを出力しない
+      （GDPR、出典: requirements.md R9-5）。
+    - Django・handler 層に依存しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import logging
+import uuid
+from collections.abc import Callable
+
+from contact_function.adapters.contact_queue import ContactQueue, QueuedContact
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import EmailSender
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md「logger = logging.getLogger(__name__)」）
+logger = logging.getLogger(__name__)
+
+
+def _new_acceptance_id() -> str:
+    """推測困難な受付 ID（UUID4 の 16 進表記）を生成する."""
+    return uuid.uuid4().hex
+
+
+class QueueingEmailSender(EmailSender):
+    """問い合わせをキューへ投入し、受付 ID を返す Email_Sender."""
+
+    def __init__(
+        self,
+        queue: ContactQueue,
+        id_factory: Callable[[], str] = _new_acceptance_id,
+    ) -> None:
+        """キュー投入型の送信アダプタを初期化する.
+
+        Args:
+            queue: 投入先の問い合わせキュー。
+            id_factory: 受付 ID の生成関数（テストで固定値を注入するため）。
+        """
+        self._queue = queue
+        self._id_factory = id_factory
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> str:
+        """問い合わせをキューへ投入し、受付 ID を返す.
+
+        Args:
+            payload: 送信対象の問い合わせ内容（検証済み）。
+            from_addr: 送信元アドレス（設定値由来）。
+            to_addr: 宛先アドレス（設定値由来）。
+
+        Returns:
+            str: 受付 ID。
+
+        Raises:
+            Exception: キュー投入に失敗した場合（握りつぶさず伝播する）。
+        """
+        acceptance_id = self._id_factory()
+        self._queue.enqueue(
+            QueuedContact(
+                acceptance_id=acceptance_id,
+                payload=payload,
+                from_addr=from_addr,
+                to_addr=to_addr,
+            )
+        )
+        logger.info("問い合わせをキューへ投入しました（受付 ID: %s）", acceptance_id)
+        return acceptance_id
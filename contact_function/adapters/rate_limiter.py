@@ -0,0 +1,261 @@
+"""クライアント単位のレート制限（トークンバケットと `ports.RateLimiter` の実装）モジュール.
+
+Contact_Function のバースト保護は API Gateway のステージスロットリングと
+アカウント同時実行数の上限（`template.yaml`）のみであり、1 つの送信元 IP が同時実行枠を
+占有すると正当な利用者の問い合わせが処理されない。handler はボディ解析の前に本モジュールの
+`RateLimiter` で送信元 IP（`requestContext.identity.sourceIp`）ごとのトークンを 1 つ
+取得し、取得できない POST を HTTP 429（`Retry-After` 付き）で拒否する。
+
+トークンバケット（`TokenBucketPolicy`）:
+    - バケットは最大 `capacity` 個のトークンを持ち、`refill_per_second` の速度で
+      補充される。1 リクエストで 1 トークンを消費し、不足時は次の 1 トークンが補充
+      されるまでの秒数を `Retry-After` とする。
+    - 初めて見るクライアントは満杯のバケットから始まる（短時間の連続送信は
+      `capacity` まで許可する）。
+
+実装:
+    - `MemoryRateLimiter`: 実行環境（コンテナ）内のバケット。保持するクライアント数は
+      LRU で上限を設ける（送信元を散らした攻撃でメモリを増やさない）。
+    - `DynamoDbRateLimiter`: 実行環境を跨いで共有するバケット（Amazon DynamoDB の
+      楽観的な条件付き書き込み。boto3 は遅延 import）。キーはデプロイごとの秘密鍵による
+      送信元 IP の HMAC-SHA256 とし、IP アドレスそのものは保存しない。IPv4 の空間は
+      総当たりできるため、鍵なしのハッシュでは IP を復元できてしまう
+      （GDPR、出典: requirements.md R9-5）。
+
+フォールバック禁止（出典: 第三原則3）: 共有ストアの障害は例外のまま伝播する
+（制限を黙って無効化しない）。Django・handler 層に依存しない。
+"""
+
+import hashlib
+import hmac
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from contact_function.adapters.aws_clients import client_error_code, create_client
+from contact_function.domain.ports import RateLimitDecision, RateLimiter
+
+# DynamoDB テーブルの属性名（パーティションキー・残りトークン・更新時刻・TTL 属性）。
+_DYNAMODB_KEY_ATTRIBUTE = "client_key"
+_DYNAMODB_TOKENS_ATTRIBUTE = "tokens"
+_DYNAMODB_UPDATED_ATTRIBUTE = "updated_at"
+_DYNAMODB_EXPIRES_ATTRIBUTE = "expires_at"
+
+# 条件付き書き込みの条件不成立を表す DynamoDB のエラーコード。
+_CONDITIONAL_CHECK_FAILED = "ConditionalCheckFailedException"
+
+# 同じクライアントの並行更新で条件が成立しなかった場合の最大試行回数。
+_DYNAMODB_MAX_ATTEMPTS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class TokenBucketPolicy:
+    """トークンバケットの容量と補充速度.
+
+    Attributes:
+        capacity: バケットの最大トークン数（連続して許可する最大リクエスト数）。
+        refill_per_second: 1 秒あたりに補充するトークン数。
+    """
+
+    capacity: float
+    refill_per_second: float
+
+    def __post_init__(self) -> None:
+        """容量・補充速度が正であることを検証する.
+
+        Raises:
+            ValueError: 容量が 1 未満、または補充速度が 0 以下の場合。
+        """
+        if self.capacity < 1:
+            raise ValueError("capacity は 1 以上である必要があります。")
+        if self.refill_per_second <= 0:
+            raise ValueError("refill_per_second は 0 より大きい必要があります。")
+
+
+def take_token(
+    tokens: float, updated_at: float, now: float, policy: TokenBucketPolicy
+) -> tuple[float, RateLimitDecision]:
+    """経過時間分を補充したうえで 1 トークンの取得を試みる（純粋関数）.
+
+    Args:
+        tokens: 前回更新時点の残りトークン数。
+        updated_at: 前回更新の時刻（秒）。
+        now: 現在時刻（秒）。
+        policy: 容量と補充速度。
+
+    Returns:
+        tuple[float, RateLimitDecision]: 更新後の残りトークン数と判定。
+    """
+    elapsed = max(0.0, now - updated_at)
+    available = min(policy.capacity, tokens + elapsed * policy.refill_per_second)
+    if available >= 1.0:
+        return available - 1.0, RateLimitDecision(allowed=True)
+    wait_seconds = (1.0 - available) / policy.refill_per_second
+    return available, RateLimitDecision(allowed=False, retry_after_seconds=wait_seconds)
+
+
+class MemoryRateLimiter(RateLimiter):
+    """実行環境内で保持するトークンバケット（クライアント数は LRU で上限を設ける）.
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、排他制御を持たない。
+    """
+
+    def __init__(
+        self,
+        policy: TokenBucketPolicy,
+        max_clients: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """空のバケット群を作る.
+
+        Args:
+            policy: 容量と補充速度。
+            max_clients: 保持する最大クライアント数（超えると最も長く参照されていない
+                クライアントのバケットを破棄する）。
+            clock: 現在時刻（秒）を返す関数（テスト用に注入可能）。
+
+        Raises:
+            ValueError: `max_clients` が 1 未満の場合。
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients は 1 以上である必要があります。")
+        self._policy = policy
+        self._max_clients = max_clients
+        self._clock = clock
+        # クライアント → (残りトークン数, 更新時刻)。末尾ほど最近参照されたクライアント。
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, client_key: str) -> RateLimitDecision:
+        """バケットを補充・消費し、判定を返す."""
+        now = self._clock()
+        tokens, updated_at = self._buckets.get(client_key, (self._policy.capacity, now))
+        remaining, decision = take_token(tokens, updated_at, now, self._policy)
+        self._buckets[client_key] = (remaining, now)
+        self._buckets.move_to_end(client_key)
+        while len(self._buckets) > self._max_clients:
+            self._buckets.popitem(last=False)
+        return decision
+
+    def __len__(self) -> int:
+        """保持中のクライアント数を返す."""
+        return len(self._buckets)
+
+
+class DynamoDbRateLimiter(RateLimiter):
+    """Amazon DynamoDB で実行環境を跨いで共有するトークンバケット.
+
+    テーブルはパーティションキー `client_key`（文字列）を持ち、`expires_at`
+    （UNIX 秒の数値。バケットが満杯に戻る時刻）を DynamoDB の TTL 属性に設定する。
+    更新は読み取った `updated_at` を条件とする楽観的な書き込みで行い、並行する更新と
+    競合した場合は読み直して再試行する。
+
+    依存性逆転とテスト容易性のため、DynamoDB クライアントはコンストラクタで注入可能と
+    する（`SqsContactQueue` と同じ注入方針）。
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        policy: TokenBucketPolicy,
+        key_secret: bytes,
+        dynamodb_client: object | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """DynamoDB テーブルのバケットを初期化する.
+
+        Args:
+            table_name: テーブル名（環境変数 `CONTACT_RATE_LIMIT_TABLE` 由来）。
+            policy: 容量と補充速度。
+            key_secret: バケットのキー（送信元 IP の HMAC）に用いる秘密鍵
+                （環境変数 `CONTACT_RATE_LIMIT_KEY` 由来）。
+            dynamodb_client: DynamoDB クライアント（依存性注入用）。None の場合は
+                `aws_clients.create_client` で生成する（タイムアウト等は環境変数）。
+            clock: 現在時刻（UNIX 秒）を返す関数。
+        """
+        if dynamodb_client is None:
+            # 接続・タイムアウト・再試行を明示した共通ファクトリで生成する
+            # （boto3 の import はファクトリ内で遅延する）。
+            dynamodb_client = create_client("dynamodb")
+        self._table_name = table_name
+        self._policy = policy
+        self._key_secret = key_secret
+        self._dynamodb_client = dynamodb_client
+        self._clock = clock
+
+    def acquire(self, client_key: str) -> RateLimitDecision:
+        """バケットを読み取り、条件付き書き込みで補充・消費する.
+
+        競合が続いて更新できない場合は、同じクライアントからの並行リクエストが集中して
+        いるとみなし拒否する（次のトークンの補充までの秒数を返す）。
+        """
+        key = {_DYNAMODB_KEY_ATTRIBUTE: {"S": _hash_client_key(self._key_secret, client_key)}}
+        for _ in range(_DYNAMODB_MAX_ATTEMPTS):
+            now = self._clock()
+            item = self._dynamodb_client.get_item(
+                TableName=self._table_name, Key=key, ConsistentRead=True
+            ).get("Item")
+            if item is None:
+                tokens, updated_at, condition = self._policy.capacity, now, None
+            else:
+                tokens, updated_at = _read_bucket(item)
+                condition = item[_DYNAMODB_UPDATED_ATTRIBUTE]["N"]
+            remaining, decision = take_token(tokens, updated_at, now, self._policy)
+            if self._write(key, remaining, now, condition):
+                return decision
+        return RateLimitDecision(
+            allowed=False, retry_after_seconds=1.0 / self._policy.refill_per_second
+        )
+
+    def _write(
+        self,
+        key: dict[str, dict[str, str]],
+        tokens: float,
+        now: float,
+        expected_updated_at: str | None,
+    ) -> bool:
+        """読み取り時点から更新されていない場合のみバケットを書き込む."""
+        refill_seconds = (self._policy.capacity - tokens) / self._policy.refill_per_second
+        item = dict(
+            key,
+            **{
+                _DYNAMODB_TOKENS_ATTRIBUTE: {"N": repr(tokens)},
+                _DYNAMODB_UPDATED_ATTRIBUTE: {"N": repr(now)},
+                _DYNAMODB_EXPIRES_ATTRIBUTE: {"N": str(math.ceil(now + refill_seconds))},
+            },
+        )
+        if expected_updated_at is None:
+            condition = {"ConditionExpression": f"attribute_not_exists({_DYNAMODB_KEY_ATTRIBUTE})"}
+        else:
+            condition = {
+                "ConditionExpression": f"{_DYNAMODB_UPDATED_ATTRIBUTE} = :expected",
+                "ExpressionAttributeValues": {":expected": {"N": expected_updated_at}},
+            }
+        try:
+            self._dynamodb_client.put_item(TableName=self._table_name, Item=item, **condition)
+        except Exception as error:
+            if client_error_code(error) == _CONDITIONAL_CHECK_FAILED:
+                return False
+            raise
+        return True
+
+
+def _hash_client_key(key_secret: bytes, client_key: str) -> str:
+    """クライアントの識別子（IP）を保存用のハッシュへ変換する."""
+    return hmac.new(key_secret, client_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _read_bucket(item: dict[str, dict[str, str]]) -> tuple[float, float]:
+    """DynamoDB の項目から残りトークン数と更新時刻を読み取る.
+
+    Raises:
+        ValueError: 項目の形式が不正な場合（既定値で補わない）。
+    """
+    try:
+        return (
+            float(item[_DYNAMODB_TOKENS_ATTRIBUTE]["N"]),
+            float(item[_DYNAMODB_UPDATED_ATTRIBUTE]["N"]),
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise ValueError("レート制限の DynamoDB 項目の形式が不正です。") from error
@@ -0,0 +1,332 @@
+"""SES 送信の再試行・サーキットブレーカー（`ResilientEmailSender`）モジュール.
+
+`SesEmailSender` を包み、SES の一時的な失敗（スロットリング・一時障害）と恒久的な
+失敗（未検証 identity・権限不足・メッセージ拒否等）を区別して扱う。
+
+構成:
+    - `classify_send_error`: botocore の例外を `throttling` / `transient` /
+      `permanent` に分類する。エラーコードで判定し、接続・読み取りタイムアウト等の
+      通信失敗は `transient` とする。
+    - 再試行: `throttling` / `transient` のみを、上限付き・フルジッタの指数
+      バックオフで再試行する。再試行は、待機と 1 回の試行の最長時間（SES クライアントの
+      接続・読み取りタイムアウト × botocore の試行回数）が呼び出しの期限
+      （`InvocationDeadline`。Lambda コンテキストの残り時間から安全余裕を引いた時刻）
+      内に収まる場合に限る（期限を越えて送信が続くと、利用者には 504 が返りながら
+      メールは届き得る）。
+    - `CircuitBreaker`: 一時的な失敗が連続してしきい値に達すると開放し、クールダウンの
+      間は SES を呼ばずに即時に失敗させる（劣化中の SES に Lambda の実行時間を
+      費やさない）。クールダウン後は 1 回の試行を許し（半開）、成功で閉じる。
+
+一時的な失敗で送信できなかった場合は、ドメインの `SendTemporarilyUnavailable`
+（再試行までの秒数付き）を送出し、handler は 503 と `Retry-After` で応答する。
+恒久的な失敗は再試行せず、元の例外のまま伝播する（フォールバック禁止、出典:
+第三原則3、requirements.md R6-4）。
+
+ブレーカーは本インスタンスが保持し、インスタンスは composition root
+（`contact_function.composition.ContactDependencies`）が実行環境単位で再利用する
+ため、状態はウォーム呼び出し間で維持される。Lambda の実行環境は同時に 1 呼び出し
+のみを処理するため排他制御は持たない。Django・handler 層に依存しない。
+"""
+
+import logging
+import random
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+from contact_function.adapters.aws_clients import client_error_code
+from contact_function.adapters.contact_digest import DigestEmailSender
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import EmailSender, SendTemporarilyUnavailable
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md「logger = logging.getLogger(__name__)」）
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# 失敗の分類（`classify_send_error` の戻り値）。
+ERROR_THROTTLING = "throttling"
+ERROR_TRANSIENT = "transient"
+ERROR_PERMANENT = "permanent"
+
+# SES / AWS 共通のスロットリングを表すエラーコード。
+_THROTTLING_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "RequestThrottled",
+        "SlowDown",
+    }
+)
+# 再試行で回復し得るサーバ側の一時障害を表すエラーコード。
+_TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "InternalFailure",
+        "InternalServerError",
+        "ServiceUnavailable",
+        "ServiceUnavailableException",
+        "RequestTimeout",
+        "RequestTimeoutException",
+    }
+)
+# 通信失敗（接続・読み取りのタイムアウト、接続断）を表す botocore の例外クラス名。
+_TRANSIENT_BOTOCORE_ERRORS = frozenset(
+    {
+        "ConnectTimeoutError",
+        "ReadTimeoutError",
+        "EndpointConnectionError",
+        "ConnectionClosedError",
+    }
+)
+
+# Lambda の残り時間から差し引く安全余裕（応答の組み立てと API Gateway の
+# 29 秒の統合タイムアウトとの差を吸収する）。
+_DEADLINE_SAFETY_MARGIN_SECONDS = 2.0
+# 1 回の試行に要し得る最長秒数の既定値（composition root は AWS クライアントの
+# タイムアウト設定から求めた値を渡す）。
+_DEFAULT_ATTEMPT_SECONDS = 1.0
+
+
+def classify_send_error(error: BaseException) -> str:
+    """送信時の例外を `throttling` / `transient` / `permanent` に分類する.
+
+    Args:
+        error: `SesEmailSender` が送出した例外。
+
+    Returns:
+        str: `ERROR_THROTTLING` / `ERROR_TRANSIENT` / `ERROR_PERMANENT` のいずれか。
+    """
+    code = client_error_code(error)
+    if code is not None:
+        if code in _THROTTLING_ERROR_CODES:
+            return ERROR_THROTTLING
+        if code in _TRANSIENT_ERROR_CODES:
+            return ERROR_TRANSIENT
+        return ERROR_PERMANENT
+    if any(cls.__name__ in _TRANSIENT_BOTOCORE_ERRORS for cls in type(error).__mro__):
+        return ERROR_TRANSIENT
+    return ERROR_PERMANENT
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """再試行の上限とバックオフ.
+
+    Attributes:
+        max_attempts: 初回を含む最大試行回数。
+        base_delay_seconds: バックオフの基準秒数（試行ごとに 2 倍）。
+        max_delay_seconds: 1 回の待機の上限秒数。
+        attempt_seconds: 1 回の試行に要し得る最長秒数。期限までに待機とこの時間が
+            収まらなければ再試行しない。
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 2.0
+    attempt_seconds: float = _DEFAULT_ATTEMPT_SECONDS
+
+    def delay(self, attempt: int, rand: Callable[[], float]) -> float:
+        """`attempt` 回目（1 始まり）の失敗後の待機秒数を返す（フルジッタ）."""
+        cap = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempt - 1)))
+        return cap * rand()
+
+
+class InvocationDeadline:
+    """現在の呼び出しの期限（単調時計上の時刻）.
+
+    Lambda エントリポイントが呼び出しごとに `start` し、再試行の可否判定に用いる。
+    コンテキストを持たない実行（ローカル・テスト）では期限なしとする。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """期限なしで初期化する."""
+        self._clock = clock
+        self._deadline: float | None = None
+
+    def start(self, context: object) -> None:
+        """Lambda コンテキストの残り時間から期限を設定する.
+
+        Args:
+            context: Lambda コンテキスト（`get_remaining_time_in_millis` を持つ）。
+                持たない場合は期限なしとする。
+        """
+        remaining = getattr(context, "get_remaining_time_in_millis", None)
+        if remaining is None:
+            self._deadline = None
+            return
+        self._deadline = (
+            self._clock() + remaining() / 1000.0 - _DEADLINE_SAFETY_MARGIN_SECONDS
+        )
+
+    def remaining_seconds(self) -> float | None:
+        """期限までの残り秒数を返す（期限なしは None）."""
+        if self._deadline is None:
+            return None
+        return self._deadline - self._clock()
+
+
+class CircuitOpenError(SendTemporarilyUnavailable):
+    """サーキットブレーカーが開放中のため送信を試みなかったことを表す例外."""
+
+
+class CircuitBreaker:
+    """連続した一時的失敗で開放し、クールダウン後に半開で 1 回試すブレーカー."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cool_down_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """ブレーカーを閉じた状態で初期化する.
+
+        Args:
+            failure_threshold: 開放する連続失敗回数。
+            cool_down_seconds: 開放してから試行を再開するまでの秒数。
+            clock: 単調時計（テストで差し替えるため）。
+        """
+        self._failure_threshold = failure_threshold
+        self._cool_down_seconds = cool_down_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> str:
+        """`closed` / `open` / `half_open` のいずれかを返す."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self._cool_down_seconds:
+            return "open"
+        return "half_open"
+
+    def before_call(self) -> None:
+        """呼び出し前に状態を確認する.
+
+        Raises:
+            CircuitOpenError: 開放中（クールダウン中）の場合。
+        """
+        if self.state == "open":
+            raise CircuitOpenError(
+                "SES の一時的な失敗が続いているため送信を一時停止しています。",
+                retry_after_seconds=self.retry_after_seconds(),
+            )
+
+    def record_success(self) -> None:
+        """成功を記録し、ブレーカーを閉じる."""
+        if self._opened_at is not None:
+            logger.info("SES 送信のサーキットブレーカーを閉じました")
+        self._consecutive_failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """一時的な失敗を記録し、しきい値に達したら（半開中は即時に）開放する."""
+        self._consecutive_failures += 1
+        if self.state == "half_open" or self._consecutive_failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+            logger.error(
+                "SES 送信のサーキットブレーカーを開放しました（連続失敗 %d 回、%.0f 秒停止）",
+                self._consecutive_failures,
+                self._cool_down_seconds,
+            )
+
+    def retry_after_seconds(self) -> float:
+        """開放中であればクールダウン終了までの秒数、それ以外は 0 を返す."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._cool_down_seconds - (self._clock() - self._opened_at))
+
+
+class ResilientEmailSender(EmailSender, DigestEmailSender):
+    """一時的な失敗を期限内で再試行し、劣化時は遮断する Email_Sender."""
+
+    def __init__(
+        self,
+        inner: EmailSender,
+        breaker: CircuitBreaker,
+        deadline: InvocationDeadline,
+        policy: RetryPolicy = RetryPolicy(),
+        sleep: Callable[[float], None] = time.sleep,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """包む送信アダプタと再試行・遮断の設定で初期化する.
+
+        Args:
+            inner: 実際に送信する Email_Sender（集約送信時は `DigestEmailSender` も実装）。
+            breaker: 実行環境内で共有するサーキットブレーカー。
+            deadline: 現在の呼び出しの期限。
+            policy: 再試行の上限とバックオフ。
+            sleep: 待機関数（テストで差し替えるため）。
+            rand: 0 以上 1 未満の乱数を返す関数（ジッタ用。テストで固定するため）。
+        """
+        self._inner = inner
+        self._breaker = breaker
+        self._deadline = deadline
+        self._policy = policy
+        self._sleep = sleep
+        self._rand = rand
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+        """1 件を送信する（一時的な失敗は期限内で再試行する）.
+
+        Raises:
+            SendTemporarilyUnavailable: 遮断中、または期限・試行回数内に送信できなかった場合。
+            Exception: 恒久的な失敗（再試行せず元の例外のまま伝播する）。
+        """
+        self._call(lambda: self._inner.send(payload, from_addr, to_addr))
+
+    def send_digest(
+        self, payloads: Sequence[ContactPayload], from_addr: str, to_addr: str
+    ) -> None:
+        """集約メールを送信する（再試行・遮断は `send` と同じ）.
+
+        Raises:
+            TypeError: 包んでいる送信アダプタが集約送信に対応しない場合。
+        """
+        if not isinstance(self._inner, DigestEmailSender):
+            raise TypeError("包んでいる送信アダプタは集約送信に対応していません。")
+        inner = self._inner
+        self._call(lambda: inner.send_digest(payloads, from_addr, to_addr))
+
+    def _call(self, operation: Callable[[], _T]) -> _T:
+        """ブレーカーを確認し、一時的な失敗を再試行しながら `operation` を実行する."""
+        attempt = 0
+        while True:
+            self._breaker.before_call()
+            attempt += 1
+            try:
+                result = operation()
+            except Exception as error:
+                kind = classify_send_error(error)
+                if kind == ERROR_PERMANENT:
+                    # 恒久的な失敗は SES の劣化ではないためブレーカーに数えない。
+                    raise
+                self._breaker.record_failure()
+                delay = self._policy.delay(attempt, self._rand)
+                if not self._may_retry(attempt, delay):
+                    raise SendTemporarilyUnavailable(
+                        f"SES の一時的な失敗（{kind}）により期限内に送信できませんでした。",
+                        retry_after_seconds=max(
+                            self._breaker.retry_after_seconds(),
+                            self._policy.max_delay_seconds,
+                        ),
+                    ) from error
+                logger.warning(
+                    "SES の一時的な失敗（%s）のため %.3f 秒後に再試行します（%d 回目）",
+                    kind,
+                    delay,
+                    attempt,
+                )
+                self._sleep(delay)
+                continue
+            self._breaker.record_success()
+            return result
+
+    def _may_retry(self, attempt: int, delay: float) -> bool:
+        """試行回数・ブレーカー・期限から再試行の可否を判定する."""
+        if attempt >= self._policy.max_attempts or self._breaker.state == "open":
+            return False
+        remaining = self._deadline.remaining_seconds()
+        return remaining is None or remaining >= delay + self._policy.attempt_seconds
@@ -27,13 +27,17 @@ Interfaces > C3」依存規則, DM3、requirements.md R4-6）。SMTP を廃し S
   - boto3 のライセンスは Apache License 2.0（環境内 `importlib.metadata` により
     `License: Apache-2.0` を確認済み、boto3 1.42.63）。Apache-2.0 は本用途での
     利用・再配布を許諾する。
+  - boto3 / botocore の import はクライアント生成・API 呼び出しの直前まで遅延する。
+    handler の import（OPTIONS プリフライトや Origin 拒否のみで終わる呼び出しを
+    含む）で botocore 全体をロードしないため（コールドスタートの import 時間削減、
+    予算は `scripts/measurement/import_time_budget.json`）。
 """
 
 import logging
+from collections.abc import Sequence
 
-import boto3  # AWS SDK for Python（ライセンス: Apache License 2.0、着手時に確認済み）
-from botocore.exceptions import BotoCoreError, ClientError
-
+from contact_function.adapters.aws_clients import create_client
+from contact_function.adapters.contact_digest import DigestEmailSender
 from contact_function.domain.contact_payload import ContactPayload
 from contact_function.domain.ports import EmailSender
 
@@ -47,8 +51,11 @@ _SES_SERVICE_NAME = "sesv2"
 # メール本文の文字セット。日本語（多バイト）を正しく送信するため UTF-8 を明示する。
 _CHARSET_UTF8 = "UTF-8"
 
+# 集約メール本文で問い合わせ同士を区切る行。
+_DIGEST_SEPARATOR = "\n\n" + "-" * 40 + "\n\n"
+
 
-class SesEmailSender(EmailSender):
+class SesEmailSender(EmailSender, DigestEmailSender):
     """Amazon SES v2 `SendEmail` で問い合わせメールを送信する `EmailSender` 具象実装.
 
     ドメイン層の抽象ポート `EmailSender` を実装する（出典: design.md DM3, C4、
@@ -64,9 +71,10 @@ class SesEmailSender(EmailSender):
         """SES 送信アダプタを初期化する.
 
         Args:
-            ses_client: SES v2 クライアント（依存性注入用）。None の場合は boto3 で
-                生成する。リージョンは実行環境（Lambda の `AWS_REGION` 等）から boto3 が
-                解決するため本コードでは指定しない（ハードコード回避、出典: design.md C4、
+            ses_client: SES v2 クライアント（依存性注入用）。None の場合は
+                `aws_clients.create_client` で生成する（タイムアウト等は環境変数）。
+                リージョンは実行環境（Lambda の `AWS_REGION` 等）から boto3 が解決する
+                ため本コードでは指定しない（ハードコード回避、出典: design.md C4、
                 requirements.md R6-7）。
 
         Returns:
@@ -74,9 +82,11 @@ class SesEmailSender(EmailSender):
         """
         # クライアントは注入値を優先し、無ければ boto3 で生成する。
         # クライアント生成自体は認証情報を要求しない（実際の API 呼び出し時に必要）。
-        self._ses_client = (
-            ses_client if ses_client is not None else boto3.client(_SES_SERVICE_NAME)
-        )
+        if ses_client is None:
+            # 接続・タイムアウト・再試行を明示した共通ファクトリで生成する
+            # （boto3 の import はファクトリ内で遅延する）。
+            ses_client = create_client(_SES_SERVICE_NAME)
+        self._ses_client = ses_client
 
     def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
         """検証済みの Contact_Payload を Amazon SES v2 でメール送信する.
@@ -102,6 +112,48 @@ class SesEmailSender(EmailSender):
         # （氏名・メール・電話・本文の順）と整合させる（出典: portfolio/forms.py, E-5）。
         subject = self._build_subject(payload)
         body = self._build_body(payload)
+        self._send_text(subject, body, from_addr, to_addr)
+
+        # 送信成功。個人データを含めず、成功事実のみを記録する（出典: R9-5）。
+        logger.info("問い合わせメールを SES で送信しました")
+
+    def send_digest(
+        self, payloads: Sequence[ContactPayload], from_addr: str, to_addr: str
+    ) -> None:
+        """複数の問い合わせを 1 通の集約メールとして SES v2 で送信する.
+
+        ダイジェストモードのドレインワーカーから呼ばれる（出典:
+        `contact_function/adapters/contact_digest.py`）。本文は各問い合わせの本文
+        （`send` と同じ構成）を受信順に番号付きで連結する。
+
+        Args:
+            payloads: まとめる問い合わせ内容（1 件以上、受信順）。
+            from_addr: 送信元アドレス（設定値由来）。
+            to_addr: 宛先アドレス（設定値由来）。
+
+        Raises:
+            ValueError: `payloads` が空の場合。
+            Exception: SES 送信に失敗した場合（`send` と同じく明示ログ記録の上で伝播する）。
+        """
+        if not payloads:
+            raise ValueError("集約メールにまとめる問い合わせが 1 件もありません。")
+        count = len(payloads)
+        subject = f"お問い合わせフォームからの送信（{count} 件のまとめ）"
+        body = _DIGEST_SEPARATOR.join(
+            f"[{index}/{count}]\n{self._build_body(payload)}"
+            for index, payload in enumerate(payloads, start=1)
+        )
+        self._send_text(subject, body, from_addr, to_addr)
+        logger.info("問い合わせ %d 件を 1 通の集約メールで送信しました", count)
+
+    def _send_text(self, subject: str, body: str, from_addr: str, to_addr: str) -> None:
+        """件名・テキスト本文を SES v2 `SendEmail`（Simple 形式）で送信する.
+
+        Raises:
+            ClientError, BotoCoreError: SES 送信に失敗した場合（明示ログ記録の上で伝播する）。
+        """
+        # 送信失敗の判定に用いる例外型は送信時に import する（import 時間削減）。
+        from botocore.exceptions import BotoCoreError, ClientError
 
         try:
             # SES v2 `SendEmail` の Simple 形式で送信する。
@@ -125,9 +177,6 @@ class SesEmailSender(EmailSender):
             # （フォールバック禁止、出典: requirements.md R6-4, R6-5, R12-5）。
             raise
 
-        # 送信成功。個人データを含めず、成功事実のみを記録する（出典: R9-5）。
-        logger.info("問い合わせメールを SES で送信しました")
-
     def _build_subject(self, payload: ContactPayload) -> str:
         """Contact_Payload から日本語のメール件名を組み立てる.
 
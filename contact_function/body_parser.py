@@ -0,0 +1,197 @@
+"""Contact_Function のリクエストボディ解析（上限付き）モジュール.
+
+API Gateway プロキシ統合イベントの `body` を問い合わせ入力（フィールド名 → 値の
+文字列辞書）へ変換する。従来の handler 実装はボディ全体を base64 復号・UTF-8
+デコードしてから `json.loads` / `parse_qsl` にかけ、項目ごとの最大文字数
+（`domain.validators.MAX_FIELD_LENGTHS`、例: `message` は 5000 文字）の超過は
+その後の入力検証で初めて拒否していた。数 MB のボット投稿も全量を復号・解析して
+いたため、本モジュールは解析の前に上限を適用する。
+
+上限（`BodyLimits`）:
+    - 最大バイト数: 4 項目の最大文字数の合計 × 1 文字あたりの最悪の符号化長
+      （UTF-8 の 4 バイトを form-encoded で `%XX` 表記した 12 バイト。JSON の
+      サロゲートペアの `\\uXXXX\\uXXXX` も 12 バイト）に、項目名・区切り・
+      ハニーポット等の余裕を加えた値。正当な最大長の入力は必ず受理する。
+    - 最大フィールド数: 4 項目とハニーポットに余裕を加えた値。
+
+上限の適用（全量を実体化しない）:
+    - 非 base64 のボディは文字数（≦ バイト数）で O(1) に判定する。
+    - base64 のボディは一定長ずつ復号し、復号済みの長さが上限を超えた時点で
+      打ち切る（残りは復号しない）。
+    - フィールド数は form-encoded では区切り文字の数、JSON ではオブジェクトの
+      要素数（`object_pairs_hook`）で判定する。
+    超過は `PayloadTooLarge` として送出し、handler は HTTP 413 を返す。
+
+採用形式（handler のモジュール docstring と同じ）:
+    - Content-Type が `application/json` を含む場合は JSON オブジェクトとして
+      解釈し、キー・値がともに文字列であることを要求する（ゼロトラスト）。
+    - それ以外は form-encoded として解釈する（現行 Django フォーム互換、出典: E-5）。
+
+フォールバック禁止（出典: 第三原則3、requirements.md R6-4, R12-5）:
+    - 不正なボディは `ValueError`、上限超過は `PayloadTooLarge` で明示的に失敗させ、
+      切り詰めて受理しない。
+    - Django を import しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import base64
+import binascii
+import json
+import re
+from dataclasses import dataclass
+from urllib.parse import parse_qsl
+
+from contact_function.domain.validators import MAX_FIELD_LENGTHS
+
+# JSON ボディ判定に用いる Content-Type の部分文字列。
+_CONTENT_TYPE_JSON = "application/json"
+
+# 1 文字あたりの最悪の符号化長（UTF-8 4 バイト × `%XX` の 3 文字）。
+_WORST_CASE_BYTES_PER_CHAR = 12
+
+# 項目名・区切り・空白・ハニーポット値等のための余裕（バイト）。
+_ENVELOPE_BYTES = 4096
+
+# 受け付ける最大フィールド数（4 項目 + ハニーポット + 将来の補助フィールドの余裕）。
+_MAX_FIELDS = 16
+
+# base64 を 1 回に復号する長さ（4 の倍数。復号後 48 KiB）。
+_BASE64_CHUNK_CHARS = 65536
+
+# base64 のアルファベット以外の文字（従来の `base64.b64decode` と同様に読み飛ばす）。
+_NON_BASE64_CHARS = re.compile(r"[^A-Za-z0-9+/=]")
+
+
+class PayloadTooLarge(Exception):
+    """ボディが上限（バイト数・フィールド数）を超えた場合の例外.
+
+    不正なボディ（`ValueError`、HTTP 400）と区別し、handler は HTTP 413 を返す。
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class BodyLimits:
+    """ボディ解析の上限.
+
+    Attributes:
+        max_bytes: 復号後のボディの最大バイト数（非 base64 は最大文字数）。
+        max_fields: 最大フィールド数。
+    """
+
+    max_bytes: int
+    max_fields: int
+
+
+def _default_limits() -> BodyLimits:
+    """入力検証の最大文字数から既定の上限を導出する."""
+    max_chars = sum(MAX_FIELD_LENGTHS.values())
+    return BodyLimits(
+        max_bytes=max_chars * _WORST_CASE_BYTES_PER_CHAR + _ENVELOPE_BYTES,
+        max_fields=_MAX_FIELDS,
+    )
+
+
+# 既定の上限（入力検証の最大文字数が変わればボディの上限も追従する）。
+DEFAULT_LIMITS = _default_limits()
+
+
+def _decode_base64_bounded(raw_body: str, max_bytes: int) -> bytes:
+    """base64 を一定長ずつ復号し、上限を超えた時点で打ち切る.
+
+    Raises:
+        PayloadTooLarge: 復号済みの長さが `max_bytes` を超えた場合。
+        ValueError: base64 として不正な場合。
+    """
+    decoded = bytearray()
+    carry = ""
+    for start in range(0, len(raw_body), _BASE64_CHUNK_CHARS):
+        chunk = carry + _NON_BASE64_CHARS.sub("", raw_body[start : start + _BASE64_CHUNK_CHARS])
+        usable = len(chunk) - len(chunk) % 4
+        carry = chunk[usable:]
+        try:
+            decoded += base64.b64decode(chunk[:usable], validate=True)
+        except binascii.Error as error:
+            raise ValueError("ボディの base64 復号に失敗しました。") from error
+        if len(decoded) > max_bytes:
+            raise PayloadTooLarge("リクエストボディが上限を超えています。")
+    if carry:
+        # 4 文字に満たない残り（パディング欠落）は従来どおり不正として扱う。
+        raise ValueError("ボディの base64 復号に失敗しました。")
+    return bytes(decoded)
+
+
+def parse_body(
+    raw_body: object,
+    is_base64: bool,
+    content_type: str,
+    limits: BodyLimits = DEFAULT_LIMITS,
+) -> dict[str, str]:
+    """イベントの `body` を上限付きで問い合わせ入力の文字列辞書へ変換する.
+
+    Args:
+        raw_body: イベントの `body`（文字列または None を想定。外部入力）。
+        is_base64: `isBase64Encoded` の値。True の場合は base64 復号する。
+        content_type: 小文字化済みの Content-Type ヘッダ値（無い場合は空文字）。
+        limits: バイト数・フィールド数の上限。
+
+    Returns:
+        dict[str, str]: フィールド名から値への辞書。`body` が無い場合は空辞書。
+
+    Raises:
+        PayloadTooLarge: ボディのバイト数・フィールド数が上限を超える場合
+            （呼び出し元で HTTP 413 に対応付ける）。
+        ValueError: ボディが不正（base64 復号失敗、UTF-8 デコード失敗、JSON 解析
+            失敗、JSON がオブジェクトでない、キー/値が文字列でない）な場合。
+            呼び出し元で HTTP 400 に対応付ける（フォールバック禁止、明示的失敗）。
+    """
+    # ボディ未指定は空入力として扱う（後続の検証で必須項目欠落として 400 になる）。
+    if raw_body is None:
+        return {}
+    # 外部入力のため文字列であることを検証する。
+    if not isinstance(raw_body, str):
+        raise ValueError("リクエストボディが文字列ではありません。")
+
+    if is_base64:
+        decoded = _decode_base64_bounded(raw_body, limits.max_bytes)
+        try:
+            text = decoded.decode("utf-8")
+        except UnicodeDecodeError as error:
+            raise ValueError("ボディの UTF-8 デコードに失敗しました。") from error
+    else:
+        # 文字数はバイト数以下のため、文字数の超過は必ずバイト数の超過でもある。
+        if len(raw_body) > limits.max_bytes:
+            raise PayloadTooLarge("リクエストボディが上限を超えています。")
+        text = raw_body
+
+    # JSON 形式（Content-Type 明示時）。
+    if _CONTENT_TYPE_JSON in content_type:
+        return _parse_json(text, limits.max_fields)
+
+    # 既定: form-encoded（現行 Django フォーム互換、出典: E-5）。
+    if text and text.count("&") + 1 > limits.max_fields:
+        raise PayloadTooLarge("リクエストボディのフィールド数が上限を超えています。")
+    # keep_blank_values=True で空値も保持し、必須項目の空文字検証（R5-2）に委ねる。
+    return dict(parse_qsl(text, keep_blank_values=True))
+
+
+def _parse_json(text: str, max_fields: int) -> dict[str, str]:
+    """JSON オブジェクトを文字列辞書へ変換する（要素数の上限付き）."""
+
+    def _bounded_object(pairs: list[tuple[str, object]]) -> dict[str, object]:
+        if len(pairs) > max_fields:
+            raise PayloadTooLarge("リクエストボディのフィールド数が上限を超えています。")
+        return dict(pairs)
+
+    try:
+        parsed = json.loads(text, object_pairs_hook=_bounded_object)
+    except json.JSONDecodeError as error:
+        raise ValueError("JSON ボディの解析に失敗しました。") from error
+    # トップレベルはオブジェクト（辞書）であることを要求する（ゼロトラスト）。
+    if not isinstance(parsed, dict):
+        raise ValueError("JSON ボディはオブジェクトである必要があります。")
+    result: dict[str, str] = {}
+    for key, value in parsed.items():
+        # キー・値がともに文字列であることを要求する（型の暗黙変換をしない）。
+        if not isinstance(key, str) or not isinstance(value, str):
+            raise ValueError("JSON ボディは文字列キーと文字列値のみを許可します。")
+        result[key] = value
+    return result
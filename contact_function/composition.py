@@ -0,0 +1,813 @@
+"""Contact_Function の composition root（具象依存のレジストリ）モジュール.
+
+Lambda エントリポイント `handler.lambda_handler` が注入する本番用の具象依存
+（`SsmConfigProvider` / `SesEmailSender`）を、実行環境（コンテナ）単位で 1 度だけ
+組み立てて再利用するためのレジストリを提供する。
+
+背景（出典: `handler.lambda_handler` の従来実装）:
+    - 従来は呼び出しごとに `SsmConfigProvider()` / `SesEmailSender()` を生成しており、
+      `boto3.client("ssm")` / `boto3.client("sesv2")` の生成（認証情報解決・
+      エンドポイント解決を含む）をウォーム呼び出しでも毎回支払っていた。
+    - Lambda はウォーム呼び出し間でモジュールスコープのオブジェクトを保持するため、
+      レジストリをモジュールスコープに置き、初回要求時に遅延生成して以後再利用する。
+
+設計上の遵守事項:
+    - 依存の生成は import 時ではなく初回要求時に遅延して行う。
+    - 生成に失敗した場合（例: 環境変数 `ENV` 欠落による `ConfigurationError`）は
+      例外を握りつぶさず呼び出し元へ伝播し、失敗結果をキャッシュしない（次回呼び出しで
+      再度生成を試みる。フォールバック禁止、出典: 第三原則3）。
+    - テストは従来どおり `handle_contact_request` へフェイクを直接注入できる。本
+      レジストリはファクトリを注入可能とし、`reset` で保持中の依存を破棄できる。
+    - 本番の設定プロバイダは `CachingConfigProvider` で包み、Parameter Store の
+      取得結果を TTL の間キャッシュする。TTL・stale 許容秒数は環境変数
+      `CONTACT_CONFIG_CACHE_TTL_SECONDS`（既定 300）・
+      `CONTACT_CONFIG_CACHE_STALE_SECONDS`（既定 0 = stale-while-revalidate 無効）
+      で調整でき、不正値は `ConfigurationError` で明示的に失敗させる。
+      キャッシュのミス時は `SsmConfigProvider.load_snapshot` で 3 パラメータを
+      1 回の往復でまとめて取得する。
+    - メール送信アダプタは環境変数 `CONTACT_DELIVERY_MODE` で選択する。`sync`
+      （既定）は `SesEmailSender` で SES へ直送し、`queue` は `QueueingEmailSender`
+      で `CONTACT_QUEUE_URL` の SQS キューへ投入して受付 ID を返す（送信は
+      `contact_function.worker` が後段で行う）。不正なモード・キュー URL の欠落は
+      `ConfigurationError` で明示的に失敗させる。
+    - SES 直送（handler の sync モード・ドレインワーカー）は `ResilientEmailSender`
+      で包み、スロットリング・一時障害を呼び出しの期限内で再試行し、連続失敗時は
+      サーキットブレーカーで遮断する。試行回数・ブレーカーのしきい値・クールダウン
+      秒数は `CONTACT_SES_MAX_ATTEMPTS`（既定 3）・`CONTACT_SES_BREAKER_THRESHOLD`
+      （既定 5）・`CONTACT_SES_BREAKER_COOLDOWN_SECONDS`（既定 30）で調整する。
+      ブレーカーは送信アダプタと共にレジストリが保持するため、ウォーム呼び出し間で
+      状態が維持される。呼び出しの期限はエントリポイントが `begin_invocation` で
+      Lambda コンテキストから設定する。
+    - ドレインワーカーのダイジェスト（まとめ送信）は `CONTACT_DIGEST_MODE` で有効化し、
+      1 通あたりの件数・本文サイズの上限を `CONTACT_DIGEST_MAX_ITEMS`（既定 50）・
+      `CONTACT_DIGEST_MAX_BYTES`（既定 200000）で調整する。
+    - 重複送信の抑止（`domain.idempotency.send_contact_once`）に用いる冪等性ストアは
+      `CONTACT_IDEMPOTENCY_MODE` で選択する。`memory`（既定）は実行環境内の上限付き
+      LRU、`dynamodb` は LRU を前段に置いた `CONTACT_IDEMPOTENCY_TABLE` の DynamoDB
+      テーブル、`file` は `CONTACT_IDEMPOTENCY_DIR` のローカル実行用ストア、`off` は
+      無効。記録の有効秒数・予約の有効秒数・LRU の件数上限は
+      `CONTACT_IDEMPOTENCY_TTL_SECONDS`（既定 600）・
+      `CONTACT_IDEMPOTENCY_RESERVATION_SECONDS`（既定 60）・
+      `CONTACT_IDEMPOTENCY_MAX_ENTRIES`（既定 1024）で調整する。
+    - 送信元 IP ごとのレート制限は `CONTACT_RATE_LIMIT_MODE` で選択する。`memory`
+      （既定）は実行環境内のトークンバケット、`dynamodb` は `CONTACT_RATE_LIMIT_TABLE`
+      の DynamoDB テーブルで実行環境を跨いで共有するバケット（キーは
+      `CONTACT_RATE_LIMIT_KEY` を鍵とする送信元 IP の HMAC）、`off` は無効。容量・
+      1 分あたりの補充数・保持するクライアント数は `CONTACT_RATE_LIMIT_BURST`（既定 5）・
+      `CONTACT_RATE_LIMIT_PER_MINUTE`（既定 5）・`CONTACT_RATE_LIMIT_MAX_CLIENTS`
+      （既定 4096）で調整する。
+    - ビルド時に埋め込むフォームトークン（`contact_function.form_token`）の検証は
+      `CONTACT_FORM_TOKEN_MODE` で選択する。`off`（既定）は検証しない、`enforce` は
+      `CONTACT_FORM_TOKEN_KEY`（`render_static` の発行に用いた鍵）で署名を検証する。
+      鍵は実行環境単位で 1 度だけ読み込む。有効秒数・最小入力秒数は
+      `CONTACT_FORM_TOKEN_MAX_AGE_SECONDS`（既定 無期限。トークンはビルドごとに
+      1 つのため、期限は再ビルドの間隔を覆う場合にのみ設定する）・
+      `CONTACT_FORM_TOKEN_MIN_FILL_SECONDS`（既定 3）で調整する。
+    - 処理段の所要時間の出力は `CONTACT_METRICS_MODE` で選択する。`emf`（既定）は
+      1 呼び出し 1 行の CloudWatch Embedded Metric Format を標準出力へ書き出し、
+      `off` は計測しない。名前空間は `CONTACT_METRICS_NAMESPACE`
+      （既定 `ServerlessPortfolio/Contact`）で調整する。
+    - ポート呼び出しのトレーシング（`contact_function.tracing`）は
+      `CONTACT_TRACING_MODE` で選択する。`off`（既定）は記録しない、`file` は
+      `CONTACT_TRACING_FILE`（既定 `contact-spans.jsonl`）へ 1 スパン 1 行の JSON を
+      追記する（ローカル実行用）、`xray` は `AWS_XRAY_DAEMON_ADDRESS`（既定
+      `127.0.0.1:2000`）の X-Ray デーモンへセグメント文書を送る。有効時はレジストリが
+      設定プロバイダ・メール送信アダプタをトレーシングのデコレータで包む。
+    - ログ出力（`contact_function.structured_logging`）は `CONTACT_LOG_FORMAT` で選択する。
+      `json`（既定）は `contact_function` 配下のログを 1 行 1 JSON で出力し、分類ごとに
+      `CONTACT_LOG_SAMPLE_RATES`（既定 `rejection=0.01`）の割合で間引いて、間引いた
+      件数を `CONTACT_LOG_SUMMARY_SECONDS`（既定 60）ごとの集計行で出力する。`plain` は
+      標準の logging 設定のまま（Lambda ランタイムのハンドラ）とする。レベルは
+      `CONTACT_LOG_LEVEL`（既定 `warning`）。環境変数は INIT 時に 1 度だけ解決する。
+    - Django を import しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import logging
+import math
+from collections.abc import Callable
+from typing import TypeVar
+
+from contact_function.adapters.aws_clients import read_client_settings
+from contact_function.adapters.caching_config_provider import CachingConfigProvider
+from contact_function.adapters.config_provider import ConfigurationError, SsmConfigProvider
+from contact_function.adapters.contact_digest import DigestPolicy
+from contact_function.adapters.contact_queue import SqsContactQueue
+from contact_function.adapters.environment import (
+    read_choice,
+    read_flag,
+    read_non_negative_float,
+    read_positive_float,
+    read_positive_int,
+    read_required_string,
+    read_string,
+)
+from contact_function.adapters.idempotency_store import (
+    DynamoDbIdempotencyStore,
+    FileIdempotencyStore,
+    MemoryIdempotencyStore,
+    TieredIdempotencyStore,
+)
+from contact_function.adapters.queueing_email_sender import QueueingEmailSender
+from contact_function.adapters.rate_limiter import (
+    DynamoDbRateLimiter,
+    MemoryRateLimiter,
+    TokenBucketPolicy,
+)
+from contact_function.adapters.resilient_email_sender import (
+    CircuitBreaker,
+    InvocationDeadline,
+    ResilientEmailSender,
+    RetryPolicy,
+)
+from contact_function.adapters.ses_email_sender import SesEmailSender
+from contact_function.domain.ports import (
+    ConfigProvider,
+    EmailSender,
+    IdempotencyStore,
+    RateLimiter,
+)
+from contact_function.form_token import FormTokenVerifier
+from contact_function.metrics import EmfMetricsEmitter
+from contact_function.structured_logging import SampledJsonLogHandler, install_log_handler
+from contact_function.tracing import (
+    JsonFileSpanExporter,
+    Tracer,
+    TracingConfigProvider,
+    TracingEmailSender,
+    XRaySegmentEmitter,
+)
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md
+# 「logger = logging.getLogger(__name__)」パターン）。
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# 設定値キャッシュの TTL・stale 許容秒数を供給する環境変数名と既定値。
+# Parameter Store の値は運用者が更新する頻度が低いため、TTL は 5 分を既定とする。
+_ENV_CONFIG_CACHE_TTL_SECONDS = "CONTACT_CONFIG_CACHE_TTL_SECONDS"
+_ENV_CONFIG_CACHE_STALE_SECONDS = "CONTACT_CONFIG_CACHE_STALE_SECONDS"
+_DEFAULT_CONFIG_CACHE_TTL_SECONDS = 300.0
+_DEFAULT_CONFIG_CACHE_STALE_SECONDS = 0.0
+
+# メール送信の配信モードを選択する環境変数名と選択肢（既定は SES 直送）。
+_ENV_DELIVERY_MODE = "CONTACT_DELIVERY_MODE"
+_ENV_QUEUE_URL = "CONTACT_QUEUE_URL"
+_DELIVERY_MODE_SYNC = "sync"
+_DELIVERY_MODE_QUEUE = "queue"
+
+# SES 送信の再試行・サーキットブレーカーを調整する環境変数名と既定値。
+_ENV_SES_MAX_ATTEMPTS = "CONTACT_SES_MAX_ATTEMPTS"
+_ENV_SES_BREAKER_THRESHOLD = "CONTACT_SES_BREAKER_THRESHOLD"
+_ENV_SES_BREAKER_COOLDOWN_SECONDS = "CONTACT_SES_BREAKER_COOLDOWN_SECONDS"
+_DEFAULT_SES_MAX_ATTEMPTS = 3
+_DEFAULT_SES_BREAKER_THRESHOLD = 5
+_DEFAULT_SES_BREAKER_COOLDOWN_SECONDS = 30.0
+
+# 現在の呼び出しの期限（Lambda の実行環境は同時に 1 呼び出しのみを処理するため、
+# 実行環境内で 1 つを共有し、エントリポイントが呼び出しごとに更新する）。
+_INVOCATION_DEADLINE = InvocationDeadline()
+
+# ドレインワーカーのダイジェスト（まとめ送信）を制御する環境変数名と既定値。
+# 既定のサイズ上限は SES の上限（40 MB）より十分小さく、メールとして読める分量とする。
+_ENV_DIGEST_MODE = "CONTACT_DIGEST_MODE"
+_ENV_DIGEST_MAX_ITEMS = "CONTACT_DIGEST_MAX_ITEMS"
+_ENV_DIGEST_MAX_BYTES = "CONTACT_DIGEST_MAX_BYTES"
+_DEFAULT_DIGEST_MAX_ITEMS = 50
+_DEFAULT_DIGEST_MAX_BYTES = 200_000
+
+# 冪等性ストア（重複送信の抑止）の選択と有効期限・件数上限を制御する環境変数名と既定値。
+# 記録の有効秒数はダブルクリック・送信直後の再読み込みによる再送を覆う長さとし、
+# 予約の有効秒数は関数のタイムアウト（API Gateway の 29 秒）より長くする。
+_ENV_IDEMPOTENCY_MODE = "CONTACT_IDEMPOTENCY_MODE"
+_ENV_IDEMPOTENCY_TABLE = "CONTACT_IDEMPOTENCY_TABLE"
+_ENV_IDEMPOTENCY_DIR = "CONTACT_IDEMPOTENCY_DIR"
+_ENV_IDEMPOTENCY_TTL_SECONDS = "CONTACT_IDEMPOTENCY_TTL_SECONDS"
+_ENV_IDEMPOTENCY_RESERVATION_SECONDS = "CONTACT_IDEMPOTENCY_RESERVATION_SECONDS"
+_ENV_IDEMPOTENCY_MAX_ENTRIES = "CONTACT_IDEMPOTENCY_MAX_ENTRIES"
+_IDEMPOTENCY_MODE_OFF = "off"
+_IDEMPOTENCY_MODE_MEMORY = "memory"
+_IDEMPOTENCY_MODE_FILE = "file"
+_IDEMPOTENCY_MODE_DYNAMODB = "dynamodb"
+_DEFAULT_IDEMPOTENCY_TTL_SECONDS = 600.0
+_DEFAULT_IDEMPOTENCY_RESERVATION_SECONDS = 60.0
+_DEFAULT_IDEMPOTENCY_MAX_ENTRIES = 1024
+
+# 送信元 IP ごとのレート制限を制御する環境変数名と既定値。既定は 1 分あたり 5 件
+# （連続 5 件まで）とし、人が問い合わせを送る頻度を十分に上回る値とする。
+_ENV_RATE_LIMIT_MODE = "CONTACT_RATE_LIMIT_MODE"
+_ENV_RATE_LIMIT_TABLE = "CONTACT_RATE_LIMIT_TABLE"
+_ENV_RATE_LIMIT_KEY = "CONTACT_RATE_LIMIT_KEY"
+_ENV_RATE_LIMIT_BURST = "CONTACT_RATE_LIMIT_BURST"
+_ENV_RATE_LIMIT_PER_MINUTE = "CONTACT_RATE_LIMIT_PER_MINUTE"
+_ENV_RATE_LIMIT_MAX_CLIENTS = "CONTACT_RATE_LIMIT_MAX_CLIENTS"
+_RATE_LIMIT_MODE_OFF = "off"
+_RATE_LIMIT_MODE_MEMORY = "memory"
+_RATE_LIMIT_MODE_DYNAMODB = "dynamodb"
+_DEFAULT_RATE_LIMIT_BURST = 5
+_DEFAULT_RATE_LIMIT_PER_MINUTE = 5.0
+_DEFAULT_RATE_LIMIT_MAX_CLIENTS = 4096
+
+# フォームトークンの検証を制御する環境変数名と既定値。トークンはビルドごとに 1 つ
+# 発行され、公開ページから誰でも最新の値を得られるため、発行からの経過時間はボットの
+# 判別に役立たない。既定の有効秒数は無期限とし（期限を設けると最後のデプロイから
+# その秒数が経過した時点で全送信が 403 になる）、最小入力秒数は人が 4 項目を入力する
+# 時間を十分に下回る値とする。
+_ENV_FORM_TOKEN_MODE = "CONTACT_FORM_TOKEN_MODE"
+_ENV_FORM_TOKEN_KEY = "CONTACT_FORM_TOKEN_KEY"
+_ENV_FORM_TOKEN_MAX_AGE_SECONDS = "CONTACT_FORM_TOKEN_MAX_AGE_SECONDS"
+_ENV_FORM_TOKEN_MIN_FILL_SECONDS = "CONTACT_FORM_TOKEN_MIN_FILL_SECONDS"
+_FORM_TOKEN_MODE_OFF = "off"
+_FORM_TOKEN_MODE_ENFORCE = "enforce"
+_DEFAULT_FORM_TOKEN_MAX_AGE_SECONDS = math.inf
+_DEFAULT_FORM_TOKEN_MIN_FILL_SECONDS = 3.0
+
+# 処理段の所要時間（EMF）の出力を制御する環境変数名と既定値。
+_ENV_METRICS_MODE = "CONTACT_METRICS_MODE"
+_ENV_METRICS_NAMESPACE = "CONTACT_METRICS_NAMESPACE"
+_METRICS_MODE_OFF = "off"
+_METRICS_MODE_EMF = "emf"
+_DEFAULT_METRICS_NAMESPACE = "ServerlessPortfolio/Contact"
+
+# ポート呼び出しのトレーシングを制御する環境変数名と既定値。
+_ENV_TRACING_MODE = "CONTACT_TRACING_MODE"
+_ENV_TRACING_FILE = "CONTACT_TRACING_FILE"
+_ENV_XRAY_DAEMON_ADDRESS = "AWS_XRAY_DAEMON_ADDRESS"
+_TRACING_MODE_OFF = "off"
+_TRACING_MODE_FILE = "file"
+_TRACING_MODE_XRAY = "xray"
+_DEFAULT_TRACING_FILE = "contact-spans.jsonl"
+_DEFAULT_XRAY_DAEMON_ADDRESS = "127.0.0.1:2000"
+
+# 構造化ログの出力を制御する環境変数名と既定値。拒否のログは大量送信下で件数が
+# 膨らむため既定で 1% に間引き、分類を指定しないログ（送信失敗等）は全件を出力する。
+_ENV_LOG_FORMAT = "CONTACT_LOG_FORMAT"
+_ENV_LOG_LEVEL = "CONTACT_LOG_LEVEL"
+_ENV_LOG_SAMPLE_RATES = "CONTACT_LOG_SAMPLE_RATES"
+_ENV_LOG_SUMMARY_SECONDS = "CONTACT_LOG_SUMMARY_SECONDS"
+_LOG_FORMAT_JSON = "json"
+_LOG_FORMAT_PLAIN = "plain"
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+_DEFAULT_LOG_LEVEL = "warning"
+_DEFAULT_LOG_SAMPLE_RATES = "rejection=0.01"
+_DEFAULT_LOG_SUMMARY_SECONDS = 60.0
+
+
+def build_config_provider() -> CachingConfigProvider:
+    """本番用の設定プロバイダ（キャッシュ付き `SsmConfigProvider`）を生成する.
+
+    Returns:
+        CachingConfigProvider: Parameter Store の取得結果をキャッシュするプロバイダ。
+
+    Raises:
+        ConfigurationError: 環境変数 `ENV` の欠落、またはキャッシュ設定の環境変数が
+            不正な場合（フォールバック禁止）。
+    """
+    ttl_seconds = read_non_negative_float(
+        _ENV_CONFIG_CACHE_TTL_SECONDS, _DEFAULT_CONFIG_CACHE_TTL_SECONDS
+    )
+    stale_seconds = read_non_negative_float(
+        _ENV_CONFIG_CACHE_STALE_SECONDS, _DEFAULT_CONFIG_CACHE_STALE_SECONDS
+    )
+    ssm_provider = SsmConfigProvider()
+    return CachingConfigProvider(
+        ssm_provider,
+        ttl_seconds,
+        stale_seconds=stale_seconds,
+        snapshot_loader=ssm_provider.load_snapshot,
+    )
+
+
+def begin_invocation(context: object) -> None:
+    """Lambda コンテキストの残り時間から現在の呼び出しの期限を設定する.
+
+    Args:
+        context: Lambda コンテキスト（持たない場合は期限なし）。
+    """
+    _INVOCATION_DEADLINE.start(context)
+
+
+def build_resilient_ses_sender() -> ResilientEmailSender:
+    """再試行・サーキットブレーカー付きの `SesEmailSender` を生成する.
+
+    Returns:
+        ResilientEmailSender: SES の一時的な失敗を期限内で再試行し、劣化時は遮断する
+            送信アダプタ（ブレーカーは本インスタンスが保持する）。
+
+    再試行は、SES クライアントの 1 回の呼び出しが占有し得る最長時間（接続・読み取り
+    タイムアウト × botocore の試行回数）を呼び出しの残り時間に確保できる場合に限る。
+
+    Raises:
+        ConfigurationError: 再試行・ブレーカー・AWS クライアントの環境変数が不正な場合。
+    """
+    max_attempts = read_positive_int(_ENV_SES_MAX_ATTEMPTS, _DEFAULT_SES_MAX_ATTEMPTS)
+    attempt_seconds = read_client_settings().worst_case_call_seconds
+    breaker = CircuitBreaker(
+        failure_threshold=read_positive_int(
+            _ENV_SES_BREAKER_THRESHOLD, _DEFAULT_SES_BREAKER_THRESHOLD
+        ),
+        cool_down_seconds=read_non_negative_float(
+            _ENV_SES_BREAKER_COOLDOWN_SECONDS, _DEFAULT_SES_BREAKER_COOLDOWN_SECONDS
+        ),
+    )
+    return ResilientEmailSender(
+        SesEmailSender(),
+        breaker,
+        _INVOCATION_DEADLINE,
+        RetryPolicy(max_attempts=max_attempts, attempt_seconds=attempt_seconds),
+    )
+
+
+def build_email_sender() -> EmailSender:
+    """配信モードに応じた本番用のメール送信アダプタを生成する.
+
+    Returns:
+        EmailSender: `sync` は再試行・遮断付きの `SesEmailSender`、`queue` は SQS
+            キューへ投入する `QueueingEmailSender`。
+
+    Raises:
+        ConfigurationError: `CONTACT_DELIVERY_MODE` が不正、または `queue` モードで
+            `CONTACT_QUEUE_URL` が未設定の場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_DELIVERY_MODE,
+        (_DELIVERY_MODE_SYNC, _DELIVERY_MODE_QUEUE),
+        _DELIVERY_MODE_SYNC,
+    )
+    if mode == _DELIVERY_MODE_QUEUE:
+        return QueueingEmailSender(SqsContactQueue(read_required_string(_ENV_QUEUE_URL)))
+    return build_resilient_ses_sender()
+
+
+def build_digest_policy() -> DigestPolicy | None:
+    """ドレインワーカーのダイジェスト設定を環境変数から組み立てる.
+
+    Returns:
+        DigestPolicy | None: `CONTACT_DIGEST_MODE` が真の場合は件数・サイズの上限、
+            それ以外（既定）は None（1 件ずつ送信）。
+
+    Raises:
+        ConfigurationError: いずれかの環境変数が不正な場合（フォールバック禁止）。
+    """
+    if not read_flag(_ENV_DIGEST_MODE):
+        return None
+    return DigestPolicy(
+        max_items=read_positive_int(_ENV_DIGEST_MAX_ITEMS, _DEFAULT_DIGEST_MAX_ITEMS),
+        max_bytes=read_positive_int(_ENV_DIGEST_MAX_BYTES, _DEFAULT_DIGEST_MAX_BYTES),
+    )
+
+
+def build_idempotency_store() -> IdempotencyStore | None:
+    """冪等性ストアのモードに応じた本番用のストアを生成する.
+
+    Returns:
+        IdempotencyStore | None: `memory` は実行環境内の LRU、`dynamodb` は LRU を
+            前段に置いた DynamoDB、`file` はローカル実行用のファイルストア。`off` は
+            None（重複送信を抑止しない）。
+
+    Raises:
+        ConfigurationError: いずれかの環境変数が不正、または `dynamodb` / `file`
+            モードでテーブル名・ディレクトリが未設定の場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_IDEMPOTENCY_MODE,
+        (
+            _IDEMPOTENCY_MODE_MEMORY,
+            _IDEMPOTENCY_MODE_DYNAMODB,
+            _IDEMPOTENCY_MODE_FILE,
+            _IDEMPOTENCY_MODE_OFF,
+        ),
+        _IDEMPOTENCY_MODE_MEMORY,
+    )
+    if mode == _IDEMPOTENCY_MODE_OFF:
+        return None
+    ttl_seconds = read_positive_float(
+        _ENV_IDEMPOTENCY_TTL_SECONDS, _DEFAULT_IDEMPOTENCY_TTL_SECONDS
+    )
+    reservation_seconds = read_positive_float(
+        _ENV_IDEMPOTENCY_RESERVATION_SECONDS, _DEFAULT_IDEMPOTENCY_RESERVATION_SECONDS
+    )
+    if mode == _IDEMPOTENCY_MODE_FILE:
+        return FileIdempotencyStore(
+            read_required_string(_ENV_IDEMPOTENCY_DIR), ttl_seconds, reservation_seconds
+        )
+    local = MemoryIdempotencyStore(
+        read_positive_int(_ENV_IDEMPOTENCY_MAX_ENTRIES, _DEFAULT_IDEMPOTENCY_MAX_ENTRIES),
+        ttl_seconds,
+        reservation_seconds,
+    )
+    if mode == _IDEMPOTENCY_MODE_DYNAMODB:
+        shared = DynamoDbIdempotencyStore(
+            read_required_string(_ENV_IDEMPOTENCY_TABLE), ttl_seconds, reservation_seconds
+        )
+        return TieredIdempotencyStore(local, shared)
+    return local
+
+
+def build_rate_limiter() -> RateLimiter | None:
+    """レート制限のモードに応じた本番用のレート制限を生成する.
+
+    Returns:
+        RateLimiter | None: `memory` は実行環境内のトークンバケット、`dynamodb` は
+            実行環境を跨いで共有するバケット。`off` は None（制限しない）。
+
+    Raises:
+        ConfigurationError: いずれかの環境変数が不正、または `dynamodb` モードで
+            テーブル名・キーの秘密鍵が未設定の場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_RATE_LIMIT_MODE,
+        (_RATE_LIMIT_MODE_MEMORY, _RATE_LIMIT_MODE_DYNAMODB, _RATE_LIMIT_MODE_OFF),
+        _RATE_LIMIT_MODE_MEMORY,
+    )
+    if mode == _RATE_LIMIT_MODE_OFF:
+        return None
+    per_minute = read_positive_float(_ENV_RATE_LIMIT_PER_MINUTE, _DEFAULT_RATE_LIMIT_PER_MINUTE)
+    policy = TokenBucketPolicy(
+        capacity=read_positive_int(_ENV_RATE_LIMIT_BURST, _DEFAULT_RATE_LIMIT_BURST),
+        refill_per_second=per_minute / 60.0,
+    )
+    if mode == _RATE_LIMIT_MODE_DYNAMODB:
+        return DynamoDbRateLimiter(
+            read_required_string(_ENV_RATE_LIMIT_TABLE),
+            policy,
+            read_required_string(_ENV_RATE_LIMIT_KEY).encode("utf-8"),
+        )
+    return MemoryRateLimiter(
+        policy,
+        read_positive_int(_ENV_RATE_LIMIT_MAX_CLIENTS, _DEFAULT_RATE_LIMIT_MAX_CLIENTS),
+    )
+
+
+def build_form_token_verifier() -> FormTokenVerifier | None:
+    """フォームトークンのモードに応じた検証器を生成する.
+
+    Returns:
+        FormTokenVerifier | None: `enforce` は `CONTACT_FORM_TOKEN_KEY` で署名を検証
+            する検証器。`off` は None（検証しない）。
+
+    Raises:
+        ConfigurationError: いずれかの環境変数が不正、または `enforce` モードで鍵が
+            未設定の場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_FORM_TOKEN_MODE,
+        (_FORM_TOKEN_MODE_OFF, _FORM_TOKEN_MODE_ENFORCE),
+        _FORM_TOKEN_MODE_OFF,
+    )
+    if mode == _FORM_TOKEN_MODE_OFF:
+        return None
+    return FormTokenVerifier(
+        read_required_string(_ENV_FORM_TOKEN_KEY).encode("utf-8"),
+        max_age_seconds=read_positive_float(
+            _ENV_FORM_TOKEN_MAX_AGE_SECONDS, _DEFAULT_FORM_TOKEN_MAX_AGE_SECONDS
+        ),
+        min_fill_seconds=read_non_negative_float(
+            _ENV_FORM_TOKEN_MIN_FILL_SECONDS, _DEFAULT_FORM_TOKEN_MIN_FILL_SECONDS
+        ),
+    )
+
+
+def build_metrics_emitter() -> EmfMetricsEmitter | None:
+    """メトリクスのモードに応じた EMF の出力器を生成する.
+
+    Returns:
+        EmfMetricsEmitter | None: `emf` は標準出力へ書き出す出力器、`off` は None
+            （計測しない）。
+
+    Raises:
+        ConfigurationError: `CONTACT_METRICS_MODE` が不正な場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_METRICS_MODE, (_METRICS_MODE_EMF, _METRICS_MODE_OFF), _METRICS_MODE_EMF
+    )
+    if mode == _METRICS_MODE_OFF:
+        return None
+    return EmfMetricsEmitter(read_string(_ENV_METRICS_NAMESPACE, _DEFAULT_METRICS_NAMESPACE))
+
+
+def build_tracer() -> Tracer | None:
+    """トレーシングのモードに応じたスパンの記録器を生成する.
+
+    Returns:
+        Tracer | None: `file` は JSON Lines ファイル、`xray` は X-Ray デーモンへ出力する
+            記録器、`off` は None（記録しない）。
+
+    Raises:
+        ConfigurationError: `CONTACT_TRACING_MODE` または X-Ray デーモンのアドレスが
+            不正な場合（フォールバック禁止）。
+    """
+    mode = read_choice(
+        _ENV_TRACING_MODE,
+        (_TRACING_MODE_OFF, _TRACING_MODE_FILE, _TRACING_MODE_XRAY),
+        _TRACING_MODE_OFF,
+    )
+    if mode == _TRACING_MODE_OFF:
+        return None
+    if mode == _TRACING_MODE_FILE:
+        path = read_string(_ENV_TRACING_FILE, _DEFAULT_TRACING_FILE)
+        return Tracer(JsonFileSpanExporter(path))
+    address = read_string(_ENV_XRAY_DAEMON_ADDRESS, _DEFAULT_XRAY_DAEMON_ADDRESS)
+    try:
+        return Tracer(XRaySegmentEmitter(address))
+    except ValueError as error:
+        raise ConfigurationError(f"{_ENV_XRAY_DAEMON_ADDRESS} が不正です: {error}") from error
+
+
+def _read_sample_rates() -> dict[str, float]:
+    """`CONTACT_LOG_SAMPLE_RATES`（`分類=率` のカンマ区切り）を読み取る.
+
+    Raises:
+        ConfigurationError: 形式が不正、または率が 0〜1 の範囲外の場合。
+    """
+    raw_value = read_string(_ENV_LOG_SAMPLE_RATES, _DEFAULT_LOG_SAMPLE_RATES)
+    rates: dict[str, float] = {}
+    for entry in raw_value.split(","):
+        category, separator, rate = entry.strip().partition("=")
+        try:
+            value = float(rate)
+        except ValueError:
+            value = -1.0
+        if not separator or not category.strip() or not 0.0 <= value <= 1.0:
+            raise ConfigurationError(
+                f"環境変数 '{_ENV_LOG_SAMPLE_RATES}' は '分類=率（0〜1）' のカンマ区切りで"
+                f"ある必要があります（値: '{raw_value}'）。"
+            )
+        rates[category.strip()] = value
+    return rates
+
+
+def build_log_handler() -> SampledJsonLogHandler | None:
+    """ログ出力の形式に応じた構造化ログのハンドラを生成する.
+
+    Returns:
+        SampledJsonLogHandler | None: `json` は分類ごとに間引くハンドラ、`plain` は
+            None（標準の logging 設定のまま）。
+
+    Raises:
+        ConfigurationError: 形式・サンプリング率・集計間隔が不正な場合
+            （フォールバック禁止）。
+    """
+    log_format = read_choice(
+        _ENV_LOG_FORMAT, (_LOG_FORMAT_JSON, _LOG_FORMAT_PLAIN), _LOG_FORMAT_JSON
+    )
+    if log_format == _LOG_FORMAT_PLAIN:
+        return None
+    return SampledJsonLogHandler(
+        _read_sample_rates(),
+        read_positive_float(_ENV_LOG_SUMMARY_SECONDS, _DEFAULT_LOG_SUMMARY_SECONDS),
+    )
+
+
+def configure_logging() -> bool:
+    """環境変数を解決し、構造化ログのハンドラを取り付ける（INIT 時に 1 度呼ぶ）.
+
+    設定が不正な場合は INIT を失敗させず（全呼び出しを止めない）、標準の logging
+    設定のまま明示ログを残して継続する。
+
+    Returns:
+        bool: ハンドラを取り付けた場合 True（`plain`・取り付け済み・不正な設定は False）。
+    """
+    try:
+        log_handler = build_log_handler()
+        level = _LOG_LEVELS[
+            read_choice(_ENV_LOG_LEVEL, tuple(_LOG_LEVELS), _DEFAULT_LOG_LEVEL)
+        ]
+    except ConfigurationError:
+        logger.error(
+            "構造化ログの設定が不正なため標準のログ出力を継続します。", exc_info=True
+        )
+        return False
+    if log_handler is None:
+        return False
+    return install_log_handler(log_handler, level)
+
+
+def _build_optional(factory: Callable[[], _T | None], feature: str) -> _T | None:
+    """任意の観測機能（メトリクス・トレーシング）を生成する.
+
+    設定が不正な場合は `configure_logging` と同様に呼び出しを止めず、明示ログを
+    残して機能なし（None）で継続する。
+
+    Args:
+        factory: 生成するファクトリ（無効時は None を返す）。
+        feature: ログに記す機能名。
+
+    Returns:
+        _T | None: 生成物（無効時・設定が不正な場合は None）。
+    """
+    try:
+        return factory()
+    except ConfigurationError:
+        logger.error("%sの設定が不正なため無効として継続します。", feature, exc_info=True)
+        return None
+
+
+class ContactDependencies:
+    """実行環境単位で具象依存を遅延生成・再利用するレジストリ.
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、本レジストリは
+    排他制御を持たない（同一実行環境内で並行呼び出しは発生しない）。
+    """
+
+    def __init__(
+        self,
+        config_provider_factory: Callable[[], ConfigProvider] = build_config_provider,
+        email_sender_factory: Callable[[], EmailSender] = build_email_sender,
+        idempotency_store_factory: Callable[
+            [], IdempotencyStore | None
+        ] = build_idempotency_store,
+        rate_limiter_factory: Callable[[], RateLimiter | None] = build_rate_limiter,
+        form_token_verifier_factory: Callable[
+            [], FormTokenVerifier | None
+        ] = build_form_token_verifier,
+        metrics_emitter_factory: Callable[
+            [], EmfMetricsEmitter | None
+        ] = build_metrics_emitter,
+        tracer_factory: Callable[[], Tracer | None] = build_tracer,
+    ) -> None:
+        """レジストリを初期化する（依存はまだ生成しない）.
+
+        Args:
+            config_provider_factory: `ConfigProvider` を生成するファクトリ
+                （既定は `build_config_provider`）。
+            email_sender_factory: `EmailSender` を生成するファクトリ
+                （既定は `build_email_sender`）。
+            idempotency_store_factory: `IdempotencyStore` を生成するファクトリ
+                （既定は `build_idempotency_store`。無効時は None を返す）。
+            rate_limiter_factory: `RateLimiter` を生成するファクトリ
+                （既定は `build_rate_limiter`。無効時は None を返す）。
+            form_token_verifier_factory: `FormTokenVerifier` を生成するファクトリ
+                （既定は `build_form_token_verifier`。無効時は None を返す）。
+            metrics_emitter_factory: `EmfMetricsEmitter` を生成するファクトリ
+                （既定は `build_metrics_emitter`。無効時は None を返す）。
+            tracer_factory: `Tracer` を生成するファクトリ（既定は `build_tracer`。
+                無効時は None を返す）。有効時は設定プロバイダ・メール送信アダプタを
+                トレーシングのデコレータで包む。
+        """
+        self._config_provider_factory = config_provider_factory
+        self._email_sender_factory = email_sender_factory
+        self._idempotency_store_factory = idempotency_store_factory
+        self._rate_limiter_factory = rate_limiter_factory
+        self._form_token_verifier_factory = form_token_verifier_factory
+        self._metrics_emitter_factory = metrics_emitter_factory
+        self._tracer_factory = tracer_factory
+        # 生成済みの依存（未生成は None）。
+        self._config_provider: ConfigProvider | None = None
+        self._email_sender: EmailSender | None = None
+        # 冪等性ストア・レート制限・フォームトークンの検証器・メトリクスの出力器・
+        # スパンの記録器は無効時に None を返すため、生成済みかどうかを別に保持する。
+        self._idempotency_store: IdempotencyStore | None = None
+        self._idempotency_store_built = False
+        self._rate_limiter: RateLimiter | None = None
+        self._rate_limiter_built = False
+        self._form_token_verifier: FormTokenVerifier | None = None
+        self._form_token_verifier_built = False
+        self._metrics_emitter: EmfMetricsEmitter | None = None
+        self._metrics_emitter_built = False
+        self._tracer: Tracer | None = None
+        self._tracer_built = False
+
+    def config_provider(self) -> ConfigProvider:
+        """設定プロバイダを返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        Returns:
+            ConfigProvider: 実行環境内で共有する設定プロバイダ。
+
+        Raises:
+            ConfigurationError: 生成に失敗した場合（キャッシュせず伝播する）。
+        """
+        if self._config_provider is None:
+            config_provider = self._config_provider_factory()
+            tracer = self.tracer()
+            if tracer is not None:
+                config_provider = TracingConfigProvider(config_provider, tracer)
+            self._config_provider = config_provider
+        return self._config_provider
+
+    def email_sender(self) -> EmailSender:
+        """メール送信アダプタを返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        Returns:
+            EmailSender: 実行環境内で共有するメール送信アダプタ。
+        """
+        if self._email_sender is None:
+            email_sender = self._email_sender_factory()
+            tracer = self.tracer()
+            if tracer is not None:
+                email_sender = TracingEmailSender(email_sender, tracer)
+            self._email_sender = email_sender
+        return self._email_sender
+
+    def idempotency_store(self) -> IdempotencyStore | None:
+        """冪等性ストアを返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        インメモリ LRU の記録はウォーム呼び出し間で維持される。
+
+        Returns:
+            IdempotencyStore | None: 実行環境内で共有するストア（無効時は None）。
+        """
+        if not self._idempotency_store_built:
+            self._idempotency_store = self._idempotency_store_factory()
+            self._idempotency_store_built = True
+        return self._idempotency_store
+
+    def rate_limiter(self) -> RateLimiter | None:
+        """レート制限を返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        インメモリのバケットはウォーム呼び出し間で維持される。
+
+        Returns:
+            RateLimiter | None: 実行環境内で共有するレート制限（無効時は None）。
+        """
+        if not self._rate_limiter_built:
+            self._rate_limiter = self._rate_limiter_factory()
+            self._rate_limiter_built = True
+        return self._rate_limiter
+
+    def form_token_verifier(self) -> FormTokenVerifier | None:
+        """フォームトークンの検証器を返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        署名鍵の読み込みは実行環境単位で 1 度だけ行う。
+
+        Returns:
+            FormTokenVerifier | None: 実行環境内で共有する検証器（無効時は None）。
+        """
+        if not self._form_token_verifier_built:
+            self._form_token_verifier = self._form_token_verifier_factory()
+            self._form_token_verifier_built = True
+        return self._form_token_verifier
+
+    def metrics_emitter(self) -> EmfMetricsEmitter | None:
+        """EMF の出力器を返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        出力器は実行環境の最初の呼び出し（コールドスタート）を識別するため、
+        ウォーム呼び出し間で維持される。
+
+        計測は任意の機能のため、設定が不正な場合は呼び出しを失敗させず（全呼び出しが
+        502 になるのを避ける）、明示ログを残して計測なしで継続する。
+
+        Returns:
+            EmfMetricsEmitter | None: 実行環境内で共有する出力器（無効時・設定が不正な
+                場合は None）。
+        """
+        if not self._metrics_emitter_built:
+            self._metrics_emitter = _build_optional(self._metrics_emitter_factory, "メトリクス")
+            self._metrics_emitter_built = True
+        return self._metrics_emitter
+
+    def tracer(self) -> Tracer | None:
+        """スパンの記録器を返す（初回のみ生成し、以後は同一インスタンスを返す）.
+
+        トレーシングは任意の機能のため、設定が不正な場合は呼び出しを失敗させず、
+        明示ログを残してスパンを記録せずに継続する。
+
+        Returns:
+            Tracer | None: 実行環境内で共有する記録器（無効時・設定が不正な場合は None）。
+        """
+        if not self._tracer_built:
+            self._tracer = _build_optional(self._tracer_factory, "トレーシング")
+            self._tracer_built = True
+        return self._tracer
+
+    def warm(self) -> None:
+        """具象依存を生成し、設定値を取得してキャッシュを満たす.
+
+        INIT フェーズのプリフェッチとウォームアップイベントから呼ばれ、最初の
+        実リクエストが Parameter Store 往復と boto3 クライアント生成を支払わない
+        ようにする。許可 Origin を先に取得する（キャッシュ付きプロバイダでは
+        一括読み込みにより送信元・宛先も同時に埋まる）。
+
+        Raises:
+            ConfigurationError: 依存の生成または設定値の取得に失敗した場合
+                （握りつぶさず伝播する）。
+        """
+        config_provider = self.config_provider()
+        config_provider.get_allowed_origins()
+        config_provider.get_from_address()
+        config_provider.get_to_address()
+        self.email_sender()
+        self.idempotency_store()
+        self.rate_limiter()
+        self.form_token_verifier()
+        self.metrics_emitter()
+
+    def reset(self) -> None:
+        """保持中の依存を破棄する（次回要求時に再生成される）."""
+        self._config_provider = None
+        self._email_sender = None
+        self._idempotency_store = None
+        self._idempotency_store_built = False
+        self._rate_limiter = None
+        self._rate_limiter_built = False
+        self._form_token_verifier = None
+        self._form_token_verifier_built = False
+        self._metrics_emitter = None
+        self._metrics_emitter_built = False
+        self._tracer = None
+        self._tracer_built = False
@@ -0,0 +1,212 @@
+"""問い合わせ送信の冪等化（重複送信の抑止）ユースケースを定義するモジュール.
+
+送信ボタンのダブルクリック等で同じ入力が短時間に 2 回 POST されると、
+SES のメールが 2 通届くことがある（フォームは送信中の再送を抑止するが、それ以前に
+配信したページや通信の再試行は抑止できない）。本モジュールは送信の手前に冪等性の
+層を置き、同じ内容の 2 回目以降の送信を Email_Sender へ引き渡さずに先行する送信の
+結果（`Success` / `Accepted`）で応答する。
+
+並行する重複（ダブルクリック）の抑止範囲:
+    先行する送信が処理中の重複は送信せず `DuplicateSubmission`（HTTP 409）とする。
+    先行する送信の応答が利用者へ届くとは限らず（送信失敗・Lambda のタイムアウト・
+    API Gateway の 29 秒の打ち切り）、強制終了では予約の削除も行われないため、
+    処理中の重複を成功として応答するとメールが失われても成功と表示されてしまう。
+    成功として応答するのは、完了済みの結果（`Success` / `Accepted`）が記録された
+    重複のみである。なお Lambda は並行するリクエストを別々の実行環境へ振り分ける
+    ため、実行環境ごとのインメモリのストアでは並行する重複を検出できない。並行する
+    重複を抑止できるのは、実行環境間で共有する DynamoDB のストアのみである。
+
+キー（`submission_key`）:
+    Contact_Payload の 4 項目を正規化（Unicode NFC、前後の空白除去、改行の
+    `\\n` への統一、メールアドレスの小文字化）し、Origin（小文字化）とともに
+    SHA-256 で要約した 16 進文字列。ストアには問い合わせ内容そのものを保存しない
+    （GDPR データ最小化、出典: requirements.md R5-1, R9-5）。
+
+処理の流れ（`send_contact_once`）:
+    1. 入力を 1 度だけ検証する（`prepare_contact`）。失敗する場合はストアを参照せず
+       `ValidationError` を返す。
+    2. ストアに完了済みの結果があれば、送信せずにその結果を返す。
+    3. 送信中の予約を原子的に記録する。記録済み（並行する重複）の場合は、
+       完了済みの結果があればそれを、送信中であれば `DuplicateSubmission` を返す。
+    4. 検証済みの Contact_Payload を送信し（`deliver_contact`）、`Success` /
+       `Accepted` は結果を記録する。失敗
+       （`SendFailed` 等）は予約を削除し、利用者の再送を妨げない。
+
+フォールバック禁止（出典: 第三原則3、requirements.md R6-4, R12-5）:
+    - 送信前のストア障害は送信せず、再試行可能な `SendFailed`（HTTP 503）とする
+      （重複排除を黙って無効化しない）。
+    - 送信後の記録・削除の失敗は送信結果を変えず、`exc_info` 付きで明示記録する
+      （送信済みのメールを失敗として応答すると利用者の再送で重複が生じるため）。
+
+本モジュールはドメイン層に属し、Django・adapters 層・handler 層に依存しない。
+ストアは抽象ポート `ports.IdempotencyStore` にのみ依存する（依存性逆転、出典:
+design.md C3、requirements.md R4-6）。
+"""
+
+import hashlib
+import json
+import logging
+import unicodedata
+from collections.abc import Mapping
+
+from contact_function.domain.ports import EmailSender, IdempotencyStore, StageTimer
+from contact_function.domain.send_contact import (
+    Accepted,
+    ContactResult,
+    DuplicateSubmission,
+    SendFailed,
+    Success,
+    ValidationError,
+    deliver_contact,
+    prepare_contact,
+    timed,
+)
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md
+# 「logger = logging.getLogger(__name__)」パターン）。
+logger = logging.getLogger(__name__)
+
+# キーを導出する 4 項目（Contact_Payload と同じ順序）。
+_KEY_FIELDS: tuple[str, ...] = ("full_name", "email", "phone_number", "message")
+
+# キーの形式版（正規化の規則を変える場合に更新し、旧形式のキーと衝突させない）。
+_KEY_VERSION = "v1"
+
+# ストアに記録する状態の符号化。
+_STATE_PENDING = "pending"
+_STATE_SUCCESS = "success"
+_STATE_ACCEPTED_PREFIX = "accepted:"
+
+# 送信前のストア障害を一時的な失敗として返す際の再試行までの秒数。
+_STORE_RETRY_AFTER_SECONDS = 1.0
+
+
+def _normalize(value: str) -> str:
+    """キー導出用に値を正規化する（NFC・改行の統一・前後の空白除去）."""
+    unified = value.replace("\r\n", "\n").replace("\r", "\n")
+    return unicodedata.normalize("NFC", unified).strip()
+
+
+def submission_key(fields: Mapping[str, str], origin: str | None) -> str:
+    """送信内容と Origin から冪等性のキーを導出する.
+
+    Args:
+        fields: 問い合わせ入力（4 項目。欠落項目は空文字として扱う）。
+        origin: リクエストの Origin（欠落時は None）。
+
+    Returns:
+        str: SHA-256 の 16 進文字列（問い合わせ内容を復元できない）。
+    """
+    values = [_normalize(fields.get(name, "")) for name in _KEY_FIELDS]
+    # メールアドレスは大文字小文字の表記揺れを同一の送信とみなす。
+    values[1] = values[1].lower()
+    material = json.dumps(
+        [_KEY_VERSION, (origin or "").strip().lower(), *values], ensure_ascii=False
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _encode_outcome(result: ContactResult) -> str:
+    """記録する完了済みの結果を状態の文字列へ符号化する."""
+    if isinstance(result, Accepted):
+        return f"{_STATE_ACCEPTED_PREFIX}{result.acceptance_id}"
+    return _STATE_SUCCESS
+
+
+def _decode_state(state: str | None) -> ContactResult | None:
+    """記録された状態を重複時に返す結果へ復元する.
+
+    Raises:
+        ValueError: 状態の形式が不正な場合（既定値で補わない）。
+    """
+    if state is None:
+        return None
+    # 処理中の送信は成否が未確定のため成功扱いにしない（失敗・強制終了し得る）。
+    if state == _STATE_PENDING:
+        return DuplicateSubmission()
+    if state == _STATE_SUCCESS:
+        return Success()
+    if state.startswith(_STATE_ACCEPTED_PREFIX) and len(state) > len(_STATE_ACCEPTED_PREFIX):
+        return Accepted(acceptance_id=state[len(_STATE_ACCEPTED_PREFIX) :])
+    raise ValueError("冪等性ストアの状態の形式が不正です。")
+
+
+def send_contact_once(
+    fields: dict[str, str],
+    origin: str | None,
+    from_addr: str,
+    to_addr: str,
+    email_sender: EmailSender,
+    store: IdempotencyStore,
+    stage_timer: StageTimer | None = None,
+) -> ContactResult:
+    """同じ内容の重複送信を抑止して問い合わせを送信するユースケース.
+
+    検証・送信の結果は `send_contact` と同一である（検証は 1 度だけ行う）。
+
+    Args:
+        fields: 問い合わせ入力（4 項目のみ。handler 層が非内容フィールドを除去する）。
+        origin: リクエストの Origin（キーの導出に用いる）。
+        from_addr: SES 送信元アドレス（設定値由来）。
+        to_addr: SES 宛先アドレス（設定値由来）。
+        email_sender: 送信を担う抽象ポート実装。
+        store: 冪等性ストアの抽象ポート実装。
+        stage_timer: 処理段の所要時間を計測するポート（ストアの参照・予約は
+            `idempotency` として計測する。None の場合は計測しない）。
+
+    Returns:
+        ContactResult: 初回の送信は `send_contact` と同じ結果。重複した送信は先行する
+            送信の `Success` / `Accepted`、先行する送信が処理中の場合は
+            `DuplicateSubmission`。
+            送信前のストア障害は再試行可能な `SendFailed`。
+    """
+    # 検証に失敗する入力は送信されないため、ストアを参照しない。
+    payload = prepare_contact(fields, stage_timer)
+    if isinstance(payload, ValidationError):
+        return payload
+
+    key = submission_key(fields, origin)
+    try:
+        with timed(stage_timer, "idempotency"):
+            previous = _decode_state(store.get(key))
+            if previous is None and not store.reserve(key, _STATE_PENDING):
+                # 参照と予約の間に並行する重複が予約した（期限切れ直後は処理中とみなす）。
+                previous = _decode_state(store.get(key)) or DuplicateSubmission()
+    except Exception as exc:
+        # 重複排除を黙って無効化せず、送信しないまま一時的な失敗として返す。
+        logger.error("冪等性ストアの参照・予約に失敗しました。", exc_info=True)
+        return SendFailed(error=str(exc), retry_after_seconds=_STORE_RETRY_AFTER_SECONDS)
+
+    if previous is not None:
+        # 個人データを含めないため、キー（ハッシュ）と結果の種別のみを記録する。
+        logger.info(
+            "重複した問い合わせ送信を抑止しました（key=%s, result=%s）。",
+            key[:12],
+            type(previous).__name__,
+        )
+        return previous
+
+    try:
+        result = deliver_contact(payload, from_addr, to_addr, email_sender, stage_timer)
+    except BaseException:
+        _release(store, key)
+        raise
+
+    if isinstance(result, (Success, Accepted)):
+        try:
+            store.complete(key, _encode_outcome(result))
+        except Exception:
+            # 送信は完了しているため結果は変えない（失敗応答は利用者の再送で重複を招く）。
+            logger.error("冪等性ストアへの送信結果の記録に失敗しました。", exc_info=True)
+    else:
+        _release(store, key)
+    return result
+
+
+def _release(store: IdempotencyStore, key: str) -> None:
+    """送信に失敗したキーの予約を削除する（削除の失敗は明示記録する）."""
+    try:
+        store.release(key)
+    except Exception:
+        # 予約は有効期限で失効する。それまでの重複は `DuplicateSubmission` となる。
+        logger.error("冪等性ストアの予約の削除に失敗しました。", exc_info=True)
@@ -11,34 +11,59 @@ requirements.md R4-6）。
 """
 
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
 
 from contact_function.domain.contact_payload import ContactPayload
 
 
+class SendTemporarilyUnavailable(Exception):
+    """送信先が一時的に利用できないことを表す例外（スロットリング・障害時の遮断）.
+
+    Email_Sender の実装が、再試行しても期限内に送信できない一時的な失敗（送信先の
+    スロットリング・障害によるサーキットブレーカーの開放等）を恒久的な失敗と区別して
+    伝えるために送出する。ユースケースはこれを再試行可能な `SendFailed` として返す。
+
+    Attributes:
+        retry_after_seconds: 呼び出し元が再試行までに待つべき秒数の目安。
+    """
+
+    def __init__(self, message: str, retry_after_seconds: float) -> None:
+        """メッセージと再試行までの秒数で初期化する."""
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
 class EmailSender(ABC):
     """問い合わせメール送信のポート（抽象）.
 
     具体実装は Amazon SES v2 `SendEmail` を用いる `adapters/ses_email_sender.py`
-    （別タスク）が担う（出典: design.md「Data Models > DM3」, C4）。
+    （別タスク）が担う（出典: design.md「Data Models > DM3」, C4）。送信をキューへ
+    委ねる `adapters/queueing_email_sender.py` も本ポートを実装する。
     ドメイン層は本抽象にのみ依存する（依存性逆転、出典: requirements.md R4-6）。
     """
 
     @abstractmethod
-    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> str | None:
         """検証済みの Contact_Payload をメール送信する.
 
         認証情報は引数に取らない。送信元・宛先は設定値から取得した値を受領する
         （出典: design.md DM3, DM4、requirements.md R6-7, R13-2）。
 
+        同期送信の実装（SES 直送）は送信完了後に None を返す。送信を後段へ委ねる
+        非同期の実装（キュー投入）は、受け付けた時点で受付 ID を返す（ユースケースは
+        これを `Accepted` として呼び出し元へ伝える）。
+
         Args:
             payload: 送信対象の問い合わせ内容（検証済み）。
             from_addr: 送信元アドレス（設定値由来）。
             to_addr: 宛先アドレス（設定値由来）。
 
         Returns:
-            None: 送信成功時は値を返さない。
+            str | None: 非同期の実装は受付 ID、同期送信の実装は None。
 
         Raises:
+            SendTemporarilyUnavailable: 一時的な失敗で期限内に送信できない場合。
             Exception: 送信に失敗した場合は例外を送出する。呼び出し元はこれを
                 握りつぶさず明示的に記録・伝播する（フォールバック禁止、
                 出典: design.md DM3, Error Handling、requirements.md R6-4, R12-5）。
@@ -96,3 +121,121 @@ class ConfigProvider(ABC):
                 （フォールバック禁止、出典: requirements.md R6-7）。
         """
         raise NotImplementedError
+
+
+class IdempotencyStore(ABC):
+    """同一送信の重複排除に用いる冪等性ストアのポート（抽象）.
+
+    送信内容から導出したキー（`domain.idempotency.submission_key`）ごとに、送信の
+    状態を不透明な文字列（送信中の予約、または完了した結果の符号化）として有効期限付きで
+    保持する。ダブルクリック等で同じ内容が重複して送られた場合に、2 通目の送信を
+    抑止するために用いる。具体実装は `adapters/idempotency_store.py` が提供する
+    （インメモリ LRU、ローカル実行用のファイル、本番共有用の DynamoDB）。
+
+    値は問い合わせ内容を含まない（キーは内容のハッシュ。GDPR データ最小化、
+    出典: requirements.md R5-1, R9-5）。ストアの障害は例外として送出し、呼び出し元が
+    明示的に扱う（フォールバック禁止、出典: 第三原則3）。
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """キーに記録された状態を返す.
+
+        Args:
+            key: 送信内容から導出したキー。
+
+        Returns:
+            str | None: 記録された状態。未記録・期限切れは None。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def reserve(self, key: str, marker: str) -> bool:
+        """キーが未記録（または期限切れ）の場合に限り、送信中の予約を原子的に記録する.
+
+        Args:
+            key: 送信内容から導出したキー。
+            marker: 予約を表す状態の文字列。
+
+        Returns:
+            bool: 予約できた場合 True。既に記録がある場合 False。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def complete(self, key: str, outcome: str) -> None:
+        """送信の結果を記録する（予約を上書きする）.
+
+        Args:
+            key: 送信内容から導出したキー。
+            outcome: 完了した結果の符号化。
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """送信に失敗したキーの記録を削除する（再送を妨げない）.
+
+        Args:
+            key: 送信内容から導出したキー。
+        """
+        raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """1 リクエストに対するレート制限の判定.
+
+    Attributes:
+        allowed: トークンを取得できた場合 True。
+        retry_after_seconds: 拒否した場合に次のトークンが補充されるまでの秒数
+            （許可した場合は 0）。
+    """
+
+    allowed: bool
+    retry_after_seconds: float = 0.0
+
+
+class RateLimiter(ABC):
+    """クライアント単位のレート制限のポート（抽象）.
+
+    handler はボディ解析の前に送信元 IP ごとのトークンを 1 つ取得し、取得できない
+    POST を拒否する。具体実装は `adapters/rate_limiter.py` が提供する（実行環境内の
+    トークンバケット、本番共有用の DynamoDB）。
+    """
+
+    @abstractmethod
+    def acquire(self, client_key: str) -> RateLimitDecision:
+        """クライアントのバケットから 1 トークンの取得を試みる.
+
+        Args:
+            client_key: クライアントの識別子（送信元 IP）。
+
+        Returns:
+            RateLimitDecision: 判定。
+
+        Raises:
+            Exception: 共有ストアの障害（握りつぶさず呼び出し元へ伝播する）。
+        """
+        raise NotImplementedError
+
+
+class StageTimer(ABC):
+    """処理段ごとの所要時間を計測するポート（抽象）.
+
+    handler とユースケースは処理段（ボディ解析・入力検証・送信等）を `stage` の
+    文脈で囲み、計測と出力は外側の実装（`contact_function.metrics`）が担う。計測値は
+    所要時間のみとし、問い合わせ内容を受け取らない（GDPR、出典: requirements.md R9-5）。
+    """
+
+    @abstractmethod
+    def stage(self, name: str) -> AbstractContextManager[None]:
+        """処理段の所要時間を計測する文脈を返す.
+
+        Args:
+            name: 処理段の名前（固定の識別子。入力値を含めない）。
+
+        Returns:
+            AbstractContextManager[None]: 文脈を抜けた時点で所要時間を記録する。
+        """
+        raise NotImplementedError
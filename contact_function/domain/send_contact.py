@@ -15,7 +15,11 @@ R6-4, R6-5, R6-6, R12-5）:
       `exc_info` 付きで明示ログ記録した上で `SendFailed` を返し、呼び出し元へ
       失敗を伝播する。成功として扱わない（フォールバック禁止、R6-4, R6-5,
       R12-5）。
-    - 送信成功時は `Success` を返す（R6-6）。
+    - 送信成功時は `Success` を返す（R6-6）。Email_Sender が受付 ID を返した場合
+      （キュー投入による非同期送信）は、送信が後段で行われることを表す
+      `Accepted`（受付 ID 付き）を返す。
+    - 計測ポート `ports.StageTimer` を渡した場合は、入力検証（`validate`）と
+      送信（`send`）の所要時間を計測する（出力は handler 層の責務）。
 
 GDPR データ最小化（出典: requirements.md R5-1, R9-5、design.md DM1）に従い、
 Contact_Payload には 4 項目（full_name, email, phone_number, message）のみを
@@ -27,10 +31,16 @@ Contact_Payload には 4 項目（full_name, email, phone_number, message）の
 """
 
 import logging
+from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 
 from contact_function.domain.contact_payload import ContactPayload
-from contact_function.domain.ports import EmailSender
+from contact_function.domain.ports import (
+    EmailSender,
+    SendTemporarilyUnavailable,
+    StageTimer,
+)
 from contact_function.domain.validators import validate_contact_input
 
 # ログ出力は標準ライブラリ logging を使用し、モジュール単位のロガーを取得する
@@ -38,6 +48,10 @@ from contact_function.domain.validators import validate_contact_input
 # 「logger = logging.getLogger(__name__)」パターン）。
 logger = logging.getLogger(__name__)
 
+# 送信失敗のログの分類（`extra` のキーと値のみを共有し、ログ出力の実装には依存しない）。
+# 構造化ログは本分類をサンプリングせず全件を出力する。
+_SEND_FAILED_LOG = {"log_category": "send_failed"}
+
 
 # frozen=True で生成後の再代入を禁止し不変性を保証する。slots=True で
 # __slots__ を定義し余剰属性の追加を型レベルで禁止する（既存の値オブジェクト
@@ -48,7 +62,7 @@ class ContactResult:
 
     実際の結果は本クラスを継承する各サブクラス（`Success` /
     `ValidationError` / `OriginRejected` / `HoneypotRejected` /
-    `SendFailed`）のいずれかのインスタンスとして表現される
+    `SendFailed` / `DuplicateSubmission`）のいずれかのインスタンスとして表現される
     （出典: design.md「Data Models > DM2」）。HTTP ステータスへのマッピングは
     handler 層が行い、本型は結果の意味のみを保持する（出典: design.md C3,
     DM2）。付随情報を持たない結果は本基底型のサブクラスとして空定義する。
@@ -63,6 +77,21 @@ class Success(ContactResult):
     """
 
 
+@dataclass(frozen=True, slots=True)
+class Accepted(ContactResult):
+    """検証成功かつ送信を後段へ受け付けたことを表す結果（HTTP 202 へマッピング）.
+
+    Email_Sender がキュー投入等で送信を非同期化した場合に生成される。メール送信は
+    ドレインワーカーが後段で行うため、本結果は送信完了を意味しない。
+
+    Attributes:
+        acceptance_id: 受け付けた問い合わせの識別子（問い合わせ内容を含まない）。
+    """
+
+    # 受付 ID（応答とログで受け付けた問い合わせを追跡するための不透明な識別子）。
+    acceptance_id: str
+
+
 @dataclass(frozen=True, slots=True)
 class ValidationError(ContactResult):
     """入力検証失敗を表す結果（HTTP 400 系へマッピング）.
@@ -107,12 +136,49 @@ class SendFailed(ContactResult):
     文脈（エラーメッセージ）を保持する（フォールバック禁止、出典: design.md
     DM2, Error Handling、requirements.md R6-4, R6-5, R12-5）。
 
+    一時的な失敗（`SendTemporarilyUnavailable`）の場合は再試行までの秒数を保持し、
+    呼び出し元が恒久的な失敗と区別できるようにする（HTTP 503 へマッピング）。
+
     Attributes:
         error: 送信失敗時の例外に由来するエラーメッセージ（文脈情報）。
+        retry_after_seconds: 一時的な失敗の場合に再試行までに待つべき秒数。
+            恒久的な失敗では None。
     """
 
     # 送信失敗時の例外由来メッセージ（呼び出し元での通知・記録用）。
     error: str
+    # 一時的な失敗の再試行までの秒数（恒久的な失敗は None）。
+    retry_after_seconds: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DuplicateSubmission(ContactResult):
+    """同じ内容の送信が処理中であることを表す結果（HTTP 409 へマッピング）.
+
+    冪等性ストアに同一キーの予約（送信中）が記録されている場合に
+    `domain.idempotency.send_contact_once` が生成する。先行する送信は失敗・
+    タイムアウトで終わり得るため成功扱いにはせず、重複した送信も行わない
+    （フォールバック禁止）。
+    """
+
+
+# 計測しない場合に用いる文脈（状態を持たないため共有する）。
+_UNTIMED = nullcontext()
+
+
+def timed(stage_timer: StageTimer | None, name: str) -> AbstractContextManager[None]:
+    """計測ポートがあれば処理段の計測文脈を、なければ何もしない文脈を返す.
+
+    Args:
+        stage_timer: 計測ポート（None の場合は計測しない）。
+        name: 処理段の名前。
+
+    Returns:
+        AbstractContextManager[None]: `with` で処理段を囲む文脈。
+    """
+    if stage_timer is None:
+        return _UNTIMED
+    return stage_timer.stage(name)
 
 
 def send_contact(
@@ -120,6 +186,7 @@ def send_contact(
     from_addr: str,
     to_addr: str,
     email_sender: EmailSender,
+    stage_timer: StageTimer | None = None,
 ) -> ContactResult:
     """問い合わせ入力を検証し、成功時のみ Email_Sender へ引き渡すユースケース.
 
@@ -134,7 +201,8 @@ def send_contact(
            最小化、R5-1, R9-5）。
         3. Email_Sender へ引き渡す。例外送出時は握りつぶさず `exc_info` 付きで
            ログ記録し `SendFailed` を返す（R6-4, R6-5, R12-5）。
-        4. 送信成功時は `Success` を返す（R6-6）。
+        4. 送信成功時は `Success` を返す（R6-6）。受付 ID が返された場合は
+           `Accepted` を返す。
 
     Args:
         fields: 問い合わせ入力のフィールド名から値へのマッピング。handler 層が
@@ -145,13 +213,35 @@ def send_contact(
         to_addr: SES 宛先アドレス（設定値由来）。
         email_sender: 送信を担う抽象ポート実装（handler 層が注入する具体
             実装、出典: design.md C3, DM3）。
+        stage_timer: 処理段の所要時間を計測するポート（None の場合は計測しない）。
 
     Returns:
         ContactResult: 処理結果。検証失敗時は `ValidationError`、送信失敗時は
-            `SendFailed`、送信成功時は `Success`。
+            `SendFailed`、送信成功時は `Success`、送信を後段へ受け付けた場合は
+            `Accepted`。
+    """
+    prepared = prepare_contact(fields, stage_timer)
+    if isinstance(prepared, ValidationError):
+        return prepared
+    return deliver_contact(prepared, from_addr, to_addr, email_sender, stage_timer)
+
+
+def prepare_contact(
+    fields: Mapping[str, str], stage_timer: StageTimer | None = None
+) -> ContactPayload | ValidationError:
+    """問い合わせ入力を検証し、送信する Contact_Payload を構築する（`send_contact` 1〜2）.
+
+    Args:
+        fields: 問い合わせ入力のフィールド名から値へのマッピング。
+        stage_timer: 処理段の所要時間を計測するポート（検証を `validate` として計測する）。
+
+    Returns:
+        ContactPayload | ValidationError: 検証成功時は 4 項目のみの Contact_Payload、
+            不備がある場合は不備対象項目を添えた `ValidationError`。
     """
     # 入力検証（純粋関数）。不備は例外ではなく結果として得る（R5 系）。
-    validation = validate_contact_input(fields)
+    with timed(stage_timer, "validate"):
+        validation = validate_contact_input(fields)
     if not validation.is_valid:
         # 送信せず不備対象項目を添えて検証失敗を返す（R5-2〜R5-6, R5-1）。
         return ValidationError(fields=validation.invalid_fields)
@@ -159,22 +249,57 @@ def send_contact(
     # 検証成功後、4 項目のみを明示的に取り出して Contact_Payload を構築する。
     # 余剰フィールドは検証で不備扱いとなるためここには到達せず、4 項目以外が
     # 送信内容へ流入しないことを保証する（GDPR データ最小化、R5-1, R9-5）。
-    payload = ContactPayload(
+    return ContactPayload(
         full_name=fields["full_name"],
         email=fields["email"],
         phone_number=fields["phone_number"],
         message=fields["message"],
     )
 
+
+def deliver_contact(
+    payload: ContactPayload,
+    from_addr: str,
+    to_addr: str,
+    email_sender: EmailSender,
+    stage_timer: StageTimer | None = None,
+) -> ContactResult:
+    """検証済みの Contact_Payload を Email_Sender へ引き渡す（`send_contact` 3〜4）.
+
+    Args:
+        payload: `prepare_contact` が構築した Contact_Payload。
+        from_addr: SES 送信元アドレス（設定値由来）。
+        to_addr: SES 宛先アドレス（設定値由来）。
+        email_sender: 送信を担う抽象ポート実装。
+        stage_timer: 処理段の所要時間を計測するポート（送信を `send` として計測する）。
+
+    Returns:
+        ContactResult: 送信失敗時は `SendFailed`、送信成功時は `Success`、送信を
+            後段へ受け付けた場合は `Accepted`。
+    """
     try:
         # 検証成功時のみ送信を実行する（R4-4）。認証情報は渡さない（R13-2）。
-        email_sender.send(payload, from_addr, to_addr)
+        with timed(stage_timer, "send"):
+            acceptance_id = email_sender.send(payload, from_addr, to_addr)
+    except SendTemporarilyUnavailable as exc:
+        # 一時的な失敗（スロットリング・遮断）は再試行可能な失敗として返す。
+        # 成功扱いにはしない（フォールバック禁止、R6-4, R6-5）。
+        logger.error(
+            "SES が一時的に利用できないため送信できませんでした。",
+            exc_info=True,
+            extra=_SEND_FAILED_LOG,
+        )
+        return SendFailed(error=str(exc), retry_after_seconds=exc.retry_after_seconds)
     except Exception as exc:
         # 例外を握りつぶさず exc_info 付きで明示記録し、失敗として伝播する。
         # 成功応答は返さない（フォールバック禁止、R6-4, R6-5, R12-5）。
         # 個人データ（payload の内容）はログに出力しない（GDPR、R9-5）。
-        logger.error("SES 送信に失敗しました。", exc_info=True)
+        logger.error("SES 送信に失敗しました。", exc_info=True, extra=_SEND_FAILED_LOG)
         return SendFailed(error=str(exc))
 
+    # 非同期の Email_Sender は受付 ID を返す（送信は後段のドレインワーカーが行う）。
+    if acceptance_id is not None:
+        return Accepted(acceptance_id=acceptance_id)
+
     # 送信成功（R6-6）。
     return Success()
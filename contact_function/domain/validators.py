@@ -20,6 +20,7 @@ import re
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 # 受領対象の 4 項目（これ以外は送信内容として処理しない、出典: R5-1, DM1）。
 # タプルで定義し、検証順序を固定して結果を決定的にする。
@@ -35,6 +36,10 @@ _MAX_LENGTHS: Mapping[str, int] = {
     "message": 5000,
 }
 
+# 上限の読み取り専用ビュー（handler 層がボディ全体の上限バイト数を導出するために
+# 参照する。検証規則の唯一の出典を本モジュールに保つ）。
+MAX_FIELD_LENGTHS: Mapping[str, int] = MappingProxyType(_MAX_LENGTHS)
+
 # 電子メール形式の検証パターン（外部依存を持たない純粋な正規表現）。
 # ローカル部・ドメイン部に空白と '@' を含まず、ドメインに少なくとも 1 つの
 # ドット（TLD 区切り）を要求する実務的な形式検証（出典: R5-3）。
@@ -0,0 +1,181 @@
+"""問い合わせフォームの署名付きトークン（発行と検証）モジュール.
+
+ボット対策は従来ハニーポット（隠しフィールド `website`）のみであり、隠しフィールドを
+埋めないボットの POST はボディ解析・入力検証を経て SES まで到達していた。本モジュールは
+ビルド時に発行する署名付きトークンと、利用者がフォームの入力に要した時間により、
+ボディを解析する前に自動投稿を拒否する。
+
+トークン（`issue_form_token`）:
+    - 形式は `v1.<発行時刻（UNIX 秒）>.<nonce>.<署名>`。署名は HMAC-SHA256
+      （鍵は環境変数 `CONTACT_FORM_TOKEN_KEY`）を URL 安全な Base64（パディングなし）で
+      表したもの。
+    - 表示ページは全利用者に同一の静的ファイルとして配信されるため、トークンは
+      `render_static` がビルドごとに 1 つ発行してフォームへ埋め込む（利用者ごとの発行
+      時刻は持てない）。トークンは「このサイトのビルドが配信したフォームからの送信で
+      あること」を示す。公開ページから誰でも最新のトークンを得られるため、発行からの
+      経過時間はボットの判別に役立たない。有効期限は既定で設けず（期限を設けると
+      最後のデプロイからその秒数が経過した時点で全送信が拒否される）、定期的に
+      再ビルドする運用でのみ、その間隔を覆う期限を設定する。
+
+入力に要した時間:
+    - 静的ページはサーバ側で表示時刻を記録できないため、`scripts.js` がページの
+      読み込みから送信までの経過ミリ秒をヘッダで送る。最小入力時間に満たない送信
+      （フォームを読み込んだ直後の自動投稿）を拒否する。値は利用者側の申告であり、
+      トークンとあわせて単純なボットを安価に排除するためのものである（入力検証・
+      レート制限を置き換えない）。
+
+検証（`FormTokenVerifier.check`）は HMAC 1 回と整数の比較のみで、ボディを参照しない。
+拒否理由（欠落・形式不正・署名不一致・期限切れ・入力が速すぎる）は
+`FormTokenRejected.reason` で返し、トークンの値はログに出さない。
+
+フォールバック禁止（出典: 第三原則3）: 鍵が空の場合は `ValueError` とする。
+Django・handler 層に依存しない（`render_static` と handler の双方から import する）。
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+from collections.abc import Callable
+
+# トークンの形式版（署名の対象・区切りを変える場合に更新する）。
+_TOKEN_VERSION = "v1"
+
+# トークンの構成要素の区切り文字（Base64 URL 安全文字・数字に含まれない）。
+_TOKEN_SEPARATOR = "."
+
+# 発行時刻が検証時刻より未来でも許容する秒数（ビルド環境と Lambda の時計のずれ）。
+_CLOCK_SKEW_SECONDS = 300
+
+# nonce に使用できる文字（トークンの区切り文字を含まない）。
+_NONCE_CHARACTERS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+)
+
+# 発行時刻・経過ミリ秒として受け付ける最大桁数（巨大な整数の変換を避ける）。
+_MAX_INTEGER_DIGITS = 12
+
+# 拒否理由。
+REASON_MISSING = "missing"
+REASON_MALFORMED = "malformed"
+REASON_FORGED = "forged"
+REASON_STALE = "stale"
+REASON_TOO_FAST = "too_fast"
+
+
+class FormTokenRejected(Exception):
+    """フォームトークンまたは入力時間の検証に失敗したことを表す例外.
+
+    Attributes:
+        reason: 拒否理由（`REASON_*` のいずれか。ログ・メトリクス用）。
+    """
+
+    def __init__(self, reason: str) -> None:
+        """拒否理由を保持する."""
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _sign(key: bytes, message: str) -> str:
+    """メッセージの HMAC-SHA256 を URL 安全な Base64（パディングなし）で返す."""
+    digest = hmac.new(key, message.encode("ascii"), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _is_integer(value: str) -> bool:
+    """上限桁数以下の ASCII の 10 進数字のみからなる空でない文字列かを返す."""
+    return len(value) <= _MAX_INTEGER_DIGITS and value.isascii() and value.isdigit()
+
+
+def issue_form_token(key: bytes, issued_at: int, nonce: str) -> str:
+    """署名付きフォームトークンを発行する.
+
+    Args:
+        key: 署名鍵。
+        issued_at: 発行時刻（UNIX 秒）。
+        nonce: ビルドごとの一意な値（英数字・`-`・`_` のみ）。
+
+    Returns:
+        str: `v1.<issued_at>.<nonce>.<署名>` 形式のトークン。
+
+    Raises:
+        ValueError: 鍵が空、または nonce に使用できない文字が含まれる場合。
+    """
+    if not key:
+        raise ValueError("フォームトークンの署名鍵が空です。")
+    if not nonce or not _NONCE_CHARACTERS.issuperset(nonce):
+        raise ValueError("フォームトークンの nonce は英数字・'-'・'_' のみで構成してください。")
+    message = _TOKEN_SEPARATOR.join((_TOKEN_VERSION, str(issued_at), nonce))
+    return f"{message}{_TOKEN_SEPARATOR}{_sign(key, message)}"
+
+
+class FormTokenVerifier:
+    """フォームトークンの署名・有効期限と、入力に要した時間を検証する.
+
+    鍵は実行環境（コンテナ）単位で 1 度だけ読み込み、本インスタンスを再利用する
+    （`composition.ContactDependencies.form_token_verifier`）。
+    """
+
+    __slots__ = ("_key", "_max_age_seconds", "_min_fill_ms", "_clock")
+
+    def __init__(
+        self,
+        key: bytes,
+        max_age_seconds: float,
+        min_fill_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """検証器を初期化する.
+
+        Args:
+            key: 署名鍵（`render_static` の発行に用いた鍵と同じ値）。
+            max_age_seconds: トークンの発行からの有効秒数（`math.inf` は無期限。期限を
+                設ける場合は再ビルドの間隔を覆う長さとする）。
+            min_fill_seconds: ページの読み込みから送信までに要求する最小秒数。
+            clock: 現在時刻（UNIX 秒）を返す関数（テスト用に注入可能）。
+
+        Raises:
+            ValueError: 鍵が空、または秒数が負の場合。
+        """
+        if not key:
+            raise ValueError("フォームトークンの署名鍵が空です。")
+        if max_age_seconds <= 0 or min_fill_seconds < 0:
+            raise ValueError("フォームトークンの有効秒数・最小入力秒数が不正です。")
+        self._key = key
+        self._max_age_seconds = max_age_seconds
+        self._min_fill_ms = min_fill_seconds * 1000.0
+        self._clock = clock
+
+    def check(self, token: str | None, elapsed_ms: str | None) -> None:
+        """トークンと入力に要した時間（経過ミリ秒）を検証する.
+
+        Args:
+            token: リクエストのトークン（欠落時は None）。
+            elapsed_ms: ページの読み込みから送信までの経過ミリ秒（10 進整数の文字列。
+                欠落時は None）。
+
+        Raises:
+            FormTokenRejected: いずれかの検証に失敗した場合。
+        """
+        if not token or elapsed_ms is None:
+            raise FormTokenRejected(REASON_MISSING)
+        parts = token.split(_TOKEN_SEPARATOR)
+        if (
+            len(parts) != 4
+            or parts[0] != _TOKEN_VERSION
+            or not _is_integer(parts[1])
+            or not _NONCE_CHARACTERS.issuperset(parts[2])
+        ):
+            raise FormTokenRejected(REASON_MALFORMED)
+        message = token[: token.rfind(_TOKEN_SEPARATOR)]
+        # 署名の比較は一定時間で行う（比較時間から署名を推測させない）。
+        expected = _sign(self._key, message).encode("ascii")
+        if not hmac.compare_digest(expected, parts[3].encode("utf-8")):
+            raise FormTokenRejected(REASON_FORGED)
+        age_seconds = self._clock() - int(parts[1])
+        if age_seconds > self._max_age_seconds or age_seconds < -_CLOCK_SKEW_SECONDS:
+            raise FormTokenRejected(REASON_STALE)
+        if not _is_integer(elapsed_ms):
+            raise FormTokenRejected(REASON_MALFORMED)
+        if int(elapsed_ms) < self._min_fill_ms:
+            raise FormTokenRejected(REASON_TOO_FAST)
@@ -8,7 +8,9 @@ API Gateway プロキシ統合イベントを受領し、問い合わせ POST 
 Interfaces > C3」依存規則、requirements.md R4-6）。
 
 Django を含めず・ロードしない（出典: requirements.md R4-1, R4-2、design.md C3）。
-本モジュールは標準ライブラリ・adapters 層・domain 層のみを import する。
+本モジュールは標準ライブラリ・adapters 層・domain 層と、同一パッケージの
+composition root（`contact_function.composition`）・応答テーブル
+（`contact_function.responses`）のみを import する。
 
 責務（出典: design.md C3, C7, DM2, Error Handling、requirements.md R4-1, R4-2,
 R6-5, R6-6, R8-1〜R8-5）:
@@ -18,29 +20,51 @@ R6-5, R6-6, R8-1〜R8-5）:
        からの CORS 応答ヘッダ供給。許可メソッドは POST/OPTIONS（design.md C7,
        requirements.md R8-5）。
     3. Origin 検証: リクエストの `Origin` ヘッダを
-       `ConfigProvider.get_allowed_origins()` の許可リストと照合し、一致時のみ
-       後続を継続する。不一致・欠落・空は HTTP 4xx（`OriginRejected`）で拒否し、
+       `ConfigProvider.get_allowed_origins()` の許可リスト（完全一致が既定。
+       `https://*.example.com` 形式のワイルドカード規則も可、
+       `contact_function.origin_policy`）と照合し、一致時のみ後続を継続する。不一致・欠落・空は HTTP 4xx（`OriginRejected`）で拒否し、
        Email_Sender へ引き渡さない（requirements.md R8-1, R8-2, R8-3, R8-4）。
     4. ハニーポット判定: 隠しフィールド（本実装の採用名 `website`。下記参照）に
        空でない値が存在する場合は HTTP 4xx（`HoneypotRejected`）で拒否し、
        Contact_Payload に含めず（4 項目のみ）Email_Sender へ引き渡さない。隠し
        フィールドは収集・保存しない（requirements.md R8-6, R9-5、design.md C7）。
     5. ユースケース呼び出し: `send_contact(fields, from_addr, to_addr,
-       email_sender)` を呼ぶ。`fields` は 4 項目のみ（ハニーポット等の非内容
-       フィールドを除去して渡す。出典: 本タスク指示、requirements.md R5-1,
+       email_sender)` を呼ぶ（冪等性ストアを注入した場合は重複送信を抑止する
+       `domain.idempotency.send_contact_once` を経由する）。`fields` は 4 項目
+       のみ（ハニーポット等の非内容フィールドを除去して渡す。出典: 本タスク指示、requirements.md R5-1,
        R9-5、design.md DM1）。`from_addr` / `to_addr` は `ConfigProvider` から
        取得する（ハードコード禁止、requirements.md R6-7）。
     6. 応答生成（`ContactResult`→HTTP マッピング、design.md DM2）: Success=200 系、
+       Accepted=202（キュー投入による非同期送信。受付 ID を返す）、
        ValidationError=400 系（不備対象項目を応答に含める）、OriginRejected /
-       HoneypotRejected=4xx、SendFailed=500 系。
+       HoneypotRejected=4xx、SendFailed=500 系（SES の一時的な失敗は 503 と
+       Retry-After）、DuplicateSubmission=409（同じ内容の送信が処理中）。
+       固定応答（プリフライト・Origin 拒否等）のボディとヘッダは許可 Origin 一覧ごとに `responses.ResponseTable` で事前計算し、再利用する。
 
-入力ボディ形式（本タスク指示に基づき採用形式を明記）:
+入力ボディ形式（本タスク指示に基づき採用形式を明記。解析は
+`contact_function.body_parser.parse_body` が上限付きで行い、バイト数・フィールド数の
+上限超過は HTTP 413 とする）:
     - Content-Type が `application/json` を含む場合は JSON オブジェクトとして
       解釈する（キー・値ともに文字列であることを要求。ゼロトラスト検証）。
     - それ以外（既定）は `application/x-www-form-urlencoded`（form-encoded）と
       して解釈する。これは現行 Django フォーム（`portfolio/forms.py`、
       `ContactForm` の POST 送信）と整合する既定形式である（出典: E-5）。
 
+レート制限（`contact_function.adapters.rate_limiter`）:
+    - Origin 検証を通過した POST は、ボディ解析の前に送信元 IP
+      （`requestContext.identity.sourceIp`）ごとのトークンバケットから 1 トークンを
+      取得する。取得できない場合は HTTP 429（`Retry-After` 付き）で拒否し、判定自体の
+      失敗は 503 とする（制限を黙って無効化しない）。
+    - 送信元 IP を持たないイベント（API Gateway を経由しない直接の呼び出し）は
+      制限を適用せず、その旨を警告ログに残す（1 つのバケットを共有させない）。
+
+フォームトークン（`contact_function.form_token`）:
+    - 検証器を注入した場合、レート制限を通過した POST は、ボディ解析の前に
+      `X-Form-Token`（`render_static` がフォームへ埋め込んだ署名付きトークン）と
+      `X-Form-Elapsed-Ms`（ページの読み込みから送信までの経過ミリ秒）を検証する。
+      欠落・形式不正・署名不一致・期限切れ・最小入力時間未満は HTTP 403
+      （`form_token_rejected`）で拒否し、ボディ解析・入力検証・送信を行わない。
+
 ハニーポットの隠しフィールド名（本タスク指示に基づき名称を明記）:
     - 採用名 `website`。人間には非表示、ボットが自動入力しやすい慣例的な名称で
       あり、当該フィールドに値が入っていれば自動投稿とみなす（出典: design.md
@@ -52,7 +76,34 @@ R6-5, R6-6, R8-1〜R8-5）:
       email_sender)` が担い、依存（`ConfigProvider` / `EmailSender`）を引数で
       受け取る（composition root は Lambda エントリポイント側）。
     - Lambda エントリポイント `lambda_handler(event, context)` が本番用の具象
-      （`SsmConfigProvider` / `SesEmailSender`）を組み立てて委譲する。
+      （`SsmConfigProvider` / `SesEmailSender`）を `composition.ContactDependencies`
+      から取得して委譲する。具象は実行環境（コンテナ）単位で 1 度だけ生成し、
+      ウォーム呼び出し間で再利用する（boto3 クライアント生成コストの削減）。
+
+処理段の計測（`contact_function.metrics`）:
+    - 計測ポート `StageTimer` を注入した場合、ヘッダ正規化（`headers`）・設定値取得
+      （`config`）・レート制限（`rate_limit`）・フォームトークン（`form_token`）・
+      ボディ解析（`parse`）と、ユースケース内の冪等性ストア（`idempotency`）・
+      入力検証（`validate`）・送信（`send`）の所要時間を計測する。
+    - `lambda_handler` は依存の取得（`dependencies`）も計測し、応答後に 1 行の
+      CloudWatch Embedded Metric Format（EMF）を標準出力へ書き出す
+      （`CONTACT_METRICS_MODE=off` で無効）。
+
+INIT フェーズのプリフェッチとウォームアップイベント:
+    - 環境変数 `CONTACT_INIT_PREFETCH` が真の場合、import 時（Lambda の INIT
+      フェーズ。課金対象の初回リクエストより前にフル CPU で実行される）に具象依存を
+      生成し設定値を取得しておく。失敗は明示ログを残して INIT を継続し、最初の
+      リクエストで改めて取得・失敗応答させる（INIT 失敗で全呼び出しを止めない）。
+    - EventBridge のスケジュールイベント（`source == "aws.events"` かつ
+      `detail-type == "Scheduled Event"`）はウォームアップとみなし、キャッシュを
+      満たしたうえで HTTP 処理を行わずに即時に返す。取得失敗は例外として伝播し、
+      呼び出しエラーとして可視化する（フォールバック禁止）。
+
+構造化ログ（`contact_function.structured_logging`）:
+    - import 時に `composition.configure_logging` が環境変数を 1 度だけ解決し、
+      `contact_function` 配下のログを 1 行 1 JSON で出力するハンドラを取り付ける。
+      拒否のログは分類 `rejection` として間引き（既定 1%）、間引いた件数を
+      定期的な集計行で出力する。送信失敗（`send_failed`）は全件を出力する。
 
 フォールバック禁止（出典: 第三原則3、requirements.md R6-4, R12-5）:
     - エラーは握りつぶさず明示的に扱い、成功応答にしない。設定値欠落・送信失敗・
@@ -60,32 +111,51 @@ R6-5, R6-6, R8-1〜R8-5）:
     - 個人データはログに出力しない（GDPR、requirements.md R9-5）。
 """
 
-import base64
-import json
 import logging
+import math
 from collections.abc import Mapping
-from urllib.parse import parse_qsl
 
-from contact_function.adapters.config_provider import (
-    ConfigurationError,
-    SsmConfigProvider,
+from contact_function import responses
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.environment import read_flag
+from contact_function.body_parser import PayloadTooLarge, parse_body
+from contact_function.composition import (
+    ContactDependencies,
+    begin_invocation,
+    configure_logging,
+)
+from contact_function.domain.idempotency import send_contact_once
+from contact_function.domain.ports import (
+    ConfigProvider,
+    EmailSender,
+    IdempotencyStore,
+    RateLimiter,
+    StageTimer,
 )
-from contact_function.adapters.ses_email_sender import SesEmailSender
-from contact_function.domain.ports import ConfigProvider, EmailSender
 from contact_function.domain.send_contact import (
+    Accepted,
     ContactResult,
+    DuplicateSubmission,
     HoneypotRejected,
     OriginRejected,
     SendFailed,
     Success,
     ValidationError,
     send_contact,
+    timed,
 )
+from contact_function.form_token import FormTokenRejected, FormTokenVerifier
+from contact_function.metrics import InvocationMetrics
+from contact_function.structured_logging import CATEGORY_REJECTION, log_category
 
 # ロガーはモジュール単位で取得する（出典: coding-conventions.md
 # 「logger = logging.getLogger(__name__)」パターン）。
 logger = logging.getLogger(__name__)
 
+# 拒否（プリフライト・Origin・レート制限・トークン・ボディ・ハニーポット）のログの分類。
+# 構造化ログではサンプリングの対象となる（`contact_function.structured_logging`）。
+_REJECTION_LOG = log_category(CATEGORY_REJECTION)
+
 # Contact_Payload の 4 項目（これ以外は送信内容として処理しない。GDPR データ
 # 最小化、出典: requirements.md R5-1, R9-5、design.md DM1）。
 _CONTENT_FIELDS: tuple[str, ...] = ("full_name", "email", "phone_number", "message")
@@ -94,20 +164,28 @@ _CONTENT_FIELDS: tuple[str, ...] = ("full_name", "email", "phone_number", "messa
 # C7、本タスク指示「名称を決めて docstring に明記」）。
 _HONEYPOT_FIELD_NAME = "website"
 
+# フォームトークンと入力に要した時間を運ぶリクエストヘッダ（小文字化後の名前）。
+_FORM_TOKEN_HEADER = "x-form-token"
+_FORM_ELAPSED_HEADER = "x-form-elapsed-ms"
+
 # 許可する HTTP メソッド（表示は静的配信のため、動的経路は POST とプリフライト
 # の OPTIONS のみ。出典: design.md C7、requirements.md R8-5）。
 _METHOD_POST = "POST"
 _METHOD_OPTIONS = "OPTIONS"
-_ALLOWED_METHODS_HEADER_VALUE = "POST, OPTIONS"
 
-# CORS プリフライトで許可するリクエストヘッダ（問い合わせ送信に必要な最小限）。
-_ALLOWED_HEADERS_HEADER_VALUE = "Content-Type"
+# INIT フェーズのプリフェッチを有効にする環境変数名（既定は無効）。
+_ENV_INIT_PREFETCH = "CONTACT_INIT_PREFETCH"
 
-# CORS プリフライトのキャッシュ秒数（過度な再プリフライトを避けるための最小設定）。
-_PREFLIGHT_MAX_AGE_SECONDS = "600"
+# ウォームアップとみなす EventBridge スケジュールイベントの識別値。
+_WARMUP_EVENT_SOURCE = "aws.events"
+_WARMUP_EVENT_DETAIL_TYPE = "Scheduled Event"
 
-# JSON ボディ判定に用いる Content-Type の部分文字列。
-_CONTENT_TYPE_JSON = "application/json"
+# 実行環境（コンテナ）単位の具象依存レジストリ。モジュールスコープに置くことで
+# ウォーム呼び出し間で boto3 クライアントと設定プロバイダを再利用する。
+_DEPENDENCIES = ContactDependencies()
+
+# 許可 Origin 一覧ごとの事前計算済み応答テーブル（許可リストが変わるまで再利用する）。
+_RESPONSE_TABLES = responses.ResponseTableCache()
 
 
 def _normalize_headers(headers: object) -> dict[str, str]:
@@ -134,135 +212,49 @@ def _normalize_headers(headers: object) -> dict[str, str]:
     return normalized
 
 
-def _parse_body(raw_body: object, is_base64: bool, content_type: str) -> dict[str, str]:
-    """イベントの `body` を問い合わせ入力の文字列辞書へ変換する.
+def _retry_after_header(seconds: float) -> dict[str, str]:
+    """再試行までの秒数を `Retry-After` ヘッダ（1 以上の整数秒）へ変換する."""
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
 
-    採用形式（モジュール docstring に明記）:
-        - Content-Type が `application/json` を含む場合は JSON オブジェクトとして
-          解釈し、キー・値がともに文字列であることを要求する（ゼロトラスト）。
-        - それ以外は form-encoded として解釈する（現行 Django フォーム互換、
-          出典: E-5）。
 
-    Args:
-        raw_body: イベントの `body`（文字列または None を想定。外部入力）。
-        is_base64: `isBase64Encoded` の値。True の場合は base64 復号する。
-        content_type: 小文字化済みの Content-Type ヘッダ値（無い場合は空文字）。
+def _source_ip(event: Mapping[str, object]) -> str | None:
+    """API Gateway が付与した送信元 IP（`requestContext.identity.sourceIp`）を返す.
 
     Returns:
-        dict[str, str]: フィールド名から値への辞書。`body` が無い場合は空辞書。
-
-    Raises:
-        ValueError: ボディが不正（base64 復号失敗、UTF-8 デコード失敗、JSON 解析
-            失敗、JSON がオブジェクトでない、キー/値が文字列でない）な場合。
-            呼び出し元で HTTP 400 に対応付ける（フォールバック禁止、明示的失敗）。
+        str | None: 送信元 IP。取得できない場合は None。
     """
-    # ボディ未指定は空入力として扱う（後続の検証で必須項目欠落として 400 になる）。
-    if raw_body is None:
-        return {}
-    # 外部入力のため文字列であることを検証する。
-    if not isinstance(raw_body, str):
-        raise ValueError("リクエストボディが文字列ではありません。")
-
-    text = raw_body
-    if is_base64:
-        try:
-            # base64 エンコードされたボディを復号し UTF-8 として解釈する。
-            text = base64.b64decode(raw_body).decode("utf-8")
-        except (ValueError, UnicodeDecodeError) as error:
-            # 復号・デコード失敗は握りつぶさず明示的に失敗させる（フォールバック禁止）。
-            raise ValueError("ボディの base64 復号に失敗しました。") from error
-
-    # JSON 形式（Content-Type 明示時）。
-    if _CONTENT_TYPE_JSON in content_type:
-        try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError as error:
-            raise ValueError("JSON ボディの解析に失敗しました。") from error
-        # トップレベルはオブジェクト（辞書）であることを要求する（ゼロトラスト）。
-        if not isinstance(parsed, dict):
-            raise ValueError("JSON ボディはオブジェクトである必要があります。")
-        result: dict[str, str] = {}
-        for key, value in parsed.items():
-            # キー・値がともに文字列であることを要求する（型の暗黙変換をしない）。
-            if not isinstance(key, str) or not isinstance(value, str):
-                raise ValueError(
-                    "JSON ボディは文字列キーと文字列値のみを許可します。"
-                )
-            result[key] = value
-        return result
-
-    # 既定: form-encoded（現行 Django フォーム互換、出典: E-5）。
-    # keep_blank_values=True で空値も保持し、必須項目の空文字検証（R5-2）に委ねる。
-    return dict(parse_qsl(text, keep_blank_values=True))
-
-
-def _build_cors_headers(allowed_origin: str | None) -> dict[str, str]:
-    """CORS 応答ヘッダを組み立てる（許可オリジン設定値から供給）.
-
-    許可された Origin に対してのみ `Access-Control-Allow-Origin` を反映する。
-    許可されていない場合は ACAO を付与しない（ブラウザ側でブロックさせる）。
-
-    Args:
-        allowed_origin: 応答に反映する許可済み Origin。許可対象外・欠落時は None。
-
-    Returns:
-        dict[str, str]: CORS 応答ヘッダ。`allowed_origin` が None の場合は
-            オリジン非依存のヘッダのみを返し `Access-Control-Allow-Origin` を含めない。
-    """
-    # 許可メソッド・許可ヘッダ・キャッシュ秒数は常に返す（CORS 契約の明示）。
-    headers: dict[str, str] = {
-        "Access-Control-Allow-Methods": _ALLOWED_METHODS_HEADER_VALUE,
-        "Access-Control-Allow-Headers": _ALLOWED_HEADERS_HEADER_VALUE,
-        "Access-Control-Max-Age": _PREFLIGHT_MAX_AGE_SECONDS,
-        # Origin ごとに応答が変わるため Vary を明示し、キャッシュ汚染を防ぐ。
-        "Vary": "Origin",
-    }
-    if allowed_origin is not None:
-        # 許可済み Origin のみを反映する（ワイルドカードは使わない、ゼロトラスト）。
-        headers["Access-Control-Allow-Origin"] = allowed_origin
-    return headers
-
-
-def _build_response(
-    status_code: int, body: dict[str, object], cors_headers: dict[str, str]
-) -> dict[str, object]:
-    """API Gateway プロキシ統合形式の HTTP 応答を組み立てる.
-
-    Args:
-        status_code: HTTP ステータスコード。
-        body: JSON 応答ボディ（辞書）。
-        cors_headers: 応答へ付与する CORS ヘッダ。
-
-    Returns:
-        dict[str, object]: `{"statusCode", "headers", "body"}` 形式の応答。
-    """
-    # Content-Type を明示し、CORS ヘッダを統合する。
-    headers: dict[str, str] = {"Content-Type": "application/json"}
-    headers.update(cors_headers)
-    return {
-        "statusCode": status_code,
-        "headers": headers,
-        # ボディは JSON 文字列化する。日本語を保持するため ensure_ascii=False。
-        "body": json.dumps(body, ensure_ascii=False),
-    }
+    request_context = event.get("requestContext")
+    if isinstance(request_context, Mapping):
+        identity = request_context.get("identity")
+        if isinstance(identity, Mapping):
+            source_ip = identity.get("sourceIp")
+            if isinstance(source_ip, str) and source_ip:
+                return source_ip
+    return None
 
 
 def _result_to_response(
-    result: ContactResult, cors_headers: dict[str, str]
+    result: ContactResult,
+    table: responses.ResponseTable,
+    reflected_origin: str | None,
 ) -> dict[str, object]:
     """`ContactResult` を HTTP 応答へマッピングする（design.md DM2）.
 
     マッピング（出典: design.md DM2、requirements.md R5-2〜R5-6, R6-5, R6-6,
     R8-2, R8-3, R8-6）:
         - Success           → 200
+        - Accepted          → 202（受付 ID を応答に含める）
         - ValidationError   → 400（不備対象項目を応答に含める）
+          （ボディの上限超過は解析段階で 413 とし、本マッピングを経由しない）
         - OriginRejected    → 403（4xx）
         - HoneypotRejected  → 403（4xx）
-        - SendFailed        → 500
+        - SendFailed        → 500（一時的な失敗は 503 + Retry-After）
+        - DuplicateSubmission → 409（同じ内容の送信が処理中）
 
     Args:
         result: ユースケースまたは handler が生成した処理結果。
-        cors_headers: 応答へ付与する CORS ヘッダ。
+        table: 許可 Origin 一覧に対応する応答テーブル。
+        reflected_origin: 応答に反映する許可済み Origin（許可外は None）。
 
     Returns:
         dict[str, object]: HTTP 応答（API Gateway プロキシ統合形式）。
@@ -273,25 +265,44 @@ def _result_to_response(
     """
     # 送信成功（R6-6）。
     if isinstance(result, Success):
-        return _build_response(
-            200, {"message": "問い合わせを受け付けました。"}, cors_headers
+        return table.static(responses.SUCCESS, reflected_origin)
+    # 送信を後段（ドレインワーカー）へ受け付けた。受付 ID を応答に含める。
+    if isinstance(result, Accepted):
+        return table.dynamic(
+            202,
+            {
+                "message": "問い合わせを受け付けました。",
+                "acceptance_id": result.acceptance_id,
+            },
+            reflected_origin,
         )
     # 入力検証失敗（R5-2〜R5-6）。不備対象項目を応答に含める。
     if isinstance(result, ValidationError):
-        return _build_response(
+        return table.dynamic(
             400,
             {"error": "validation_error", "fields": list(result.fields)},
-            cors_headers,
+            reflected_origin,
         )
     # Origin 不正・欠落・空（R8-2, R8-3）。
     if isinstance(result, OriginRejected):
-        return _build_response(403, {"error": "origin_rejected"}, cors_headers)
+        return table.static(responses.ORIGIN_REJECTED, reflected_origin)
     # ハニーポット発火（R8-6）。
     if isinstance(result, HoneypotRejected):
-        return _build_response(403, {"error": "honeypot_rejected"}, cors_headers)
+        return table.static(responses.HONEYPOT_REJECTED, reflected_origin)
     # SES 送信失敗（R6-5）。個人データを含めない汎用メッセージのみ返す。
     if isinstance(result, SendFailed):
-        return _build_response(500, {"error": "send_failed"}, cors_headers)
+        if result.retry_after_seconds is not None:
+            # 一時的な失敗（スロットリング・遮断）は再試行の目安を Retry-After で伝える。
+            return table.dynamic(
+                503,
+                {"error": "send_unavailable"},
+                reflected_origin,
+                _retry_after_header(result.retry_after_seconds),
+            )
+        return table.static(responses.SEND_FAILED, reflected_origin)
+    # 同じ内容の送信が処理中（先行する送信の成否が未確定のため成功扱いにしない）。
+    if isinstance(result, DuplicateSubmission):
+        return table.static(responses.DUPLICATE_IN_FLIGHT, reflected_origin)
 
     # 網羅漏れ（未知の結果型）は握りつぶさず明示的に失敗させる（フォールバック禁止）。
     raise TypeError(f"未知の ContactResult 型です: {type(result)!r}")
@@ -301,6 +312,10 @@ def handle_contact_request(
     event: Mapping[str, object],
     config_provider: ConfigProvider,
     email_sender: EmailSender,
+    idempotency_store: IdempotencyStore | None = None,
+    rate_limiter: RateLimiter | None = None,
+    form_token_verifier: FormTokenVerifier | None = None,
+    stage_timer: StageTimer | None = None,
 ) -> dict[str, object]:
     """API Gateway プロキシ統合イベントを処理する（依存注入可能な本体）.
 
@@ -314,87 +329,148 @@ def handle_contact_request(
             `httpMethod`, `isBase64Encoded` を参照）。
         config_provider: 送信元/宛先/許可 Origin を供給する設定プロバイダ（抽象）。
         email_sender: 問い合わせメール送信の抽象ポート実装。
+        idempotency_store: 重複送信の抑止に用いる冪等性ストア（None の場合は
+            抑止せず、送信ごとに `send_contact` を呼ぶ）。
+        rate_limiter: 送信元 IP ごとのレート制限（None の場合は制限しない）。
+        form_token_verifier: フォームトークンの検証器（None の場合は検証しない）。
+        stage_timer: 処理段の所要時間を計測するポート（None の場合は計測しない）。
 
     Returns:
         dict[str, object]: API Gateway プロキシ統合形式の HTTP 応答
             （`statusCode`, `headers`, `body`）。
     """
     # ヘッダを小文字キーへ正規化し、大文字小文字非依存で参照する。
-    headers = _normalize_headers(event.get("headers"))
-    content_type = headers.get("content-type", "").lower()
-    # Origin ヘッダ（欠落時は None）。
-    origin = headers.get("origin")
-    # HTTP メソッド（欠落・非文字列は空文字として扱い、後続で 405 になる）。
-    raw_method = event.get("httpMethod")
-    method = raw_method.upper() if isinstance(raw_method, str) else ""
+    with timed(stage_timer, "headers"):
+        headers = _normalize_headers(event.get("headers"))
+        content_type = headers.get("content-type", "").lower()
+        # Origin ヘッダ（欠落時は None）。
+        origin = headers.get("origin")
+        # HTTP メソッド（欠落・非文字列は空文字として扱い、後続で 405 になる）。
+        raw_method = event.get("httpMethod")
+        method = raw_method.upper() if isinstance(raw_method, str) else ""
 
     # 許可 Origin 一覧を設定値から取得する。欠落時はフォールバックせず 500 とする
     # （出典: design.md Error Handling 設定値欠落行、requirements.md R6-7）。
+    # 許可 Origin 一覧に対応する事前計算済みの応答テーブル（Origin ポリシーを含む）を
+    # 得る。一覧が変わらない限り再利用し、固定応答はヘッダ辞書の複製のみで返す。
     try:
-        allowed_origins = config_provider.get_allowed_origins()
+        with timed(stage_timer, "config"):
+            allowed_origins = config_provider.get_allowed_origins()
+            table = _RESPONSE_TABLES.get(allowed_origins)
     except ConfigurationError:
-        # 設定値欠落・取得失敗は握りつぶさず明示ログの上 500 を返す（config_provider
-        # 側で exc_info を記録済み。ここでは重複出力を避け事実のみ記録）。
-        logger.error("許可 Origin 設定値の取得に失敗しました。")
+        # 設定値欠落・取得失敗・解釈できない規則は握りつぶさず明示ログの上 500 を返す
+        # （取得失敗は config_provider 側で exc_info を記録済み。ここでは事実のみ記録）。
+        logger.error("許可 Origin 設定値の取得またはコンパイルに失敗しました。")
         # 設定不備のため CORS ヘッダは付与できない。
-        return _build_response(500, {"error": "configuration_error"}, {})
+        return responses.configuration_error_without_cors()
 
-    # Origin が許可リストに含まれるか判定する（一致時のみ CORS で反映する）。
-    is_origin_allowed = origin is not None and origin in allowed_origins
-    # 許可時のみ ACAO に反映する Origin を決める。
-    reflected_origin = origin if is_origin_allowed else None
-    cors_headers = _build_cors_headers(reflected_origin)
+    # Origin が許可規則（完全一致・ワイルドカード）に一致する場合のみ ACAO に反映する。
+    reflected_origin = table.reflect(origin)
+    is_origin_allowed = reflected_origin is not None
 
     # CORS プリフライト（OPTIONS）への応答（出典: design.md C7、requirements.md R8-5）。
     if method == _METHOD_OPTIONS:
         if is_origin_allowed:
             # 許可 Origin のプリフライトには 204（No Content）+ CORS ヘッダで応答。
-            return _build_response(204, {}, cors_headers)
+            return table.static(responses.PREFLIGHT, reflected_origin)
         # 許可外 Origin のプリフライトは拒否する（ACAO を付与しない）。
-        logger.warning("許可外 Origin からのプリフライトを拒否しました。")
-        return _build_response(403, {"error": "origin_rejected"}, cors_headers)
+        logger.warning("許可外 Origin からのプリフライトを拒否しました。", extra=_REJECTION_LOG)
+        return table.static(responses.ORIGIN_REJECTED, reflected_origin)
 
     # POST 以外（かつ OPTIONS 以外）は許可しない（表示は静的配信、動的は POST のみ）。
     if method != _METHOD_POST:
-        return _build_response(
-            405, {"error": "method_not_allowed"}, cors_headers
-        )
+        return table.static(responses.METHOD_NOT_ALLOWED, reflected_origin)
 
     # Origin 検証: 不一致・欠落・空は 4xx で拒否し Email_Sender へ引き渡さない
     # （出典: requirements.md R8-1, R8-2, R8-3, R8-4、design.md C7, DM2）。
     if not is_origin_allowed:
-        logger.warning("許可外・欠落 Origin の問い合わせ POST を拒否しました。")
-        return _result_to_response(OriginRejected(), cors_headers)
+        logger.warning("許可外・欠落 Origin の問い合わせ POST を拒否しました。", extra=_REJECTION_LOG)
+        return _result_to_response(OriginRejected(), table, reflected_origin)
+
+    # 送信元 IP ごとのレート制限（ボディ解析・送信の前）。1 つの送信元が同時実行枠を
+    # 占有しないよう、トークンを取得できない POST は 429 と Retry-After で拒否する。
+    source_ip = _source_ip(event) if rate_limiter is not None else None
+    if rate_limiter is not None and source_ip is None:
+        # API Gateway は送信元 IP を必ず付与するため、欠落するのは直接の呼び出し
+        # （ローカル実行等）に限られる。互いを制限し合う共有バケットには入れず、
+        # 制限を適用しなかったことを明示ログに残す。
+        logger.warning("送信元 IP を取得できないためレート制限を適用せずに処理します。")
+    elif rate_limiter is not None:
+        try:
+            with timed(stage_timer, "rate_limit"):
+                decision = rate_limiter.acquire(source_ip)
+        except Exception:
+            # 制限を黙って無効化せず、一時的な失敗として 503 を返す（フォールバック禁止）。
+            logger.error("レート制限の判定に失敗しました。", exc_info=True)
+            return table.dynamic(
+                503,
+                {"error": "rate_limit_unavailable"},
+                reflected_origin,
+                _retry_after_header(1.0),
+            )
+        if not decision.allowed:
+            # 送信元 IP は個人データとなりうるためログに出力しない（GDPR、R9-5）。
+            logger.warning("レート制限を超えた問い合わせ POST を 429 で拒否しました。", extra=_REJECTION_LOG)
+            return table.dynamic(
+                429,
+                {"error": "rate_limited"},
+                reflected_origin,
+                _retry_after_header(decision.retry_after_seconds),
+            )
+
+    # フォームトークンと入力に要した時間の検証（ヘッダのみを参照し、ボディ解析の前）。
+    # トークンを持たない・読み込み直後に送信する自動投稿は解析・検証・送信を行わない。
+    if form_token_verifier is not None:
+        try:
+            with timed(stage_timer, "form_token"):
+                form_token_verifier.check(
+                    headers.get(_FORM_TOKEN_HEADER), headers.get(_FORM_ELAPSED_HEADER)
+                )
+        except FormTokenRejected as rejection:
+            # トークンの値は記録せず、拒否理由のみを記録する。
+            logger.warning(
+                "フォームトークンの検証に失敗した問い合わせ POST を拒否しました（reason=%s）。",
+                rejection.reason,
+                extra=_REJECTION_LOG,
+            )
+            return table.static(responses.FORM_TOKEN_REJECTED, reflected_origin)
 
     # ボディを問い合わせ入力の文字列辞書へ変換する。不正ボディは 400 で拒否する。
+    # 上限（入力検証の最大文字数から導出したバイト数・フィールド数）を超えるボディは
+    # 全量を復号・解析せずに 413 で拒否する。
     try:
-        parsed = _parse_body(
-            event.get("body"),
-            bool(event.get("isBase64Encoded")),
-            content_type,
-        )
+        with timed(stage_timer, "parse"):
+            parsed = parse_body(
+                event.get("body"),
+                bool(event.get("isBase64Encoded")),
+                content_type,
+            )
+    except PayloadTooLarge:
+        logger.warning("上限を超える問い合わせボディを 413 で拒否しました。", extra=_REJECTION_LOG)
+        return table.static(responses.PAYLOAD_TOO_LARGE, reflected_origin)
     except ValueError:
         # 不正ボディは握りつぶさず明示的に 400 とする（フォールバック禁止）。
         # 個人データを含めないため詳細値はログに出さず事実のみ記録する。
-        logger.warning("不正な問い合わせボディを 400 で拒否しました。")
-        return _build_response(400, {"error": "invalid_body"}, cors_headers)
+        logger.warning("不正な問い合わせボディを 400 で拒否しました。", extra=_REJECTION_LOG)
+        return table.static(responses.INVALID_BODY, reflected_origin)
 
     # ハニーポット判定: 隠しフィールドに空でない値があれば自動投稿として拒否する。
     # 当該フィールドは Contact_Payload に含めず収集・保存しない（出典: R8-6, R9-5、
     # design.md C7, DM1）。
     honeypot_value = parsed.get(_HONEYPOT_FIELD_NAME, "")
     if honeypot_value.strip() != "":
-        logger.warning("ハニーポット発火を検出し問い合わせを拒否しました。")
-        return _result_to_response(HoneypotRejected(), cors_headers)
+        logger.warning("ハニーポット発火を検出し問い合わせを拒否しました。", extra=_REJECTION_LOG)
+        return _result_to_response(HoneypotRejected(), table, reflected_origin)
 
     # 送信元・宛先アドレスを設定値から取得する（ハードコード禁止、R6-7）。
     # 欠落時はフォールバックせず 500 とする（design.md Error Handling）。
     try:
-        from_addr = config_provider.get_from_address()
-        to_addr = config_provider.get_to_address()
+        with timed(stage_timer, "config"):
+            from_addr = config_provider.get_from_address()
+            to_addr = config_provider.get_to_address()
     except ConfigurationError:
         logger.error("送信元/宛先アドレス設定値の取得に失敗しました。")
-        return _build_response(500, {"error": "configuration_error"}, cors_headers)
+        return table.static(responses.CONFIGURATION_ERROR, reflected_origin)
 
     # ユースケースへ渡すフィールドは 4 項目のみに限定する（ハニーポット等の非内容
     # フィールドを除去。出典: 本タスク指示、requirements.md R5-1, R9-5、
@@ -405,28 +481,117 @@ def handle_contact_request(
 
     # 検証済みユースケースを呼び出す。認証情報は渡さない（Cognito-ready、R13-2）。
     # 送信失敗（例外）は send_contact 内で握りつぶさず SendFailed として返る。
-    result = send_contact(content_fields, from_addr, to_addr, email_sender)
+    if idempotency_store is None:
+        result = send_contact(content_fields, from_addr, to_addr, email_sender, stage_timer)
+    else:
+        # 同じ内容・Origin の重複送信（ダブルクリック等）は SES を呼ばずに先行する
+        # 送信の結果で応答する（domain.idempotency）。
+        result = send_contact_once(
+            content_fields,
+            origin,
+            from_addr,
+            to_addr,
+            email_sender,
+            idempotency_store,
+            stage_timer,
+        )
 
     # 処理結果を HTTP 応答へマッピングして返す（design.md DM2）。
-    return _result_to_response(result, cors_headers)
+    return _result_to_response(result, table, reflected_origin)
+
+
+def _is_warmup_event(event: Mapping[str, object]) -> bool:
+    """イベントが EventBridge スケジュールによるウォームアップかを判定する.
+
+    Args:
+        event: Lambda に渡されたイベント。
+
+    Returns:
+        bool: `source` と `detail-type` がスケジュールイベントの値に一致する場合 True。
+    """
+    return (
+        event.get("source") == _WARMUP_EVENT_SOURCE
+        and event.get("detail-type") == _WARMUP_EVENT_DETAIL_TYPE
+    )
+
+
+def _prefetch_at_init(dependencies: ContactDependencies) -> bool:
+    """`CONTACT_INIT_PREFETCH` が真の場合に具象依存と設定値を先行取得する.
+
+    Args:
+        dependencies: 先行取得の対象レジストリ。
+
+    Returns:
+        bool: 先行取得を行い成功した場合 True、無効または失敗の場合 False。
+    """
+    try:
+        if not read_flag(_ENV_INIT_PREFETCH):
+            return False
+        dependencies.warm()
+    except ConfigurationError:
+        # INIT を失敗させると全呼び出しが停止するため、明示ログを残して継続する。
+        # 最初のリクエストで改めて取得し、失敗は 500 として顕在化する。
+        logger.error("INIT フェーズの設定値プリフェッチに失敗しました。", exc_info=True)
+        return False
+    return True
 
 
 def lambda_handler(event: Mapping[str, object], context: object) -> dict[str, object]:
     """Lambda エントリポイント（本番用の具象を組み立てて委譲する composition root）.
 
-    本番用の具象アダプタ（`SsmConfigProvider` / `SesEmailSender`）を生成し、
-    実処理を `handle_contact_request` へ委譲する（依存性逆転・テスト容易性の
-    ため実処理本体から依存生成を分離。出典: 本タスク指示、design.md C3）。
-    Django は import・ロードしない（requirements.md R4-1, R4-2）。
+    本番用の具象アダプタ（`SsmConfigProvider` / `SesEmailSender`）をレジストリ
+    `_DEPENDENCIES` から取得し、実処理を `handle_contact_request` へ委譲する
+    （依存性逆転・テスト容易性のため実処理本体から依存生成を分離。出典: 本タスク
+    指示、design.md C3）。具象は初回呼び出し時に生成され、ウォーム呼び出しでは
+    再利用される。Django は import・ロードしない（requirements.md R4-1, R4-2）。
+    ウォームアップイベントではキャッシュを満たしたうえで即時に返す。
 
     Args:
-        event: API Gateway プロキシ統合イベント。
-        context: Lambda コンテキストオブジェクト（本処理では未使用）。
+        event: API Gateway プロキシ統合イベント、またはウォームアップイベント。
+        context: Lambda コンテキストオブジェクト（残り時間を SES 再試行の期限に用いる）。
 
     Returns:
-        dict[str, object]: API Gateway プロキシ統合形式の HTTP 応答。
+        dict[str, object]: API Gateway プロキシ統合形式の HTTP 応答
+            （ウォームアップイベントでは `{"warmed": True}`）。
+
+    Raises:
+        ConfigurationError: ウォームアップで依存の生成・設定値の取得に失敗した場合。
     """
-    # composition root: 具象依存をここでのみ生成し注入する。
-    config_provider = SsmConfigProvider()
-    email_sender = SesEmailSender()
-    return handle_contact_request(event, config_provider, email_sender)
+    if _is_warmup_event(event):
+        _DEPENDENCIES.warm()
+        return {"warmed": True}
+
+    # SES 再試行の期限をこの呼び出しの残り時間から設定する。
+    begin_invocation(context)
+    # 処理段の計測（EMF 出力が無効な場合は計測しない）。
+    metrics_emitter = _DEPENDENCIES.metrics_emitter()
+    metrics = InvocationMetrics() if metrics_emitter is not None else None
+    # 呼び出し全体のスパン（ポート呼び出しのスパンの親。トレーシング無効時は記録しない）。
+    with timed(_DEPENDENCIES.tracer(), "contact_request"):
+        # composition root: 実行環境単位で共有する具象依存を取得して注入する。
+        with timed(metrics, "dependencies"):
+            config_provider = _DEPENDENCIES.config_provider()
+            email_sender = _DEPENDENCIES.email_sender()
+            idempotency_store = _DEPENDENCIES.idempotency_store()
+            rate_limiter = _DEPENDENCIES.rate_limiter()
+            form_token_verifier = _DEPENDENCIES.form_token_verifier()
+        response = handle_contact_request(
+            event,
+            config_provider,
+            email_sender,
+            idempotency_store,
+            rate_limiter,
+            form_token_verifier,
+            metrics,
+        )
+    if metrics_emitter is not None:
+        # 1 呼び出し 1 行の EMF を標準出力へ書き出す（個人データを含めない）。
+        metrics_emitter.emit(metrics, response)
+    return response
+
+
+# INIT フェーズ（import 時）のログ出力の設定（環境変数はここで 1 度だけ解決する）。
+configure_logging()
+
+# INIT フェーズ（import 時）の先行取得（`CONTACT_INIT_PREFETCH` が真の場合のみ）。
+_prefetch_at_init(_DEPENDENCIES)
@@ -0,0 +1,233 @@
+"""呼び出し単位の処理段計測と CloudWatch Embedded Metric Format（EMF）出力モジュール.
+
+1 回の呼び出しの所要時間がどの処理段（ヘッダ正規化・設定値取得・ボディ解析・
+入力検証・SES 送信等）に費やされたかを、追加の API 呼び出しなしに CloudWatch の
+メトリクスとして観測するための計測面を提供する。
+
+計測（`InvocationMetrics`）:
+    - `ports.StageTimer` の実装。handler とユースケースが `stage(name)` の文脈で
+      処理段を囲み、`time.perf_counter` による所要時間（ミリ秒）を処理段ごとに
+      合算する（同じ処理段を複数回通る場合は合計）。
+    - 計測値は所要時間のみで、問い合わせ内容・Origin・送信元 IP を保持しない
+      （GDPR、出典: requirements.md R9-5）。
+
+出力（`EmfMetricsEmitter`）:
+    - 1 呼び出しにつき 1 行の EMF JSON を標準出力へ書き出す。Lambda は標準出力を
+      CloudWatch Logs へ送り、CloudWatch が `_aws` メタデータからメトリクスを抽出する
+      （PutMetricData の呼び出しは不要）。
+    - メトリクスは `TotalMs`（呼び出し全体）と処理段ごとの `<Stage>Ms`
+      （例: `ParseMs`, `SendMs`）。ディメンションは `Result`（応答の種別。handler が
+      生成する固定の識別子のみ）と `ColdStart`（`cold` / `warm`）の 2 つに限定し、
+      カーディナリティを有界に保つ。
+    - 出力の失敗は応答を変えず、`exc_info` 付きで明示記録する（メトリクスの欠落で
+      利用者への応答を失敗させない）。
+
+Django・handler 層に依存しない。
+"""
+
+import json
+import logging
+import re
+import sys
+import time
+from collections.abc import Callable, Mapping
+from typing import TextIO
+
+from contact_function.domain.ports import StageTimer
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md
+# 「logger = logging.getLogger(__name__)」パターン）。
+logger = logging.getLogger(__name__)
+
+# EMF のディメンション名とメトリクスの単位。
+_DIMENSION_RESULT = "Result"
+_DIMENSION_COLD_START = "ColdStart"
+_UNIT_MILLISECONDS = "Milliseconds"
+
+# 呼び出し全体の所要時間のメトリクス名。
+_TOTAL_METRIC_NAME = "TotalMs"
+
+# ボディに `error` を持たない応答の種別（ステータスコード → 種別）。
+_RESULT_BY_STATUS = {200: "success", 202: "accepted", 204: "preflight"}
+
+# `Result` ディメンションに用いる識別子の形式（handler が返すエラー識別子）。
+# 形式に合わない値は `error_<ステータス>` にまとめ、ディメンションを有界に保つ。
+_RESULT_PATTERN = re.compile(r"[a-z_]{1,40}")
+
+# 処理段の名前の形式（`snake_case`。メトリクス名 `<CamelCase>Ms` へ変換する）。
+_STAGE_NAME_PATTERN = re.compile(r"[a-z][a-z_]{0,39}")
+
+# 所要時間の丸め桁数（ミリ秒の小数点以下。マイクロ秒単位）。
+_DURATION_DIGITS = 3
+
+
+class _Span:
+    """1 つの処理段の計測文脈（`InvocationMetrics.stage` が返す）."""
+
+    __slots__ = ("_metrics", "_name", "_started_at")
+
+    def __init__(self, metrics: "InvocationMetrics", name: str) -> None:
+        """計測対象を保持する."""
+        self._metrics = metrics
+        self._name = name
+        self._started_at = 0.0
+
+    def __enter__(self) -> None:
+        """計測を開始する."""
+        self._started_at = self._metrics._clock()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """所要時間を記録する（例外は伝播させる）."""
+        self._metrics._add(self._name, self._metrics._clock() - self._started_at)
+
+
+class InvocationMetrics(StageTimer):
+    """1 回の呼び出しの処理段ごとの所要時間を合算する計測器."""
+
+    __slots__ = ("_clock", "_started_at", "_durations")
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """呼び出しの開始時刻を記録する.
+
+        Args:
+            clock: 単調増加する時刻（秒）を返す関数（テスト用に注入可能）。
+        """
+        self._clock = clock
+        self._started_at = clock()
+        # 処理段 → 所要時間（秒）の合計。記録順を保持する。
+        self._durations: dict[str, float] = {}
+
+    def stage(self, name: str) -> _Span:
+        """処理段の所要時間を計測する文脈を返す.
+
+        Raises:
+            ValueError: 処理段の名前が `snake_case` でない場合（メトリクス名を
+                入力値から作らない）。
+        """
+        if not _STAGE_NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"処理段の名前が不正です: {name!r}")
+        return _Span(self, name)
+
+    def _add(self, name: str, seconds: float) -> None:
+        """処理段の所要時間を合算する."""
+        self._durations[name] = self._durations.get(name, 0.0) + seconds
+
+    def durations_ms(self) -> dict[str, float]:
+        """処理段ごとの所要時間（ミリ秒）を記録順に返す."""
+        return {name: seconds * 1000.0 for name, seconds in self._durations.items()}
+
+    def total_ms(self) -> float:
+        """呼び出しの開始からの経過時間（ミリ秒）を返す."""
+        return (self._clock() - self._started_at) * 1000.0
+
+
+def result_label(response: Mapping[str, object]) -> str:
+    """HTTP 応答から `Result` ディメンションの値を導出する.
+
+    Args:
+        response: handler が返した API Gateway プロキシ統合形式の応答。
+
+    Returns:
+        str: 200/202/204 は `success` / `accepted` / `preflight`、それ以外は
+            ボディの `error` 識別子（形式に合わない場合は `error_<ステータス>`）。
+    """
+    status_code = response.get("statusCode")
+    label = _RESULT_BY_STATUS.get(status_code)
+    if label is not None:
+        return label
+    body = response.get("body")
+    try:
+        error = json.loads(body).get("error") if isinstance(body, str) else None
+    except (ValueError, AttributeError):
+        error = None
+    if isinstance(error, str) and _RESULT_PATTERN.fullmatch(error):
+        return error
+    return f"error_{status_code}"
+
+
+def _metric_name(stage_name: str) -> str:
+    """処理段の名前（`snake_case`）をメトリクス名（`CamelCaseMs`）へ変換する."""
+    return "".join(part.capitalize() for part in stage_name.split("_")) + "Ms"
+
+
+class EmfMetricsEmitter:
+    """計測結果を 1 呼び出し 1 行の EMF JSON として出力する.
+
+    実行環境（コンテナ）単位で 1 つを保持し、最初に出力する呼び出しを
+    `ColdStart=cold`、以後を `warm` とする。
+    """
+
+    __slots__ = ("_namespace", "_stream", "_clock", "_emitted")
+
+    def __init__(
+        self,
+        namespace: str,
+        stream: TextIO | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """出力先を初期化する.
+
+        Args:
+            namespace: CloudWatch メトリクスの名前空間。
+            stream: 出力先（None の場合は出力時点の `sys.stdout`）。
+            clock: 現在時刻（UNIX 秒）を返す関数（EMF の `Timestamp` に用いる）。
+        """
+        self._namespace = namespace
+        self._stream = stream
+        self._clock = clock
+        self._emitted = False
+
+    def build_record(
+        self, metrics: InvocationMetrics, response: Mapping[str, object], cold_start: bool
+    ) -> dict[str, object]:
+        """EMF の 1 レコード（JSON オブジェクト）を組み立てる.
+
+        Args:
+            metrics: 呼び出しの計測結果。
+            response: handler が返した応答（`Result` ディメンションの導出に用いる）。
+            cold_start: 実行環境の最初の呼び出しの場合 True。
+
+        Returns:
+            dict[str, object]: `_aws` メタデータ・ディメンション・メトリクス値を持つ
+                レコード。
+        """
+        values = {_TOTAL_METRIC_NAME: metrics.total_ms()}
+        for stage_name, milliseconds in metrics.durations_ms().items():
+            values[_metric_name(stage_name)] = milliseconds
+        return {
+            "_aws": {
+                "Timestamp": int(self._clock() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": self._namespace,
+                        "Dimensions": [[_DIMENSION_RESULT, _DIMENSION_COLD_START]],
+                        "Metrics": [
+                            {"Name": name, "Unit": _UNIT_MILLISECONDS} for name in values
+                        ],
+                    }
+                ],
+            },
+            _DIMENSION_RESULT: result_label(response),
+            _DIMENSION_COLD_START: "cold" if cold_start else "warm",
+            **{name: round(value, _DURATION_DIGITS) for name, value in values.items()},
+        }
+
+    def emit(self, metrics: InvocationMetrics, response: Mapping[str, object]) -> None:
+        """計測結果を 1 行の EMF JSON として出力する.
+
+        Args:
+            metrics: 呼び出しの計測結果。
+            response: handler が返した応答。
+        """
+        cold_start = not self._emitted
+        self._emitted = True
+        try:
+            line = json.dumps(
+                self.build_record(metrics, response, cold_start), separators=(",", ":")
+            )
+            stream = self._stream if self._stream is not None else sys.stdout
+            stream.write(line + "\n")
+            stream.flush()
+        except Exception:
+            # 応答は変えない（メトリクスの欠落で利用者への応答を失敗させない）。
+            logger.error("EMF メトリクスの出力に失敗しました。", exc_info=True)
@@ -0,0 +1,222 @@
+"""Contact_Function の許可 Origin 判定（コンパイル済み Origin ポリシー）モジュール.
+
+許可 Origin 設定値（Parameter Store `csrf_trusted_origins`、出典: design.md DM4、
+requirements.md R8-1）を設定値の読み込みごとに 1 度だけ `OriginPolicy` へコンパイルし、
+リクエストの `Origin` ヘッダを判定する。従来は `origin in allowed_origins`（タプルの
+線形走査・文字列の完全一致）で判定しており、ブランチごとのプレビュー環境のような
+`https://*.example.com` 形式の規則を表現できなかった。
+
+規則の書式（設定値の各要素）:
+    - 完全一致（既定・従来どおり）: `https://example.com`、`http://localhost:8000`。
+    - サブドメインのワイルドカード: `https://*.example.com`。先頭ラベルの `*.` のみ
+      許可し、任意の深さのサブドメイン（`a.example.com`・`a.b.example.com`）と
+      apex（`example.com`）に一致する。同じ設定値を用いる Django の
+      `CSRF_TRUSTED_ORIGINS`（`config/settings/prod.py`）のワイルドカード解釈と揃える。
+    - ポート: 省略時は scheme の既定ポート（http: 80、https: 443）のみ。`:8080` は
+      そのポートのみ、`:*` は任意のポートに一致する（ワイルドカード規則でのみ許可）。
+
+正規化（RFC 6454 の Origin の直列化に合わせる）:
+    - scheme・host は小文字化し、scheme の既定ポートは省略形へ揃える。
+    - パス・クエリ・フラグメント・userinfo を含む値は Origin ではないため一致しない
+      （設定値に含まれる場合は `ConfigurationError`）。
+
+判定の順序と統計:
+    1. 生の Origin 文字列の完全一致（frozenset、正規化なし）。
+    2. 正規化した Origin の完全一致（frozenset）。
+    3. 事前コンパイル済みのワイルドカード規則（正規表現）。
+    各段の一致数・不一致数を `OriginPolicy.stats()` で取得できる（運用時の規則見直し用）。
+
+フォールバック禁止（出典: 第三原則3、requirements.md R8-1〜R8-3）:
+    - 解釈できない規則・全許可（`*`）・scheme のワイルドカードは黙って無視せず
+      `ConfigurationError` で失敗させる（handler は 500 `configuration_error` を返す）。
+    - Django を import しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from contact_function.adapters.config_provider import ConfigurationError
+
+# 受け付ける scheme と既定ポート（Origin の直列化で省略されるポート）。
+_DEFAULT_PORTS: dict[str, int] = {"http": 80, "https": 443}
+
+# ワイルドカード規則の任意ポート指定。
+_ANY_PORT = "*"
+
+# Origin（scheme://host[:port]）の構文。host は英数字・ハイフン・ドット（IPv6 リテラル
+# を含む角括弧表記も許可する）。
+_ORIGIN_PATTERN = re.compile(
+    r"^(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*)://"
+    r"(?P<host>\[[0-9A-Fa-f:.]+\]|[A-Za-z0-9.-]+)"
+    r"(?::(?P<port>[0-9]{1,5}))?$"
+)
+
+# ワイルドカード規則の構文（`scheme://*.suffix[:port|:*]`）。
+_WILDCARD_PATTERN = re.compile(
+    r"^(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*)://\*\."
+    r"(?P<suffix>[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*)"
+    r"(?::(?P<port>[0-9]{1,5}|\*))?$"
+)
+
+# ワイルドカードの 1 ラベル（DNS ラベルの文字）。
+_LABEL_REGEX = r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+
+
+def normalize_origin(value: str) -> str | None:
+    """Origin を正規形（小文字の scheme・host、既定ポートは省略）へ変換する.
+
+    Args:
+        value: Origin ヘッダまたは設定値の文字列。
+
+    Returns:
+        str | None: 正規形の Origin。Origin として解釈できない場合（パス付き、
+            未対応の scheme、範囲外のポート等）は None。
+    """
+    match = _ORIGIN_PATTERN.match(value)
+    if match is None:
+        return None
+    scheme = match.group("scheme").lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port is None:
+        return None
+    host = match.group("host").lower()
+    raw_port = match.group("port")
+    if raw_port is None:
+        return f"{scheme}://{host}"
+    port = int(raw_port)
+    if not 0 < port < 65536:
+        return None
+    if port == default_port:
+        return f"{scheme}://{host}"
+    return f"{scheme}://{host}:{port}"
+
+
+def _compile_wildcard(rule: str) -> re.Pattern[str]:
+    """ワイルドカード規則を正規形の Origin に対する正規表現へコンパイルする."""
+    match = _WILDCARD_PATTERN.match(rule)
+    if match is None:
+        raise ConfigurationError(
+            f"許可 Origin の規則を解釈できません（ワイルドカードは先頭ラベルの '*.' のみ）: "
+            f"'{rule}'"
+        )
+    scheme = match.group("scheme").lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port is None:
+        raise ConfigurationError(f"許可 Origin の scheme は http/https のみです: '{rule}'")
+    suffix = re.escape(match.group("suffix").lower())
+    raw_port = match.group("port")
+    if raw_port is None or (raw_port != _ANY_PORT and int(raw_port) == default_port):
+        # 既定ポートは正規形では省略されるため、ポートなしのみに一致させる。
+        port_regex = ""
+    elif raw_port == _ANY_PORT:
+        port_regex = r"(?::[0-9]{1,5})?"
+    else:
+        port_regex = f":{int(raw_port)}"
+    return re.compile(rf"{re.escape(scheme)}://(?:{_LABEL_REGEX}\.)*{suffix}{port_regex}")
+
+
+@dataclass(frozen=True, slots=True)
+class OriginMatchStats:
+    """Origin 判定の統計（取得時点のスナップショット）.
+
+    Attributes:
+        exact_hits: 完全一致（生の文字列・正規形のいずれか）で許可した回数。
+        wildcard_hits: ワイルドカード規則で許可した回数。
+        misses: 許可しなかった回数（欠落・空・解釈不能を含む）。
+    """
+
+    exact_hits: int
+    wildcard_hits: int
+    misses: int
+
+
+class OriginPolicy:
+    """設定値の読み込みごとにコンパイルする許可 Origin ポリシー.
+
+    Attributes:
+        rules: コンパイル元の規則（設定値の順序のまま）。
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、統計の更新は排他制御を
+    持たない。
+    """
+
+    __slots__ = (
+        "rules",
+        "_raw_exact",
+        "_exact",
+        "_wildcards",
+        "_exact_hits",
+        "_wildcard_hits",
+        "_misses",
+    )
+
+    def __init__(self, rules: Iterable[str]) -> None:
+        """規則をコンパイルする.
+
+        Args:
+            rules: 許可 Origin の規則（完全一致またはワイルドカード）。
+
+        Raises:
+            ConfigurationError: 解釈できない規則、全許可（`*`）を含む場合。
+        """
+        self.rules: tuple[str, ...] = tuple(rule.strip() for rule in rules if rule.strip())
+        exact: list[str] = []
+        wildcards: list[re.Pattern[str]] = []
+        for rule in self.rules:
+            if "*" not in rule:
+                normalized = normalize_origin(rule)
+                if normalized is None:
+                    raise ConfigurationError(
+                        f"許可 Origin の規則を Origin として解釈できません: '{rule}'"
+                    )
+                exact.append(normalized)
+            elif rule == "*":
+                # 全許可は CSRF 相当の送信元検証（R8-4）を無効化するため受け付けない。
+                raise ConfigurationError("許可 Origin に全許可（'*'）は指定できません。")
+            else:
+                wildcards.append(_compile_wildcard(rule))
+        self._raw_exact = frozenset(rule for rule in self.rules if "*" not in rule)
+        self._exact = frozenset(exact)
+        self._wildcards = tuple(wildcards)
+        self._exact_hits = 0
+        self._wildcard_hits = 0
+        self._misses = 0
+
+    def matches(self, origin: str | None) -> bool:
+        """Origin が許可されるかを判定し、統計を更新する.
+
+        Args:
+            origin: リクエストの `Origin` ヘッダ（欠落時は None）。
+
+        Returns:
+            bool: 許可される場合 True。欠落・空・解釈不能・不一致は False。
+        """
+        if not origin:
+            self._misses += 1
+            return False
+        # 高速経路: 設定値どおりの文字列（ブラウザが送る正規形と通常一致する）。
+        if origin in self._raw_exact:
+            self._exact_hits += 1
+            return True
+        normalized = normalize_origin(origin)
+        if normalized is None:
+            self._misses += 1
+            return False
+        if normalized in self._exact:
+            self._exact_hits += 1
+            return True
+        for pattern in self._wildcards:
+            if pattern.fullmatch(normalized):
+                self._wildcard_hits += 1
+                return True
+        self._misses += 1
+        return False
+
+    def stats(self) -> OriginMatchStats:
+        """判定の統計のスナップショットを返す."""
+        return OriginMatchStats(
+            exact_hits=self._exact_hits,
+            wildcard_hits=self._wildcard_hits,
+            misses=self._misses,
+        )
@@ -0,0 +1,284 @@
+"""Contact_Function の HTTP 応答テーブル（事前計算済みの応答本文・ヘッダ）モジュール.
+
+handler が返す API Gateway プロキシ統合形式の応答のうち、内容が固定のもの
+（プリフライト 204、Origin 拒否 403、405、設定不備 500 等）は、許可 Origin 設定値が
+決まれば（応答種別, 反映 Origin）ごとに完全に決まる。従来は呼び出しのたびに CORS
+ヘッダ辞書を組み立て、同じ定数ボディを `json.dumps` していた。
+
+本モジュールは許可 Origin 一覧から `ResponseTable` を 1 度だけ組み立て、
+    - 固定応答の JSON ボディ（直列化済み文字列）
+    - 反映 Origin ごとの不変なヘッダテンプレート（`Content-Type` と CORS ヘッダ）
+を事前計算する。ホットパス（大量のプリフライト・Origin 拒否）は辞書 1 回の参照と
+小さなヘッダ辞書の複製だけで応答を返す。内容が入力で変わる応答（202 の受付 ID、
+400 の不備項目、503 の Retry-After）はボディのみ都度直列化し、ヘッダは同じ
+テンプレートを用いる。
+
+設計上の遵守事項:
+    - 返す応答は毎回新しい辞書（ヘッダも複製）とし、呼び出し側の変更がテーブルへ
+      波及しないようにする。
+    - 許可 Origin 一覧が変わった場合（設定値キャッシュの更新）は
+      `ResponseTableCache` がテーブルを組み立て直す（古い許可リストで応答しない）。
+    - Origin の許可判定は `origin_policy.OriginPolicy`（完全一致の frozenset と
+      コンパイル済みワイルドカード規則）へ委ね、テーブルと同時に 1 度だけコンパイル
+      する。ワイルドカードで許可された Origin のヘッダは初回に組み立てて上限付きで
+      保持する。
+    - 未知の応答種別は `KeyError` で明示的に失敗させる（フォールバック禁止、
+      出典: 第三原則3）。
+    - Django を import しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import json
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+
+from contact_function.origin_policy import OriginPolicy
+
+# 許可する HTTP メソッド（表示は静的配信のため、動的経路は POST とプリフライト
+# の OPTIONS のみ。出典: design.md C7、requirements.md R8-5）。
+_ALLOWED_METHODS_HEADER_VALUE = "POST, OPTIONS"
+
+# CORS プリフライトで許可するリクエストヘッダ（問い合わせ送信に必要な最小限。
+# フォームトークンと入力に要した時間は `contact_function.form_token` の検証に用いる）。
+_ALLOWED_HEADERS_HEADER_VALUE = "Content-Type, X-Form-Token, X-Form-Elapsed-Ms"
+
+# CORS プリフライトのキャッシュ秒数（過度な再プリフライトを避けるための最小設定）。
+_PREFLIGHT_MAX_AGE_SECONDS = "600"
+
+# ワイルドカード規則で許可された Origin のヘッダを保持する上限（プレビュー環境の
+# 数に対して十分大きく、任意のサブドメインを送る攻撃でメモリを増やさない値）。
+_MAX_MEMOIZED_WILDCARD_ORIGINS = 256
+
+# 固定応答の種別。
+PREFLIGHT = "preflight"
+SUCCESS = "success"
+ORIGIN_REJECTED = "origin_rejected"
+HONEYPOT_REJECTED = "honeypot_rejected"
+METHOD_NOT_ALLOWED = "method_not_allowed"
+INVALID_BODY = "invalid_body"
+PAYLOAD_TOO_LARGE = "payload_too_large"
+CONFIGURATION_ERROR = "configuration_error"
+SEND_FAILED = "send_failed"
+DUPLICATE_IN_FLIGHT = "duplicate_in_flight"
+FORM_TOKEN_REJECTED = "form_token_rejected"
+
+# 固定応答の（ステータスコード, JSON ボディ）（出典: design.md DM2）。
+_STATIC_RESPONSES: dict[str, tuple[int, dict[str, object]]] = {
+    PREFLIGHT: (204, {}),
+    SUCCESS: (200, {"message": "問い合わせを受け付けました。"}),
+    ORIGIN_REJECTED: (403, {"error": "origin_rejected"}),
+    HONEYPOT_REJECTED: (403, {"error": "honeypot_rejected"}),
+    METHOD_NOT_ALLOWED: (405, {"error": "method_not_allowed"}),
+    INVALID_BODY: (400, {"error": "invalid_body"}),
+    PAYLOAD_TOO_LARGE: (413, {"error": "payload_too_large"}),
+    CONFIGURATION_ERROR: (500, {"error": "configuration_error"}),
+    SEND_FAILED: (500, {"error": "send_failed"}),
+    DUPLICATE_IN_FLIGHT: (409, {"error": "duplicate_in_flight"}),
+    FORM_TOKEN_REJECTED: (403, {"error": "form_token_rejected"}),
+}
+
+
+def serialize_body(body: Mapping[str, object]) -> str:
+    """応答ボディを JSON 文字列化する（日本語を保持するため ensure_ascii=False）."""
+    return json.dumps(body, ensure_ascii=False)
+
+
+# 固定応答の直列化済みボディ（許可 Origin に依存しないため import 時に 1 度だけ計算する）。
+_SERIALIZED_STATIC_RESPONSES: dict[str, tuple[int, str]] = {
+    kind: (status_code, serialize_body(body))
+    for kind, (status_code, body) in _STATIC_RESPONSES.items()
+}
+
+
+def build_headers(reflected_origin: str | None) -> dict[str, str]:
+    """`Content-Type` と CORS 応答ヘッダを組み立てる.
+
+    許可された Origin に対してのみ `Access-Control-Allow-Origin` を反映する。
+    許可されていない場合は ACAO を付与しない（ブラウザ側でブロックさせる）。
+
+    Args:
+        reflected_origin: 応答に反映する許可済み Origin。許可対象外・欠落時は None。
+
+    Returns:
+        dict[str, str]: 応答ヘッダ。`reflected_origin` が None の場合は
+            オリジン非依存のヘッダのみを返し `Access-Control-Allow-Origin` を含めない。
+    """
+    # 許可メソッド・許可ヘッダ・キャッシュ秒数は常に返す（CORS 契約の明示）。
+    headers: dict[str, str] = {
+        "Content-Type": "application/json",
+        "Access-Control-Allow-Methods": _ALLOWED_METHODS_HEADER_VALUE,
+        "Access-Control-Allow-Headers": _ALLOWED_HEADERS_HEADER_VALUE,
+        "Access-Control-Max-Age": _PREFLIGHT_MAX_AGE_SECONDS,
+        # Origin ごとに応答が変わるため Vary を明示し、キャッシュ汚染を防ぐ。
+        "Vary": "Origin",
+    }
+    if reflected_origin is not None:
+        # 許可済み Origin のみを反映する（ワイルドカードは使わない、ゼロトラスト）。
+        headers["Access-Control-Allow-Origin"] = reflected_origin
+    return headers
+
+
+# 設定不備で許可 Origin が得られない場合の応答（CORS ヘッダを付与できない）。
+_CONFIGURATION_ERROR_WITHOUT_CORS: tuple[int, Mapping[str, str], str] = (
+    _SERIALIZED_STATIC_RESPONSES[CONFIGURATION_ERROR][0],
+    MappingProxyType({"Content-Type": "application/json"}),
+    _SERIALIZED_STATIC_RESPONSES[CONFIGURATION_ERROR][1],
+)
+
+
+def _materialize(entry: tuple[int, Mapping[str, str], str]) -> dict[str, object]:
+    """事前計算済みの応答から新しい応答辞書を作る（ヘッダは複製する）."""
+    status_code, headers, body = entry
+    return {"statusCode": status_code, "headers": dict(headers), "body": body}
+
+
+def configuration_error_without_cors() -> dict[str, object]:
+    """許可 Origin 設定値を取得できない場合の 500 応答（CORS ヘッダなし）を返す."""
+    return _materialize(_CONFIGURATION_ERROR_WITHOUT_CORS)
+
+
+class ResponseTable:
+    """許可 Origin 一覧ごとの事前計算済み応答テーブル.
+
+    Attributes:
+        allowed_origins: テーブルの組み立てに用いた許可 Origin の不変な列。
+        policy: `allowed_origins` からコンパイルした Origin ポリシー。
+    """
+
+    __slots__ = (
+        "allowed_origins",
+        "policy",
+        "_source",
+        "_headers",
+        "_static",
+        "_wildcard_headers",
+    )
+
+    def __init__(self, allowed_origins: Iterable[str]) -> None:
+        """許可 Origin 一覧から全（応答種別, 反映 Origin）の応答を事前計算する.
+
+        Args:
+            allowed_origins: 許可 Origin 一覧（設定値由来。ワイルドカード規則を含みうる）。
+
+        Raises:
+            ConfigurationError: 許可 Origin の規則を解釈できない場合。
+        """
+        # 不変な列のみ同一性判定に用いる（可変な列は内容が変わりうるため比較する）。
+        self._source = allowed_origins if isinstance(allowed_origins, tuple) else None
+        self.allowed_origins: tuple[str, ...] = tuple(allowed_origins)
+        self.policy = OriginPolicy(self.allowed_origins)
+        # 反映 Origin（許可外は None）→ 不変なヘッダテンプレート。完全一致の規則のみ
+        # 事前計算する（ワイルドカードで許可された Origin は初回に組み立てる）。
+        self._headers: dict[str | None, Mapping[str, str]] = {
+            origin: MappingProxyType(build_headers(origin))
+            for origin in (None, *self.allowed_origins)
+            if origin is None or "*" not in origin
+        }
+        self._wildcard_headers: dict[str, Mapping[str, str]] = {}
+        # （応答種別, 反映 Origin）→（ステータス, ヘッダ, 直列化済みボディ）。
+        self._static: dict[tuple[str, str | None], tuple[int, Mapping[str, str], str]] = {
+            (kind, origin): (status_code, headers, body)
+            for kind, (status_code, body) in _SERIALIZED_STATIC_RESPONSES.items()
+            for origin, headers in self._headers.items()
+        }
+
+    def matches(self, allowed_origins: Iterable[str]) -> bool:
+        """本テーブルが `allowed_origins` から組み立てたものかを返す.
+
+        設定値キャッシュは同じ不変な列を返し続けるため、まず同一性で判定し、
+        異なるオブジェクトの場合のみ内容を比較する。
+        """
+        return allowed_origins is self._source or tuple(allowed_origins) == self.allowed_origins
+
+    def reflect(self, origin: str | None) -> str | None:
+        """Origin が許可される場合のみそのまま返す（それ以外は None）.
+
+        ACAO にはブラウザが送った値をそのまま反映する（ブラウザは自身の直列化した
+        Origin と ACAO を文字列として比較するため、正規形へ書き換えない）。
+        """
+        return origin if self.policy.matches(origin) else None
+
+    def headers(self, reflected_origin: str | None) -> Mapping[str, str]:
+        """反映 Origin に対応する不変なヘッダテンプレートを返す."""
+        headers = self._headers.get(reflected_origin)
+        if headers is not None:
+            return headers
+        if reflected_origin is None:
+            raise KeyError(reflected_origin)
+        headers = self._wildcard_headers.get(reflected_origin)
+        if headers is None:
+            headers = MappingProxyType(build_headers(reflected_origin))
+            if len(self._wildcard_headers) < _MAX_MEMOIZED_WILDCARD_ORIGINS:
+                self._wildcard_headers[reflected_origin] = headers
+        return headers
+
+    def static(self, kind: str, reflected_origin: str | None) -> dict[str, object]:
+        """固定応答を返す.
+
+        Args:
+            kind: 応答種別（`PREFLIGHT` 等の本モジュールの定数）。
+            reflected_origin: 応答に反映する許可済み Origin（許可外は None）。
+
+        Returns:
+            dict[str, object]: `{"statusCode", "headers", "body"}` 形式の新しい応答。
+
+        Raises:
+            KeyError: 未知の応答種別の場合。
+        """
+        entry = self._static.get((kind, reflected_origin))
+        if entry is None:
+            # 完全一致以外（ワイルドカードで許可、または大文字小文字等が設定値と異なる
+            # Origin）は、直列化済みボディと反映 Origin のヘッダから組み立てる。
+            status_code, body = _SERIALIZED_STATIC_RESPONSES[kind]
+            entry = (status_code, self.headers(reflected_origin), body)
+        return _materialize(entry)
+
+    def dynamic(
+        self,
+        status_code: int,
+        body: Mapping[str, object],
+        reflected_origin: str | None,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> dict[str, object]:
+        """内容が入力で変わる応答を返す（ボディのみ都度直列化する）.
+
+        Args:
+            status_code: HTTP ステータスコード。
+            body: JSON 応答ボディ。
+            reflected_origin: 応答に反映する許可済み Origin（許可外は None）。
+            extra_headers: テンプレートへ追加するヘッダ（`Retry-After` 等）。
+
+        Returns:
+            dict[str, object]: `{"statusCode", "headers", "body"}` 形式の新しい応答。
+        """
+        headers = dict(self.headers(reflected_origin))
+        if extra_headers:
+            headers.update(extra_headers)
+        return {"statusCode": status_code, "headers": headers, "body": serialize_body(body)}
+
+
+class ResponseTableCache:
+    """最新の許可 Origin 一覧に対応する `ResponseTable` を 1 つだけ保持するキャッシュ.
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、排他制御を持たない。
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self) -> None:
+        """空のキャッシュを作る（テーブルは初回要求時に組み立てる）."""
+        self._table: ResponseTable | None = None
+
+    def get(self, allowed_origins: Iterable[str]) -> ResponseTable:
+        """許可 Origin 一覧に対応するテーブルを返す（変わっていれば組み立て直す）.
+
+        Args:
+            allowed_origins: 許可 Origin 一覧（設定値由来）。
+
+        Returns:
+            ResponseTable: `allowed_origins` から組み立てたテーブル。
+        """
+        table = self._table
+        if table is None or not table.matches(allowed_origins):
+            table = ResponseTable(allowed_origins)
+            self._table = table
+        return table
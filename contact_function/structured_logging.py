@@ -0,0 +1,211 @@
+"""サンプリング付きの構造化（JSON）ログ出力モジュール.
+
+許可外 Origin のプリフライト・POST、ハニーポット発火等の拒否は 1 件ごとに警告ログを
+1 行出力しており、ボットの大量送信下では CloudWatch Logs の取り込み費用が関数の
+実行費用を上回る。本モジュールは `contact_function` 配下のログを 1 行 1 JSON で
+出力し、分類（カテゴリ）ごとの割合でサンプリングする。
+
+分類:
+    - ログ呼び出しは `extra={"log_category": ...}` で分類を指定する（例: handler の
+      拒否は `rejection`、ユースケースの送信失敗は `send_failed`）。指定の無いログは
+      `default` とする。
+    - 分類ごとのサンプリング率（0〜1）は `SampledJsonLogHandler` に渡す。率を指定
+      しない分類は全件を出力する（送信失敗等の調査に必要なログを落とさない）。
+
+集計（サマリ）:
+    - サンプリング率が 1 未満の分類は、ロガー名とメッセージのテンプレート（引数を
+      埋め込む前の文字列。個人データを含まない）ごとに件数と出力件数を数え、
+      `summary_interval_seconds` を過ぎた後の最初のログ出力時に 1 行の
+      `log_summary` として出力する。間引いた行の件数はこの集計で把握できる。
+    - Lambda の実行環境は呼び出しの間で停止するため、集計は次のログ出力まで
+      遅れることがある（実行環境の破棄時に未出力の集計は失われる）。
+
+Django・handler 層に依存しない。
+"""
+
+import json
+import logging
+import random
+import time
+from collections.abc import Callable, Mapping
+from typing import TextIO
+
+# ログの分類を指定する `extra` のキーと、指定の無いログの分類。
+CATEGORY_KEY = "log_category"
+CATEGORY_DEFAULT = "default"
+
+# 主な分類（handler の拒否・ユースケースの送信失敗）。
+CATEGORY_REJECTION = "rejection"
+CATEGORY_SEND_FAILED = "send_failed"
+
+# 集計の 1 行に含める最大件数（メッセージのテンプレートは有限だが念のため上限を置く）。
+_MAX_SUMMARY_ENTRIES = 256
+
+# 集計の行のメッセージ。
+_SUMMARY_MESSAGE = "log_summary"
+
+
+def log_category(category: str) -> dict[str, str]:
+    """ログ呼び出しの `extra` に渡す分類の辞書を返す."""
+    return {CATEGORY_KEY: category}
+
+
+def _category_of(record: logging.LogRecord) -> str:
+    """ログレコードの分類を返す."""
+    category = getattr(record, CATEGORY_KEY, None)
+    return category if isinstance(category, str) else CATEGORY_DEFAULT
+
+
+class JsonLogFormatter(logging.Formatter):
+    """ログレコードを 1 行の JSON へ整形する."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """時刻・レベル・ロガー名・分類・メッセージ（と例外）を JSON で返す."""
+        document: dict[str, object] = {
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "category": _category_of(record),
+            "message": record.getMessage(),
+        }
+        counters = getattr(record, "counters", None)
+        if counters is not None:
+            document["counters"] = counters
+        if record.exc_info:
+            document["exception"] = self.formatException(record.exc_info)
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+
+
+class SampledJsonLogHandler(logging.StreamHandler):
+    """分類ごとにサンプリングし、間引いた分類の件数を定期的に集計出力するハンドラ.
+
+    Lambda の実行環境は 1 度に 1 呼び出しのみを処理するが、ログ出力は任意の
+    スレッドから行われうるため、集計の更新はハンドラのロック内で行う。
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[str, float],
+        summary_interval_seconds: float,
+        stream: TextIO | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sample: Callable[[], float] = random.random,
+    ) -> None:
+        """ハンドラを初期化する.
+
+        Args:
+            rates: 分類 → サンプリング率（0〜1）。指定の無い分類は全件を出力する。
+            summary_interval_seconds: 集計を出力する間隔（秒）。
+            stream: 出力先（None の場合は `sys.stderr`）。
+            clock: 単調増加する時刻（秒）を返す関数（テスト用に注入可能）。
+            sample: [0, 1) の乱数を返す関数（テスト用に注入可能）。
+
+        Raises:
+            ValueError: サンプリング率が 0〜1 の範囲外、または間隔が正でない場合。
+        """
+        if any(not 0.0 <= rate <= 1.0 for rate in rates.values()):
+            raise ValueError("ログのサンプリング率は 0 以上 1 以下である必要があります。")
+        if summary_interval_seconds <= 0:
+            raise ValueError("ログの集計間隔は正の秒数である必要があります。")
+        super().__init__(stream)
+        self.setFormatter(JsonLogFormatter())
+        self._rates = dict(rates)
+        self._interval = summary_interval_seconds
+        self._clock = clock
+        self._sample = sample
+        self._window_started_at = clock()
+        # (分類, ロガー名, テンプレート) → [件数, 出力件数]。記録順を保持する。
+        self._counters: dict[tuple[str, str, str], list[int]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """サンプリングしたレコードを出力し、期限を過ぎた集計を出力する.
+
+        Returns:
+            bool: レコードを出力した場合 True（間引いた・フィルタで除外した場合 False）。
+        """
+        if not self.filter(record):
+            return False
+        category = _category_of(record)
+        rate = self._rates.get(category, 1.0)
+        emitted = rate >= 1.0 or self._sample() < rate
+        self.acquire()
+        try:
+            if rate < 1.0:
+                self._count(category, record, emitted)
+            if emitted:
+                self.emit(record)
+            if self._clock() - self._window_started_at >= self._interval:
+                summary = self._take_summary()
+                if summary is not None:
+                    self.emit(summary)
+        finally:
+            self.release()
+        return emitted
+
+    def _count(self, category: str, record: logging.LogRecord, emitted: bool) -> None:
+        """間引きの対象となる分類のレコードを数える（ロック内で呼ぶ）."""
+        key = (category, record.name, str(record.msg))
+        counter = self._counters.get(key)
+        if counter is None:
+            if len(self._counters) >= _MAX_SUMMARY_ENTRIES:
+                # 上限を超えた種類はテンプレートを問わず 1 つにまとめる。
+                key = (category, record.name, "*")
+                counter = self._counters.setdefault(key, [0, 0])
+            else:
+                counter = self._counters[key] = [0, 0]
+        counter[0] += 1
+        counter[1] += int(emitted)
+
+    def _take_summary(self) -> logging.LogRecord | None:
+        """集計の行を組み立て、集計を初期化する（ロック内で呼ぶ）.
+
+        Returns:
+            logging.LogRecord | None: 集計の行（数えたレコードが無い場合は None）。
+        """
+        counters = [
+            {
+                "category": category,
+                "logger": name,
+                "message": message,
+                "count": count,
+                "emitted": emitted,
+            }
+            for (category, name, message), (count, emitted) in self._counters.items()
+        ]
+        window_seconds = self._clock() - self._window_started_at
+        self._counters = {}
+        self._window_started_at = self._clock()
+        if not counters:
+            return None
+        return logging.makeLogRecord(
+            {
+                "name": __name__,
+                "levelno": logging.INFO,
+                "levelname": logging.getLevelName(logging.INFO),
+                "msg": _SUMMARY_MESSAGE,
+                CATEGORY_KEY: _SUMMARY_MESSAGE,
+                "counters": {"window_seconds": round(window_seconds, 3), "entries": counters},
+            }
+        )
+
+
+def install_log_handler(log_handler: logging.Handler, level: int) -> bool:
+    """`contact_function` 配下のロガーへハンドラを取り付ける（1 度のみ）.
+
+    ルートロガー（Lambda ランタイムのハンドラ）へ同じ行が重複して出力されないよう、
+    `contact_function` ロガーの伝播を止める。
+
+    Args:
+        log_handler: 取り付けるハンドラ。
+        level: `contact_function` ロガーのレベル。
+
+    Returns:
+        bool: 取り付けた場合 True、既に取り付け済みの場合 False。
+    """
+    package_logger = logging.getLogger("contact_function")
+    if any(isinstance(existing, SampledJsonLogHandler) for existing in package_logger.handlers):
+        return False
+    package_logger.addHandler(log_handler)
+    package_logger.setLevel(level)
+    package_logger.propagate = False
+    return True
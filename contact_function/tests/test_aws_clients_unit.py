@@ -0,0 +1,197 @@
+"""AWS クライアント生成ファクトリ（`aws_clients`）の例示ベース単体テスト.
+
+検証観点:
+    1. 環境変数未設定時は既定値（接続 2 秒・読み取り 5 秒・standard・2 回・
+       キープアライブ有効・プール 10）を用いる。
+    2. 設定値を環境変数から読み取り、不正値（非数値・0 以下・上限超過・未知の
+       再試行モード・真偽値でない表記）は `ConfigurationError` とする。
+    3. `create_client` が設定を反映した `botocore.config.Config` を boto3 へ渡し、
+       `SsmConfigProvider`・`SesEmailSender`・`SqsContactQueue` がこれを用いる。
+    4. `client_error_code` は ClientError の構造を持つ例外からエラーコードを取り出す。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - `boto3.client` は呼び出しを記録する差し替えに置き換える。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_aws_clients_unit -v
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.aws_clients import (
+    ClientSettings,
+    build_client_config,
+    client_error_code,
+    create_client,
+    read_client_settings,
+)
+from contact_function.adapters.config_provider import ConfigurationError, SsmConfigProvider
+from contact_function.adapters.contact_queue import SqsContactQueue
+from contact_function.adapters.ses_email_sender import SesEmailSender
+from contact_function.tests.test_idempotency_unit import ConditionalCheckFailed
+
+# 本テストが扱う環境変数（各テストの前に空へ戻し、実行環境の値に依存しない）。
+_CLEARED_ENVIRON = {
+    "CONTACT_AWS_CONNECT_TIMEOUT_SECONDS": "",
+    "CONTACT_AWS_READ_TIMEOUT_SECONDS": "",
+    "CONTACT_AWS_RETRY_MODE": "",
+    "CONTACT_AWS_MAX_ATTEMPTS": "",
+    "CONTACT_AWS_TCP_KEEPALIVE": "",
+    "CONTACT_AWS_MAX_POOL_CONNECTIONS": "",
+}
+
+
+class _RecordingBoto3Client:
+    """`boto3.client` の呼び出し（サービス名・設定）を記録する差し替え."""
+
+    def __init__(self) -> None:
+        """呼び出し記録を初期化する."""
+        self.calls: list[tuple[str, object]] = []
+
+    def __call__(self, service_name: str, config: object = None) -> object:
+        """呼び出しを記録し、識別用のオブジェクトを返す."""
+        self.calls.append((service_name, config))
+        return object()
+
+
+class ReadClientSettingsTests(unittest.TestCase):
+    """`read_client_settings` の読み取りと検証."""
+
+    def test_defaults_when_unset(self) -> None:
+        """未設定時は既定値."""
+        with patch.dict(os.environ, _CLEARED_ENVIRON):
+            self.assertEqual(read_client_settings(), ClientSettings())
+        self.assertEqual(
+            ClientSettings(),
+            ClientSettings(
+                connect_timeout_seconds=2.0,
+                read_timeout_seconds=5.0,
+                retry_mode="standard",
+                max_attempts=2,
+                tcp_keepalive=True,
+                max_pool_connections=10,
+            ),
+        )
+
+    def test_values_are_read_from_environment(self) -> None:
+        """設定値を環境変数から読み取る."""
+        environ = {
+            **_CLEARED_ENVIRON,
+            "CONTACT_AWS_CONNECT_TIMEOUT_SECONDS": "0.5",
+            "CONTACT_AWS_READ_TIMEOUT_SECONDS": "3",
+            "CONTACT_AWS_RETRY_MODE": "Adaptive",
+            "CONTACT_AWS_MAX_ATTEMPTS": "4",
+            "CONTACT_AWS_TCP_KEEPALIVE": "false",
+            "CONTACT_AWS_MAX_POOL_CONNECTIONS": "25",
+        }
+        with patch.dict(os.environ, environ):
+            settings = read_client_settings()
+        self.assertEqual(
+            settings,
+            ClientSettings(
+                connect_timeout_seconds=0.5,
+                read_timeout_seconds=3.0,
+                retry_mode="adaptive",
+                max_attempts=4,
+                tcp_keepalive=False,
+                max_pool_connections=25,
+            ),
+        )
+        # 1 回の呼び出しの最長は各試行がタイムアウトまで待つ場合の合計。
+        self.assertEqual(settings.worst_case_call_seconds, (0.5 + 3.0) * 4)
+
+    def test_invalid_values_fail(self) -> None:
+        """不正値は既定値で埋めず `ConfigurationError`."""
+        cases = [
+            ("CONTACT_AWS_CONNECT_TIMEOUT_SECONDS", "fast"),
+            ("CONTACT_AWS_CONNECT_TIMEOUT_SECONDS", "0"),
+            ("CONTACT_AWS_READ_TIMEOUT_SECONDS", "-1"),
+            ("CONTACT_AWS_READ_TIMEOUT_SECONDS", "60"),
+            ("CONTACT_AWS_RETRY_MODE", "aggressive"),
+            ("CONTACT_AWS_MAX_ATTEMPTS", "0"),
+            ("CONTACT_AWS_TCP_KEEPALIVE", "sometimes"),
+            ("CONTACT_AWS_MAX_POOL_CONNECTIONS", "many"),
+        ]
+        for name, value in cases:
+            with self.subTest(name=name, value=value):
+                with patch.dict(os.environ, {**_CLEARED_ENVIRON, name: value}):
+                    with self.assertRaises(ConfigurationError):
+                        read_client_settings()
+
+
+class CreateClientTests(unittest.TestCase):
+    """`create_client` と各アダプタの既定クライアント生成の検証."""
+
+    def test_config_reflects_settings(self) -> None:
+        """タイムアウト・再試行・キープアライブ・プール設定を反映する."""
+        settings = ClientSettings(
+            connect_timeout_seconds=1.5,
+            read_timeout_seconds=4.0,
+            retry_mode="adaptive",
+            max_attempts=3,
+            tcp_keepalive=False,
+            max_pool_connections=7,
+        )
+        recorder = _RecordingBoto3Client()
+        with patch("boto3.client", recorder):
+            create_client("sesv2", settings)
+        ((service_name, config),) = recorder.calls
+        self.assertEqual(service_name, "sesv2")
+        self.assertEqual(config.connect_timeout, 1.5)
+        self.assertEqual(config.read_timeout, 4.0)
+        self.assertEqual(config.retries, {"mode": "adaptive", "max_attempts": 3})
+        self.assertFalse(config.tcp_keepalive)
+        self.assertEqual(config.max_pool_connections, 7)
+
+    def test_build_client_config_defaults(self) -> None:
+        """既定設定でもタイムアウトを明示する（boto3 既定の 60 秒にしない）."""
+        config = build_client_config(ClientSettings())
+        self.assertEqual((config.connect_timeout, config.read_timeout), (2.0, 5.0))
+        self.assertTrue(config.tcp_keepalive)
+
+    def test_adapters_use_the_factory(self) -> None:
+        """SSM・SES・SQS アダプタは既定で共通ファクトリのクライアントを用いる."""
+        recorder = _RecordingBoto3Client()
+        with patch.dict(os.environ, {**_CLEARED_ENVIRON, "ENV": "dev"}):
+            with patch("boto3.client", recorder):
+                SsmConfigProvider()
+                SesEmailSender()
+                SqsContactQueue("https://sqs.example/queue")
+        self.assertEqual([name for name, _ in recorder.calls], ["ssm", "sesv2", "sqs"])
+        for _, config in recorder.calls:
+            self.assertEqual(config.read_timeout, 5.0)
+
+    def test_invalid_environment_fails_adapter_construction(self) -> None:
+        """設定値が不正ならアダプタの生成時に失敗する（boto3 を呼ばない）."""
+        recorder = _RecordingBoto3Client()
+        environ = {**_CLEARED_ENVIRON, "CONTACT_AWS_READ_TIMEOUT_SECONDS": "0"}
+        with patch.dict(os.environ, environ), patch("boto3.client", recorder):
+            with self.assertRaises(ConfigurationError):
+                SesEmailSender()
+        self.assertEqual(recorder.calls, [])
+
+
+class ClientErrorCodeTests(unittest.TestCase):
+    """`client_error_code` の検証."""
+
+    def test_code_is_read_from_response(self) -> None:
+        """ClientError の構造を持つ例外はコード、コードの無い応答は空文字."""
+        self.assertEqual(
+            client_error_code(ConditionalCheckFailed()), "ConditionalCheckFailedException"
+        )
+        error = RuntimeError("no code")
+        error.response = {"Error": {}}
+        self.assertEqual(client_error_code(error), "")
+
+    def test_other_errors_have_no_code(self) -> None:
+        """`response` を持たない例外（接続エラー等）は None."""
+        self.assertIsNone(client_error_code(TimeoutError("connect timeout")))
+
+
+if __name__ == "__main__":
+    unittest.main()
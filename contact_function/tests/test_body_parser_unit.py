@@ -0,0 +1,148 @@
+"""上限付きボディ解析（`contact_function.body_parser`）の例示ベース単体テスト.
+
+検証観点:
+    1. 既定の上限は入力検証の最大文字数から導出され、最悪の符号化（4 バイト文字を
+       form-encoded / JSON で表記）でも最大長の正当な入力を受理する。
+    2. 上限を超えるボディは `PayloadTooLarge`。base64 は上限を超えた時点で復号を
+       打ち切り、残りを復号しない。
+    3. フィールド数の上限（form-encoded・JSON）を超えると `PayloadTooLarge`。
+    4. 不正なボディ（base64・UTF-8・JSON・型）は従来どおり `ValueError`。
+    5. handler は上限超過を 413 `payload_too_large` とし、Email_Sender を呼ばない。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_body_parser_unit -v
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+from contact_function import body_parser
+from contact_function.body_parser import (
+    DEFAULT_LIMITS,
+    BodyLimits,
+    PayloadTooLarge,
+    parse_body,
+)
+from contact_function.domain.validators import MAX_FIELD_LENGTHS
+from contact_function.handler import handle_contact_request
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+_FORM = "application/x-www-form-urlencoded"
+_JSON = "application/json"
+
+# 4 バイトの UTF-8 文字（form-encoded で 12 バイト、JSON で `\\uXXXX\\uXXXX` の 12 バイト）。
+_ASTRAL_CHAR = "\U0001f600"
+
+
+def _max_length_fields(char: str) -> dict[str, str]:
+    """各項目を最大文字数まで `char` で埋めた入力を返す."""
+    return {name: char * limit for name, limit in MAX_FIELD_LENGTHS.items()}
+
+
+class LimitsTests(unittest.TestCase):
+    """既定の上限の導出の検証."""
+
+    def test_worst_case_valid_input_fits_within_default_limits(self) -> None:
+        """最大長・4 バイト文字の入力を form / JSON / base64 のいずれでも受理する."""
+        fields = _max_length_fields(_ASTRAL_CHAR)
+        bodies = [
+            (urlencode(fields), _FORM),
+            (json.dumps(fields), _JSON),
+        ]
+        for body, content_type in bodies:
+            with self.subTest(content_type=content_type):
+                self.assertEqual(parse_body(body, False, content_type), fields)
+                encoded = base64.b64encode(body.encode("utf-8")).decode("ascii")
+                self.assertEqual(parse_body(encoded, True, content_type), fields)
+
+    def test_default_byte_ceiling_tracks_field_caps(self) -> None:
+        """既定のバイト上限は最大文字数の合計から導出される（項目数の固定値ではない）."""
+        self.assertGreaterEqual(DEFAULT_LIMITS.max_bytes, sum(MAX_FIELD_LENGTHS.values()) * 12)
+        self.assertLess(DEFAULT_LIMITS.max_bytes, 1024 * 1024)
+
+
+class RejectionTests(unittest.TestCase):
+    """上限超過・不正ボディの検証."""
+
+    _LIMITS = BodyLimits(max_bytes=64, max_fields=3)
+
+    def test_oversized_text_body_is_rejected(self) -> None:
+        """非 base64 のボディは文字数で判定する."""
+        with self.assertRaises(PayloadTooLarge):
+            parse_body("message=" + "a" * 100, False, _FORM, self._LIMITS)
+
+    def test_oversized_base64_body_stops_decoding_early(self) -> None:
+        """base64 は上限を超えた時点で打ち切り、残りを復号しない."""
+        raw = base64.b64encode(b"a" * (body_parser._BASE64_CHUNK_CHARS * 10)).decode()
+        with patch.object(
+            body_parser.base64, "b64decode", wraps=base64.b64decode
+        ) as decoder:
+            with self.assertRaises(PayloadTooLarge):
+                parse_body(raw, True, _FORM, self._LIMITS)
+        self.assertEqual(decoder.call_count, 1)
+
+    def test_too_many_fields_are_rejected(self) -> None:
+        """フィールド数の上限は form-encoded・JSON の双方に適用する."""
+        with self.assertRaises(PayloadTooLarge):
+            parse_body("a=1&b=2&c=3&d=4", False, _FORM, self._LIMITS)
+        with self.assertRaises(PayloadTooLarge):
+            parse_body('{"a":"1","b":"2","c":"3","d":"4"}', False, _JSON, self._LIMITS)
+        self.assertEqual(
+            parse_body("a=1&b=2&c=3", False, _FORM, self._LIMITS),
+            {"a": "1", "b": "2", "c": "3"},
+        )
+
+    def test_malformed_bodies_raise_value_error(self) -> None:
+        """不正な base64・UTF-8・JSON・型は `ValueError`（413 ではない）."""
+        cases = [
+            ("YQ", True, _FORM),
+            (base64.b64encode(b"\xff\xfe").decode(), True, _FORM),
+            ("{not json", False, _JSON),
+            ('["a"]', False, _JSON),
+            ('{"a": 1}', False, _JSON),
+        ]
+        for raw, is_base64, content_type in cases:
+            with self.subTest(raw=raw):
+                with self.assertRaises(ValueError):
+                    parse_body(raw, is_base64, content_type)
+
+    def test_base64_whitespace_is_ignored(self) -> None:
+        """base64 中の改行等は従来どおり読み飛ばす."""
+        encoded = base64.encodebytes(b"full_name=a&message=b").decode("ascii")
+        self.assertEqual(
+            parse_body(encoded, True, _FORM), {"full_name": "a", "message": "b"}
+        )
+
+
+class HandlerPayloadTooLargeTests(unittest.TestCase):
+    """handler の 413 応答の検証."""
+
+    def test_oversized_post_returns_413_without_sending(self) -> None:
+        """上限超過のボディは 413 `payload_too_large` とし、送信しない."""
+        sender = RecordingEmailSender()
+        body = "message=" + "a" * (DEFAULT_LIMITS.max_bytes + 1)
+        with self.assertLogs("contact_function.handler", level="WARNING"):
+            response = handle_contact_request(
+                _post_event(_ALLOWED_ORIGIN, body), FakeConfigProvider(), sender
+            )
+        self.assertEqual(response["statusCode"], 413)
+        self.assertEqual(json.loads(response["body"]), {"error": "payload_too_large"})
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], _ALLOWED_ORIGIN)
+        self.assertEqual(sender.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
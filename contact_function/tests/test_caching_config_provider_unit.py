@@ -0,0 +1,246 @@
+"""キャッシュ付き設定値プロバイダ（`CachingConfigProvider`）の例示ベース単体テスト.
+
+検証観点:
+    1. TTL 内の再取得は内側プロバイダを呼ばずキャッシュ値を返す（ヒット）。
+    2. TTL 切れ後は内側から同期取得する（ミス）。
+    3. stale-while-revalidate: TTL 切れ後 stale 許容期間内は古い値を即時に返し、
+       再取得を 1 度だけ予約する。再取得失敗時は古い値を保持する。
+    4. キャッシュ値が無い状態での取得失敗は `ConfigurationError` をそのまま伝播する
+       （フォールバック禁止）。
+    5. `invalidate` でキャッシュが破棄され、`stats` が計数を反映する。
+    6. composition root の環境変数（TTL・stale 秒数）の不正値は
+       `ConfigurationError` で明示的に失敗する。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - 時計は手動で進めるフェイク、再取得実行器はタスクを溜めて明示実行する
+      フェイクを注入し、スレッドのタイミングに依存しない。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_caching_config_provider_unit -v
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function import composition
+from contact_function.adapters.caching_config_provider import (
+    CacheStats,
+    CachingConfigProvider,
+)
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.environment import read_non_negative_float
+from contact_function.domain.ports import ConfigProvider
+
+_FROM_ADDR = "noreply@example.com"
+_TO_ADDR = "owner@example.com"
+_ORIGINS = ("https://example.com",)
+
+
+class _FakeClock:
+    """手動で進める単調増加時計."""
+
+    def __init__(self) -> None:
+        """時刻 0 で初期化する."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """時刻を `seconds` 秒進める."""
+        self.now += seconds
+
+
+class _QueuedExecutor:
+    """再取得タスクを溜めておき、`run_all` で明示実行する実行器."""
+
+    def __init__(self) -> None:
+        """空のタスク列で初期化する."""
+        self.tasks: list = []
+
+    def __call__(self, task) -> None:
+        """タスクを溜める（即時実行しない）."""
+        self.tasks.append(task)
+
+    def run_all(self) -> None:
+        """溜めたタスクをすべて実行する."""
+        tasks, self.tasks = self.tasks, []
+        for task in tasks:
+            task()
+
+
+class _CountingConfigProvider(ConfigProvider):
+    """取得回数を数え、`fail` が真の間は `ConfigurationError` を送出するプロバイダ."""
+
+    def __init__(self) -> None:
+        """既知の設定値・計数 0 で初期化する."""
+        self.from_addr = _FROM_ADDR
+        self.calls = 0
+        self.fail = False
+
+    def _record(self) -> None:
+        self.calls += 1
+        if self.fail:
+            raise ConfigurationError("パラメータを取得できません（テスト）")
+
+    def get_from_address(self) -> str:
+        """送信元アドレスを返す."""
+        self._record()
+        return self.from_addr
+
+    def get_to_address(self) -> str:
+        """宛先アドレスを返す."""
+        self._record()
+        return _TO_ADDR
+
+    def get_allowed_origins(self) -> tuple[str, ...]:
+        """許可 Origin 一覧を返す."""
+        self._record()
+        return _ORIGINS
+
+
+class CachingConfigProviderTests(unittest.TestCase):
+    """TTL キャッシュ・stale-while-revalidate・無効化・計数の検証."""
+
+    def setUp(self) -> None:
+        """フェイク時計・実行器・内側プロバイダを用意する."""
+        self.clock = _FakeClock()
+        self.executor = _QueuedExecutor()
+        self.inner = _CountingConfigProvider()
+
+    def _provider(self, ttl: float = 60.0, stale: float = 0.0) -> CachingConfigProvider:
+        return CachingConfigProvider(
+            self.inner,
+            ttl,
+            stale_seconds=stale,
+            clock=self.clock,
+            revalidate_executor=self.executor,
+        )
+
+    def test_values_within_ttl_are_served_from_cache(self) -> None:
+        """TTL 内の再取得は内側を呼ばない."""
+        provider = self._provider()
+        self.assertEqual(provider.get_from_address(), _FROM_ADDR)
+        self.assertEqual(provider.get_to_address(), _TO_ADDR)
+        self.assertEqual(provider.get_allowed_origins(), _ORIGINS)
+        self.clock.advance(59)
+        provider.get_from_address()
+        provider.get_to_address()
+        provider.get_allowed_origins()
+        self.assertEqual(self.inner.calls, 3)
+        self.assertEqual(provider.stats(), CacheStats(3, 3, 0, 0, 0))
+
+    def test_expired_value_is_reloaded_synchronously(self) -> None:
+        """stale 無効時、TTL 切れ後は内側から同期取得して新しい値を返す."""
+        provider = self._provider()
+        provider.get_from_address()
+        self.inner.from_addr = "changed@example.com"
+        self.clock.advance(60)
+        self.assertEqual(provider.get_from_address(), "changed@example.com")
+        self.assertEqual(self.inner.calls, 2)
+        self.assertEqual(provider.stats().misses, 2)
+
+    def test_failure_without_cached_value_propagates(self) -> None:
+        """キャッシュ値が無い状態の取得失敗は `ConfigurationError` を伝播する."""
+        provider = self._provider()
+        self.inner.fail = True
+        with self.assertRaises(ConfigurationError):
+            provider.get_from_address()
+        # 失敗はキャッシュされず、回復後は取得できる。
+        self.inner.fail = False
+        self.assertEqual(provider.get_from_address(), _FROM_ADDR)
+
+    def test_stale_value_is_served_while_revalidating(self) -> None:
+        """stale 許容期間内は古い値を返し、再取得を 1 度だけ予約する."""
+        provider = self._provider(ttl=60, stale=30)
+        provider.get_from_address()
+        self.inner.from_addr = "changed@example.com"
+        self.clock.advance(70)
+        self.assertEqual(provider.get_from_address(), _FROM_ADDR)
+        self.assertEqual(provider.get_from_address(), _FROM_ADDR)
+        # 同一キーの再取得は多重に予約されない。
+        self.assertEqual(len(self.executor.tasks), 1)
+        self.executor.run_all()
+        self.assertEqual(provider.get_from_address(), "changed@example.com")
+        self.assertEqual(provider.stats(), CacheStats(1, 1, 2, 1, 0))
+
+    def test_failed_revalidation_keeps_stale_value(self) -> None:
+        """再取得失敗時は古い値を保持し、失敗を計数する."""
+        provider = self._provider(ttl=60, stale=30)
+        provider.get_from_address()
+        self.clock.advance(70)
+        self.inner.fail = True
+        with self.assertLogs(
+            "contact_function.adapters.caching_config_provider", level="WARNING"
+        ):
+            provider.get_from_address()
+            self.executor.run_all()
+        self.assertEqual(provider.get_from_address(), _FROM_ADDR)
+        self.assertEqual(provider.stats().refresh_failures, 1)
+        # 失敗後は再度の再取得を予約できる。
+        self.assertEqual(len(self.executor.tasks), 1)
+
+    def test_value_past_stale_window_is_not_served(self) -> None:
+        """stale 許容期間を超えた値は返さず、同期取得の失敗を伝播する."""
+        provider = self._provider(ttl=60, stale=30)
+        provider.get_from_address()
+        self.clock.advance(90)
+        self.inner.fail = True
+        with self.assertRaises(ConfigurationError):
+            provider.get_from_address()
+        self.assertEqual(self.executor.tasks, [])
+
+    def test_invalidate_forces_reload(self) -> None:
+        """`invalidate` 後の取得は内側から再取得する."""
+        provider = self._provider()
+        provider.get_allowed_origins()
+        provider.invalidate()
+        provider.get_allowed_origins()
+        self.assertEqual(self.inner.calls, 2)
+
+    def test_negative_durations_are_rejected(self) -> None:
+        """負の TTL・stale 秒数は `ValueError`."""
+        with self.assertRaises(ValueError):
+            CachingConfigProvider(self.inner, -1)
+        with self.assertRaises(ValueError):
+            CachingConfigProvider(self.inner, 1, stale_seconds=-1)
+
+
+class CacheEnvironmentTests(unittest.TestCase):
+    """キャッシュ設定の環境変数読み取りの検証."""
+
+    def test_unset_or_empty_uses_default(self) -> None:
+        """未設定・空文字は呼び出し元の既定値を用いる."""
+        with patch.dict(os.environ, {"CONTACT_TEST_SECONDS": ""}):
+            self.assertEqual(read_non_negative_float("CONTACT_TEST_SECONDS", 5.0), 5.0)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(read_non_negative_float("CONTACT_TEST_SECONDS", 5.0), 5.0)
+
+    def test_valid_value_is_parsed(self) -> None:
+        """有効な実数はそのまま返す."""
+        with patch.dict(os.environ, {"CONTACT_TEST_SECONDS": " 12.5 "}):
+            self.assertEqual(read_non_negative_float("CONTACT_TEST_SECONDS", 5.0), 12.5)
+
+    def test_invalid_values_raise_configuration_error(self) -> None:
+        """実数でない・負・非有限の値は `ConfigurationError`."""
+        for raw_value in ("abc", "-1", "nan", "inf"):
+            with self.subTest(value=raw_value):
+                with patch.dict(os.environ, {"CONTACT_TEST_SECONDS": raw_value}):
+                    with self.assertRaises(ConfigurationError):
+                        read_non_negative_float("CONTACT_TEST_SECONDS", 5.0)
+
+    def test_build_config_provider_rejects_invalid_ttl(self) -> None:
+        """composition root は不正な TTL を既定値で埋めずに失敗させる."""
+        env = {"ENV": "test", "CONTACT_CONFIG_CACHE_TTL_SECONDS": "-5"}
+        with patch.dict(os.environ, env):
+            with self.assertRaises(ConfigurationError):
+                composition.build_config_provider()
+
+
+if __name__ == "__main__":
+    unittest.main()
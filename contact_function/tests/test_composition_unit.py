@@ -0,0 +1,262 @@
+"""composition root（`contact_function.composition`）の例示ベース単体テスト.
+
+検証観点:
+    1. `ContactDependencies` が具象依存を初回要求時にのみ生成し、以後は同一
+       インスタンスを返す（ウォーム呼び出し間の再利用）。
+    2. 生成に失敗した場合は例外を伝播し、失敗をキャッシュしない（フォールバック
+       禁止。次回要求時に再生成を試みる）。
+    3. `lambda_handler` が複数回呼ばれても依存を 1 度しか生成しない。任意の観測機能
+       （メトリクス・トレーシング）の設定が不正な場合は明示ログを残して無効で継続する。
+    4. `warm` / INIT プリフェッチ / ウォームアップイベントが依存を生成し設定値を
+       取得する。プリフェッチの失敗は INIT を止めずに明示ログを残す。
+    5. `build_email_sender` が `CONTACT_DELIVERY_MODE` に応じて SES 直送または
+       キュー投入のアダプタを生成し、不正な設定は `ConfigurationError` とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - 具象（`SsmConfigProvider` / `SesEmailSender`）の代わりに、生成回数を数える
+      ファクトリを注入する。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_composition_unit -v
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function import handler
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.queueing_email_sender import QueueingEmailSender
+from contact_function.adapters.resilient_email_sender import ResilientEmailSender
+from contact_function.composition import ContactDependencies, build_email_sender
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _options_event,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+
+class _CountingFactory:
+    """呼び出し回数を数えつつ生成物を返すテスト用ファクトリ."""
+
+    def __init__(self, build) -> None:
+        """生成関数を受け取り、呼び出し回数を 0 で初期化する."""
+        self._build = build
+        self.calls = 0
+
+    def __call__(self):
+        """生成関数を呼び出し、回数を記録して生成物を返す."""
+        self.calls += 1
+        return self._build()
+
+
+class ContactDependenciesTests(unittest.TestCase):
+    """`ContactDependencies` の遅延生成・再利用の検証."""
+
+    def test_dependencies_are_built_once_and_reused(self) -> None:
+        """同一レジストリからの再取得は同一インスタンスを返し、生成は 1 回のみ."""
+        config_factory = _CountingFactory(FakeConfigProvider)
+        sender_factory = _CountingFactory(RecordingEmailSender)
+        registry = ContactDependencies(config_factory, sender_factory)
+
+        # 生成は初回要求まで遅延される。
+        self.assertEqual(config_factory.calls, 0)
+        self.assertEqual(sender_factory.calls, 0)
+
+        first_config = registry.config_provider()
+        first_sender = registry.email_sender()
+        self.assertIs(registry.config_provider(), first_config)
+        self.assertIs(registry.email_sender(), first_sender)
+        self.assertEqual(config_factory.calls, 1)
+        self.assertEqual(sender_factory.calls, 1)
+
+    def test_failed_build_is_not_cached(self) -> None:
+        """生成失敗は伝播し、次回要求時に再度生成を試みる."""
+        attempts: list[int] = []
+
+        def _flaky_factory() -> FakeConfigProvider:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConfigurationError("環境名を解決できません（テスト）")
+            return FakeConfigProvider()
+
+        registry = ContactDependencies(_flaky_factory, RecordingEmailSender)
+        with self.assertRaises(ConfigurationError):
+            registry.config_provider()
+        # 2 回目は生成に成功し、以後は再利用される。
+        provider = registry.config_provider()
+        self.assertIs(registry.config_provider(), provider)
+        self.assertEqual(len(attempts), 2)
+
+    def test_reset_discards_cached_dependencies(self) -> None:
+        """`reset` 後の要求では依存を再生成する."""
+        config_factory = _CountingFactory(FakeConfigProvider)
+        registry = ContactDependencies(config_factory, RecordingEmailSender)
+        registry.config_provider()
+        registry.reset()
+        registry.config_provider()
+        self.assertEqual(config_factory.calls, 2)
+
+
+class LambdaHandlerReuseTests(unittest.TestCase):
+    """`lambda_handler` がウォーム呼び出し間で依存を再利用することの検証."""
+
+    def test_warm_invocations_reuse_dependencies(self) -> None:
+        """3 回の呼び出しで設定プロバイダ・送信アダプタの生成はそれぞれ 1 回のみ."""
+        config_factory = _CountingFactory(FakeConfigProvider)
+        sender_factory = _CountingFactory(RecordingEmailSender)
+        registry = ContactDependencies(config_factory, sender_factory)
+        with patch.object(handler, "_DEPENDENCIES", registry):
+            for _ in range(3):
+                response = handler.lambda_handler(_options_event(_ALLOWED_ORIGIN), None)
+                self.assertEqual(response["statusCode"], 204)
+        self.assertEqual(config_factory.calls, 1)
+        self.assertEqual(sender_factory.calls, 1)
+
+    def test_invalid_observability_settings_do_not_fail_invocations(self) -> None:
+        """メトリクス・トレーシングの設定が不正でも明示ログを残して応答を返す."""
+        registry = ContactDependencies(FakeConfigProvider, RecordingEmailSender)
+        invalid = {"CONTACT_METRICS_MODE": "emff", "CONTACT_TRACING_MODE": "xry"}
+        with patch.object(handler, "_DEPENDENCIES", registry), patch.dict(os.environ, invalid):
+            with self.assertLogs("contact_function.composition", level="ERROR") as logs:
+                response = handler.lambda_handler(_options_event(_ALLOWED_ORIGIN), None)
+            self.assertEqual(response["statusCode"], 204)
+            self.assertEqual(len(logs.records), 2)
+            self.assertIsNone(registry.metrics_emitter())
+            self.assertIsNone(registry.tracer())
+            # 無効として確定し、以後の呼び出しでは再構築もログも行わない。
+            with self.assertNoLogs("contact_function.composition", level="ERROR"):
+                handler.lambda_handler(_options_event(_ALLOWED_ORIGIN), None)
+
+
+class _RecordingConfigProvider(FakeConfigProvider):
+    """取得されたキーを記録するテスト用設定プロバイダ."""
+
+    def __init__(self) -> None:
+        """記録を空で初期化する."""
+        super().__init__()
+        self.requested: list[str] = []
+
+    def get_from_address(self) -> str:
+        """取得を記録して送信元アドレスを返す."""
+        self.requested.append("from")
+        return super().get_from_address()
+
+    def get_to_address(self) -> str:
+        """取得を記録して宛先アドレスを返す."""
+        self.requested.append("to")
+        return super().get_to_address()
+
+    def get_allowed_origins(self) -> tuple[str, ...]:
+        """取得を記録して許可 Origin 一覧を返す."""
+        self.requested.append("origins")
+        return super().get_allowed_origins()
+
+
+def _warmup_event() -> dict[str, object]:
+    """EventBridge スケジュールイベント形状のウォームアップイベントを返す."""
+    return {"source": "aws.events", "detail-type": "Scheduled Event", "detail": {}}
+
+
+class WarmUpTests(unittest.TestCase):
+    """`warm`・INIT プリフェッチ・ウォームアップイベントの検証."""
+
+    def test_warm_builds_dependencies_and_reads_every_setting(self) -> None:
+        """`warm` は両依存を生成し、3 つの設定値を取得する."""
+        sender_factory = _CountingFactory(RecordingEmailSender)
+        registry = ContactDependencies(_RecordingConfigProvider, sender_factory)
+        registry.warm()
+        self.assertEqual(registry.config_provider().requested, ["origins", "from", "to"])
+        self.assertEqual(sender_factory.calls, 1)
+
+    def test_warmup_event_returns_without_http_handling(self) -> None:
+        """ウォームアップイベントはキャッシュを満たして即時に返す."""
+        registry = ContactDependencies(_RecordingConfigProvider, RecordingEmailSender)
+        with patch.object(handler, "_DEPENDENCIES", registry):
+            with patch.object(handler, "handle_contact_request") as handle:
+                response = handler.lambda_handler(_warmup_event(), None)
+        self.assertEqual(response, {"warmed": True})
+        handle.assert_not_called()
+        self.assertIn("origins", registry.config_provider().requested)
+
+    def test_warmup_failure_propagates(self) -> None:
+        """ウォームアップでの設定取得失敗は握りつぶさず伝播する."""
+
+        def _failing_factory() -> FakeConfigProvider:
+            raise ConfigurationError("環境名を解決できません（テスト）")
+
+        registry = ContactDependencies(_failing_factory, RecordingEmailSender)
+        with patch.object(handler, "_DEPENDENCIES", registry):
+            with self.assertRaises(ConfigurationError):
+                handler.lambda_handler(_warmup_event(), None)
+
+    def test_init_prefetch_is_disabled_by_default(self) -> None:
+        """`CONTACT_INIT_PREFETCH` 未設定時は依存を生成しない."""
+        config_factory = _CountingFactory(FakeConfigProvider)
+        registry = ContactDependencies(config_factory, RecordingEmailSender)
+        with patch.dict(os.environ, {"CONTACT_INIT_PREFETCH": ""}):
+            self.assertFalse(handler._prefetch_at_init(registry))
+        self.assertEqual(config_factory.calls, 0)
+
+    def test_init_prefetch_warms_dependencies_when_enabled(self) -> None:
+        """`CONTACT_INIT_PREFETCH=true` では依存を生成し設定値を取得する."""
+        config_factory = _CountingFactory(_RecordingConfigProvider)
+        registry = ContactDependencies(config_factory, RecordingEmailSender)
+        with patch.dict(os.environ, {"CONTACT_INIT_PREFETCH": "true"}):
+            self.assertTrue(handler._prefetch_at_init(registry))
+        self.assertEqual(config_factory.calls, 1)
+        self.assertEqual(len(registry.config_provider().requested), 3)
+
+    def test_init_prefetch_failure_is_logged_not_raised(self) -> None:
+        """プリフェッチ失敗・フラグ誤記は INIT を止めず ERROR ログを残す."""
+
+        def _failing_factory() -> FakeConfigProvider:
+            raise ConfigurationError("環境名を解決できません（テスト）")
+
+        for flag, factory in (("true", _failing_factory), ("maybe", FakeConfigProvider)):
+            with self.subTest(flag=flag):
+                registry = ContactDependencies(factory, RecordingEmailSender)
+                with patch.dict(os.environ, {"CONTACT_INIT_PREFETCH": flag}):
+                    with self.assertLogs("contact_function.handler", level="ERROR"):
+                        self.assertFalse(handler._prefetch_at_init(registry))
+
+
+class DeliveryModeTests(unittest.TestCase):
+    """`build_email_sender` の配信モード選択の検証."""
+
+    # boto3 クライアント生成にはリージョンのみが必要（API は呼ばない）。
+    _REGION = {"AWS_DEFAULT_REGION": "ap-northeast-1"}
+
+    def test_default_mode_sends_via_ses(self) -> None:
+        """未設定（既定 sync）は再試行・遮断付きの `SesEmailSender`."""
+        with patch.dict(os.environ, dict(self._REGION, CONTACT_DELIVERY_MODE="")):
+            self.assertIsInstance(build_email_sender(), ResilientEmailSender)
+
+    def test_queue_mode_enqueues_to_configured_queue(self) -> None:
+        """queue は `CONTACT_QUEUE_URL` へ投入する `QueueingEmailSender`."""
+        environ = dict(
+            self._REGION,
+            CONTACT_DELIVERY_MODE="Queue",
+            CONTACT_QUEUE_URL="https://sqs.ap-northeast-1.amazonaws.com/000000000000/q",
+        )
+        with patch.dict(os.environ, environ):
+            self.assertIsInstance(build_email_sender(), QueueingEmailSender)
+
+    def test_invalid_mode_or_missing_queue_url_fails(self) -> None:
+        """不正なモード・キュー URL 欠落は `ConfigurationError`（フォールバック禁止）."""
+        for environ in (
+            {"CONTACT_DELIVERY_MODE": "smtp"},
+            {"CONTACT_DELIVERY_MODE": "queue", "CONTACT_QUEUE_URL": " "},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, dict(self._REGION, **environ)):
+                    with self.assertRaises(ConfigurationError):
+                        build_email_sender()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Parameter Store 設定値プロバイダ（`SsmConfigProvider`）の例示ベース単体テスト.
+
+検証観点:
+    1. `load_snapshot` が 3 パラメータを `get_parameters` 1 回で取得し、前後空白を
+       除去した値・分割済みの許可 Origin をスナップショットとして返す。
+    2. 欠落（InvalidParameters）・空値・有効 Origin 無しのパスをすべて列挙した
+       単一の `ConfigurationError` を送出する（フォールバック禁止）。
+    3. API 呼び出しの失敗は `ConfigurationError` として伝播する。
+    4. `CachingConfigProvider` に一括読み込み関数を与えると、ミス時に 1 回の
+       往復で全キーが埋まる。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - SSM クライアントはコンストラクタ注入口へ応答を記録済みのフェイクを渡す。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_config_provider_unit -v
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from botocore.exceptions import EndpointConnectionError
+
+from contact_function.adapters.caching_config_provider import CachingConfigProvider
+from contact_function.adapters.config_provider import (
+    ConfigSnapshot,
+    ConfigurationError,
+    SsmConfigProvider,
+)
+
+_FROM_PATH = "/test/portfolio/parameter/default_from_email"
+_TO_PATH = "/test/portfolio/parameter/default_to_mail"
+_ORIGINS_PATH = "/test/portfolio/parameter/csrf_trusted_origins"
+
+
+class _FakeSsmClient:
+    """`get_parameters` の応答を返し、呼び出しを記録するテスト用 SSM クライアント."""
+
+    def __init__(self, values: dict[str, str], error: Exception | None = None) -> None:
+        """パスと値の対応（未登録パスは InvalidParameters 扱い）で初期化する."""
+        self._values = values
+        self._error = error
+        self.calls: list[list[str]] = []
+
+    def get_parameters(self, Names: list[str]) -> dict:  # noqa: N803 - boto3 の引数名
+        """登録済みの値を Parameters、未登録を InvalidParameters として返す."""
+        self.calls.append(list(Names))
+        if self._error is not None:
+            raise self._error
+        return {
+            "Parameters": [
+                {"Name": name, "Value": self._values[name]}
+                for name in Names
+                if name in self._values
+            ],
+            "InvalidParameters": [name for name in Names if name not in self._values],
+        }
+
+
+def _complete_values() -> dict[str, str]:
+    """3 パラメータすべてが設定された値の対応を返す."""
+    return {
+        _FROM_PATH: " noreply@example.com ",
+        _TO_PATH: "owner@example.com",
+        _ORIGINS_PATH: "https://example.com, https://www.example.com ,",
+    }
+
+
+class LoadSnapshotTests(unittest.TestCase):
+    """`SsmConfigProvider.load_snapshot` の一括取得・一括検証の検証."""
+
+    def test_loads_all_parameters_in_one_call(self) -> None:
+        """1 回の `get_parameters` で全値を取得し、整形して返す."""
+        client = _FakeSsmClient(_complete_values())
+        snapshot = SsmConfigProvider(env="test", ssm_client=client).load_snapshot()
+        self.assertEqual(
+            snapshot,
+            ConfigSnapshot(
+                from_address="noreply@example.com",
+                to_address="owner@example.com",
+                allowed_origins=("https://example.com", "https://www.example.com"),
+            ),
+        )
+        self.assertEqual(client.calls, [[_FROM_PATH, _TO_PATH, _ORIGINS_PATH]])
+
+    def test_reports_every_missing_path_in_one_error(self) -> None:
+        """未登録・空値・有効 Origin 無しのパスをすべてメッセージに含める."""
+        client = _FakeSsmClient({_TO_PATH: "   ", _ORIGINS_PATH: " , "})
+        provider = SsmConfigProvider(env="test", ssm_client=client)
+        with self.assertRaises(ConfigurationError) as context:
+            provider.load_snapshot()
+        for path in (_FROM_PATH, _TO_PATH, _ORIGINS_PATH):
+            self.assertIn(path, str(context.exception))
+        self.assertEqual(len(client.calls), 1)
+
+    def test_api_failure_raises_configuration_error(self) -> None:
+        """通信失敗は `ConfigurationError` として伝播する."""
+        client = _FakeSsmClient(
+            {}, error=EndpointConnectionError(endpoint_url="https://ssm.invalid")
+        )
+        provider = SsmConfigProvider(env="test", ssm_client=client)
+        with self.assertLogs("contact_function.adapters.config_provider", level="ERROR"):
+            with self.assertRaises(ConfigurationError):
+                provider.load_snapshot()
+
+
+class CachingSnapshotLoaderTests(unittest.TestCase):
+    """一括読み込み関数を与えた `CachingConfigProvider` の検証."""
+
+    def test_miss_fills_every_key_with_one_round_trip(self) -> None:
+        """最初のミスで全キーが埋まり、以後の取得は SSM を呼ばない."""
+        client = _FakeSsmClient(_complete_values())
+        ssm_provider = SsmConfigProvider(env="test", ssm_client=client)
+        provider = CachingConfigProvider(
+            ssm_provider, 60, snapshot_loader=ssm_provider.load_snapshot
+        )
+        self.assertEqual(provider.get_allowed_origins()[0], "https://example.com")
+        self.assertEqual(provider.get_from_address(), "noreply@example.com")
+        self.assertEqual(provider.get_to_address(), "owner@example.com")
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(provider.stats().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""ダイジェスト（まとめ送信）計画と集約メール送信の例示ベース単体テスト.
+
+検証観点:
+    1. `plan_digests` が送信元・宛先ごとに受信順でまとめ、件数しきい値・サイズ
+       しきい値で次の 1 通へ切り替える。単独でしきい値を超える 1 件は 1 通とする。
+    2. `SesEmailSender.send_digest` が件数入りの件名と番号付きの本文で `SendEmail`
+       を 1 回だけ呼び、空の入力は `ValueError` とする。
+    3. `build_digest_policy` が既定で無効、有効時は上限を環境変数から読み、不正値は
+       `ConfigurationError` とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - SES クライアントはコンストラクタ注入口へ呼び出しを記録するフェイクを渡す。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_contact_digest_unit -v
+"""
+
+from __future__ import annotations
+
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.contact_digest import (
+    DigestPolicy,
+    estimate_payload_bytes,
+    plan_digests,
+)
+from contact_function.adapters.contact_queue import QueuedContact
+from contact_function.adapters.ses_email_sender import SesEmailSender
+from contact_function.composition import build_digest_policy
+from contact_function.domain.contact_payload import ContactPayload
+
+_FROM = "noreply@example.com"
+_TO = "owner@example.com"
+
+
+def _payload(name: str, message: str = "本文です。") -> ContactPayload:
+    """氏名・本文を指定した問い合わせ内容を返す."""
+    return ContactPayload(
+        full_name=name, email="taro@example.com", phone_number="0312345678", message=message
+    )
+
+
+def _entry(message_id: str, to_addr: str = _TO, message: str = "本文です。"):
+    """（メッセージ ID, 問い合わせ）の組を返す."""
+    return (
+        message_id,
+        QueuedContact(
+            acceptance_id=f"accept-{message_id}",
+            payload=_payload(message_id, message),
+            from_addr=_FROM,
+            to_addr=to_addr,
+        ),
+    )
+
+
+class _FakeSesClient:
+    """`send_email` の呼び出しを記録するフェイク."""
+
+    def __init__(self) -> None:
+        """呼び出し記録を初期化する."""
+        self.calls: list[dict] = []
+
+    def send_email(self, **kwargs) -> dict:
+        """呼び出しを記録する."""
+        self.calls.append(kwargs)
+        return {"MessageId": "ses-1"}
+
+
+class PlanDigestsTests(unittest.TestCase):
+    """`plan_digests` のまとめ方の検証."""
+
+    _LOOSE = DigestPolicy(max_items=100, max_bytes=1_000_000)
+
+    def test_groups_by_addresses_preserving_order(self) -> None:
+        """送信元・宛先ごとに、組の初出順・組内の受信順でまとめる."""
+        entries = [_entry("a"), _entry("b", "other@example.com"), _entry("c")]
+        batches = plan_digests(entries, self._LOOSE)
+        self.assertEqual([b.message_ids for b in batches], [("a", "c"), ("b",)])
+        self.assertEqual([b.to_addr for b in batches], [_TO, "other@example.com"])
+        self.assertEqual([p.full_name for p in batches[0].payloads], ["a", "c"])
+
+    def test_item_threshold_flushes(self) -> None:
+        """件数しきい値に達すると次の 1 通へ切り替える."""
+        entries = [_entry(str(i)) for i in range(5)]
+        batches = plan_digests(entries, DigestPolicy(max_items=2, max_bytes=1_000_000))
+        self.assertEqual(
+            [b.message_ids for b in batches], [("0", "1"), ("2", "3"), ("4",)]
+        )
+
+    def test_size_threshold_flushes_and_oversized_item_stands_alone(self) -> None:
+        """サイズしきい値を超える時点で切り替え、単独で超える 1 件も 1 通とする."""
+        small = _entry("s1")
+        item_bytes = estimate_payload_bytes(small[1].payload)
+        policy = DigestPolicy(max_items=100, max_bytes=item_bytes * 2)
+        entries = [small, _entry("s2"), _entry("s3"), _entry("big", message="x" * item_bytes * 3)]
+        batches = plan_digests(entries, policy)
+        self.assertEqual(
+            [b.message_ids for b in batches], [("s1", "s2"), ("s3",), ("big",)]
+        )
+
+    def test_empty_input_plans_nothing(self) -> None:
+        """入力が空なら 1 通も計画しない."""
+        self.assertEqual(plan_digests([], self._LOOSE), [])
+
+
+class SendDigestTests(unittest.TestCase):
+    """`SesEmailSender.send_digest` の検証."""
+
+    def test_single_send_email_call_with_numbered_body(self) -> None:
+        """件数入りの件名と番号付きの本文で 1 回だけ送信する."""
+        client = _FakeSesClient()
+        SesEmailSender(ses_client=client).send_digest(
+            [_payload("一郎"), _payload("二郎")], _FROM, _TO
+        )
+        (call,) = client.calls
+        simple = call["Content"]["Simple"]
+        self.assertIn("2 件", simple["Subject"]["Data"])
+        body = simple["Body"]["Text"]["Data"]
+        self.assertLess(body.index("[1/2]"), body.index("一郎"))
+        self.assertLess(body.index("一郎"), body.index("[2/2]"))
+        self.assertLess(body.index("[2/2]"), body.index("二郎"))
+        self.assertEqual(call["Destination"], {"ToAddresses": [_TO]})
+
+    def test_empty_digest_is_rejected(self) -> None:
+        """空の入力は送信せず `ValueError`."""
+        client = _FakeSesClient()
+        with self.assertRaises(ValueError):
+            SesEmailSender(ses_client=client).send_digest([], _FROM, _TO)
+        self.assertEqual(client.calls, [])
+
+
+class DigestPolicyConfigurationTests(unittest.TestCase):
+    """`build_digest_policy` の環境変数読み取りの検証."""
+
+    def test_disabled_by_default(self) -> None:
+        """`CONTACT_DIGEST_MODE` 未設定は None（1 件ずつ送信）."""
+        with patch.dict(os.environ, {"CONTACT_DIGEST_MODE": ""}):
+            self.assertIsNone(build_digest_policy())
+
+    def test_enabled_policy_reads_limits(self) -> None:
+        """有効時は上限を環境変数から読む（未設定は既定値）."""
+        environ = {
+            "CONTACT_DIGEST_MODE": "true",
+            "CONTACT_DIGEST_MAX_ITEMS": "20",
+            "CONTACT_DIGEST_MAX_BYTES": "",
+        }
+        with patch.dict(os.environ, environ):
+            self.assertEqual(build_digest_policy(), DigestPolicy(max_items=20, max_bytes=200_000))
+
+    def test_invalid_limits_fail(self) -> None:
+        """非整数・1 未満の上限は `ConfigurationError`."""
+        for value in ("many", "0", "-3"):
+            environ = {"CONTACT_DIGEST_MODE": "on", "CONTACT_DIGEST_MAX_ITEMS": value}
+            with self.subTest(value=value), patch.dict(os.environ, environ):
+                with self.assertRaises(ConfigurationError):
+                    build_digest_policy()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+"""問い合わせキュー（`contact_queue`）と `QueueingEmailSender` の例示ベース単体テスト.
+
+検証観点:
+    1. メッセージ本文の往復変換が 4 項目・送信元・宛先・受付 ID を保ち、形式不正は
+       `ValueError` で失敗する（既定値で補わない）。
+    2. インメモリ・ファイルキューが投入順に受信し、`acknowledge` で削除、`release`
+       で再配信可能へ戻す。
+    3. `SqsContactQueue` が SendMessage / ReceiveMessage / DeleteMessage /
+       ChangeMessageVisibility を正しい引数で呼ぶ。
+    4. `QueueingEmailSender` が受付 ID を返し、ユースケースが `Accepted` を返す。
+       投入失敗は `SendFailed` となり受け付けたことにしない。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - SQS クライアントはコンストラクタ注入口へ呼び出しを記録するフェイクを渡す。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_contact_queue_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+
+from contact_function.adapters.contact_queue import (
+    FileContactQueue,
+    InMemoryContactQueue,
+    QueuedContact,
+    SqsContactQueue,
+    decode_queued_contact,
+    encode_queued_contact,
+)
+from contact_function.adapters.queueing_email_sender import QueueingEmailSender
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.send_contact import Accepted, SendFailed, send_contact
+
+_QUEUE_URL = "https://sqs.ap-northeast-1.amazonaws.com/000000000000/test-contact-queue"
+
+_PAYLOAD = ContactPayload(
+    full_name="山田 太郎",
+    email="taro@example.com",
+    phone_number="0312345678",
+    message="お問い合わせ本文です。",
+)
+
+
+def _message(acceptance_id: str = "accept-1") -> QueuedContact:
+    """テスト用の投入メッセージを返す."""
+    return QueuedContact(
+        acceptance_id=acceptance_id,
+        payload=_PAYLOAD,
+        from_addr="noreply@example.com",
+        to_addr="owner@example.com",
+    )
+
+
+def _fields() -> dict[str, str]:
+    """検証を通過する 4 項目の入力を返す."""
+    return {
+        "full_name": _PAYLOAD.full_name,
+        "email": _PAYLOAD.email,
+        "phone_number": _PAYLOAD.phone_number,
+        "message": _PAYLOAD.message,
+    }
+
+
+class _FakeSqsClient:
+    """SQS API の呼び出しを記録し、`receive_message` で登録済みの応答を返すフェイク."""
+
+    def __init__(self, messages: list[dict[str, str]] | None = None) -> None:
+        """受信応答として返すメッセージで初期化する."""
+        self._messages = messages or []
+        self.calls: list[tuple[str, dict]] = []
+
+    def send_message(self, **kwargs) -> dict:
+        """呼び出しを記録する."""
+        self.calls.append(("send_message", kwargs))
+        return {"MessageId": "m-1"}
+
+    def receive_message(self, **kwargs) -> dict:
+        """呼び出しを記録し、登録済みのメッセージを返す."""
+        self.calls.append(("receive_message", kwargs))
+        return {"Messages": self._messages}
+
+    def delete_message(self, **kwargs) -> dict:
+        """呼び出しを記録する."""
+        self.calls.append(("delete_message", kwargs))
+        return {}
+
+    def change_message_visibility(self, **kwargs) -> dict:
+        """呼び出しを記録する."""
+        self.calls.append(("change_message_visibility", kwargs))
+        return {}
+
+
+class _FailingQueue(InMemoryContactQueue):
+    """投入が常に失敗するキュー."""
+
+    def enqueue(self, message: QueuedContact) -> None:
+        """投入失敗を模擬する例外を送出する."""
+        raise RuntimeError("SQS 投入失敗（テスト用の模擬例外）")
+
+
+class MessageEncodingTests(unittest.TestCase):
+    """メッセージ本文の往復変換と形式不正の検証."""
+
+    def test_round_trip_preserves_all_fields(self) -> None:
+        """往復変換で全項目が保たれる."""
+        self.assertEqual(decode_queued_contact(encode_queued_contact(_message())), _message())
+
+    def test_body_contains_only_minimised_fields(self) -> None:
+        """本文は 4 項目・送信元・宛先・受付 ID・版のみを含む（データ最小化）."""
+        data = json.loads(encode_queued_contact(_message()))
+        self.assertEqual(
+            sorted(data), ["acceptance_id", "from_addr", "payload", "to_addr", "version"]
+        )
+        self.assertEqual(
+            sorted(data["payload"]), ["email", "full_name", "message", "phone_number"]
+        )
+
+    def test_malformed_bodies_are_rejected(self) -> None:
+        """JSON でない・版違い・項目欠落・非文字列はすべて `ValueError`."""
+        valid = json.loads(encode_queued_contact(_message()))
+        wrong_version = dict(valid, version=2)
+        missing_payload = {k: v for k, v in valid.items() if k != "payload"}
+        non_string = dict(valid, payload=dict(valid["payload"], email=None))
+        for body in (
+            "not json",
+            "[]",
+            json.dumps(wrong_version),
+            json.dumps(missing_payload),
+            json.dumps(non_string),
+        ):
+            with self.subTest(body=body), self.assertRaises(ValueError):
+                decode_queued_contact(body)
+
+
+class LocalQueueTests(unittest.TestCase):
+    """インメモリ・ファイルキューの受信・削除・再配信の検証."""
+
+    def _queues(self):
+        """検証対象のキュー（インメモリ・一時ディレクトリのファイル）を返す."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return (InMemoryContactQueue(), FileContactQueue(directory.name))
+
+    def test_receive_is_fifo_and_bounded(self) -> None:
+        """投入順に最大件数まで受信し、受信済みは再受信されない."""
+        for queue in self._queues():
+            with self.subTest(queue=type(queue).__name__):
+                for index in range(3):
+                    queue.enqueue(_message(f"accept-{index}"))
+                first = queue.receive(2)
+                ids = [decode_queued_contact(r.body).acceptance_id for r in first]
+                self.assertEqual(ids, ["accept-0", "accept-1"])
+                second = queue.receive(10)
+                self.assertEqual(
+                    [decode_queued_contact(r.body).acceptance_id for r in second],
+                    ["accept-2"],
+                )
+                self.assertEqual(queue.receive(10), [])
+
+    def test_release_redelivers_and_acknowledge_deletes(self) -> None:
+        """`release` したメッセージは再受信でき、`acknowledge` したものは消える."""
+        for queue in self._queues():
+            with self.subTest(queue=type(queue).__name__):
+                queue.enqueue(_message("accept-a"))
+                queue.enqueue(_message("accept-b"))
+                first, second = queue.receive(2)
+                queue.acknowledge([first.receipt])
+                queue.release([second.receipt])
+                (redelivered,) = queue.receive(10)
+                self.assertEqual(decode_queued_contact(redelivered.body).acceptance_id, "accept-b")
+                queue.acknowledge([redelivered.receipt])
+                self.assertEqual(queue.receive(10), [])
+
+    def test_file_queue_is_shared_across_instances(self) -> None:
+        """同じディレクトリを指すファイルキュー間で投入・受信できる."""
+        with tempfile.TemporaryDirectory() as directory:
+            FileContactQueue(directory).enqueue(_message())
+            (record,) = FileContactQueue(directory).receive(10)
+            self.assertEqual(decode_queued_contact(record.body), _message())
+
+
+class SqsContactQueueTests(unittest.TestCase):
+    """`SqsContactQueue` の SQS API 呼び出しの検証."""
+
+    def test_enqueue_sends_encoded_body(self) -> None:
+        """`SendMessage` にキュー URL と本文を渡す."""
+        client = _FakeSqsClient()
+        SqsContactQueue(_QUEUE_URL, sqs_client=client).enqueue(_message())
+        ((name, kwargs),) = client.calls
+        self.assertEqual(name, "send_message")
+        self.assertEqual(kwargs["QueueUrl"], _QUEUE_URL)
+        self.assertEqual(decode_queued_contact(kwargs["MessageBody"]), _message())
+
+    def test_receive_caps_batch_at_api_limit(self) -> None:
+        """受信件数は API 上限の 10 件に丸め、応答をメッセージへ変換する."""
+        client = _FakeSqsClient(
+            [{"MessageId": "m-1", "ReceiptHandle": "r-1", "Body": "body"}]
+        )
+        (record,) = SqsContactQueue(_QUEUE_URL, sqs_client=client).receive(50)
+        self.assertEqual(client.calls[0][1]["MaxNumberOfMessages"], 10)
+        self.assertEqual((record.message_id, record.receipt, record.body), ("m-1", "r-1", "body"))
+
+    def test_acknowledge_and_release_use_receipt_handles(self) -> None:
+        """削除は DeleteMessage、再配信は可視性タイムアウト 0 で行う."""
+        client = _FakeSqsClient()
+        queue = SqsContactQueue(_QUEUE_URL, sqs_client=client)
+        queue.acknowledge(["r-1"])
+        queue.release(["r-2"])
+        self.assertEqual(
+            client.calls,
+            [
+                ("delete_message", {"QueueUrl": _QUEUE_URL, "ReceiptHandle": "r-1"}),
+                (
+                    "change_message_visibility",
+                    {"QueueUrl": _QUEUE_URL, "ReceiptHandle": "r-2", "VisibilityTimeout": 0},
+                ),
+            ],
+        )
+
+
+class QueueingEmailSenderTests(unittest.TestCase):
+    """`QueueingEmailSender` とユースケースの `Accepted` の検証."""
+
+    def test_send_enqueues_and_returns_acceptance_id(self) -> None:
+        """投入したメッセージの受付 ID を返す."""
+        queue = InMemoryContactQueue()
+        sender = QueueingEmailSender(queue, id_factory=lambda: "accept-1")
+        acceptance_id = sender.send(_PAYLOAD, "noreply@example.com", "owner@example.com")
+        self.assertEqual(acceptance_id, "accept-1")
+        (record,) = queue.receive(10)
+        self.assertEqual(decode_queued_contact(record.body), _message())
+
+    def test_default_acceptance_ids_are_unique(self) -> None:
+        """既定の受付 ID は呼び出しごとに異なる."""
+        sender = QueueingEmailSender(InMemoryContactQueue())
+        first = sender.send(_PAYLOAD, "noreply@example.com", "owner@example.com")
+        second = sender.send(_PAYLOAD, "noreply@example.com", "owner@example.com")
+        self.assertNotEqual(first, second)
+
+    def test_use_case_returns_accepted(self) -> None:
+        """受付 ID を返す Email_Sender ではユースケースが `Accepted` を返す."""
+        sender = QueueingEmailSender(InMemoryContactQueue(), id_factory=lambda: "accept-1")
+        result = send_contact(_fields(), "noreply@example.com", "owner@example.com", sender)
+        self.assertEqual(result, Accepted(acceptance_id="accept-1"))
+
+    def test_enqueue_failure_is_send_failed(self) -> None:
+        """投入失敗は `SendFailed` となり、受け付けたことにしない."""
+        sender = QueueingEmailSender(_FailingQueue())
+        with self.assertLogs("contact_function.domain.send_contact", level="ERROR"):
+            result = send_contact(_fields(), "noreply@example.com", "owner@example.com", sender)
+        self.assertIsInstance(result, SendFailed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -466,14 +466,14 @@ class AuthIndependenceTests(unittest.TestCase):
     def test_send_contact_takes_no_auth_params(self) -> None:
         """send_contact が認証情報を引数に取らない（R13-2）.
 
-        期待される引数は fields / from_addr / to_addr / email_sender のみで
-        あり、認証情報を含まない（出典: send_contact.py シグネチャ）。
+        期待される引数は fields / from_addr / to_addr / email_sender と計測ポート
+        stage_timer のみであり、認証情報を含まない（出典: send_contact.py シグネチャ）。
         """
         self._assert_no_auth_params(send_contact)
         # 期待パラメータ集合を明示し、想定外引数の混入も検知する（回帰防止）。
         params = tuple(inspect.signature(send_contact).parameters)
         self.assertEqual(
-            params, ("fields", "from_addr", "to_addr", "email_sender")
+            params, ("fields", "from_addr", "to_addr", "email_sender", "stage_timer")
         )
 
     def test_email_sender_send_takes_no_auth_params(self) -> None:
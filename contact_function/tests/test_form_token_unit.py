@@ -0,0 +1,216 @@
+"""署名付きフォームトークン（`contact_function.form_token`）の例示ベース単体テスト.
+
+検証観点:
+    1. `issue_form_token` が発行したトークンは同じ鍵の `FormTokenVerifier` で検証でき、
+       欠落・形式不正・署名不一致・期限切れ・最小入力時間未満をそれぞれの理由で拒否する。
+    2. handler はボディ解析の前にヘッダのトークンを検証し、拒否を 403
+       （`form_token_rejected`）とする（ボディ解析・Email_Sender を呼ばない）。
+    3. `build_form_token_verifier` は `CONTACT_FORM_TOKEN_MODE` に応じた検証器を生成し、
+       鍵の欠落・不正な数値は `ConfigurationError` とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（時計は注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_form_token_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.composition import build_form_token_verifier
+from contact_function.form_token import (
+    REASON_FORGED,
+    REASON_MALFORMED,
+    REASON_MISSING,
+    REASON_STALE,
+    REASON_TOO_FAST,
+    FormTokenRejected,
+    FormTokenVerifier,
+    issue_form_token,
+)
+from contact_function.handler import handle_contact_request
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+_KEY = b"test-form-token-key"
+_ISSUED_AT = 1_700_000_000
+_TOKEN = issue_form_token(_KEY, _ISSUED_AT, "build-1")
+
+
+def _verifier(now: float = _ISSUED_AT + 60.0) -> FormTokenVerifier:
+    """有効期限 1 日・最小入力 3 秒の検証器を返す."""
+    return FormTokenVerifier(_KEY, 86_400.0, 3.0, clock=lambda: now)
+
+
+def _event_with(token: str | None, elapsed_ms: str | None) -> dict[str, object]:
+    """トークンと経過ミリ秒のヘッダを付けた正当な POST イベントを返す."""
+    event = _post_event(_ALLOWED_ORIGIN, _valid_form_body())
+    headers = event["headers"]
+    if token is not None:
+        headers["X-Form-Token"] = token
+    if elapsed_ms is not None:
+        headers["X-Form-Elapsed-Ms"] = elapsed_ms
+    return event
+
+
+class FormTokenVerifierTests(unittest.TestCase):
+    """`issue_form_token` と `FormTokenVerifier.check` の検証."""
+
+    def assertRejected(  # noqa: N802
+        self,
+        reason: str,
+        token: str | None,
+        elapsed_ms: str | None,
+        verifier: FormTokenVerifier | None = None,
+    ) -> None:
+        """`check` が指定の理由で拒否することを検証する."""
+        with self.assertRaises(FormTokenRejected) as raised:
+            (verifier or _verifier()).check(token, elapsed_ms)
+        self.assertEqual(raised.exception.reason, reason)
+
+    def test_issued_token_is_accepted(self) -> None:
+        """発行したトークンと十分な入力時間は受理する."""
+        self.assertTrue(_TOKEN.startswith(f"v1.{_ISSUED_AT}.build-1."))
+        _verifier().check(_TOKEN, "3000")
+
+    def test_missing_token_or_elapsed(self) -> None:
+        """トークン・経過ミリ秒の欠落は `missing`."""
+        self.assertRejected(REASON_MISSING, None, "5000")
+        self.assertRejected(REASON_MISSING, "", "5000")
+        self.assertRejected(REASON_MISSING, _TOKEN, None)
+
+    def test_malformed_values(self) -> None:
+        """区切り・版・数値・nonce の文字が不正なトークンと経過ミリ秒は `malformed`."""
+        for token in (
+            "v1.abc",
+            _TOKEN.replace("v1.", "v2.", 1),
+            f"v1.１７.build-1.{_TOKEN.rsplit('.', 1)[1]}",
+            f"v1.{_ISSUED_AT}.bü.{_TOKEN.rsplit('.', 1)[1]}",
+            f"v1.{'9' * 40}.build-1.sig",
+        ):
+            with self.subTest(token=token):
+                self.assertRejected(REASON_MALFORMED, token, "5000")
+        for elapsed_ms in ("", "-1", "1.5", "５０００", "9" * 40):
+            with self.subTest(elapsed_ms=elapsed_ms):
+                self.assertRejected(REASON_MALFORMED, _TOKEN, elapsed_ms)
+
+    def test_forged_signature(self) -> None:
+        """別の鍵・改変した発行時刻・非 ASCII の署名は `forged`."""
+        other_key = issue_form_token(b"other-key", _ISSUED_AT, "build-1")
+        tampered = _TOKEN.replace(str(_ISSUED_AT), str(_ISSUED_AT + 1), 1)
+        for token in (other_key, tampered, _TOKEN[:-1] + "é"):
+            with self.subTest(token=token):
+                self.assertRejected(REASON_FORGED, token, "5000")
+
+    def test_stale_or_future_token(self) -> None:
+        """有効期限切れ・時計のずれを超える未来の発行時刻は `stale`."""
+        self.assertRejected(REASON_STALE, _TOKEN, "5000", _verifier(_ISSUED_AT + 86_401.0))
+        self.assertRejected(REASON_STALE, _TOKEN, "5000", _verifier(_ISSUED_AT - 301.0))
+
+    def test_too_fast(self) -> None:
+        """最小入力時間に満たない送信は `too_fast`."""
+        self.assertRejected(REASON_TOO_FAST, _TOKEN, "2999")
+
+    def test_invalid_construction_fails(self) -> None:
+        """空の鍵・不正な nonce・不正な秒数は `ValueError`."""
+        with self.assertRaises(ValueError):
+            issue_form_token(b"", _ISSUED_AT, "n")
+        with self.assertRaises(ValueError):
+            issue_form_token(_KEY, _ISSUED_AT, "a.b")
+        with self.assertRaises(ValueError):
+            FormTokenVerifier(b"", 1.0, 0.0)
+        with self.assertRaises(ValueError):
+            FormTokenVerifier(_KEY, 0.0, 0.0)
+
+
+class HandlerFormTokenTests(unittest.TestCase):
+    """handler のフォームトークン段の検証."""
+
+    def test_rejected_token_returns_403_before_parsing(self) -> None:
+        """拒否したトークンは 403 とし、ボディ解析・送信を行わない."""
+        sender = RecordingEmailSender()
+        with patch("contact_function.handler.parse_body") as parse_body:
+            with self.assertLogs("contact_function.handler", level="WARNING") as logs:
+                response = handle_contact_request(
+                    _event_with(_TOKEN, "100"),
+                    FakeConfigProvider(),
+                    sender,
+                    form_token_verifier=_verifier(),
+                )
+        self.assertEqual(response["statusCode"], 403)
+        self.assertEqual(json.loads(response["body"]), {"error": "form_token_rejected"})
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], _ALLOWED_ORIGIN)
+        parse_body.assert_not_called()
+        self.assertEqual(sender.calls, [])
+        # 拒否理由のみを記録し、トークンの値は記録しない。
+        self.assertIn("reason=too_fast", logs.output[0])
+        self.assertNotIn(_TOKEN, logs.output[0])
+
+    def test_valid_token_is_sent(self) -> None:
+        """正当なトークンと入力時間の POST は送信する."""
+        sender = RecordingEmailSender()
+        response = handle_contact_request(
+            _event_with(_TOKEN, "12000"),
+            FakeConfigProvider(),
+            sender,
+            form_token_verifier=_verifier(),
+        )
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(len(sender.calls), 1)
+
+
+class BuildFormTokenVerifierTests(unittest.TestCase):
+    """`build_form_token_verifier` のモード選択の検証."""
+
+    def test_modes(self) -> None:
+        """既定は無効（None）、`enforce` は鍵で検証する."""
+        self.assertIsNone(build_form_token_verifier())
+        environ = {
+            "CONTACT_FORM_TOKEN_MODE": "enforce",
+            "CONTACT_FORM_TOKEN_KEY": _KEY.decode("ascii"),
+        }
+        with patch.dict(os.environ, environ):
+            verifier = build_form_token_verifier()
+        self.assertIsInstance(verifier, FormTokenVerifier)
+        with self.assertRaises(FormTokenRejected):
+            verifier.check(issue_form_token(b"other-key", _ISSUED_AT, "n"), "5000")
+
+    def test_default_has_no_max_age(self) -> None:
+        """既定では発行から長期間経過したトークンも受け付け、設定した期限は適用する."""
+        enforce = {"CONTACT_FORM_TOKEN_MODE": "enforce", "CONTACT_FORM_TOKEN_KEY": "k"}
+        old_token = issue_form_token(b"k", 1_000_000_000, "old-build")
+        with patch.dict(os.environ, enforce):
+            build_form_token_verifier().check(old_token, "5000")
+        with patch.dict(os.environ, {**enforce, "CONTACT_FORM_TOKEN_MAX_AGE_SECONDS": "86400"}):
+            with self.assertRaises(FormTokenRejected) as raised:
+                build_form_token_verifier().check(old_token, "5000")
+        self.assertEqual(raised.exception.reason, REASON_STALE)
+
+    def test_invalid_configuration_fails(self) -> None:
+        """不正なモード・鍵の欠落・不正な数値は `ConfigurationError`."""
+        enforce = {"CONTACT_FORM_TOKEN_MODE": "enforce", "CONTACT_FORM_TOKEN_KEY": "k"}
+        for environ in (
+            {"CONTACT_FORM_TOKEN_MODE": "strict"},
+            {"CONTACT_FORM_TOKEN_MODE": "enforce", "CONTACT_FORM_TOKEN_KEY": ""},
+            {**enforce, "CONTACT_FORM_TOKEN_MAX_AGE_SECONDS": "0"},
+            {**enforce, "CONTACT_FORM_TOKEN_MIN_FILL_SECONDS": "-1"},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, environ):
+                    with self.assertRaises(ConfigurationError):
+                        build_form_token_verifier()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,8 @@ design.md「Testing Strategy > 単体/例ベーステスト」）。
        プリフライトが送信を行わずに応答すること
        （出典: requirements.md R8-5、design.md C7）。
      - 応答マッピング: 検証失敗=400、SES 送信失敗（失敗するダブルを注入）=500、
-       成功=200（出典: requirements.md R5-2〜R5-6, R6-5, R6-6、design.md DM2）。
+       一時的な送信失敗=503、成功=200、キュー投入による受付=202（出典:
+       requirements.md R5-2〜R5-6, R6-5, R6-6、design.md DM2）。
 
 2. 静的検査:
      - Django 非同梱スモーク: Contact_Function の各モジュールを import しても
@@ -58,8 +59,14 @@ import unittest
 from pathlib import Path
 from urllib.parse import urlencode
 
+from contact_function.adapters.contact_queue import InMemoryContactQueue
+from contact_function.adapters.queueing_email_sender import QueueingEmailSender
 from contact_function.domain.contact_payload import ContactPayload
-from contact_function.domain.ports import ConfigProvider, EmailSender
+from contact_function.domain.ports import (
+    ConfigProvider,
+    EmailSender,
+    SendTemporarilyUnavailable,
+)
 from contact_function.handler import handle_contact_request
 
 # task 1.4 で確立した共有テストハーネスを再利用する（重複排除・単一責務）。
@@ -149,6 +156,14 @@ class FailingEmailSender(EmailSender):
         raise RuntimeError("SES 送信失敗（テスト用の模擬例外）")
 
 
+class _UnavailableEmailSender(EmailSender):
+    """常に一時的な失敗（`SendTemporarilyUnavailable`）を送出するテスト用の Email_Sender."""
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+        """SES のスロットリングが続いた状況を模擬する."""
+        raise SendTemporarilyUnavailable("SES スロットリング（テスト用）", retry_after_seconds=12.2)
+
+
 def _valid_form_body() -> str:
     """検証を通過する 4 項目の form-encoded ボディを構築するヘルパー.
 
@@ -405,6 +420,31 @@ class ResponseMappingTests(unittest.TestCase):
         # 成功メッセージ（個人データを含まない汎用メッセージ）を返す。
         self.assertIn("message", _parse_body(response))
 
+    def test_temporary_send_failure_maps_to_503_with_retry_after(self) -> None:
+        """一時的な送信失敗は 503 と切り上げた Retry-After を返す."""
+        response = handle_contact_request(
+            _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+            FakeConfigProvider(),
+            _UnavailableEmailSender(),
+        )
+        self.assertEqual(response["statusCode"], 503)
+        self.assertEqual(response["headers"]["Retry-After"], "13")
+        self.assertEqual(_parse_body(response)["error"], "send_unavailable")
+        # CORS ヘッダは失敗応答にも付与する。
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], _ALLOWED_ORIGIN)
+
+    def test_queued_send_maps_to_202_with_acceptance_id(self) -> None:
+        """キュー投入（受付 ID を返す Email_Sender）は 202 と受付 ID を返す."""
+        queue = InMemoryContactQueue()
+        response = handle_contact_request(
+            _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+            FakeConfigProvider(),
+            QueueingEmailSender(queue, id_factory=lambda: "accept-1"),
+        )
+        self.assertEqual(response["statusCode"], 202)
+        self.assertEqual(_parse_body(response)["acceptance_id"], "accept-1")
+        self.assertEqual(queue.pending_count(), 1)
+
 
 class DjangoNonBundlingSmokeTests(unittest.TestCase):
     """Django 非同梱スモーク: 各モジュール import で django をロードしない（R4-1, R4-2）.
@@ -420,9 +460,28 @@ class DjangoNonBundlingSmokeTests(unittest.TestCase):
     # import するため最も網羅的だが、各層を個別にも検査して層ごとの非依存を示す）。
     _MODULES_UNDER_TEST: tuple[str, ...] = (
         "contact_function.handler",
+        "contact_function.composition",
+        "contact_function.worker",
+        "contact_function.responses",
+        "contact_function.origin_policy",
+        "contact_function.body_parser",
+        "contact_function.form_token",
+        "contact_function.metrics",
+        "contact_function.tracing",
+        "contact_function.structured_logging",
+        "contact_function.adapters.aws_clients",
+        "contact_function.adapters.caching_config_provider",
+        "contact_function.adapters.contact_digest",
+        "contact_function.adapters.contact_queue",
+        "contact_function.adapters.queueing_email_sender",
+        "contact_function.adapters.resilient_email_sender",
+        "contact_function.adapters.environment",
+        "contact_function.adapters.idempotency_store",
+        "contact_function.adapters.rate_limiter",
         "contact_function.adapters.config_provider",
         "contact_function.adapters.ses_email_sender",
         "contact_function.domain.send_contact",
+        "contact_function.domain.idempotency",
         "contact_function.domain.validators",
         "contact_function.domain.contact_payload",
         "contact_function.domain.ports",
@@ -0,0 +1,486 @@
+"""重複送信の抑止（`domain.idempotency`・`adapters.idempotency_store`）の例示ベース単体テスト.
+
+検証観点:
+    1. キーは 4 項目の表記揺れ（前後の空白・改行コード・メールの大文字小文字）を
+       同一視し、内容・Origin が異なれば異なる。
+    2. 完了済みの重複は Email_Sender を呼ばずに先行する `Success` / `Accepted` を返す。
+       処理中の重複は送信せず `DuplicateSubmission`。送信失敗・検証失敗は記録を残さない。
+       入力の検証は 1 度だけ行う。
+    3. 送信前のストア障害は送信せず再試行可能な `SendFailed`、送信後の記録失敗は
+       送信結果を変えない。
+    4. インメモリ LRU は件数上限・有効期限を守る。ファイル・DynamoDB の共有ストアは
+       予約を 1 つだけ成立させ、期限切れの記録は未記録として扱う。
+    5. handler は完了済みの重複を 200（SES 呼び出しは 1 回）、処理中の重複を 409 とする。
+    6. `build_idempotency_store` は `CONTACT_IDEMPOTENCY_MODE` に応じたストアを生成し、
+       不正な設定は `ConfigurationError` とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない。DynamoDB は
+      条件付き書き込みを再現するフェイクのクライアントを注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_idempotency_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.idempotency_store import (
+    DynamoDbIdempotencyStore,
+    FileIdempotencyStore,
+    MemoryIdempotencyStore,
+    TieredIdempotencyStore,
+)
+from contact_function.composition import build_idempotency_store
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.idempotency import send_contact_once, submission_key
+from contact_function.domain.ports import EmailSender
+from contact_function.domain.send_contact import (
+    Accepted,
+    DuplicateSubmission,
+    SendFailed,
+    Success,
+    ValidationError,
+)
+from contact_function.domain.validators import validate_contact_input
+from contact_function.handler import handle_contact_request
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+_ORIGIN = "https://example.com"
+_FIELDS = {
+    "full_name": "山田 太郎",
+    "email": "Taro@example.com",
+    "phone_number": "09012345678",
+    "message": "お問い合わせです。\r\n2 行目",
+}
+
+
+class _FakeClock:
+    """手動で進める時計."""
+
+    def __init__(self) -> None:
+        """時刻 1000 秒で初期化する."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+class _FailingSender(EmailSender):
+    """常に送信に失敗する Email_Sender."""
+
+    def __init__(self) -> None:
+        """呼び出し回数を 0 で初期化する."""
+        self.calls = 0
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+        """呼び出しを数えて失敗する."""
+        self.calls += 1
+        raise RuntimeError("送信失敗（テスト）")
+
+
+class _AcceptingSender(EmailSender):
+    """受付 ID を返す非同期の Email_Sender."""
+
+    def __init__(self) -> None:
+        """呼び出し回数を 0 で初期化する."""
+        self.calls = 0
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> str:
+        """呼び出しを数えて受付 ID を返す."""
+        self.calls += 1
+        return f"acceptance-{self.calls}"
+
+
+class _BrokenStore(MemoryIdempotencyStore):
+    """指定した操作で失敗するストア."""
+
+    def __init__(self, failing: str) -> None:
+        """失敗させる操作名を保持する."""
+        super().__init__(16, 60.0, 60.0)
+        self._failing = failing
+
+    def get(self, key: str) -> str | None:
+        """`get` の失敗を模擬する."""
+        if self._failing == "get":
+            raise OSError("ストア障害（テスト）")
+        return super().get(key)
+
+    def complete(self, key: str, outcome: str) -> None:
+        """`complete` の失敗を模擬する."""
+        if self._failing == "complete":
+            raise OSError("ストア障害（テスト）")
+        super().complete(key, outcome)
+
+
+def _memory_store(clock: _FakeClock | None = None) -> MemoryIdempotencyStore:
+    """テスト用のインメモリストアを返す."""
+    return MemoryIdempotencyStore(16, 600.0, 60.0, clock=clock or _FakeClock())
+
+
+def _send(store, sender, fields=None, origin=_ORIGIN):
+    """既定の送信元・宛先で `send_contact_once` を呼ぶ."""
+    return send_contact_once(
+        dict(fields or _FIELDS), origin, "from@example.com", "to@example.com", sender, store
+    )
+
+
+class SubmissionKeyTests(unittest.TestCase):
+    """`submission_key` の正規化の検証."""
+
+    def test_cosmetic_differences_produce_the_same_key(self) -> None:
+        """前後の空白・改行コード・メールの大文字小文字は同一の送信とみなす."""
+        variant = dict(
+            _FIELDS,
+            full_name="  山田 太郎 ",
+            email="taro@EXAMPLE.com",
+            message="お問い合わせです。\n2 行目\n",
+        )
+        self.assertEqual(
+            submission_key(_FIELDS, _ORIGIN), submission_key(variant, "HTTPS://Example.com")
+        )
+
+    def test_content_and_origin_change_the_key(self) -> None:
+        """内容・Origin が異なるキーは異なり、キーは内容を含まない."""
+        key = submission_key(_FIELDS, _ORIGIN)
+        self.assertNotEqual(key, submission_key(dict(_FIELDS, message="別件"), _ORIGIN))
+        self.assertNotEqual(key, submission_key(_FIELDS, "https://www.example.com"))
+        self.assertEqual(len(key), 64)
+        self.assertNotIn("example", key)
+
+
+class SendContactOnceTests(unittest.TestCase):
+    """`send_contact_once` の重複抑止の検証."""
+
+    def test_completed_duplicate_returns_previous_success_without_sending(self) -> None:
+        """2 回目は Email_Sender を呼ばずに `Success` を返す."""
+        store = _memory_store()
+        sender = RecordingEmailSender()
+        self.assertEqual(_send(store, sender), Success())
+        self.assertEqual(_send(store, sender), Success())
+        self.assertEqual(len(sender.calls), 1)
+
+    def test_completed_duplicate_returns_previous_acceptance_id(self) -> None:
+        """非同期送信の重複は同じ受付 ID の `Accepted` を返す."""
+        store = _memory_store()
+        sender = _AcceptingSender()
+        first = _send(store, sender)
+        self.assertEqual(first, Accepted(acceptance_id="acceptance-1"))
+        self.assertEqual(_send(store, sender), first)
+        self.assertEqual(sender.calls, 1)
+
+    def test_in_flight_duplicate_is_reported(self) -> None:
+        """予約（処理中）のキーへの重複は送信せず、成功扱いにもせず `DuplicateSubmission`."""
+        store = _memory_store()
+        store.reserve(submission_key(_FIELDS, _ORIGIN), "pending")
+        sender = RecordingEmailSender()
+        self.assertEqual(_send(store, sender), DuplicateSubmission())
+        self.assertEqual(sender.calls, [])
+
+    def test_input_is_validated_once(self) -> None:
+        """検証は送信の有無によらず 1 度だけ行う."""
+        store = _memory_store()
+        with patch(
+            "contact_function.domain.send_contact.validate_contact_input",
+            wraps=validate_contact_input,
+        ) as validate:
+            self.assertEqual(_send(store, RecordingEmailSender()), Success())
+        self.assertEqual(validate.call_count, 1)
+
+    def test_failed_send_is_not_remembered(self) -> None:
+        """送信失敗は予約を削除し、再送で再び送信を試みる."""
+        store = _memory_store()
+        sender = _FailingSender()
+        with self.assertLogs("contact_function.domain.send_contact", level="ERROR"):
+            self.assertIsInstance(_send(store, sender), SendFailed)
+            self.assertIsInstance(_send(store, sender), SendFailed)
+        self.assertEqual(sender.calls, 2)
+        self.assertEqual(len(store), 0)
+
+    def test_invalid_input_bypasses_the_store(self) -> None:
+        """検証失敗はストアを参照・記録しない."""
+        store = _memory_store()
+        result = _send(store, RecordingEmailSender(), dict(_FIELDS, email="invalid"))
+        self.assertIsInstance(result, ValidationError)
+        self.assertEqual(len(store), 0)
+
+    def test_store_failure_before_send_is_retryable(self) -> None:
+        """送信前のストア障害は送信せず、再試行可能な `SendFailed`."""
+        sender = RecordingEmailSender()
+        with self.assertLogs("contact_function.domain.idempotency", level="ERROR"):
+            result = _send(_BrokenStore("get"), sender)
+        self.assertIsInstance(result, SendFailed)
+        self.assertIsNotNone(result.retry_after_seconds)
+        self.assertEqual(sender.calls, [])
+
+    def test_store_failure_after_send_keeps_the_result(self) -> None:
+        """送信後の記録失敗は送信結果（`Success`）を変えない."""
+        sender = RecordingEmailSender()
+        with self.assertLogs("contact_function.domain.idempotency", level="ERROR"):
+            result = _send(_BrokenStore("complete"), sender)
+        self.assertEqual(result, Success())
+        self.assertEqual(len(sender.calls), 1)
+
+
+class MemoryStoreTests(unittest.TestCase):
+    """`MemoryIdempotencyStore` の LRU・有効期限の検証."""
+
+    def test_entries_expire(self) -> None:
+        """予約・結果はそれぞれの有効秒数で失効する."""
+        clock = _FakeClock()
+        store = MemoryIdempotencyStore(4, 600.0, 60.0, clock=clock)
+        self.assertTrue(store.reserve("a", "pending"))
+        self.assertFalse(store.reserve("a", "pending"))
+        clock.now += 61
+        self.assertIsNone(store.get("a"))
+        self.assertTrue(store.reserve("a", "pending"))
+        store.complete("a", "success")
+        clock.now += 599
+        self.assertEqual(store.get("a"), "success")
+        clock.now += 2
+        self.assertIsNone(store.get("a"))
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """上限を超えると最も長く参照されていない記録から破棄する."""
+        store = MemoryIdempotencyStore(2, 600.0, 60.0, clock=_FakeClock())
+        store.complete("a", "success")
+        store.complete("b", "success")
+        store.get("a")
+        store.complete("c", "success")
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get("a"), "success")
+        self.assertIsNone(store.get("b"))
+
+    def test_invalid_bounds_fail(self) -> None:
+        """件数上限 0・負の秒数は `ValueError`."""
+        with self.assertRaises(ValueError):
+            MemoryIdempotencyStore(0, 600.0, 60.0)
+        with self.assertRaises(ValueError):
+            MemoryIdempotencyStore(1, -1.0, 60.0)
+
+
+class FileStoreTests(unittest.TestCase):
+    """`FileIdempotencyStore`（ローカル実行用の共有ストア）の検証."""
+
+    def setUp(self) -> None:
+        """一時ディレクトリと時計を用意する."""
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.clock = _FakeClock()
+
+    def _store(self) -> FileIdempotencyStore:
+        """同じディレクトリを共有するストアを返す."""
+        return FileIdempotencyStore(self._directory.name, 600.0, 60.0, clock=self.clock)
+
+    def test_reservation_is_shared_across_instances(self) -> None:
+        """別インスタンス（別プロセス相当）の予約・結果を参照できる."""
+        first, second = self._store(), self._store()
+        self.assertTrue(first.reserve("k", "pending"))
+        self.assertFalse(second.reserve("k", "pending"))
+        first.complete("k", "success")
+        self.assertEqual(second.get("k"), "success")
+        second.release("k")
+        self.assertIsNone(first.get("k"))
+
+    def test_expired_record_can_be_reserved_again(self) -> None:
+        """期限切れの予約は未記録として扱い、予約し直せる."""
+        store = self._store()
+        self.assertTrue(store.reserve("k", "pending"))
+        self.clock.now += 61
+        self.assertIsNone(store.get("k"))
+        self.assertTrue(store.reserve("k", "pending"))
+        self.assertEqual(
+            sorted(os.listdir(self._directory.name)), ["k.json"]
+        )
+
+    def test_corrupt_record_fails(self) -> None:
+        """形式不正の記録ファイルは `ValueError`."""
+        store = self._store()
+        with open(os.path.join(self._directory.name, "k.json"), "w", encoding="utf-8") as file:
+            file.write(json.dumps({"state": 1}))
+        with self.assertRaises(ValueError):
+            store.get("k")
+
+
+class ConditionalCheckFailed(Exception):
+    """botocore の ClientError（条件不成立）と同じ `response` を持つ例外."""
+
+    def __init__(self) -> None:
+        """エラーコードを設定する."""
+        super().__init__("ConditionalCheckFailedException")
+        self.response = {"Error": {"Code": "ConditionalCheckFailedException"}}
+
+
+class _FakeDynamoDbClient:
+    """条件付き書き込みを再現する DynamoDB クライアントのフェイク."""
+
+    def __init__(self) -> None:
+        """空のテーブルと呼び出し記録を用意する."""
+        self.items: dict[str, dict[str, dict[str, str]]] = {}
+        self.calls: list[str] = []
+
+    def get_item(self, TableName, Key, ConsistentRead):  # noqa: N803
+        """項目を返す."""
+        self.calls.append("get_item")
+        item = self.items.get(Key["idempotency_key"]["S"])
+        return {"Item": item} if item is not None else {}
+
+    def put_item(self, TableName, Item, **kwargs):  # noqa: N803
+        """条件（未記録または期限切れ）を評価して書き込む."""
+        self.calls.append("put_item")
+        key = Item["idempotency_key"]["S"]
+        existing = self.items.get(key)
+        if "ConditionExpression" in kwargs and existing is not None:
+            now = float(kwargs["ExpressionAttributeValues"][":now"]["N"])
+            if float(existing["expires_at"]["N"]) > now:
+                raise ConditionalCheckFailed()
+        self.items[key] = Item
+
+    def delete_item(self, TableName, Key):  # noqa: N803
+        """項目を削除する."""
+        self.calls.append("delete_item")
+        self.items.pop(Key["idempotency_key"]["S"], None)
+
+
+class DynamoDbStoreTests(unittest.TestCase):
+    """`DynamoDbIdempotencyStore` と `TieredIdempotencyStore` の検証."""
+
+    def setUp(self) -> None:
+        """フェイクのクライアントと時計を用意する."""
+        self.client = _FakeDynamoDbClient()
+        self.clock = _FakeClock()
+        self.store = DynamoDbIdempotencyStore(
+            "table", 600.0, 60.0, dynamodb_client=self.client, clock=self.clock
+        )
+
+    def test_conditional_reservation(self) -> None:
+        """予約は 1 つだけ成立し、期限切れ後は再び成立する."""
+        self.assertTrue(self.store.reserve("k", "pending"))
+        self.assertFalse(self.store.reserve("k", "pending"))
+        self.assertEqual(self.store.get("k"), "pending")
+        self.clock.now += 61
+        self.assertIsNone(self.store.get("k"))
+        self.assertTrue(self.store.reserve("k", "pending"))
+
+    def test_other_errors_propagate(self) -> None:
+        """条件不成立以外の失敗は例外のまま伝播する."""
+        with patch.object(self.client, "put_item", side_effect=OSError("接続失敗")):
+            with self.assertRaises(OSError):
+                self.store.reserve("k", "pending")
+
+    def test_items_carry_a_ttl_attribute(self) -> None:
+        """結果の項目は整数秒の TTL 属性を持つ."""
+        self.store.complete("k", "success")
+        self.assertEqual(self.client.items["k"]["expires_at"], {"N": "1600"})
+
+    def test_tiered_store_answers_local_hits_without_round_trips(self) -> None:
+        """完了した結果はインメモリから応答し、共有ストアを呼ばない."""
+        tiered = TieredIdempotencyStore(_memory_store(), self.store)
+        sender = RecordingEmailSender()
+        self.assertEqual(_send(tiered, sender), Success())
+        self.client.calls.clear()
+        self.assertEqual(_send(tiered, sender), Success())
+        self.assertEqual(self.client.calls, [])
+        self.assertEqual(len(sender.calls), 1)
+
+    def test_tiered_store_sees_other_containers(self) -> None:
+        """別コンテナ（別のインメモリ）の完了済み結果も共有ストアから参照する."""
+        sender = RecordingEmailSender()
+        _send(TieredIdempotencyStore(_memory_store(), self.store), sender)
+        result = _send(TieredIdempotencyStore(_memory_store(), self.store), sender)
+        self.assertEqual(result, Success())
+        self.assertEqual(len(sender.calls), 1)
+
+
+class HandlerIdempotencyTests(unittest.TestCase):
+    """handler と冪等性ストアの結合の検証."""
+
+    def test_double_submit_sends_once(self) -> None:
+        """同じ POST の 2 回目は 200 を返し、SES 送信は 1 回のみ."""
+        store = _memory_store()
+        sender = RecordingEmailSender()
+        for _ in range(2):
+            response = handle_contact_request(
+                _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+                FakeConfigProvider(),
+                sender,
+                store,
+            )
+            self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(len(sender.calls), 1)
+
+    def test_in_flight_duplicate_returns_409(self) -> None:
+        """処理中の重複は送信せず 409 `duplicate_in_flight`（CORS ヘッダ付き）."""
+        store = _memory_store()
+        sender = RecordingEmailSender()
+        with patch.object(store, "reserve", return_value=False), patch.object(
+            store, "get", side_effect=[None, "pending"]
+        ):
+            response = handle_contact_request(
+                _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+                FakeConfigProvider(),
+                sender,
+                store,
+            )
+        self.assertEqual(response["statusCode"], 409)
+        self.assertEqual(json.loads(response["body"]), {"error": "duplicate_in_flight"})
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], _ALLOWED_ORIGIN)
+        self.assertEqual(sender.calls, [])
+
+
+class BuildIdempotencyStoreTests(unittest.TestCase):
+    """`build_idempotency_store` のモード選択の検証."""
+
+    def test_modes(self) -> None:
+        """既定は LRU、`off` は None、`file` はファイルストア、`dynamodb` は多段."""
+        with tempfile.TemporaryDirectory() as directory:
+            cases = [
+                ({}, MemoryIdempotencyStore),
+                ({"CONTACT_IDEMPOTENCY_MODE": "file", "CONTACT_IDEMPOTENCY_DIR": directory},
+                 FileIdempotencyStore),
+            ]
+            for environ, expected in cases:
+                with self.subTest(environ=environ):
+                    with patch.dict(os.environ, environ):
+                        self.assertIsInstance(build_idempotency_store(), expected)
+        with patch.dict(os.environ, {"CONTACT_IDEMPOTENCY_MODE": "off"}):
+            self.assertIsNone(build_idempotency_store())
+        environ = {
+            "CONTACT_IDEMPOTENCY_MODE": "dynamodb",
+            "CONTACT_IDEMPOTENCY_TABLE": "table",
+        }
+        with patch.dict(os.environ, environ), patch(
+            "contact_function.adapters.idempotency_store.create_client",
+            return_value=_FakeDynamoDbClient(),
+        ):
+            self.assertIsInstance(build_idempotency_store(), TieredIdempotencyStore)
+
+    def test_invalid_configuration_fails(self) -> None:
+        """不正なモード・テーブル名の欠落・不正な秒数は `ConfigurationError`."""
+        for environ in (
+            {"CONTACT_IDEMPOTENCY_MODE": "redis"},
+            {"CONTACT_IDEMPOTENCY_MODE": "dynamodb", "CONTACT_IDEMPOTENCY_TABLE": ""},
+            {"CONTACT_IDEMPOTENCY_TTL_SECONDS": "0"},
+            {"CONTACT_IDEMPOTENCY_MAX_ENTRIES": "-1"},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, environ):
+                    with self.assertRaises(ConfigurationError):
+                        build_idempotency_store()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""処理段計測と EMF 出力（`contact_function.metrics`）の例示ベース単体テスト.
+
+検証観点:
+    1. `InvocationMetrics` は処理段ごとの所要時間を合算し、例外で抜けた処理段も記録する。
+    2. `result_label` は応答から有界な `Result` ディメンションの値を導出する。
+    3. `EmfMetricsEmitter` は 1 呼び出し 1 行の EMF JSON を出力し、最初の呼び出しのみ
+       `ColdStart=cold` とする。出力に個人データを含めず、出力の失敗は応答を変えない。
+    4. handler・ユースケースは各処理段を計測し、`lambda_handler` は 1 行を出力する。
+    5. `build_metrics_emitter` は `CONTACT_METRICS_MODE` に応じた出力器を生成する。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（時計・出力先は注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_metrics_unit -v
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function import handler
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.composition import ContactDependencies, build_metrics_emitter
+from contact_function.metrics import EmfMetricsEmitter, InvocationMetrics, result_label
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+
+class _StepClock:
+    """呼び出しごとに一定秒数ずつ進む時計."""
+
+    def __init__(self, step: float) -> None:
+        """0 秒から始める."""
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        """現在時刻を返し、時計を進める."""
+        value = self.now
+        self.now += self.step
+        return value
+
+
+class InvocationMetricsTests(unittest.TestCase):
+    """`InvocationMetrics` の検証."""
+
+    def test_stages_are_accumulated_in_order(self) -> None:
+        """同じ処理段は合算し、記録順を保つ."""
+        metrics = InvocationMetrics(clock=_StepClock(0.001))
+        with metrics.stage("parse"):
+            pass
+        with metrics.stage("send"):
+            pass
+        with metrics.stage("parse"):
+            pass
+        durations = metrics.durations_ms()
+        self.assertEqual(list(durations), ["parse", "send"])
+        self.assertAlmostEqual(durations["parse"], 2.0)
+        self.assertAlmostEqual(durations["send"], 1.0)
+
+    def test_stage_left_by_exception_is_recorded(self) -> None:
+        """例外で抜けた処理段も記録し、例外は伝播する."""
+        metrics = InvocationMetrics(clock=_StepClock(0.001))
+        with self.assertRaises(RuntimeError):
+            with metrics.stage("send"):
+                raise RuntimeError("失敗")
+        self.assertIn("send", metrics.durations_ms())
+
+    def test_invalid_stage_name_fails(self) -> None:
+        """`snake_case` でない処理段の名前は `ValueError`."""
+        for name in ("", "Parse", "parse-body", "x" * 41):
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    InvocationMetrics().stage(name)
+
+
+class ResultLabelTests(unittest.TestCase):
+    """`result_label` の検証."""
+
+    def test_labels(self) -> None:
+        """成功系はステータス、失敗系はボディの識別子（不正な形式はステータス）."""
+        cases = (
+            ({"statusCode": 200, "body": "{}"}, "success"),
+            ({"statusCode": 202, "body": "{}"}, "accepted"),
+            ({"statusCode": 204, "body": "{}"}, "preflight"),
+            ({"statusCode": 429, "body": '{"error": "rate_limited"}'}, "rate_limited"),
+            ({"statusCode": 400, "body": '{"error": "Bad Value!"}'}, "error_400"),
+            ({"statusCode": 500, "body": "not json"}, "error_500"),
+            ({"statusCode": 500, "body": "[]"}, "error_500"),
+        )
+        for response, expected in cases:
+            with self.subTest(response=response):
+                self.assertEqual(result_label(response), expected)
+
+
+class EmfMetricsEmitterTests(unittest.TestCase):
+    """`EmfMetricsEmitter` の検証."""
+
+    def test_one_line_per_invocation_with_cold_then_warm(self) -> None:
+        """1 呼び出し 1 行の EMF を出力し、2 回目以降は warm とする."""
+        stream = io.StringIO()
+        emitter = EmfMetricsEmitter("Test/Contact", stream, clock=lambda: 1700000000.5)
+        for _ in range(2):
+            metrics = InvocationMetrics(clock=_StepClock(0.002))
+            with metrics.stage("rate_limit"):
+                pass
+            emitter.emit(metrics, {"statusCode": 200, "body": "{}"})
+
+        first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+        directive = first["_aws"]["CloudWatchMetrics"][0]
+        self.assertEqual(first["_aws"]["Timestamp"], 1700000000500)
+        self.assertEqual(directive["Namespace"], "Test/Contact")
+        self.assertEqual(directive["Dimensions"], [["Result", "ColdStart"]])
+        self.assertEqual(
+            [metric["Name"] for metric in directive["Metrics"]], ["TotalMs", "RateLimitMs"]
+        )
+        self.assertEqual((first["Result"], first["ColdStart"]), ("success", "cold"))
+        self.assertEqual(second["ColdStart"], "warm")
+        self.assertEqual(first["RateLimitMs"], 2.0)
+
+    def test_emit_failure_is_logged_not_raised(self) -> None:
+        """出力の失敗は例外にせず、明示記録する."""
+        stream = io.StringIO()
+        stream.close()
+        emitter = EmfMetricsEmitter("Test/Contact", stream)
+        with self.assertLogs("contact_function.metrics", level="ERROR"):
+            emitter.emit(InvocationMetrics(), {"statusCode": 200, "body": "{}"})
+
+
+class HandlerMetricsTests(unittest.TestCase):
+    """handler・ユースケースの計測と `lambda_handler` の出力の検証."""
+
+    def test_handler_and_use_case_stages_are_timed(self) -> None:
+        """正常な POST はヘッダ・設定値・解析・検証・送信の各処理段を計測する."""
+        metrics = InvocationMetrics()
+        response = handler.handle_contact_request(
+            _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+            FakeConfigProvider(),
+            RecordingEmailSender(),
+            stage_timer=metrics,
+        )
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(
+            list(metrics.durations_ms()), ["headers", "config", "parse", "validate", "send"]
+        )
+
+    def test_lambda_handler_emits_one_line_without_personal_data(self) -> None:
+        """`lambda_handler` は 1 行を出力し、入力値を含めない."""
+        stream = io.StringIO()
+        registry = ContactDependencies(
+            FakeConfigProvider,
+            RecordingEmailSender,
+            idempotency_store_factory=lambda: None,
+            rate_limiter_factory=lambda: None,
+            metrics_emitter_factory=lambda: EmfMetricsEmitter("Test/Contact", stream),
+        )
+        event = _post_event(_ALLOWED_ORIGIN, _valid_form_body())
+        with patch.object(handler, "_DEPENDENCIES", registry):
+            response = handler.lambda_handler(event, None)
+        (line,) = stream.getvalue().splitlines()
+        record = json.loads(line)
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(record["Result"], "success")
+        self.assertIn("DependenciesMs", record)
+        self.assertIn("SendMs", record)
+        for value in ("example.com", _ALLOWED_ORIGIN, "お問い合わせ"):
+            self.assertNotIn(value, line)
+
+
+class BuildMetricsEmitterTests(unittest.TestCase):
+    """`build_metrics_emitter` のモード選択の検証."""
+
+    def test_modes(self) -> None:
+        """既定は EMF、`off` は None、不正なモードは `ConfigurationError`."""
+        self.assertIsInstance(build_metrics_emitter(), EmfMetricsEmitter)
+        with patch.dict(os.environ, {"CONTACT_METRICS_MODE": "off"}):
+            self.assertIsNone(build_metrics_emitter())
+        with patch.dict(os.environ, {"CONTACT_METRICS_MODE": "statsd"}):
+            with self.assertRaises(ConfigurationError):
+                build_metrics_emitter()
+
+
+if __name__ == "__main__":
+    unittest.main()
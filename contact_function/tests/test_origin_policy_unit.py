@@ -0,0 +1,176 @@
+"""コンパイル済み Origin ポリシー（`contact_function.origin_policy`）の例示ベース単体テスト.
+
+検証観点:
+    1. 完全一致（既定）は従来どおり許可リストの Origin のみを許可し、scheme・host の
+       大文字小文字と既定ポートの表記揺れは正規化して一致させる。
+    2. `https://*.example.com` はサブドメイン（任意の深さ）と apex に一致し、
+       接尾辞が同じだけの別ドメイン・別 scheme・別ポートには一致しない。
+       ポート指定（`:8080`・`:*`）を規則どおりに扱う。
+    3. 解釈できない規則・全許可（`*`）・先頭以外のワイルドカードは
+       `ConfigurationError`。
+    4. 判定の統計（完全一致・ワイルドカード・不一致の件数）を取得できる。
+    5. handler がワイルドカードで許可した Origin をそのまま ACAO に反映し、不正な
+       規則では 500 `configuration_error` を返す。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_origin_policy_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import unittest
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.handler import handle_contact_request
+from contact_function.origin_policy import OriginMatchStats, OriginPolicy, normalize_origin
+from contact_function.tests.test_handler_adapters_unit import (
+    FakeConfigProvider,
+    _options_event,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+
+class NormalizeOriginTests(unittest.TestCase):
+    """`normalize_origin` の正規化の検証."""
+
+    def test_scheme_host_and_default_port_are_normalized(self) -> None:
+        """scheme・host を小文字化し、既定ポートを省略する."""
+        cases = [
+            ("HTTPS://Example.COM", "https://example.com"),
+            ("https://example.com:443", "https://example.com"),
+            ("http://localhost:80", "http://localhost"),
+            ("http://localhost:8000", "http://localhost:8000"),
+            ("https://[::1]:8443", "https://[::1]:8443"),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(normalize_origin(value), expected)
+
+    def test_non_origin_values_are_rejected(self) -> None:
+        """パス付き・未対応 scheme・範囲外ポート・userinfo は None."""
+        for value in (
+            "https://example.com/",
+            "https://example.com/path",
+            "ftp://example.com",
+            "https://example.com:70000",
+            "https://user@example.com",
+            "null",
+        ):
+            with self.subTest(value=value):
+                self.assertIsNone(normalize_origin(value))
+
+
+class OriginPolicyTests(unittest.TestCase):
+    """`OriginPolicy` の判定と統計の検証."""
+
+    def test_exact_match_is_the_default(self) -> None:
+        """ワイルドカードを含まない規則は完全一致のみ（表記揺れは正規化）."""
+        policy = OriginPolicy(("https://example.com", "http://localhost:8000"))
+        self.assertTrue(policy.matches("https://example.com"))
+        self.assertTrue(policy.matches("https://EXAMPLE.com:443"))
+        self.assertTrue(policy.matches("http://localhost:8000"))
+        for origin in (
+            "https://www.example.com",
+            "http://example.com",
+            "http://localhost:8001",
+            "https://example.com.evil.net",
+            "",
+            None,
+        ):
+            with self.subTest(origin=origin):
+                self.assertFalse(policy.matches(origin))
+
+    def test_wildcard_subdomain_rule(self) -> None:
+        """`*.` はサブドメインと apex に一致し、別ドメイン・別 scheme には一致しない."""
+        policy = OriginPolicy(("https://*.preview.example.com",))
+        for origin in (
+            "https://feature-x.preview.example.com",
+            "https://a.b.preview.example.com",
+            "https://preview.example.com",
+            "https://Feature-X.preview.example.com:443",
+        ):
+            with self.subTest(origin=origin):
+                self.assertTrue(policy.matches(origin))
+        for origin in (
+            "http://feature-x.preview.example.com",
+            "https://feature-x.preview.example.com:8443",
+            "https://evilpreview.example.com",
+            "https://preview.example.com.evil.net",
+            "https://-bad.preview.example.com",
+        ):
+            with self.subTest(origin=origin):
+                self.assertFalse(policy.matches(origin))
+
+    def test_wildcard_port_rules(self) -> None:
+        """ポート指定は指定ポートのみ、`:*` は任意のポート（省略を含む）に一致する."""
+        fixed = OriginPolicy(("http://*.localhost:8080",))
+        self.assertTrue(fixed.matches("http://app.localhost:8080"))
+        self.assertFalse(fixed.matches("http://app.localhost:8081"))
+        self.assertFalse(fixed.matches("http://app.localhost"))
+
+        any_port = OriginPolicy(("http://*.localhost:*",))
+        self.assertTrue(any_port.matches("http://app.localhost:8081"))
+        self.assertTrue(any_port.matches("http://app.localhost"))
+
+    def test_invalid_rules_fail(self) -> None:
+        """解釈できない規則・全許可は `ConfigurationError`."""
+        for rule in (
+            "*",
+            "https://example.com/",
+            "https://foo.*.example.com",
+            "https://*example.com",
+            "*://example.com",
+            "ftp://*.example.com",
+            "https://example.com:*",
+        ):
+            with self.subTest(rule=rule):
+                with self.assertRaises(ConfigurationError):
+                    OriginPolicy((rule,))
+
+    def test_stats_count_each_outcome(self) -> None:
+        """完全一致・ワイルドカード・不一致を件数として集計する."""
+        policy = OriginPolicy(("https://example.com", "https://*.preview.example.com"))
+        for origin in (
+            "https://example.com",
+            "https://Example.com",
+            "https://pr-1.preview.example.com",
+            "https://evil.example.net",
+            None,
+        ):
+            policy.matches(origin)
+        self.assertEqual(
+            policy.stats(), OriginMatchStats(exact_hits=2, wildcard_hits=1, misses=2)
+        )
+
+
+class HandlerWildcardOriginTests(unittest.TestCase):
+    """handler とワイルドカード規則の結合の検証."""
+
+    def test_wildcard_matched_origin_is_reflected(self) -> None:
+        """ワイルドカードで許可した Origin をそのまま ACAO に反映する."""
+        provider = FakeConfigProvider(allowed_origins=("https://*.preview.example.com",))
+        origin = "https://pr-42.preview.example.com"
+        response = handle_contact_request(
+            _options_event(origin), provider, RecordingEmailSender()
+        )
+        self.assertEqual(response["statusCode"], 204)
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], origin)
+
+    def test_invalid_rule_returns_configuration_error(self) -> None:
+        """不正な規則は 500 `configuration_error`（CORS ヘッダなし）."""
+        provider = FakeConfigProvider(allowed_origins=("*",))
+        with self.assertLogs("contact_function.handler", level="ERROR"):
+            response = handle_contact_request(
+                _options_event("https://example.com"), provider, RecordingEmailSender()
+            )
+        self.assertEqual(response["statusCode"], 500)
+        self.assertEqual(json.loads(response["body"]), {"error": "configuration_error"})
+        self.assertNotIn("Access-Control-Allow-Origin", response["headers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -46,9 +46,9 @@
 
 イベントボディ形式（本テストの採用形式）:
     - Content-Type を `application/json` とし、handler の JSON 解釈経路
-      （`_parse_body`）を用いる。JSON はキー・値ともに文字列で往復が厳密であり、
-      form-encoded の記号往復差異を避けて生成入力を忠実に handler へ渡せる
-      （出典: handler.py `_parse_body` JSON 経路）。
+      （`body_parser.parse_body`）を用いる。JSON はキー・値ともに文字列で往復が
+      厳密であり、form-encoded の記号往復差異を避けて生成入力を忠実に handler へ渡せる
+      （出典: body_parser.py `parse_body` JSON 経路）。
 
 実行コマンド（プロジェクトルートから、Django 非ロード）:
     python -m unittest contact_function.tests.test_property_honeypot -v
@@ -171,7 +171,7 @@ def _build_event(body_fields: dict[str, str], origin: str) -> dict[str, object]:
 
     handler の実 API に整合する最小構成のイベントを生成する。ボディは JSON
     （Content-Type: application/json）で厳密に往復させ、生成入力を忠実に渡す
-    （出典: handler.py `_parse_body` JSON 経路、`handle_contact_request`）。
+    （出典: body_parser.py `parse_body` JSON 経路、`handle_contact_request`）。
 
     Args:
         body_fields: リクエストボディへ載せるフィールド辞書（4 項目に加え、
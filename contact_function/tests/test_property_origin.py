@@ -189,8 +189,8 @@ def _build_event(fields: dict[str, str], origin_value: object) -> dict[str, obje
     """Origin のみが変化する API Gateway プロキシ統合イベントを構築する.
 
     ボディは有効入力を JSON で表現する（handler は Content-Type に
-    `application/json` を含む場合に JSON として解釈する。出典: handler.py
-    `_parse_body`）。JSON 化により任意文字列を bytes へエンコードせずに往復でき、
+    `application/json` を含む場合に JSON として解釈する。出典: body_parser.py
+    `parse_body`）。JSON 化により任意文字列を bytes へエンコードせずに往復でき、
     Origin 以外の要因での失敗を排除する。
 
     Args:
@@ -0,0 +1,294 @@
+"""送信元 IP ごとのレート制限（`contact_function.adapters.rate_limiter`）の例示ベース単体テスト.
+
+検証観点:
+    1. `take_token` は経過時間分を容量まで補充し、不足時は次のトークンまでの秒数を返す。
+    2. `MemoryRateLimiter` はクライアントごとに独立したバケットを持ち、保持数を LRU で
+       制限する。
+    3. `DynamoDbRateLimiter` は条件付き書き込みで更新し、競合時は読み直して再試行する。
+       キーは秘密鍵による送信元 IP の HMAC で、IP そのものを保存しない。
+    4. handler はボディ解析の前に判定し、超過を 429 + `Retry-After`、判定の失敗を 503
+       とする（Email_Sender を呼ばない）。送信元 IP を持たないイベントは制限を適用せず
+       警告ログを残す。
+    5. `build_rate_limiter` は `CONTACT_RATE_LIMIT_MODE` に応じたレート制限を生成し、
+       不正な設定は `ConfigurationError` とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない。DynamoDB は
+      条件付き書き込みを再現するフェイクのクライアントを注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_rate_limiter_unit -v
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.adapters.rate_limiter import (
+    DynamoDbRateLimiter,
+    MemoryRateLimiter,
+    TokenBucketPolicy,
+    take_token,
+)
+from contact_function.composition import build_rate_limiter
+from contact_function.domain.ports import RateLimitDecision
+from contact_function.handler import handle_contact_request
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+from contact_function.tests.test_idempotency_unit import ConditionalCheckFailed
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+_POLICY = TokenBucketPolicy(capacity=2, refill_per_second=0.5)
+
+
+class _FakeClock:
+    """手動で進める時計."""
+
+    def __init__(self) -> None:
+        """時刻 1000 秒で初期化する."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+def _event_from(source_ip: str | None) -> dict[str, object]:
+    """送信元 IP 付きの正当な POST イベントを返す."""
+    event = _post_event(_ALLOWED_ORIGIN, _valid_form_body())
+    if source_ip is not None:
+        event["requestContext"] = {"identity": {"sourceIp": source_ip}}
+    return event
+
+
+class TakeTokenTests(unittest.TestCase):
+    """`take_token`（純粋関数）の検証."""
+
+    def test_refill_is_capped_at_capacity(self) -> None:
+        """長時間の経過でも容量を超えて補充しない."""
+        remaining, decision = take_token(0.0, 0.0, 1_000_000.0, _POLICY)
+        self.assertEqual((remaining, decision), (1.0, RateLimitDecision(allowed=True)))
+
+    def test_empty_bucket_reports_wait_until_next_token(self) -> None:
+        """不足時は次の 1 トークンまでの秒数を返す."""
+        remaining, decision = take_token(0.5, 10.0, 10.0, _POLICY)
+        self.assertEqual(remaining, 0.5)
+        self.assertFalse(decision.allowed)
+        self.assertAlmostEqual(decision.retry_after_seconds, 1.0)
+
+    def test_invalid_policy_fails(self) -> None:
+        """容量 1 未満・補充速度 0 以下は `ValueError`."""
+        with self.assertRaises(ValueError):
+            TokenBucketPolicy(capacity=0, refill_per_second=1.0)
+        with self.assertRaises(ValueError):
+            TokenBucketPolicy(capacity=1, refill_per_second=0.0)
+
+
+class MemoryRateLimiterTests(unittest.TestCase):
+    """`MemoryRateLimiter` の検証."""
+
+    def test_burst_then_refill(self) -> None:
+        """容量分は連続で許可し、超過は拒否、補充後は再び許可する."""
+        clock = _FakeClock()
+        limiter = MemoryRateLimiter(_POLICY, 16, clock=clock)
+        self.assertTrue(limiter.acquire("a").allowed)
+        self.assertTrue(limiter.acquire("a").allowed)
+        rejected = limiter.acquire("a")
+        self.assertFalse(rejected.allowed)
+        self.assertAlmostEqual(rejected.retry_after_seconds, 2.0)
+        # 別クライアントは独立したバケットを持つ。
+        self.assertTrue(limiter.acquire("b").allowed)
+        clock.now += 2.0
+        self.assertTrue(limiter.acquire("a").allowed)
+
+    def test_client_count_is_bounded(self) -> None:
+        """保持するクライアント数は上限を超えない."""
+        limiter = MemoryRateLimiter(_POLICY, 2, clock=_FakeClock())
+        for client in ("a", "b", "c", "d"):
+            limiter.acquire(client)
+        self.assertEqual(len(limiter), 2)
+
+
+class _FakeDynamoDbClient:
+    """条件付き書き込みを再現する DynamoDB クライアントのフェイク."""
+
+    def __init__(self) -> None:
+        """空のテーブルと、競合を注入する回数を用意する."""
+        self.items: dict[str, dict[str, dict[str, str]]] = {}
+        self.conflicts = 0
+        self.puts = 0
+
+    def get_item(self, TableName, Key, ConsistentRead):  # noqa: N803
+        """項目を返す."""
+        item = self.items.get(Key["client_key"]["S"])
+        return {"Item": item} if item is not None else {}
+
+    def put_item(self, TableName, Item, ConditionExpression, **kwargs):  # noqa: N803
+        """`updated_at` の一致（または未作成）を条件に書き込む."""
+        self.puts += 1
+        if self.conflicts:
+            self.conflicts -= 1
+            raise ConditionalCheckFailed()
+        key = Item["client_key"]["S"]
+        existing = self.items.get(key)
+        expected = kwargs.get("ExpressionAttributeValues", {}).get(":expected")
+        if (existing is None) != (expected is None) or (
+            existing is not None and existing["updated_at"] != expected
+        ):
+            raise ConditionalCheckFailed()
+        self.items[key] = Item
+
+
+class DynamoDbRateLimiterTests(unittest.TestCase):
+    """`DynamoDbRateLimiter` の検証."""
+
+    def setUp(self) -> None:
+        """フェイクのクライアントと時計を用意する."""
+        self.client = _FakeDynamoDbClient()
+        self.clock = _FakeClock()
+        self.limiter = DynamoDbRateLimiter(
+            "table", _POLICY, b"secret", dynamodb_client=self.client, clock=self.clock
+        )
+
+    def test_shared_bucket_limits_and_hashes_the_client(self) -> None:
+        """バケットはテーブルで共有され、キーは秘密鍵による IP の HMAC."""
+        other_container = DynamoDbRateLimiter(
+            "table", _POLICY, b"secret", dynamodb_client=self.client, clock=self.clock
+        )
+        self.assertTrue(self.limiter.acquire("203.0.113.7").allowed)
+        self.assertTrue(other_container.acquire("203.0.113.7").allowed)
+        self.assertFalse(self.limiter.acquire("203.0.113.7").allowed)
+        (key,) = self.client.items
+        self.assertNotIn("203.0.113.7", key)
+        self.assertEqual(len(key), 64)
+        # 鍵なしの SHA-256 ではなく、鍵が異なれば別のキーとなる（総当たりで復元させない）。
+        self.assertNotEqual(key, hashlib.sha256(b"203.0.113.7").hexdigest())
+        other_deployment = DynamoDbRateLimiter(
+            "table", _POLICY, b"other", dynamodb_client=self.client, clock=self.clock
+        )
+        self.assertTrue(other_deployment.acquire("203.0.113.7").allowed)
+        self.assertEqual(len(self.client.items), 2)
+
+    def test_conflicts_are_retried(self) -> None:
+        """競合は読み直して再試行し、続く場合は拒否する."""
+        self.client.conflicts = 1
+        self.assertTrue(self.limiter.acquire("a").allowed)
+        self.assertEqual(self.client.puts, 2)
+        self.client.conflicts = 10
+        decision = self.limiter.acquire("b")
+        self.assertFalse(decision.allowed)
+        self.assertGreater(decision.retry_after_seconds, 0)
+
+    def test_other_errors_propagate(self) -> None:
+        """条件不成立以外の失敗は例外のまま伝播する."""
+        with patch.object(self.client, "get_item", side_effect=OSError("接続失敗")):
+            with self.assertRaises(OSError):
+                self.limiter.acquire("a")
+
+
+class HandlerRateLimitTests(unittest.TestCase):
+    """handler のレート制限段の検証."""
+
+    def test_excess_posts_return_429_before_parsing(self) -> None:
+        """超過した POST は 429 + Retry-After とし、ボディ解析・送信を行わない."""
+        limiter = MemoryRateLimiter(_POLICY, 16, clock=_FakeClock())
+        sender = RecordingEmailSender()
+        statuses = []
+        with self.assertLogs("contact_function.handler", level="WARNING"):
+            for _ in range(3):
+                response = handle_contact_request(
+                    _event_from("198.51.100.1"), FakeConfigProvider(), sender, None, limiter
+                )
+                statuses.append(response["statusCode"])
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(json.loads(response["body"]), {"error": "rate_limited"})
+        self.assertEqual(response["headers"]["Retry-After"], "2")
+        self.assertEqual(response["headers"]["Access-Control-Allow-Origin"], _ALLOWED_ORIGIN)
+        self.assertEqual(len(sender.calls), 2)
+
+        # 別の送信元は制限されない。
+        other = handle_contact_request(
+            _event_from("198.51.100.2"), FakeConfigProvider(), sender, None, limiter
+        )
+        self.assertEqual(other["statusCode"], 200)
+
+    def test_missing_source_ip_skips_the_limiter(self) -> None:
+        """送信元 IP を取得できないイベントは共有バケットに入れず、警告して処理する."""
+        limiter = MemoryRateLimiter(_POLICY, 16, clock=_FakeClock())
+        sender = RecordingEmailSender()
+        with patch.object(limiter, "acquire") as acquire:
+            with self.assertLogs("contact_function.handler", level="WARNING") as logs:
+                statuses = [
+                    handle_contact_request(
+                        _event_from(None), FakeConfigProvider(), sender, None, limiter
+                    )["statusCode"]
+                    for _ in range(3)
+                ]
+        self.assertEqual(statuses, [200, 200, 200])
+        acquire.assert_not_called()
+        self.assertEqual(len(logs.records), 3)
+        self.assertEqual(len(sender.calls), 3)
+
+    def test_limiter_failure_returns_503(self) -> None:
+        """判定の失敗は 503 とし、送信しない."""
+        limiter = MemoryRateLimiter(_POLICY, 16)
+        sender = RecordingEmailSender()
+        with patch.object(limiter, "acquire", side_effect=OSError("障害")):
+            with self.assertLogs("contact_function.handler", level="ERROR"):
+                response = handle_contact_request(
+                    _event_from("198.51.100.1"), FakeConfigProvider(), sender, None, limiter
+                )
+        self.assertEqual(response["statusCode"], 503)
+        self.assertEqual(response["headers"]["Retry-After"], "1")
+        self.assertEqual(sender.calls, [])
+
+
+class BuildRateLimiterTests(unittest.TestCase):
+    """`build_rate_limiter` のモード選択の検証."""
+
+    def test_modes(self) -> None:
+        """既定はインメモリ、`off` は None、`dynamodb` は共有バケット."""
+        self.assertIsInstance(build_rate_limiter(), MemoryRateLimiter)
+        with patch.dict(os.environ, {"CONTACT_RATE_LIMIT_MODE": "off"}):
+            self.assertIsNone(build_rate_limiter())
+        environ = {
+            "CONTACT_RATE_LIMIT_MODE": "dynamodb",
+            "CONTACT_RATE_LIMIT_TABLE": "t",
+            "CONTACT_RATE_LIMIT_KEY": "k",
+        }
+        with patch.dict(os.environ, environ), patch(
+            "contact_function.adapters.rate_limiter.create_client",
+            return_value=_FakeDynamoDbClient(),
+        ):
+            self.assertIsInstance(build_rate_limiter(), DynamoDbRateLimiter)
+
+    def test_invalid_configuration_fails(self) -> None:
+        """不正なモード・テーブル名や鍵の欠落・不正な数値は `ConfigurationError`."""
+        for environ in (
+            {"CONTACT_RATE_LIMIT_MODE": "redis"},
+            {
+                "CONTACT_RATE_LIMIT_MODE": "dynamodb",
+                "CONTACT_RATE_LIMIT_TABLE": "",
+                "CONTACT_RATE_LIMIT_KEY": "k",
+            },
+            {"CONTACT_RATE_LIMIT_MODE": "dynamodb", "CONTACT_RATE_LIMIT_TABLE": "t"},
+            {"CONTACT_RATE_LIMIT_BURST": "0"},
+            {"CONTACT_RATE_LIMIT_PER_MINUTE": "-1"},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, environ):
+                    with self.assertRaises(ConfigurationError):
+                        build_rate_limiter()
+
+
+if __name__ == "__main__":
+    unittest.main()
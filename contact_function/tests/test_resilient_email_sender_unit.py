@@ -0,0 +1,275 @@
+"""SES 送信の再試行・サーキットブレーカー（`resilient_email_sender`）の例示ベース単体テスト.
+
+検証観点:
+    1. botocore の例外がスロットリング・一時障害・恒久的な失敗に分類される。
+    2. 一時的な失敗は上限付き・フルジッタのバックオフで再試行し、恒久的な失敗は
+       再試行せず元の例外のまま伝播する。
+    3. 試行回数・呼び出しの期限（Lambda コンテキストの残り時間）を超える再試行は
+       行わず、`SendTemporarilyUnavailable` を送出する。再試行には待機と 1 回の試行の
+       最長時間（AWS クライアントのタイムアウト × botocore の試行回数）を要する。
+    4. 連続した一時的失敗でブレーカーが開放し、クールダウン中は SES を呼ばずに
+       即時に失敗する。クールダウン後は半開で 1 回試し、成功で閉じ、失敗で再開放する。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - 時計・待機・乱数を注入し、実時間の待機を行わない。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_resilient_email_sender_unit -v
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+from contact_function.adapters.aws_clients import ClientSettings
+from contact_function.adapters.resilient_email_sender import (
+    ERROR_PERMANENT,
+    ERROR_THROTTLING,
+    ERROR_TRANSIENT,
+    CircuitBreaker,
+    CircuitOpenError,
+    InvocationDeadline,
+    ResilientEmailSender,
+    RetryPolicy,
+    classify_send_error,
+)
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import EmailSender, SendTemporarilyUnavailable
+
+_PAYLOAD = ContactPayload(
+    full_name="山田 太郎",
+    email="taro@example.com",
+    phone_number="0312345678",
+    message="お問い合わせ本文です。",
+)
+
+
+def _client_error(code: str) -> ClientError:
+    """指定したエラーコードの `ClientError` を返す."""
+    return ClientError({"Error": {"Code": code, "Message": "test"}}, "SendEmail")
+
+
+class _FakeClock:
+    """手動で進める単調時計."""
+
+    def __init__(self) -> None:
+        """時刻 0 で初期化する."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+class _ScriptedSender(EmailSender):
+    """あらかじめ与えた例外（None は成功）を順に返す Email_Sender."""
+
+    def __init__(self, outcomes: list[Exception | None]) -> None:
+        """結果の列で初期化する."""
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+        """次の結果を返す（例外なら送出する）."""
+        self.calls += 1
+        outcome = self._outcomes.pop(0) if self._outcomes else None
+        if outcome is not None:
+            raise outcome
+
+
+class _LambdaContext:
+    """`get_remaining_time_in_millis` だけを持つ Lambda コンテキストの代用."""
+
+    def __init__(self, remaining_ms: int) -> None:
+        """残り時間（ミリ秒）で初期化する."""
+        self._remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self) -> int:
+        """残り時間を返す."""
+        return self._remaining_ms
+
+
+class ClassifySendErrorTests(unittest.TestCase):
+    """`classify_send_error` の分類の検証."""
+
+    def test_error_codes_and_connection_failures_are_classified(self) -> None:
+        """スロットリング・一時障害・通信失敗・恒久的な失敗を区別する."""
+        cases = [
+            (_client_error("TooManyRequestsException"), ERROR_THROTTLING),
+            (_client_error("Throttling"), ERROR_THROTTLING),
+            (_client_error("InternalFailure"), ERROR_TRANSIENT),
+            (_client_error("MessageRejected"), ERROR_PERMANENT),
+            (_client_error("AccessDeniedException"), ERROR_PERMANENT),
+            (EndpointConnectionError(endpoint_url="https://email"), ERROR_TRANSIENT),
+            (ReadTimeoutError(endpoint_url="https://email"), ERROR_TRANSIENT),
+            (ValueError("unexpected"), ERROR_PERMANENT),
+        ]
+        for error, expected in cases:
+            with self.subTest(error=type(error).__name__):
+                self.assertEqual(classify_send_error(error), expected)
+
+
+class RetryTests(unittest.TestCase):
+    """再試行とバックオフの検証."""
+
+    def setUp(self) -> None:
+        """時計・待機記録・期限を用意する."""
+        self.clock = _FakeClock()
+        self.sleeps: list[float] = []
+        self.deadline = InvocationDeadline(clock=self.clock)
+
+    def _sender(self, inner: EmailSender, max_attempts: int = 3) -> ResilientEmailSender:
+        """乱数 0.5 固定・待機を記録する送信アダプタを返す."""
+
+        def _sleep(seconds: float) -> None:
+            self.sleeps.append(seconds)
+            self.clock.now += seconds
+
+        return ResilientEmailSender(
+            inner,
+            CircuitBreaker(failure_threshold=100, cool_down_seconds=30, clock=self.clock),
+            self.deadline,
+            RetryPolicy(max_attempts=max_attempts, base_delay_seconds=0.1, max_delay_seconds=0.3),
+            sleep=_sleep,
+            rand=lambda: 0.5,
+        )
+
+    def test_throttling_is_retried_with_capped_jittered_backoff(self) -> None:
+        """スロットリングは上限付きジッタで待機して再試行し、成功すれば返る."""
+        inner = _ScriptedSender([_client_error("Throttling")] * 3)
+        self._sender(inner, max_attempts=4).send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(inner.calls, 4)
+        # 0.1, 0.2, 0.4→上限 0.3 にそれぞれジッタ 0.5 を掛けた値。
+        self.assertEqual(self.sleeps, [0.05, 0.1, 0.15])
+
+    def test_permanent_error_is_not_retried(self) -> None:
+        """恒久的な失敗は再試行せず元の例外のまま伝播する."""
+        inner = _ScriptedSender([_client_error("MessageRejected")])
+        with self.assertRaises(ClientError):
+            self._sender(inner).send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_exhausted_attempts_raise_temporarily_unavailable(self) -> None:
+        """試行回数を使い切ると `SendTemporarilyUnavailable`（原因付き）."""
+        inner = _ScriptedSender([_client_error("Throttling")] * 5)
+        with self.assertRaises(SendTemporarilyUnavailable) as context:
+            self._sender(inner, max_attempts=2).send(
+                _PAYLOAD, "from@example.com", "to@example.com"
+            )
+        self.assertEqual(inner.calls, 2)
+        self.assertIsInstance(context.exception.__cause__, ClientError)
+        self.assertGreater(context.exception.retry_after_seconds, 0)
+
+    def test_deadline_stops_retries(self) -> None:
+        """期限まで再試行の余地がなければ待機せずに失敗する."""
+        # 残り 2.5 秒 - 安全余裕 2 秒 = 0.5 秒（再試行 1 回に必要な 1 秒に満たない）。
+        self.deadline.start(_LambdaContext(remaining_ms=2500))
+        inner = _ScriptedSender([_client_error("Throttling")] * 5)
+        with self.assertRaises(SendTemporarilyUnavailable):
+            self._sender(inner).send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_retry_requires_worst_case_attempt_time(self) -> None:
+        """待機と 1 回の試行の最長時間が期限内に収まる場合に限り再試行する."""
+        # 1 回目の失敗後の待機は 0.05 秒。1 回の試行の最長は (2 + 5) × 2 = 14 秒。
+        policy = RetryPolicy(
+            max_attempts=3,
+            base_delay_seconds=0.1,
+            max_delay_seconds=0.3,
+            attempt_seconds=ClientSettings().worst_case_call_seconds,
+        )
+        for remaining_seconds, expected_calls in ((14.04, 1), (14.06, 2)):
+            with self.subTest(remaining_seconds=remaining_seconds):
+                clock = _FakeClock()
+                deadline = InvocationDeadline(clock=clock)
+                # 安全余裕（2 秒）を差し引いた残りが `remaining_seconds` になる。
+                deadline.start(_LambdaContext(remaining_ms=int((remaining_seconds + 2) * 1000)))
+                inner = _ScriptedSender([_client_error("Throttling")] * 5)
+                sender = ResilientEmailSender(
+                    inner,
+                    CircuitBreaker(failure_threshold=100, cool_down_seconds=30, clock=clock),
+                    deadline,
+                    policy,
+                    sleep=lambda seconds: None,
+                    rand=lambda: 0.5,
+                )
+                with self.assertRaises(SendTemporarilyUnavailable):
+                    sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+                self.assertEqual(inner.calls, expected_calls)
+
+    def test_context_without_remaining_time_has_no_deadline(self) -> None:
+        """残り時間を持たないコンテキストは期限なし."""
+        self.deadline.start(None)
+        self.assertIsNone(self.deadline.remaining_seconds())
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    """サーキットブレーカーの開放・半開・閉鎖の検証."""
+
+    def setUp(self) -> None:
+        """時計とブレーカー（しきい値 2、クールダウン 30 秒）を用意する."""
+        self.clock = _FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, cool_down_seconds=30, clock=self.clock)
+
+    def _sender(self, inner: EmailSender) -> ResilientEmailSender:
+        """再試行なし（1 回のみ試行）の送信アダプタを返す."""
+        return ResilientEmailSender(
+            inner,
+            self.breaker,
+            InvocationDeadline(clock=self.clock),
+            RetryPolicy(max_attempts=1),
+            sleep=lambda seconds: None,
+        )
+
+    def test_breaker_opens_and_fails_fast_during_cool_down(self) -> None:
+        """連続失敗で開放し、クールダウン中は SES を呼ばずに失敗する."""
+        inner = _ScriptedSender([_client_error("Throttling")] * 2)
+        sender = self._sender(inner)
+        for _ in range(2):
+            with self.assertRaises(SendTemporarilyUnavailable):
+                sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(self.breaker.state, "open")
+
+        self.clock.now = 10.0
+        with self.assertRaises(CircuitOpenError) as context:
+            sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(inner.calls, 2)
+        self.assertAlmostEqual(context.exception.retry_after_seconds, 20.0)
+
+    def test_half_open_trial_closes_on_success_and_reopens_on_failure(self) -> None:
+        """クールダウン後の 1 回の試行が成功すれば閉じ、失敗すれば再び開放する."""
+        inner = _ScriptedSender(
+            [_client_error("Throttling")] * 2 + [_client_error("Throttling"), None]
+        )
+        sender = self._sender(inner)
+        for _ in range(2):
+            with self.assertRaises(SendTemporarilyUnavailable):
+                sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+
+        self.clock.now = 31.0
+        self.assertEqual(self.breaker.state, "half_open")
+        with self.assertRaises(SendTemporarilyUnavailable):
+            sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(self.breaker.state, "open")
+
+        self.clock.now = 62.0
+        sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(self.breaker.state, "closed")
+
+    def test_permanent_errors_do_not_open_the_breaker(self) -> None:
+        """恒久的な失敗はブレーカーに数えない."""
+        inner = _ScriptedSender([_client_error("MessageRejected")] * 3)
+        sender = self._sender(inner)
+        for _ in range(3):
+            with self.assertRaises(ClientError):
+                sender.send(_PAYLOAD, "from@example.com", "to@example.com")
+        self.assertEqual(self.breaker.state, "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""事前計算済み応答テーブル（`contact_function.responses`）の例示ベース単体テスト.
+
+検証観点:
+    1. 固定応答のステータス・ボディ・ヘッダが従来の組み立て（CORS ヘッダ +
+       `json.dumps(..., ensure_ascii=False)`）と一致し、許可 Origin のみ ACAO に反映する。
+    2. 返す応答は毎回新しい辞書であり、呼び出し側の変更がテーブルへ波及しない。
+    3. `ResponseTableCache` は許可 Origin 一覧が同じ間は同一テーブルを再利用し、
+       一覧が変わると組み立て直す。
+    4. 未知の応答種別は `KeyError`（フォールバックしない）。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_responses_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import unittest
+
+from contact_function import responses
+
+_ALLOWED = ("https://example.com", "https://www.example.com")
+
+
+class ResponseTableTests(unittest.TestCase):
+    """`ResponseTable` の固定応答・可変応答の検証."""
+
+    def setUp(self) -> None:
+        """テスト用の許可 Origin でテーブルを組み立てる."""
+        self.table = responses.ResponseTable(_ALLOWED)
+
+    def test_static_response_matches_serialized_body_and_cors_headers(self) -> None:
+        """固定応答は直列化済みボディと反映 Origin 付きのヘッダを返す."""
+        response = self.table.static(responses.ORIGIN_REJECTED, "https://example.com")
+        self.assertEqual(response["statusCode"], 403)
+        self.assertEqual(
+            response["body"], json.dumps({"error": "origin_rejected"}, ensure_ascii=False)
+        )
+        self.assertEqual(response["headers"], responses.build_headers("https://example.com"))
+        self.assertEqual(
+            response["headers"]["Access-Control-Allow-Origin"], "https://example.com"
+        )
+
+    def test_preflight_and_unreflected_origin(self) -> None:
+        """プリフライトは 204 と空オブジェクト、許可外は ACAO を付与しない."""
+        response = self.table.static(responses.PREFLIGHT, None)
+        self.assertEqual((response["statusCode"], response["body"]), (204, "{}"))
+        self.assertNotIn("Access-Control-Allow-Origin", response["headers"])
+        self.assertEqual(response["headers"]["Vary"], "Origin")
+
+    def test_reflect_only_allowed_origins(self) -> None:
+        """許可リストの Origin のみ反映し、欠落・許可外は None."""
+        self.assertEqual(self.table.reflect("https://www.example.com"), "https://www.example.com")
+        self.assertIsNone(self.table.reflect("https://evil.example"))
+        self.assertIsNone(self.table.reflect(None))
+
+    def test_returned_responses_are_independent_copies(self) -> None:
+        """応答を変更しても次の応答・テンプレートに波及しない."""
+        first = self.table.static(responses.SUCCESS, "https://example.com")
+        first["headers"]["X-Injected"] = "1"
+        first["body"] = "changed"
+        second = self.table.static(responses.SUCCESS, "https://example.com")
+        self.assertNotIn("X-Injected", second["headers"])
+        self.assertEqual(
+            second["body"],
+            json.dumps({"message": "問い合わせを受け付けました。"}, ensure_ascii=False),
+        )
+        with self.assertRaises(TypeError):
+            self.table.headers(None)["X-Injected"] = "1"  # type: ignore[index]
+
+    def test_dynamic_response_merges_extra_headers(self) -> None:
+        """可変応答はボディを直列化し、追加ヘッダをテンプレートへ合成する."""
+        response = self.table.dynamic(
+            503, {"error": "send_unavailable"}, None, {"Retry-After": "13"}
+        )
+        self.assertEqual(response["statusCode"], 503)
+        self.assertEqual(response["headers"]["Retry-After"], "13")
+        self.assertNotIn("Retry-After", self.table.headers(None))
+
+    def test_unknown_kind_fails(self) -> None:
+        """未知の応答種別は `KeyError`."""
+        with self.assertRaises(KeyError):
+            self.table.static("teapot", None)
+
+    def test_configuration_error_without_cors(self) -> None:
+        """許可 Origin を取得できない場合の 500 は Content-Type のみを返す."""
+        response = responses.configuration_error_without_cors()
+        self.assertEqual(response["statusCode"], 500)
+        self.assertEqual(response["headers"], {"Content-Type": "application/json"})
+
+
+class ResponseTableCacheTests(unittest.TestCase):
+    """`ResponseTableCache` の再利用・組み立て直しの検証."""
+
+    def test_table_is_reused_until_allowed_origins_change(self) -> None:
+        """同じ許可 Origin 一覧（同値の別オブジェクトを含む）では同一テーブルを返す."""
+        cache = responses.ResponseTableCache()
+        first = cache.get(_ALLOWED)
+        self.assertIs(cache.get(_ALLOWED), first)
+        self.assertIs(cache.get(list(_ALLOWED)), first)
+
+        changed = cache.get(("https://example.com",))
+        self.assertIsNot(changed, first)
+        self.assertIsNone(changed.reflect("https://www.example.com"))
+
+
+if __name__ == "__main__":
+    unittest.main()
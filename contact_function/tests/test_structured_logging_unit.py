@@ -0,0 +1,211 @@
+"""サンプリング付き構造化ログ（`contact_function.structured_logging`）の例示ベース単体テスト.
+
+検証観点:
+    1. `JsonLogFormatter` は 1 行の JSON（時刻・レベル・ロガー名・分類・メッセージ・
+       例外）を出力する。
+    2. `SampledJsonLogHandler` は分類ごとの率で間引き、率を指定しない分類は全件を
+       出力する。間引いた分類の件数を集計間隔の経過後に 1 行の集計として出力する。
+    3. handler の拒否は `rejection`、ユースケースの送信失敗は `send_failed` に分類する。
+    4. `build_log_handler` / `configure_logging` は環境変数に応じてハンドラを生成・
+       取り付け、不正な設定は `ConfigurationError`（取り付けでは継続）とする。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（時計・乱数は注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_structured_logging_unit -v
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.composition import build_log_handler, configure_logging
+from contact_function.handler import handle_contact_request
+from contact_function.structured_logging import (
+    CATEGORY_KEY,
+    CATEGORY_REJECTION,
+    JsonLogFormatter,
+    SampledJsonLogHandler,
+    log_category,
+)
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FailingEmailSender,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+
+
+class _ManualClock:
+    """手動で進める時計."""
+
+    def __init__(self) -> None:
+        """0 秒から始める."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """現在時刻を返す."""
+        return self.now
+
+
+def _record(message: str, category: str | None = None, *args: object) -> logging.LogRecord:
+    """分類付きのログレコードを返す."""
+    record = logging.LogRecord(
+        "contact_function.handler", logging.WARNING, "", 0, message, args, None
+    )
+    if category is not None:
+        setattr(record, CATEGORY_KEY, category)
+    return record
+
+
+def _lines(stream: io.StringIO) -> list[dict[str, object]]:
+    """出力された JSON 行を返す."""
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class JsonLogFormatterTests(unittest.TestCase):
+    """`JsonLogFormatter` の検証."""
+
+    def test_record_is_one_json_line(self) -> None:
+        """引数を埋め込んだメッセージと分類・例外を 1 行で出力する."""
+        try:
+            raise RuntimeError("失敗")
+        except RuntimeError:
+            record = logging.LogRecord(
+                "contact_function.x", logging.ERROR, "", 0, "件数 %d", (3,), None
+            )
+            record.exc_info = sys.exc_info()
+        line = JsonLogFormatter().format(record)
+        self.assertNotIn("\n", line)
+        document = json.loads(line)
+        self.assertEqual(document["level"], "ERROR")
+        self.assertEqual(document["category"], "default")
+        self.assertEqual(document["message"], "件数 3")
+        self.assertIn("RuntimeError: 失敗", document["exception"])
+
+
+class SampledJsonLogHandlerTests(unittest.TestCase):
+    """`SampledJsonLogHandler` の検証."""
+
+    def test_sampling_and_summary(self) -> None:
+        """率 0.5 の分類は乱数で間引き、期限後に件数の集計を 1 行出力する."""
+        stream = io.StringIO()
+        clock = _ManualClock()
+        samples = iter((0.1, 0.9, 0.9, 0.2))
+        log_handler = SampledJsonLogHandler(
+            {CATEGORY_REJECTION: 0.5}, 60.0, stream, clock=clock, sample=lambda: next(samples)
+        )
+        for _ in range(3):
+            log_handler.handle(_record("Origin を拒否しました。", CATEGORY_REJECTION))
+        log_handler.handle(_record("送信に失敗しました。", "send_failed"))
+        self.assertEqual(len(_lines(stream)), 2)
+
+        clock.now = 60.0
+        log_handler.handle(_record("Origin を拒否しました。", CATEGORY_REJECTION))
+        emitted, summary = _lines(stream)[2:]
+        self.assertEqual(emitted["category"], CATEGORY_REJECTION)
+        self.assertEqual(summary["message"], "log_summary")
+        self.assertEqual(
+            summary["counters"]["entries"],
+            [
+                {
+                    "category": CATEGORY_REJECTION,
+                    "logger": "contact_function.handler",
+                    "message": "Origin を拒否しました。",
+                    "count": 4,
+                    "emitted": 2,
+                }
+            ],
+        )
+
+    def test_summary_uses_template_not_arguments(self) -> None:
+        """集計はテンプレートで数え、埋め込む引数（入力値）を含めない."""
+        stream = io.StringIO()
+        clock = _ManualClock()
+        log_handler = SampledJsonLogHandler({CATEGORY_REJECTION: 0.0}, 1.0, stream, clock=clock)
+        log_handler.handle(_record("拒否（reason=%s）", CATEGORY_REJECTION, "user@example.com"))
+        clock.now = 1.0
+        log_handler.handle(_record("拒否（reason=%s）", CATEGORY_REJECTION, "other"))
+        (summary,) = _lines(stream)
+        self.assertNotIn("example.com", json.dumps(summary))
+        self.assertEqual(summary["counters"]["entries"][0]["count"], 2)
+
+    def test_invalid_construction_fails(self) -> None:
+        """範囲外の率・正でない間隔は `ValueError`."""
+        with self.assertRaises(ValueError):
+            SampledJsonLogHandler({CATEGORY_REJECTION: 1.5}, 60.0)
+        with self.assertRaises(ValueError):
+            SampledJsonLogHandler({}, 0.0)
+
+
+class LogCategoryTests(unittest.TestCase):
+    """handler・ユースケースのログの分類の検証."""
+
+    def test_rejection_and_send_failed_categories(self) -> None:
+        """Origin の拒否は `rejection`、送信失敗は `send_failed` に分類する."""
+        with self.assertLogs("contact_function.handler", level="WARNING") as logs:
+            handle_contact_request(
+                _post_event("https://evil.example.com", _valid_form_body()),
+                FakeConfigProvider(),
+                FailingEmailSender(),
+            )
+        self.assertEqual(getattr(logs.records[0], CATEGORY_KEY), CATEGORY_REJECTION)
+        with self.assertLogs("contact_function.domain.send_contact", level="ERROR") as logs:
+            handle_contact_request(
+                _post_event(_ALLOWED_ORIGIN, _valid_form_body()),
+                FakeConfigProvider(),
+                FailingEmailSender(),
+            )
+        self.assertEqual(getattr(logs.records[0], CATEGORY_KEY), "send_failed")
+        self.assertEqual(log_category("x"), {CATEGORY_KEY: "x"})
+
+
+class BuildLogHandlerTests(unittest.TestCase):
+    """`build_log_handler` / `configure_logging` の検証."""
+
+    def test_modes(self) -> None:
+        """既定は JSON、`plain` は None、率は環境変数から読む."""
+        self.assertIsInstance(build_log_handler(), SampledJsonLogHandler)
+        with patch.dict(os.environ, {"CONTACT_LOG_FORMAT": "plain"}):
+            self.assertIsNone(build_log_handler())
+        with patch.dict(os.environ, {"CONTACT_LOG_SAMPLE_RATES": "rejection=0, default=0.5"}):
+            self.assertIsInstance(build_log_handler(), SampledJsonLogHandler)
+
+    def test_invalid_configuration(self) -> None:
+        """不正な設定は `ConfigurationError`、`configure_logging` は記録して継続する."""
+        for environ in (
+            {"CONTACT_LOG_FORMAT": "xml"},
+            {"CONTACT_LOG_SAMPLE_RATES": "rejection"},
+            {"CONTACT_LOG_SAMPLE_RATES": "rejection=2"},
+            {"CONTACT_LOG_SAMPLE_RATES": "=0.1"},
+            {"CONTACT_LOG_SUMMARY_SECONDS": "0"},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, environ):
+                    with self.assertRaises(ConfigurationError):
+                        build_log_handler()
+        with patch.dict(os.environ, {"CONTACT_LOG_LEVEL": "verbose"}):
+            with self.assertLogs("contact_function.composition", level="ERROR"):
+                self.assertFalse(configure_logging())
+
+    def test_configure_logging_installs_once(self) -> None:
+        """取り付けは 1 度のみ（handler の import 時に取り付け済み）."""
+        package_logger = logging.getLogger("contact_function")
+        self.assertTrue(
+            any(isinstance(h, SampledJsonLogHandler) for h in package_logger.handlers)
+        )
+        self.assertFalse(package_logger.propagate)
+        self.assertFalse(configure_logging())
+
+
+if __name__ == "__main__":
+    unittest.main()
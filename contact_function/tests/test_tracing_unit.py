@@ -0,0 +1,277 @@
+"""ポート呼び出しのトレーシング（`contact_function.tracing`）の例示ベース単体テスト.
+
+検証観点:
+    1. `Tracer` は入れ子のスパンを外側のスパンの子とし、最も外側のスパンは
+       `_X_AMZN_TRACE_ID` のトレース ID・親 ID・サンプリング判定を引き継ぐ。
+       例外で抜けたスパンは型名のみを記録し、例外は伝播する。
+    2. デコレータはポートの各呼び出し（集約送信を含む）をスパンで囲み、戻り値を変えない。
+    3. 出力先: JSON Lines ファイルへ追記し、X-Ray へはサンプリング対象のみを
+       サブセグメント文書として送る。出力の失敗は応答を変えない。
+    4. `lambda_handler` は呼び出し全体のスパンの下に SSM・SES のスパンを記録し、
+       スパンに個人データを含めない。
+    5. `build_tracer` は `CONTACT_TRACING_MODE` に応じた記録器を生成する。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（時計・環境変数は注入する）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_tracing_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from contact_function import handler
+from contact_function.adapters.config_provider import ConfigurationError
+from contact_function.composition import ContactDependencies, build_tracer
+from contact_function.tracing import (
+    JsonFileSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    TracingConfigProvider,
+    TracingEmailSender,
+    XRaySegmentEmitter,
+    parse_trace_header,
+    xray_document,
+)
+from contact_function.tests.test_handler_adapters_unit import (
+    _ALLOWED_ORIGIN,
+    FakeConfigProvider,
+    _post_event,
+    _valid_form_body,
+)
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+from contact_function.tests.test_worker_unit import _PAYLOAD, _RecordingDigestSender
+
+_TRACE_HEADER = "Root=1-5759e988-bd862e3fe1be46a994272793;Parent=53995c3f42cd8ad8;Sampled=1"
+
+
+class RecordingSpanExporter(SpanExporter):
+    """出力されたスパンを記録するフェイク."""
+
+    def __init__(self) -> None:
+        """記録を空で初期化する."""
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        """スパンを記録する."""
+        self.spans.append(span)
+
+
+class _FailingExporter(SpanExporter):
+    """常に失敗する出力先."""
+
+    def export(self, span: Span) -> None:
+        """出力に失敗する."""
+        raise OSError("出力先が利用できません")
+
+
+class TracerTests(unittest.TestCase):
+    """`Tracer` の検証."""
+
+    def test_nested_spans_inherit_lambda_trace_header(self) -> None:
+        """外側のスパンはトレースヘッダを引き継ぎ、内側は外側を親とする."""
+        exporter = RecordingSpanExporter()
+        tracer = Tracer(exporter, clock=lambda: 10.0, environ={"_X_AMZN_TRACE_ID": _TRACE_HEADER})
+        with tracer.stage("outer"):
+            with tracer.stage("inner"):
+                pass
+        inner, outer = exporter.spans
+        self.assertEqual(outer.trace_id, "1-5759e988-bd862e3fe1be46a994272793")
+        self.assertEqual(outer.parent_id, "53995c3f42cd8ad8")
+        self.assertEqual(inner.trace_id, outer.trace_id)
+        self.assertEqual(inner.parent_id, outer.span_id)
+        self.assertTrue(outer.sampled)
+
+    def test_local_trace_id_is_generated(self) -> None:
+        """トレースヘッダが無い場合は X-Ray 形式のトレース ID を採番する."""
+        exporter = RecordingSpanExporter()
+        tracer = Tracer(exporter, clock=lambda: 0x5759E988, environ={})
+        with tracer.stage("outer"):
+            pass
+        (span,) = exporter.spans
+        self.assertRegex(span.trace_id, r"^1-5759e988-[0-9a-f]{24}$")
+        self.assertIsNone(span.parent_id)
+
+    def test_exception_type_is_recorded_and_propagated(self) -> None:
+        """例外で抜けたスパンは型名のみを記録し、例外は伝播する."""
+        exporter = RecordingSpanExporter()
+        tracer = Tracer(exporter, environ={})
+        with self.assertRaises(ConfigurationError):
+            with tracer.stage("ConfigProvider.get_to_address"):
+                raise ConfigurationError("秘密の値を含むメッセージ")
+        (span,) = exporter.spans
+        self.assertEqual(span.error, "ConfigurationError")
+        self.assertNotIn("秘密", json.dumps(xray_document(span), ensure_ascii=False))
+
+    def test_export_failure_is_logged_not_raised(self) -> None:
+        """出力の失敗は例外にせず、明示記録する."""
+        tracer = Tracer(_FailingExporter(), environ={})
+        with self.assertLogs("contact_function.tracing", level="ERROR"):
+            with tracer.stage("outer"):
+                pass
+
+    def test_parse_trace_header(self) -> None:
+        """`Root` が無いヘッダは None、`Sampled=0` はサンプリング対象外."""
+        self.assertIsNone(parse_trace_header(""))
+        self.assertIsNone(parse_trace_header("Parent=53995c3f42cd8ad8"))
+        self.assertEqual(parse_trace_header("Root=1-a-b;Sampled=0"), ("1-a-b", None, False))
+
+
+class DecoratorTests(unittest.TestCase):
+    """ポートのデコレータの検証."""
+
+    def test_port_calls_are_wrapped(self) -> None:
+        """各呼び出しを名前付きのスパンで囲み、戻り値を変えない."""
+        exporter = RecordingSpanExporter()
+        tracer = Tracer(exporter, environ={})
+        inner = FakeConfigProvider()
+        provider = TracingConfigProvider(inner, tracer)
+        self.assertEqual(provider.get_allowed_origins(), inner.get_allowed_origins())
+        self.assertEqual(provider.get_from_address(), inner.get_from_address())
+        self.assertEqual(provider.get_to_address(), inner.get_to_address())
+        self.assertEqual(
+            [span.name for span in exporter.spans],
+            [
+                "ConfigProvider.get_allowed_origins",
+                "ConfigProvider.get_from_address",
+                "ConfigProvider.get_to_address",
+            ],
+        )
+
+    def test_digest_calls_are_wrapped(self) -> None:
+        """集約送信をスパンで囲み、集約送信に対応しない送信アダプタは `TypeError`."""
+        exporter = RecordingSpanExporter()
+        tracer = Tracer(exporter, environ={})
+        inner = _RecordingDigestSender()
+        TracingEmailSender(inner, tracer).send_digest([_PAYLOAD], "from@x.test", "to@x.test")
+        self.assertEqual(len(inner.digests), 1)
+        self.assertEqual([span.name for span in exporter.spans], ["EmailSender.send_digest"])
+        with self.assertRaises(TypeError):
+            TracingEmailSender(RecordingEmailSender(), tracer).send_digest(
+                [_PAYLOAD], "from@x.test", "to@x.test"
+            )
+
+
+class ExporterTests(unittest.TestCase):
+    """出力先の検証."""
+
+    def _span(self, sampled: bool = True, parent_id: str | None = "53995c3f42cd8ad8") -> Span:
+        """固定値のスパンを返す."""
+        return Span("EmailSender.send", "1-a-b", "0123456789abcdef", parent_id, 1.0, 1.5, sampled)
+
+    def test_json_file_exporter_appends_lines(self) -> None:
+        """1 スパン 1 行の JSON を追記する."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spans.jsonl")
+            exporter = JsonFileSpanExporter(path)
+            exporter.export(self._span())
+            exporter.export(self._span())
+            with open(path, encoding="utf-8") as stream:
+                lines = stream.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])["name"], "EmailSender.send")
+
+    def test_xray_document(self) -> None:
+        """親を持つスパンはサブセグメント、親の無いスパンはセグメントとする."""
+        document = xray_document(self._span())
+        self.assertEqual(document["type"], "subsegment")
+        self.assertEqual(document["parent_id"], "53995c3f42cd8ad8")
+        self.assertNotIn("type", xray_document(self._span(parent_id=None)))
+
+    def test_xray_emitter_sends_sampled_spans_only(self) -> None:
+        """サンプリング対象のスパンのみをヘッダ付きの UDP パケットで送る."""
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(receiver.close)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(5)
+        emitter = XRaySegmentEmitter(f"127.0.0.1:{receiver.getsockname()[1]}")
+        self.addCleanup(emitter.close)
+        emitter.export(self._span(sampled=False))
+        emitter.export(self._span())
+        packet, _ = receiver.recvfrom(65536)
+        header, body = packet.split(b"\n", 1)
+        self.assertEqual(json.loads(header), {"format": "json", "version": 1})
+        self.assertEqual(json.loads(body)["id"], "0123456789abcdef")
+
+    def test_invalid_daemon_address_fails(self) -> None:
+        """`host:port` 形式でないアドレスは `ValueError`."""
+        for address in ("", "127.0.0.1", ":2000", "127.0.0.1:port"):
+            with self.subTest(address=address):
+                with self.assertRaises(ValueError):
+                    XRaySegmentEmitter(address)
+
+
+class LambdaHandlerTracingTests(unittest.TestCase):
+    """`lambda_handler` のスパンの検証."""
+
+    def test_port_spans_are_children_of_request_span(self) -> None:
+        """SSM・SES のスパンを呼び出し全体のスパンの子とし、入力値を含めない."""
+        exporter = RecordingSpanExporter()
+        sender = RecordingEmailSender()
+        registry = ContactDependencies(
+            FakeConfigProvider,
+            lambda: sender,
+            idempotency_store_factory=lambda: None,
+            rate_limiter_factory=lambda: None,
+            metrics_emitter_factory=lambda: None,
+            tracer_factory=lambda: Tracer(exporter, environ={}),
+        )
+        event = _post_event(_ALLOWED_ORIGIN, _valid_form_body())
+        with patch.object(handler, "_DEPENDENCIES", registry):
+            response = handler.lambda_handler(event, None)
+
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(len(sender.calls), 1)
+        root = exporter.spans[-1]
+        self.assertEqual(root.name, "contact_request")
+        children = exporter.spans[:-1]
+        self.assertIn("EmailSender.send", [span.name for span in children])
+        self.assertIn("ConfigProvider.get_allowed_origins", [span.name for span in children])
+        self.assertTrue(all(span.parent_id == root.span_id for span in children))
+        serialized = json.dumps([xray_document(span) for span in exporter.spans])
+        for value in ("example.com", _ALLOWED_ORIGIN):
+            self.assertNotIn(value, serialized)
+
+    def test_decorators_wrap_registry_dependencies_only_when_enabled(self) -> None:
+        """トレーシング無効時はファクトリの依存をそのまま返す."""
+        registry = ContactDependencies(FakeConfigProvider, RecordingEmailSender)
+        self.assertIsInstance(registry.config_provider(), FakeConfigProvider)
+        registry = ContactDependencies(
+            FakeConfigProvider,
+            RecordingEmailSender,
+            tracer_factory=lambda: Tracer(RecordingSpanExporter()),
+        )
+        self.assertIsInstance(registry.config_provider(), TracingConfigProvider)
+        self.assertIsInstance(registry.email_sender(), TracingEmailSender)
+
+
+class BuildTracerTests(unittest.TestCase):
+    """`build_tracer` のモード選択の検証."""
+
+    def test_modes(self) -> None:
+        """既定は無効、`file` / `xray` は記録器、不正な設定は `ConfigurationError`."""
+        self.assertIsNone(build_tracer())
+        for mode in ("file", "xray"):
+            with self.subTest(mode=mode):
+                with patch.dict(os.environ, {"CONTACT_TRACING_MODE": mode}):
+                    self.assertIsInstance(build_tracer(), Tracer)
+        for environ in (
+            {"CONTACT_TRACING_MODE": "zipkin"},
+            {"CONTACT_TRACING_MODE": "xray", "AWS_XRAY_DAEMON_ADDRESS": "daemon"},
+        ):
+            with self.subTest(environ=environ):
+                with patch.dict(os.environ, environ):
+                    with self.assertRaises(ConfigurationError):
+                        build_tracer()
+
+
+if __name__ == "__main__":
+    unittest.main()
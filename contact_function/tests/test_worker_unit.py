@@ -0,0 +1,227 @@
+"""ドレインワーカー（`contact_function.worker`）の例示ベース単体テスト.
+
+検証観点:
+    1. SQS イベントのうち送信に失敗したメッセージ・本文の形式不正のメッセージのみを
+       `batchItemFailures` として報告し、成功分は報告しない（部分バッチ応答）。
+    2. `drain_queue` が成功分を削除し、失敗分を再配信可能へ戻す。
+    3. SQS 形式でないイベントは推測せず `ValueError` で失敗する。
+    4. ダイジェスト有効時は宛先ごとに 1 通の集約メールで送信し、集約メールの失敗は
+       まとめた全件を失敗として報告する。1 件だけの組は通常の 1 件送信とする。
+       トレーシング有効時も集約送信する。
+
+テスト方針:
+    - 標準ライブラリ `unittest` による決定的な例示検証（AWS を呼ばない）。
+    - Email_Sender は記録用ダブル・特定の宛先でのみ失敗するダブルを注入する。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest contact_function.tests.test_worker_unit -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from contact_function import worker
+from contact_function.adapters.contact_digest import DigestEmailSender, DigestPolicy
+from contact_function.adapters.contact_queue import (
+    InMemoryContactQueue,
+    QueuedContact,
+    QueueRecord,
+    encode_queued_contact,
+)
+from contact_function.composition import ContactDependencies
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import EmailSender
+from contact_function.tests.test_property_valid_payload import RecordingEmailSender
+
+_PAYLOAD = ContactPayload(
+    full_name="山田 太郎",
+    email="taro@example.com",
+    phone_number="0312345678",
+    message="お問い合わせ本文です。",
+)
+_FAILING_TO_ADDR = "broken@example.com"
+
+
+def _message(acceptance_id: str, to_addr: str = "owner@example.com") -> QueuedContact:
+    """テスト用の投入メッセージを返す."""
+    return QueuedContact(
+        acceptance_id=acceptance_id,
+        payload=_PAYLOAD,
+        from_addr="noreply@example.com",
+        to_addr=to_addr,
+    )
+
+
+def _sqs_record(message_id: str, body: str) -> dict[str, str]:
+    """SQS イベントの 1 レコードを返す."""
+    return {"messageId": message_id, "receiptHandle": f"receipt-{message_id}", "body": body}
+
+
+class _SelectivelyFailingEmailSender(RecordingEmailSender):
+    """特定の宛先への送信のみ失敗する Email_Sender."""
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> None:
+        """宛先が失敗対象なら例外を送出し、それ以外は記録する."""
+        if to_addr == _FAILING_TO_ADDR:
+            raise RuntimeError("SES 送信失敗（テスト用の模擬例外）")
+        super().send(payload, from_addr, to_addr)
+
+
+class _RecordingDigestSender(_SelectivelyFailingEmailSender, DigestEmailSender):
+    """集約メールの送信を記録し、失敗対象の宛先では失敗する Email_Sender."""
+
+    def __init__(self) -> None:
+        """1 件送信・集約送信の記録を初期化する."""
+        super().__init__()
+        self.digests: list[tuple[tuple[str, ...], str]] = []
+
+    def send_digest(self, payloads, from_addr: str, to_addr: str) -> None:
+        """宛先が失敗対象なら例外を送出し、それ以外は氏名の列と宛先を記録する."""
+        if to_addr == _FAILING_TO_ADDR:
+            raise RuntimeError("SES 送信失敗（テスト用の模擬例外）")
+        self.digests.append((tuple(p.full_name for p in payloads), to_addr))
+
+
+class SqsEventTests(unittest.TestCase):
+    """`lambda_handler` の部分バッチ応答の検証."""
+
+    def _invoke(self, event: dict, sender: EmailSender) -> dict:
+        """送信アダプタを差し替えた依存で `lambda_handler` を呼ぶ."""
+        dependencies = ContactDependencies(email_sender_factory=lambda: sender)
+        with patch.object(worker, "_DEPENDENCIES", dependencies):
+            return worker.lambda_handler(event, None)
+
+    def test_only_failed_messages_are_reported(self) -> None:
+        """送信失敗・形式不正のメッセージのみを報告し、成功分は送信される."""
+        sender = _SelectivelyFailingEmailSender()
+        event = {
+            "Records": [
+                _sqs_record("m-1", encode_queued_contact(_message("accept-1"))),
+                _sqs_record("m-2", encode_queued_contact(_message("accept-2", _FAILING_TO_ADDR))),
+                _sqs_record("m-3", "not json"),
+                _sqs_record("m-4", encode_queued_contact(_message("accept-4"))),
+            ]
+        }
+        with self.assertLogs("contact_function.worker", level="ERROR"):
+            response = self._invoke(event, sender)
+        self.assertEqual(
+            response,
+            {"batchItemFailures": [{"itemIdentifier": "m-2"}, {"itemIdentifier": "m-3"}]},
+        )
+        self.assertEqual(len(sender.calls), 2)
+
+    def test_all_successful_batch_reports_no_failures(self) -> None:
+        """全件成功時は空の `batchItemFailures` を返す."""
+        sender = RecordingEmailSender()
+        event = {"Records": [_sqs_record("m-1", encode_queued_contact(_message("accept-1")))]}
+        self.assertEqual(self._invoke(event, sender), {"batchItemFailures": []})
+        self.assertEqual(sender.calls, [(_PAYLOAD, "noreply@example.com", "owner@example.com")])
+
+    def test_non_sqs_event_is_rejected(self) -> None:
+        """`Records` を持たないイベントは `ValueError`."""
+        with self.assertRaises(ValueError):
+            self._invoke({"source": "aws.events"}, RecordingEmailSender())
+
+
+class DigestModeTests(unittest.TestCase):
+    """ダイジェスト有効時の送信と失敗報告の検証."""
+
+    _POLICY = DigestPolicy(max_items=10, max_bytes=1_000_000)
+
+    def test_batch_is_sent_as_one_digest_per_recipient(self) -> None:
+        """宛先ごとに 1 通へまとめ、失敗した 1 通の全件を報告する."""
+        sender = _RecordingDigestSender()
+        records = [
+            QueueRecord(f"m-{i}", f"r-{i}", encode_queued_contact(message))
+            for i, message in enumerate(
+                [
+                    _message("a"),
+                    _message("b", _FAILING_TO_ADDR),
+                    _message("c"),
+                    _message("d", _FAILING_TO_ADDR),
+                    _message("e", "solo@example.com"),
+                ]
+            )
+        ]
+        with self.assertLogs("contact_function.worker", level="ERROR"):
+            failed = worker.drain_records(records, sender, self._POLICY)
+        self.assertEqual(failed, ["m-1", "m-3"])
+        self.assertEqual(sender.digests, [((_PAYLOAD.full_name,) * 2, "owner@example.com")])
+        # 1 件だけの組（solo）は通常の 1 件送信とする。
+        self.assertEqual([call[2] for call in sender.calls], ["solo@example.com"])
+
+    def test_digest_requires_digest_capable_sender(self) -> None:
+        """集約送信に対応しない Email_Sender は `TypeError`（1 件送信で代替しない）."""
+        with self.assertRaises(TypeError):
+            worker.drain_records([], RecordingEmailSender(), self._POLICY)
+
+    def test_lambda_handler_reads_digest_mode_from_environment(self) -> None:
+        """`CONTACT_DIGEST_MODE` が真なら `lambda_handler` は集約送信する."""
+        sender = _RecordingDigestSender()
+        event = {
+            "Records": [
+                _sqs_record("m-1", encode_queued_contact(_message("accept-1"))),
+                _sqs_record("m-2", encode_queued_contact(_message("accept-2"))),
+            ]
+        }
+        dependencies = ContactDependencies(email_sender_factory=lambda: sender)
+        with patch.object(worker, "_DEPENDENCIES", dependencies):
+            with patch.dict(os.environ, {"CONTACT_DIGEST_MODE": "true"}):
+                response = worker.lambda_handler(event, None)
+        self.assertEqual(response, {"batchItemFailures": []})
+        self.assertEqual(len(sender.digests), 1)
+        self.assertEqual(sender.calls, [])
+
+    def test_digest_mode_with_tracing_enabled(self) -> None:
+        """トレーシング有効時も集約送信し、その呼び出しをスパンとして記録する."""
+        sender = _RecordingDigestSender()
+        event = {
+            "Records": [
+                _sqs_record("m-1", encode_queued_contact(_message("accept-1"))),
+                _sqs_record("m-2", encode_queued_contact(_message("accept-2"))),
+            ]
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            spans = Path(directory) / "spans.jsonl"
+            environ = {
+                "CONTACT_DIGEST_MODE": "true",
+                "CONTACT_TRACING_MODE": "file",
+                "CONTACT_TRACING_FILE": str(spans),
+            }
+            dependencies = ContactDependencies(email_sender_factory=lambda: sender)
+            with patch.object(worker, "_DEPENDENCIES", dependencies):
+                with patch.dict(os.environ, environ):
+                    response = worker.lambda_handler(event, None)
+            names = [json.loads(line)["name"] for line in spans.read_text().splitlines()]
+        self.assertEqual(response, {"batchItemFailures": []})
+        self.assertEqual(len(sender.digests), 1)
+        self.assertEqual(names, ["EmailSender.send_digest"])
+
+
+class DrainQueueTests(unittest.TestCase):
+    """`drain_queue` の削除・再配信の検証."""
+
+    def test_failures_are_released_and_successes_acknowledged(self) -> None:
+        """成功分は削除され、失敗分のみが再受信される."""
+        queue = InMemoryContactQueue()
+        queue.enqueue(_message("accept-1"))
+        queue.enqueue(_message("accept-2", _FAILING_TO_ADDR))
+        with self.assertLogs("contact_function.worker", level="ERROR"):
+            counts = worker.drain_queue(queue, _SelectivelyFailingEmailSender())
+        self.assertEqual(counts, {"received": 2, "sent": 1, "failed": 1})
+        self.assertEqual(queue.pending_count(), 1)
+
+    def test_empty_queue_drains_nothing(self) -> None:
+        """空のキューでは何も送信しない."""
+        counts = worker.drain_queue(InMemoryContactQueue(), RecordingEmailSender())
+        self.assertEqual(counts, {"received": 0, "sent": 0, "failed": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
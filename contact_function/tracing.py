@@ -0,0 +1,376 @@
+"""ポート呼び出しのトレーシング（スパンの記録と出力）モジュール.
+
+`metrics`（処理段ごとの所要時間の合計）は「どの処理段が遅いか」を示すが、遅い
+呼び出しの所要時間が Parameter Store（SSM）・SES・自前のコードのいずれに費やされた
+かを 1 呼び出し単位で追うことはできない。本モジュールは `ConfigProvider` /
+`EmailSender` の呼び出しをスパンで囲み、呼び出し全体のスパン（handler が開始する）の
+子として記録する。子スパンの外側の時間が自前のコードの時間である。
+
+スパンの記録（`Tracer`）:
+    - `ports.StageTimer` の実装。`stage(name)` の文脈で 1 つのスパンを記録し、
+      入れ子のスパンは外側のスパンを親とする。
+    - 最も外側のスパンは、環境変数 `_X_AMZN_TRACE_ID`（Lambda が呼び出しごとに
+      設定する X-Ray のトレースヘッダ）のトレース ID・親 ID・サンプリング判定を
+      引き継ぐ。ヘッダが無い場合（ローカル実行）は新しいトレース ID を採番する。
+    - スパンが持つのは名前・ID・時刻・例外の型名のみで、問い合わせ内容・Origin・
+      送信元 IP・例外のメッセージを保持しない（GDPR、出典: requirements.md R9-5）。
+
+ポートのデコレータ（`TracingConfigProvider` / `TracingEmailSender`）:
+    - 任意のポート実装を包み、各メソッドの呼び出しをスパンで囲む（ドメイン層は
+      スパンの存在を知らない。包むのは composition root の責務）。
+    - `TracingEmailSender` は集約送信（`DigestEmailSender.send_digest`）も囲み、
+      ワーカーのダイジェストモードでもトレーシングを有効にできる。
+    - 例外はスパンに型名を記録したうえでそのまま伝播する（フォールバック禁止、
+      出典: 第三原則3）。
+
+出力（`SpanExporter`）:
+    - `NoopSpanExporter`: 何も出力しない（既定の実装）。
+    - `JsonFileSpanExporter`: 1 スパン 1 行の JSON をファイルへ追記する（ローカル実行用）。
+    - `XRaySegmentEmitter`: X-Ray デーモン（Lambda では `AWS_XRAY_DAEMON_ADDRESS`）へ
+      UDP でセグメント文書を送る。SDK を追加せず、Lambda が作成するファサード
+      セグメントの下にサブセグメントとして表示される。
+    - 出力の失敗は応答を変えず、`exc_info` 付きで明示記録する（トレースの欠落で
+      利用者への応答を失敗させない）。
+
+Lambda の実行環境は 1 度に 1 呼び出しのみを処理するため、`Tracer` は排他制御を
+持たない。Django・handler 層に依存しない。
+"""
+
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from contact_function.adapters.contact_digest import DigestEmailSender
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import ConfigProvider, EmailSender, StageTimer
+
+if TYPE_CHECKING:
+    import socket
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md
+# 「logger = logging.getLogger(__name__)」パターン）。
+logger = logging.getLogger(__name__)
+
+# Lambda が呼び出しごとに設定する X-Ray のトレースヘッダの環境変数名。
+_ENV_TRACE_HEADER = "_X_AMZN_TRACE_ID"
+
+# X-Ray デーモンへ送る UDP パケットの先頭行（文書の形式を示すヘッダ）。
+_XRAY_DAEMON_HEADER = b'{"format":"json","version":1}\n'
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """記録済みの 1 つのスパン（不変）.
+
+    Attributes:
+        name: スパンの名前（例: `EmailSender.send`）。
+        trace_id: X-Ray 形式のトレース ID（`1-<8 桁 16 進>-<24 桁 16 進>`）。
+        span_id: スパン ID（16 桁 16 進）。
+        parent_id: 親スパン（またはファサードセグメント）の ID。無い場合は None。
+        start_time: 開始時刻（UNIX 秒）。
+        end_time: 終了時刻（UNIX 秒）。
+        sampled: トレースがサンプリング対象かどうか（X-Ray へは対象のみ送る）。
+        error: スパン内で送出された例外の型名（正常終了は None）。
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    end_time: float
+    sampled: bool
+    error: str | None = None
+
+
+class SpanExporter(ABC):
+    """記録済みのスパンの出力先."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """スパンを 1 つ出力する.
+
+        Args:
+            span: 終了したスパン。
+        """
+
+
+class NoopSpanExporter(SpanExporter):
+    """スパンを出力しない（既定の出力先）."""
+
+    def export(self, span: Span) -> None:
+        """何もしない."""
+
+
+class JsonFileSpanExporter(SpanExporter):
+    """1 スパン 1 行の JSON をファイルへ追記する（ローカル実行用）."""
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str) -> None:
+        """出力先のファイルを保持する（ファイルは出力時に開く）.
+
+        Args:
+            path: 追記する JSON Lines ファイルのパス。
+        """
+        self._path = path
+
+    def export(self, span: Span) -> None:
+        """スパンを 1 行の JSON として追記する."""
+        line = json.dumps(asdict(span), ensure_ascii=False, separators=(",", ":"))
+        with open(self._path, "a", encoding="utf-8") as stream:
+            stream.write(line + "\n")
+
+
+def _parse_daemon_address(address: str) -> tuple[str, int]:
+    """`host:port` 形式の X-Ray デーモンのアドレスを分解する.
+
+    Raises:
+        ValueError: 形式が不正な場合。
+    """
+    host, separator, port = address.rpartition(":")
+    if not separator or not host or not port.isascii() or not port.isdigit():
+        raise ValueError(f"X-Ray デーモンのアドレスが不正です: {address!r}")
+    return host, int(port)
+
+
+def xray_document(span: Span) -> dict[str, object]:
+    """スパンを X-Ray のセグメント文書へ変換する.
+
+    親 ID を持つスパンはサブセグメント（`type=subsegment`）として送り、X-Ray 側で
+    親（Lambda のファサードセグメントまたは外側のスパン）の下に表示させる。
+
+    Args:
+        span: 変換するスパン。
+
+    Returns:
+        dict[str, object]: X-Ray デーモンへ送るセグメント文書。
+    """
+    document: dict[str, object] = {
+        "name": span.name,
+        "id": span.span_id,
+        "trace_id": span.trace_id,
+        "start_time": span.start_time,
+        "end_time": span.end_time,
+    }
+    if span.parent_id is not None:
+        document["type"] = "subsegment"
+        document["parent_id"] = span.parent_id
+    if span.error is not None:
+        document["fault"] = True
+        document["cause"] = {"exceptions": [{"id": span.span_id, "type": span.error}]}
+    return document
+
+
+class XRaySegmentEmitter(SpanExporter):
+    """スパンを X-Ray デーモンへ UDP で送る.
+
+    サンプリング対象外のトレースのスパンは送らない。ソケットは最初の送信時に
+    生成し、実行環境内で再利用する。
+    """
+
+    __slots__ = ("_address", "_socket")
+
+    def __init__(self, address: str) -> None:
+        """送信先を初期化する.
+
+        Args:
+            address: X-Ray デーモンのアドレス（`host:port`）。
+
+        Raises:
+            ValueError: アドレスの形式が不正な場合。
+        """
+        self._address = _parse_daemon_address(address)
+        self._socket: "socket.socket | None" = None
+
+    def export(self, span: Span) -> None:
+        """サンプリング対象のスパンをセグメント文書として送る."""
+        if not span.sampled:
+            return
+        if self._socket is None:
+            # socket は X-Ray 出力の有効時のみ必要なため遅延 import する
+            # （コールドスタートの import 時間を増やさない）。
+            import socket
+
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        payload = json.dumps(xray_document(span), separators=(",", ":")).encode("utf-8")
+        self._socket.sendto(_XRAY_DAEMON_HEADER + payload, self._address)
+
+    def close(self) -> None:
+        """ソケットを閉じる（次の送信時に再生成される）."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+def _new_span_id() -> str:
+    """スパン ID（16 桁 16 進）を採番する."""
+    return os.urandom(8).hex()
+
+
+def parse_trace_header(header: str) -> tuple[str, str | None, bool] | None:
+    """X-Ray のトレースヘッダ（`Root=...;Parent=...;Sampled=1`）を分解する.
+
+    Args:
+        header: トレースヘッダの値。
+
+    Returns:
+        tuple[str, str | None, bool] | None: トレース ID・親 ID・サンプリング判定。
+            `Root` が無い場合は None。
+    """
+    fields = {}
+    for part in header.split(";"):
+        key, separator, value = part.strip().partition("=")
+        if separator:
+            fields[key] = value
+    root = fields.get("Root")
+    if not root:
+        return None
+    return root, fields.get("Parent") or None, fields.get("Sampled") != "0"
+
+
+class _ActiveSpan:
+    """記録中の 1 つのスパン（`Tracer.stage` が返す文脈）."""
+
+    __slots__ = ("_tracer", "_name", "_span_id", "_trace_id", "_parent_id", "_sampled", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str) -> None:
+        """記録対象を保持する."""
+        self._tracer = tracer
+        self._name = name
+        self._span_id = ""
+        self._trace_id = ""
+        self._parent_id: str | None = None
+        self._sampled = True
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        """親を決めて記録を開始する."""
+        self._span_id = _new_span_id()
+        self._trace_id, self._parent_id, self._sampled = self._tracer._context()
+        self._tracer._stack.append(self)
+        self._start = self._tracer._clock()
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        """スパンを出力する（例外は伝播させる）."""
+        end = self._tracer._clock()
+        self._tracer._stack.pop()
+        self._tracer._export(
+            Span(
+                name=self._name,
+                trace_id=self._trace_id,
+                span_id=self._span_id,
+                parent_id=self._parent_id,
+                start_time=self._start,
+                end_time=end,
+                sampled=self._sampled,
+                error=exc_type.__name__ if exc_type is not None else None,
+            )
+        )
+
+
+class Tracer(StageTimer):
+    """スパンを記録し、出力先へ渡す."""
+
+    __slots__ = ("_exporter", "_clock", "_environ", "_stack")
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        clock: Callable[[], float] = time.time,
+        environ: Mapping[str, str] = os.environ,
+    ) -> None:
+        """記録器を初期化する.
+
+        Args:
+            exporter: スパンの出力先。
+            clock: 現在時刻（UNIX 秒）を返す関数（テスト用に注入可能）。
+            environ: トレースヘッダを読む環境変数（テスト用に注入可能）。
+        """
+        self._exporter = exporter
+        self._clock = clock
+        self._environ = environ
+        # 記録中のスパン（外側から順）。
+        self._stack: list[_ActiveSpan] = []
+
+    def stage(self, name: str) -> _ActiveSpan:
+        """名前付きのスパンを記録する文脈を返す."""
+        return _ActiveSpan(self, name)
+
+    def _context(self) -> tuple[str, str | None, bool]:
+        """新しいスパンのトレース ID・親 ID・サンプリング判定を返す."""
+        if self._stack:
+            outer = self._stack[-1]
+            return outer._trace_id, outer._span_id, outer._sampled
+        parsed = parse_trace_header(self._environ.get(_ENV_TRACE_HEADER, ""))
+        if parsed is not None:
+            return parsed
+        return f"1-{int(self._clock()):08x}-{os.urandom(12).hex()}", None, True
+
+    def _export(self, span: Span) -> None:
+        """スパンを出力する（失敗は記録のみ）."""
+        try:
+            self._exporter.export(span)
+        except Exception:
+            # 応答は変えない（トレースの欠落で利用者への応答を失敗させない）。
+            logger.error("スパンの出力に失敗しました: %s", span.name, exc_info=True)
+
+
+class TracingConfigProvider(ConfigProvider):
+    """`ConfigProvider` の各取得をスパンで囲むデコレータ."""
+
+    def __init__(self, inner: ConfigProvider, tracer: Tracer) -> None:
+        """包む設定プロバイダと記録器を保持する."""
+        self._inner = inner
+        self._tracer = tracer
+
+    def get_from_address(self) -> str:
+        """送信元アドレスの取得を記録する."""
+        with self._tracer.stage("ConfigProvider.get_from_address"):
+            return self._inner.get_from_address()
+
+    def get_to_address(self) -> str:
+        """宛先アドレスの取得を記録する."""
+        with self._tracer.stage("ConfigProvider.get_to_address"):
+            return self._inner.get_to_address()
+
+    def get_allowed_origins(self) -> tuple[str, ...]:
+        """許可 Origin の取得を記録する."""
+        with self._tracer.stage("ConfigProvider.get_allowed_origins"):
+            return self._inner.get_allowed_origins()
+
+
+class TracingEmailSender(EmailSender, DigestEmailSender):
+    """`EmailSender.send` / `DigestEmailSender.send_digest` をスパンで囲むデコレータ.
+
+    ワーカーのダイジェストモードでも包めるよう集約送信も実装し、包んでいる送信
+    アダプタへ転送する（`ResilientEmailSender` と同じ扱い）。
+    """
+
+    def __init__(self, inner: EmailSender, tracer: Tracer) -> None:
+        """包む送信アダプタと記録器を保持する."""
+        self._inner = inner
+        self._tracer = tracer
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> str | None:
+        """送信を記録する."""
+        with self._tracer.stage("EmailSender.send"):
+            return self._inner.send(payload, from_addr, to_addr)
+
+    def send_digest(
+        self, payloads: Sequence[ContactPayload], from_addr: str, to_addr: str
+    ) -> None:
+        """集約メールの送信を記録する.
+
+        Raises:
+            TypeError: 包んでいる送信アダプタが集約送信に対応しない場合。
+        """
+        if not isinstance(self._inner, DigestEmailSender):
+            raise TypeError("包んでいる送信アダプタは集約送信に対応していません。")
+        with self._tracer.stage("EmailSender.send_digest"):
+            self._inner.send_digest(payloads, from_addr, to_addr)
@@ -0,0 +1,218 @@
+"""Contact_Function のドレインワーカー（キュー → SES 送信）モジュール.
+
+`QueueingEmailSender` が問い合わせキューへ投入したメッセージを取り出し、
+`SesEmailSender` で SES へ送信する。HTTP 経路（`contact_function.handler`）から
+SES の遅延・スロットリングを切り離すための後段処理であり、配信モード
+`CONTACT_DELIVERY_MODE=queue` の場合にのみデプロイされる（`template.yaml` の
+`ContactWorkerFunction`）。
+
+エントリポイント:
+    - `lambda_handler(event, context)`: SQS イベントソースマッピングから呼ばれる。
+      送信に失敗したメッセージのみを `batchItemFailures` として返し（部分バッチ応答、
+      `ReportBatchItemFailures`）、成功分は SQS が削除する。失敗分は可視性タイムアウト
+      後に再配信され、最大受信回数を超えるとデッドレターキューへ移る。
+    - `drain_queue(queue, email_sender, batch_size)`: ローカル実行・テスト用。
+      インメモリ・ファイルキューから 1 バッチを取り出して送信し、成功分を削除、
+      失敗分を再配信可能へ戻す。
+
+ダイジェストモード（環境変数 `CONTACT_DIGEST_MODE`。既定は無効 = 1 件ずつ送信）:
+    - 1 バッチ（SQS のバッチウィンドウ `MaximumBatchingWindowInSeconds` と最大件数で
+      集めた分）を送信元・宛先ごとにまとめ、件数・本文サイズの上限
+      （`CONTACT_DIGEST_MAX_ITEMS` / `CONTACT_DIGEST_MAX_BYTES`）ごとに 1 通の
+      集約メールで送信する（出典: `contact_function/adapters/contact_digest.py`）。
+      集中時の SES API 呼び出し数を件数からバッチ数へ減らす。
+
+フォールバック禁止（出典: 第三原則3、requirements.md R6-4, R12-5）:
+    - 本文の形式不正・送信失敗はいずれも失敗として報告し、成功扱いで削除しない。
+      形式不正は再配信しても成功しないが、黙って破棄せずデッドレターキューで
+      運用者が確認できるようにする。
+    - ログには受付 ID・メッセージ ID のみを出力し、問い合わせ内容を出力しない
+      （GDPR、出典: requirements.md R9-5）。
+    - Django を import しない（出典: requirements.md R4-1, R4-2）。
+"""
+
+import logging
+from collections.abc import Iterable, Mapping
+
+from contact_function.adapters.contact_digest import (
+    DigestBatch,
+    DigestEmailSender,
+    DigestPolicy,
+    plan_digests,
+)
+from contact_function.adapters.contact_queue import (
+    ContactQueue,
+    QueuedContact,
+    QueueRecord,
+    decode_queued_contact,
+)
+from contact_function.composition import (
+    ContactDependencies,
+    begin_invocation,
+    build_digest_policy,
+    build_resilient_ses_sender,
+    configure_logging,
+)
+from contact_function.domain.ports import EmailSender
+
+# ロガーはモジュール単位で取得する（出典: coding-conventions.md「logger = logging.getLogger(__name__)」）
+logger = logging.getLogger(__name__)
+
+# ワーカーは常に SES へ直送する（配信モードに関わらず、キューへ再投入しない）。
+# 一時的な失敗は再試行・遮断付きで扱い、回復しなければ SQS の再配信に委ねる。
+_DEPENDENCIES = ContactDependencies(email_sender_factory=build_resilient_ses_sender)
+
+# INIT フェーズ（import 時）のログ出力の設定（環境変数はここで 1 度だけ解決する）。
+configure_logging()
+
+
+def drain_records(
+    records: Iterable[QueueRecord],
+    email_sender: EmailSender,
+    digest: DigestPolicy | None = None,
+) -> list[str]:
+    """受信したメッセージを送信し、失敗したメッセージの ID を返す.
+
+    `digest` が None の場合は 1 件ずつ送信する（既定）。指定された場合は
+    `plan_digests` で送信元・宛先ごとにまとめ、1 通ずつ集約メールで送信する
+    （1 件だけの組は通常の 1 件送信とする）。
+
+    Args:
+        records: 受信したメッセージ。
+        email_sender: 送信に用いる Email_Sender（同期送信の実装。ダイジェスト時は
+            `DigestEmailSender` も実装していること）。
+        digest: ダイジェストの上限（None でダイジェスト無効）。
+
+    Returns:
+        list[str]: 本文の形式不正または送信失敗となったメッセージの ID（受信順）。
+
+    Raises:
+        TypeError: ダイジェスト指定時に `email_sender` が集約送信に対応しない場合
+            （設定誤りを 1 件送信で黙って代替しない）。
+    """
+    if digest is not None and not isinstance(email_sender, DigestEmailSender):
+        raise TypeError(
+            "ダイジェストモードの送信アダプタは DigestEmailSender を実装する必要があります。"
+        )
+    records = list(records)
+    failed: set[str] = set()
+    decoded: list[tuple[str, QueuedContact]] = []
+    for record in records:
+        try:
+            decoded.append((record.message_id, decode_queued_contact(record.body)))
+        except ValueError:
+            logger.error(
+                "キューのメッセージ本文が不正です（メッセージ ID: %s）",
+                record.message_id,
+                exc_info=True,
+            )
+            failed.add(record.message_id)
+
+    if digest is None:
+        for message_id, message in decoded:
+            if not _send_one(email_sender, message):
+                failed.add(message_id)
+    else:
+        by_id = dict(decoded)
+        for batch in plan_digests(decoded, digest):
+            if len(batch.message_ids) == 1:
+                sent = _send_one(email_sender, by_id[batch.message_ids[0]])
+            else:
+                sent = _send_digest(email_sender, batch)
+            if not sent:
+                failed.update(batch.message_ids)
+    # 報告は受信順とする（部分バッチ応答の可読性のため）。
+    return [record.message_id for record in records if record.message_id in failed]
+
+
+def _send_one(email_sender: EmailSender, message: QueuedContact) -> bool:
+    """1 件を送信し、成否を返す（失敗は明示ログを残す）."""
+    try:
+        email_sender.send(message.payload, message.from_addr, message.to_addr)
+    except Exception:
+        # 握りつぶさず明示記録し、再配信対象として報告する（R6-4, R12-5）。
+        logger.error(
+            "キューからの SES 送信に失敗しました（受付 ID: %s）",
+            message.acceptance_id,
+            exc_info=True,
+        )
+        return False
+    logger.info("問い合わせを送信しました（受付 ID: %s）", message.acceptance_id)
+    return True
+
+
+def _send_digest(email_sender: DigestEmailSender, batch: DigestBatch) -> bool:
+    """集約メールを 1 通送信し、成否を返す（失敗時はまとめた全件が再配信対象）."""
+    try:
+        email_sender.send_digest(batch.payloads, batch.from_addr, batch.to_addr)
+    except Exception:
+        logger.error(
+            "キューからの集約メール送信に失敗しました（%d 件）",
+            len(batch.message_ids),
+            exc_info=True,
+        )
+        return False
+    return True
+
+
+def drain_queue(
+    queue: ContactQueue,
+    email_sender: EmailSender,
+    batch_size: int = 10,
+    digest: DigestPolicy | None = None,
+) -> dict[str, int]:
+    """キューから 1 バッチを取り出して送信する（ローカル実行・テスト用）.
+
+    Args:
+        queue: 取り出し元の問い合わせキュー。
+        email_sender: 送信に用いる Email_Sender（同期送信の実装）。
+        batch_size: 1 回に取り出す最大件数。
+        digest: ダイジェストの上限（None でダイジェスト無効）。
+
+    Returns:
+        dict[str, int]: `received`（受信件数）・`sent`（送信成功件数）・
+            `failed`（失敗して再配信可能へ戻した件数）。
+    """
+    records = queue.receive(batch_size)
+    failed_ids = set(drain_records(records, email_sender, digest))
+    queue.acknowledge(r.receipt for r in records if r.message_id not in failed_ids)
+    queue.release(r.receipt for r in records if r.message_id in failed_ids)
+    return {
+        "received": len(records),
+        "sent": len(records) - len(failed_ids),
+        "failed": len(failed_ids),
+    }
+
+
+def _records_from_sqs_event(event: Mapping[str, object]) -> list[QueueRecord]:
+    """SQS イベントの `Records` をメッセージの列へ変換する."""
+    records = event.get("Records")
+    if not isinstance(records, list):
+        raise ValueError("SQS イベントに Records がありません。")
+    return [
+        QueueRecord(
+            message_id=record["messageId"],
+            receipt=record["receiptHandle"],
+            body=record["body"],
+        )
+        for record in records
+    ]
+
+
+def lambda_handler(event: Mapping[str, object], context: object) -> dict[str, object]:
+    """SQS イベントソースマッピングのエントリポイント.
+
+    Args:
+        event: SQS イベント（`Records` に最大バッチサイズ分のメッセージを含む）。
+        context: Lambda コンテキスト（残り時間を SES 再試行の期限に用いる）。
+
+    Returns:
+        dict[str, object]: 部分バッチ応答（`batchItemFailures`）。失敗が無い場合は空。
+
+    Raises:
+        ValueError: イベントが SQS の形式でない場合（呼び出しエラーとして可視化する）。
+    """
+    records = _records_from_sqs_event(event)
+    begin_invocation(context)
+    failed = drain_records(records, _DEPENDENCIES.email_sender(), build_digest_policy())
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed]}
@@ -0,0 +1,162 @@
+"""`render_static` の増分ビルド用キャッシュ（入力の指紋と言語別ページの保存）.
+
+`render_static --cache-dir DIR` は、言語別 Prerendered_Page ごとに入力（テンプレート・
+当該言語のコンパイル済みカタログ・静的ファイルのマニフェスト・CSP ディレクティブ等）の
+指紋（SHA-256）を算出し、指紋が前回のビルドと一致する言語はキャッシュしたページを
+再利用する。本モジュールは指紋の算出と、キャッシュディレクトリへの読み書きを担う。
+
+キャッシュの形式:
+    - 1 言語 1 ファイル（`<DIR>/<lang>.json`）に、形式の版・指紋・HTML・マニフェストの
+      ページエントリを保存する。書き込みは一時ファイルからの置換で行い、中断しても
+      途中までのファイルを残さない。
+    - 存在しない・読めない・形式の版が異なるファイルはキャッシュミス（再レンダリング）
+      として扱う。キャッシュは再現可能な中間成果物であり、ミスは出力を変えない。
+
+`_csp_hash` と同様に Django を import しない（指紋へ含める値の収集は
+`render_static` が行う）。`_` 始まりのためコマンド自動探索の対象外である。
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+# キャッシュファイルの形式の版（形式を変えた場合は上げ、旧形式をミスとする）。
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """キャッシュした言語別ページ.
+
+    Attributes:
+        fingerprint: ページの入力の指紋（16 進 SHA-256）。
+        html: レンダリング済み HTML。
+        entry: マニフェストのページエントリ（CSP・インラインハッシュ）。
+    """
+
+    fingerprint: str
+    html: str
+    entry: dict[str, object]
+
+
+def hash_files(paths: Iterable[Path], suffixes: tuple[str, ...] = ()) -> str:
+    """ファイル・ディレクトリ配下のファイルの相対パスと内容から指紋を算出する.
+
+    Args:
+        paths: 対象のファイルまたはディレクトリの列（存在しないパスは空として扱う）。
+        suffixes: ディレクトリ配下で対象とする拡張子（空の場合は全ファイル）。
+
+    Returns:
+        str: 16 進 SHA-256。パスの順序・相対パス・内容のいずれかが変われば変わる。
+    """
+    digest = hashlib.sha256()
+    for index, path in enumerate(paths):
+        if path.is_file():
+            files = [(path.name, path)]
+        elif path.is_dir():
+            files = sorted(
+                (child.relative_to(path).as_posix(), child)
+                for child in path.rglob("*")
+                if child.is_file() and (not suffixes or child.suffix in suffixes)
+            )
+        else:
+            continue
+        for relative, file in files:
+            digest.update(f"{index}:{relative}\0".encode("utf-8"))
+            digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def page_fingerprint(inputs: Mapping[str, object]) -> str:
+    """ページの入力（名前 → JSON で表せる値）から指紋を算出する.
+
+    Args:
+        inputs: 入力の名前と値。値はキー順に JSON 化する（タプルは配列、JSON で表せない
+            値（CSP の nonce の番兵等）は `repr` として扱う）。
+
+    Returns:
+        str: 16 進 SHA-256。
+    """
+    document = json.dumps(
+        {"version": CACHE_FORMAT_VERSION, "inputs": inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=repr,
+    )
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+class BuildCache:
+    """言語別ページのキャッシュディレクトリ."""
+
+    def __init__(self, directory: Path) -> None:
+        """キャッシュディレクトリを指定する（作成は最初の保存時に行う）.
+
+        Args:
+            directory: キャッシュディレクトリ。
+        """
+        self._directory = directory
+
+    def _path(self, language: str) -> Path:
+        """言語のキャッシュファイルのパスを返す."""
+        return self._directory / f"{language}.json"
+
+    def load(self, language: str, fingerprint: str) -> CachedPage | None:
+        """指紋が一致するキャッシュ済みページを返す.
+
+        Args:
+            language: 言語コード。
+            fingerprint: 今回のビルドでのページの入力の指紋。
+
+        Returns:
+            CachedPage | None: 指紋が一致するページ。存在しない・読めない・形式の版や
+                指紋が異なる場合は None（キャッシュミス）。
+        """
+        try:
+            document = json.loads(self._path(language).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict) or document.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        html = document.get("html")
+        entry = document.get("entry")
+        if (
+            document.get("fingerprint") != fingerprint
+            or not isinstance(html, str)
+            or not isinstance(entry, dict)
+        ):
+            return None
+        return CachedPage(fingerprint, html, entry)
+
+    def store(self, language: str, page: CachedPage) -> None:
+        """ページをキャッシュへ保存する（一時ファイルから置換する）.
+
+        Args:
+            language: 言語コード。
+            page: 保存するページ。
+
+        Raises:
+            OSError: ディレクトリの作成・書き込みに失敗した場合。
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        document = {
+            "version": CACHE_FORMAT_VERSION,
+            "fingerprint": page.fingerprint,
+            "html": page.html,
+            "entry": page.entry,
+        }
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self._directory, prefix=f".{language}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+                json.dump(document, stream, ensure_ascii=False)
+            os.replace(temporary, self._path(language))
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
@@ -17,12 +17,28 @@ requirements.md R7-2, R7-5, R7-6）。
       新規に緩和しない（R7-5）。本モジュールが新規に加える配信元は
       「インライン内容の `'sha256-...'`」と「CloudFront ドメイン」のみである。
 
+抽出バックエンド（`extract_inline_contents` の `extractor`）:
+    - `htmlparser`（既定）: 標準ライブラリ `html.parser` で全タグ・属性・テキストを
+      トークン化し、script / style の内容のみを残す。
+    - `scanner`: script / style の生テキストのみを探す状態機械。タグ・コメント・宣言の
+      境界は `html.parser` / `_markupbase` の正規表現をそのまま用いて判定し、実体参照の
+      変換・通常のタグの属性解析を省く。結果は `htmlparser` と同一であり（差分テスト
+      `portfolio/tests/test_property_inline_scanner.py`）、表示ページでは約 4 倍速い
+      （`python -m scripts.measurement.csp_extract_benchmark`）。
+
 実装方針（出典: 本タスク制約、principles.md 第三原則）:
     - すべて副作用の無い純粋関数として実装する（I/O・グローバル状態を持たない）。
+      例外として `CspPipeline` は 1 回のビルド内で HTML の解析結果（内容の
+      SHA-256 をキーとする `InlineContents` / `InlineHashes`）をインスタンスに
+      保持し、同一内容の HTML を再解析しない（I/O・グローバル状態は持たない）。
     - Django・django-csp を import しない（Django 非依存）。標準ライブラリ
       （hashlib / base64 / html.parser）のみで実装する。
     - フォールバック禁止。想定外の入力（空の CloudFront ドメイン、CSP ソースに
       現れ得ない非文字列トークン）はエラーを握りつぶさず明示的に例外送出する。
+    - ハッシュソースの重複排除・ディレクティブへの冪等追加は順序付き集合（挿入順を
+      保つ dict、所属判定用の set）で行い、統一 CSP のソースが数千件になっても
+      線形時間で組み立てる。出力の順序はソースの出現順で決定的である
+      （`python -m scripts.measurement.csp_directive_benchmark`）。
 
 なお本モジュールはビルド用ヘルパーであり Django の管理コマンドではないため、
 ファイル名を `_` 始まりとして `BaseCommand` 自動探索の対象外にしている（出典:
@@ -30,8 +46,10 @@ Django management command のローダはコマンドモジュールのみを探
 """
 
 import base64
+import functools
 import hashlib
-from collections.abc import Mapping, Sequence
+import re
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from html.parser import HTMLParser
 
@@ -184,7 +202,237 @@ class _InlineTagCollector(HTMLParser):
         self._buffer = []
 
 
-def extract_inline_contents(html: str) -> InlineContents:
+# --- 走査器バックエンド（`EXTRACTOR_SCANNER`） ---
+# タグ・コメント・マーク区間・宣言の境界は、実行中の Python の `html.parser` /
+# `_markupbase` がモジュール水準で持つ正規表現をそのまま用いる（複製すると、ビルドの
+# Python（3.12）で規則が改訂された場合に `htmlparser` と食い違う）。走査器はこれらを
+# タグの境界にのみ適用し、テキストの実体参照の変換や属性値の復号を行わない。状態遷移の
+# 同一性は差分テスト（`portfolio/tests/test_property_inline_scanner.py`）をビルドの
+# Python で実行して確認する（`buildspec.yml`）。
+# これらは標準ライブラリの非公開名であり、将来の Python で改名・削除され得るため、
+# `scanner` を選んだときにだけ参照する（既定の `htmlparser` と本モジュールの import は
+# 非公開名に依存しない）。
+
+
+@dataclass(frozen=True, slots=True)
+class _ScannerPatterns:
+    """走査器が用いる `html.parser` / `_markupbase` の正規表現."""
+
+    start_tag_end: re.Pattern[str]
+    tag_name: re.Pattern[str]
+    attribute: re.Pattern[str]
+    comment_close: re.Pattern[str]
+    marked_section_close: re.Pattern[str]
+    ms_marked_section_close: re.Pattern[str]
+    declaration_name_match: Callable[[str, int], re.Match[str] | None]
+
+
+def _private_attribute(module: object, name: str) -> object:
+    """標準ライブラリの非公開名を取得する.
+
+    Raises:
+        RuntimeError: 実行中の Python に名前が無い場合（`htmlparser` へ黙って
+            切り替えない。フォールバック禁止）。
+    """
+    try:
+        return getattr(module, name)
+    except AttributeError as error:
+        raise RuntimeError(
+            f"抽出バックエンド {EXTRACTOR_SCANNER!r} は実行中の Python では使用できません"
+            f"（{module.__name__}.{name} がありません）。"
+            f"{EXTRACTOR_HTMLPARSER!r} を指定してください。"
+        ) from error
+
+
+@functools.cache
+def _scanner_patterns() -> _ScannerPatterns:
+    """走査器の正規表現を初回の使用時に 1 度だけ読み込む.
+
+    Raises:
+        RuntimeError: 実行中の Python の `html.parser` / `_markupbase` に必要な
+            非公開名が無い場合。
+    """
+    import _markupbase
+    from html import parser as html_parser
+
+    # コメントの終端は `HTMLParser` が実際に用いる `parse_comment` の規則に合わせる
+    # （独自に定義していなければ `_markupbase` の実装を継承している）。
+    if "parse_comment" in HTMLParser.__dict__:
+        comment_close = _private_attribute(html_parser, "commentclose")
+    else:
+        comment_close = _private_attribute(_markupbase, "_commentclose")
+    return _ScannerPatterns(
+        start_tag_end=_private_attribute(html_parser, "locatestarttagend_tolerant"),
+        tag_name=_private_attribute(html_parser, "tagfind_tolerant"),
+        attribute=_private_attribute(html_parser, "attrfind_tolerant"),
+        comment_close=comment_close,
+        marked_section_close=_private_attribute(_markupbase, "_markedsectionclose"),
+        ms_marked_section_close=_private_attribute(_markupbase, "_msmarkedsectionclose"),
+        declaration_name_match=_private_attribute(_markupbase, "_declname_match"),
+    )
+
+# 生テキスト要素（内容をタグとして解釈しない要素）と、その終了タグ。
+_RAW_TEXT_END = {
+    "script": re.compile(r"</\s*script\s*>", re.I),
+    "style": re.compile(r"</\s*style\s*>", re.I),
+}
+
+# 開始タグの終端の直後にあると入力途中（タグ未完了）とみなす文字。
+_INCOMPLETE_START_TAG_NEXT = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ=/"
+)
+
+
+def _skip_incomplete(html: str, i: int) -> int:
+    """閉じていない構文（`<` から始まる）をテキストとして読み飛ばした位置を返す."""
+    gt = html.find(">", i + 1)
+    if gt >= 0:
+        return gt + 1
+    lt = html.find("<", i + 1)
+    return lt if lt >= 0 else i + 1
+
+
+def _scan_start_tag(
+    html: str, i: int, patterns: _ScannerPatterns
+) -> tuple[int, str | None, bool]:
+    """`<` + 英字から始まる開始タグを読み、次の位置と生テキスト要素の情報を返す.
+
+    Returns:
+        tuple[int, str | None, bool]: 次の走査位置、生テキスト要素として内容を
+            読む場合はタグ名（それ以外は None）、内容を収集するか（`src` 属性を
+            持つ script は収集しない）。
+    """
+    j = patterns.start_tag_end.match(html, i).end()
+    following = html[j : j + 1]
+    if following == ">":
+        end = j + 1
+    elif following == "/":
+        if not html.startswith("/>", j):
+            return _skip_incomplete(html, i), None, False
+        end = j + 2
+    elif following == "" or following in _INCOMPLETE_START_TAG_NEXT:
+        return _skip_incomplete(html, i), None, False
+    else:
+        end = j
+    # 生テキスト要素（script / style）の名前は s / S で始まる。それ以外は読み飛ばす。
+    if html[i + 1] not in "sS":
+        return end, None, False
+    name = patterns.tag_name.match(html, i + 1)
+    tag = name.group(1).lower()
+    if tag not in _RAW_TEXT_END:
+        return end, None, False
+    k = name.end()
+    has_src = False
+    while k < end:
+        attribute = patterns.attribute.match(html, k)
+        if attribute is None:
+            break
+        if attribute.group(1).lower() == "src":
+            has_src = True
+        k = attribute.end()
+    rest = html[k:end].strip()
+    # 不正な開始タグ（テキスト扱い）と `<script/>`（空要素）は内容を持たない。
+    if rest != ">":
+        return end, None, False
+    return end, tag, tag == "style" or not has_src
+
+
+def _scan_marked_section(html: str, i: int, patterns: _ScannerPatterns) -> int:
+    """`<![` から始まるマーク区間を読み飛ばした位置を返す（未完了は -1）.
+
+    Raises:
+        ValueError: 区間名が無い・未知の区間名の場合（`html.parser` も例外とする）。
+    """
+    n = len(html)
+    if i + 3 == n:
+        return -1
+    name = patterns.declaration_name_match(html, i + 3)
+    if name is None:
+        raise ValueError(f"マーク区間の名前がありません: {html[i : i + 20]!r}")
+    if name.end() == n:
+        return -1
+    keyword = name.group().strip().lower()
+    if keyword in {"temp", "cdata", "ignore", "include", "rcdata"}:
+        close = patterns.marked_section_close.search(html, i + 3)
+    elif keyword in {"if", "else", "endif"}:
+        close = patterns.ms_marked_section_close.search(html, i + 3)
+    else:
+        raise ValueError(f"未知のマーク区間です: {html[i + 3 : name.end()]!r}")
+    return close.end() if close is not None else -1
+
+
+def _scan_inline_contents(html: str) -> InlineContents:
+    """生テキスト要素のみを探す状態機械でインライン内容を抽出する.
+
+    `_InlineTagCollector`（`html.parser`）と同じ規則でタグ・コメント・宣言の境界を
+    判定し、script / style の開始タグから終了タグ（`</script>` 等、大文字小文字と
+    前後の空白を問わない）までの生テキストを切り出す。テキスト部分は `<` の検索で
+    読み飛ばし、通常のタグは終端の位置のみを求める（属性は script / style のみ解析）。
+    終了タグの無い script / style の内容は `html.parser` と同じく収集しない。
+
+    Args:
+        html: 対象の HTML 文字列。
+
+    Returns:
+        InlineContents: 抽出したインライン script / style 内容。
+
+    Raises:
+        ValueError: `html.parser` が例外とする不正なマーク区間（`<![`）を含む場合。
+        RuntimeError: 実行中の Python に走査器が用いる非公開名が無い場合。
+    """
+    patterns = _scanner_patterns()
+    scripts: list[str] = []
+    styles: list[str] = []
+    find = html.find
+    n = len(html)
+    i = find("<")
+    while 0 <= i < n - 1:
+        following = html[i + 1]
+        if following.isascii() and following.isalpha():
+            end, tag, capture = _scan_start_tag(html, i, patterns)
+            if tag is not None:
+                close = _RAW_TEXT_END[tag].search(html, end)
+                if close is None:
+                    break
+                content = html[end : close.start()]
+                if capture and content:
+                    (scripts if tag == "script" else styles).append(content)
+                end = close.end()
+        elif following == "/":
+            gt = find(">", i + 2)
+            end = gt + 1 if gt >= 0 else _skip_incomplete(html, i)
+        elif html.startswith("<!--", i):
+            close = patterns.comment_close.search(html, i + 4)
+            end = close.end() if close is not None else _skip_incomplete(html, i)
+        elif following == "?":
+            gt = find(">", i + 2)
+            end = gt + 1 if gt >= 0 else _skip_incomplete(html, i)
+        elif following == "!":
+            if html.startswith("<![", i):
+                end = _scan_marked_section(html, i, patterns)
+            elif html[i : i + 9].lower() == "<!doctype":
+                gt = find(">", i + 9)
+                end = gt + 1 if gt >= 0 else -1
+            else:
+                gt = find(">", i + 2)
+                end = gt + 1 if gt >= 0 else -1
+            if end < 0:
+                end = _skip_incomplete(html, i)
+        else:
+            end = i + 1
+        i = find("<", end)
+    return InlineContents(scripts=tuple(scripts), styles=tuple(styles))
+
+
+# インライン内容の抽出バックエンド（`extract_inline_contents` の `extractor`）。
+# `htmlparser` は標準ライブラリ `html.parser` による全トークン化（既定）、
+# `scanner` は生テキスト要素のみを探す走査器（同一の結果を高速に得る）。
+EXTRACTOR_HTMLPARSER = "htmlparser"
+EXTRACTOR_SCANNER = "scanner"
+EXTRACTORS: tuple[str, ...] = (EXTRACTOR_HTMLPARSER, EXTRACTOR_SCANNER)
+
+
+def extract_inline_contents(html: str, extractor: str = EXTRACTOR_HTMLPARSER) -> InlineContents:
     """HTML からインライン `<script>` / `<style>` の内容を抽出する純粋関数.
 
     `src` 属性を持たない `<script>`（インライン）と、すべての `<style>` の
@@ -193,16 +441,24 @@ def extract_inline_contents(html: str) -> InlineContents:
 
     Args:
         html: 対象の Prerendered_Page の HTML 文字列（UTF-8 前提）。
+        extractor: 抽出バックエンド（`EXTRACTORS` のいずれか）。いずれも同一の
+            結果を返す。
 
     Returns:
         InlineContents: 抽出したインライン script / style 内容。
 
     Raises:
         TypeError: `html` が文字列でない場合（フォールバック禁止・明示失敗）。
+        ValueError: `extractor` が未知の場合。
+        RuntimeError: `scanner` が実行中の Python で使用できない場合。
     """
     # ゼロトラスト検証: 文字列以外は不正入力として明示的に失敗させる。
     if not isinstance(html, str):
         raise TypeError(f"html は str である必要があります: {type(html)!r}")
+    if extractor == EXTRACTOR_SCANNER:
+        return _scan_inline_contents(html)
+    if extractor != EXTRACTOR_HTMLPARSER:
+        raise ValueError(f"未知の抽出バックエンドです: {extractor!r}")
     # パーサへ入力し、収集結果を不変オブジェクトへ変換して返す。
     collector = _InlineTagCollector()
     collector.feed(html)
@@ -239,7 +495,7 @@ def hash_source(content: str) -> str:
 
 
 def _dedupe_preserving_order(values: Sequence[str]) -> tuple[str, ...]:
-    """出現順を保ちつつ重複を排除する内部ヘルパー.
+    """出現順を保ちつつ重複を排除する内部ヘルパー（最初の出現を残す）.
 
     Args:
         values: 対象の文字列列。
@@ -247,11 +503,8 @@ def _dedupe_preserving_order(values: Sequence[str]) -> tuple[str, ...]:
     Returns:
         tuple[str, ...]: 重複を除いた出現順の列。
     """
-    seen: list[str] = []
-    for value in values:
-        if value not in seen:
-            seen.append(value)
-    return tuple(seen)
+    # dict はキーの挿入順を保つため、順序付き集合として使う（線形時間）。
+    return tuple(dict.fromkeys(values))
 
 
 def compute_inline_hashes(contents: InlineContents) -> InlineHashes:
@@ -328,6 +581,29 @@ def _strip_nonce(sources: Sequence[object]) -> list[str]:
     return result
 
 
+class _SourceBucket:
+    """1 ディレクティブのソース列（出現順）と、所属判定用の集合.
+
+    追加時の重複判定を集合で行い、ハッシュソースが数千件になってもディレクティブの
+    組み立てを線形時間に保つ。出典ディレクティブに重複したソースがある場合も
+    そのまま保持し（従来の出力と同一）、追加するソースのみ重複を排除する。
+    """
+
+    __slots__ = ("sources", "_members")
+
+    def __init__(self, sources: Iterable[str] = ()) -> None:
+        """初期のソース列（重複を含み得る）を保持する."""
+        self.sources: list[str] = list(sources)
+        self._members: set[str] = set(self.sources)
+
+    def extend(self, sources: Iterable[str]) -> None:
+        """未登録のソースのみを出現順に追加する（冪等）."""
+        for source in sources:
+            if source not in self._members:
+                self._members.add(source)
+                self.sources.append(source)
+
+
 def build_csp_directives(
     base_directives: Mapping[str, Sequence[object]],
     cloudfront_domain: str,
@@ -375,33 +651,25 @@ def build_csp_directives(
     cloudfront_source = f"https://{cloudfront_domain}"
 
     # 現行ディレクティブを順序保持でコピーしつつ nonce を除去する。
-    directives: dict[str, list[str]] = {}
+    directives: dict[str, _SourceBucket] = {}
     for name, sources in base_directives.items():
-        directives[name] = _strip_nonce(sources)
+        directives[name] = _SourceBucket(_strip_nonce(sources))
 
     # prod.py と同等に CloudFront ドメインを所定ディレクティブへ冪等追加する。
     # prod.py は setdefault で未定義ディレクティブを生成するため同挙動を再現する。
     for name in _CLOUDFRONT_DOMAIN_DIRECTIVES:
-        bucket = directives.setdefault(name, [])
-        if cloudfront_source not in bucket:
-            bucket.append(cloudfront_source)
+        directives.setdefault(name, _SourceBucket()).extend((cloudfront_source,))
 
     # インライン script のハッシュを script 系ディレクティブへ冪等追加する。
     for name in _SCRIPT_DIRECTIVES:
-        bucket = directives.setdefault(name, [])
-        for source in inline_hashes.scripts:
-            if source not in bucket:
-                bucket.append(source)
+        directives.setdefault(name, _SourceBucket()).extend(inline_hashes.scripts)
 
     # インライン style のハッシュを style 系ディレクティブへ冪等追加する。
     for name in _STYLE_DIRECTIVES:
-        bucket = directives.setdefault(name, [])
-        for source in inline_hashes.styles:
-            if source not in bucket:
-                bucket.append(source)
+        directives.setdefault(name, _SourceBucket()).extend(inline_hashes.styles)
 
     # 不変なタプルへ変換して返す。
-    return {name: tuple(sources) for name, sources in directives.items()}
+    return {name: tuple(bucket.sources) for name, bucket in directives.items()}
 
 
 def render_csp_header_value(directives: Mapping[str, Sequence[str]]) -> str:
@@ -453,3 +721,116 @@ def generate_csp_header(
     inline_hashes = compute_inline_hashes(contents)
     directives = build_csp_directives(base_directives, cloudfront_domain, inline_hashes)
     return render_csp_header_value(directives)
+
+
+class CspPipeline:
+    """HTML ごとの解析結果を再利用して per-page / 統一 CSP を生成するパイプライン.
+
+    `render_static` は 1 ページの CSP 生成でインライン内容の抽出を複数回行い、
+    ルート（既定言語の複製）と統一 CSP の算出でも同じ HTML を再度解析していた。
+    本クラスは HTML の内容の SHA-256 をキーに `InlineContents` と `InlineHashes` を
+    保持し、同一内容の HTML を 1 度だけ解析する。CSP の出典ディレクティブの
+    正規化（nonce 除去・CloudFront ドメイン追加）も生成時に 1 度だけ行う。
+
+    生成結果は `generate_csp_header` / `compute_inline_hashes` と同一である
+    （`build_csp_directives` は冪等であり、正規化済みのディレクティブへハッシュを
+    追加しても同じディレクティブになる）。
+
+    Attributes:
+        extractor: インライン内容の抽出バックエンド（`EXTRACTORS` のいずれか）。
+        parse_count: HTML を解析した回数（キャッシュに無い HTML の数）。
+    """
+
+    def __init__(
+        self,
+        base_directives: Mapping[str, Sequence[object]],
+        cloudfront_domain: str,
+        extractor: str = EXTRACTOR_HTMLPARSER,
+    ) -> None:
+        """出典ディレクティブを正規化して保持する.
+
+        Args:
+            base_directives: 現行 CSP ディレクティブ（base.py 出典。nonce を含み得る）。
+            cloudfront_domain: CloudFront 配信ドメイン（`https://` は付けない）。
+            extractor: インライン内容の抽出バックエンド。
+
+        Raises:
+            ValueError: `cloudfront_domain` が空、または `extractor` が未知の場合。
+            TypeError: ソースに nonce 以外の非文字列トークンが含まれる場合。
+            RuntimeError: `scanner` が実行中の Python で使用できない場合（最初の
+                ページの解析を待たずに失敗させる）。
+        """
+        if extractor not in EXTRACTORS:
+            raise ValueError(f"未知の抽出バックエンドです: {extractor!r}")
+        if extractor == EXTRACTOR_SCANNER:
+            _scanner_patterns()
+        self.extractor = extractor
+        self._cloudfront_domain = cloudfront_domain
+        self._base_directives = build_csp_directives(
+            base_directives, cloudfront_domain, InlineHashes(scripts=(), styles=())
+        )
+        # HTML の SHA-256 → (インライン内容, ハッシュソース)。
+        self._documents: dict[bytes, tuple[InlineContents, InlineHashes]] = {}
+        self.parse_count = 0
+
+    def _document(self, html: str) -> tuple[InlineContents, InlineHashes]:
+        """HTML の解析結果を返す（未解析の内容のみ解析する）."""
+        if not isinstance(html, str):
+            raise TypeError(f"html は str である必要があります: {type(html)!r}")
+        key = hashlib.sha256(html.encode("utf-8")).digest()
+        document = self._documents.get(key)
+        if document is None:
+            contents = extract_inline_contents(html, self.extractor)
+            self.parse_count += 1
+            document = self._documents[key] = (contents, compute_inline_hashes(contents))
+        return document
+
+    def inline_contents(self, html: str) -> InlineContents:
+        """HTML のインライン内容を返す（`extract_inline_contents` と同一）."""
+        return self._document(html)[0]
+
+    def inline_hashes(self, html: str) -> InlineHashes:
+        """HTML のインライン内容のハッシュソースを返す（`compute_inline_hashes` と同一）."""
+        return self._document(html)[1]
+
+    def page_header(self, html: str) -> str:
+        """1 ページの CSP ヘッダ値を返す（`generate_csp_header` と同一）."""
+        return self.header_for(self.inline_hashes(html))
+
+    def header_for(self, inline_hashes: InlineHashes) -> str:
+        """ハッシュソース集合を包含する CSP ヘッダ値を返す.
+
+        Args:
+            inline_hashes: CSP へ追加するハッシュソース集合。
+
+        Returns:
+            str: `Content-Security-Policy` ヘッダの値。
+        """
+        directives = build_csp_directives(
+            self._base_directives, self._cloudfront_domain, inline_hashes
+        )
+        return render_csp_header_value(directives)
+
+    def unified_header(self, page_hashes: Iterable[InlineHashes]) -> str:
+        """全ページのハッシュソースの和集合を包含する統一 CSP ヘッダ値を返す.
+
+        全ページのインライン内容を出現順に連結してハッシュ化した場合と同じ
+        （ハッシュは内容で決まるため、ページ順の連結後に重複を除けば同じ列になる）。
+
+        Args:
+            page_hashes: ページ順の各ページのハッシュソース集合。
+
+        Returns:
+            str: `Content-Security-Policy` ヘッダの値。
+        """
+        scripts: list[str] = []
+        styles: list[str] = []
+        for hashes in page_hashes:
+            scripts.extend(hashes.scripts)
+            styles.extend(hashes.styles)
+        return self.header_for(
+            InlineHashes(
+                scripts=_dedupe_preserving_order(scripts),
+                styles=_dedupe_preserving_order(styles),
+            )
+        )
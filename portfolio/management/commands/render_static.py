@@ -17,47 +17,93 @@ R3-1, R3-5）。
        フルページを複製生成する（CloudFront `DefaultRootObject: index.html` 整合。
        ルート言語はユーザー確認により既定言語複製と確定。出典: base.py
        `LANGUAGE_CODE = 'ja'`）。
-    4. 各ページのハッシュベース CSP ヘッダ値とインライン `'sha256-...'` を
+    4. `settings.CONTACT_FORM_TOKEN_KEY` が設定されている場合は、ビルドごとに 1 つの
+       署名付きフォームトークン（`contact_function.form_token.issue_form_token`）を
+       発行し、全言語のフォームへ埋め込む（Contact_Function がボディ解析の前に
+       自動投稿を拒否するため）。発行時刻と nonce をマニフェストへ記録する。
+    5. 各ページのハッシュベース CSP ヘッダ値とインライン `'sha256-...'` を
        `_csp_hash` モジュールで算出し、生成物一覧とともにマニフェストへ記録する
-       （出典: design.md C6, DM5、requirements.md R7-2, R7-5）。
+       （出典: design.md C6, DM5、requirements.md R7-2, R7-5）。HTML の解析は
+       `_csp_hash.CspPipeline` により各言語ページにつき 1 度のみとし、ルート（既定
+       言語の複製）と統一 CSP は算出済みのハッシュから導く。インライン内容の抽出方式は
+       `--html-extractor`（既定 `htmlparser`、生テキスト要素のみを探す `scanner`）で
+       選択でき、いずれも同一の成果物を生成する。
+
+並列レンダリング（`--jobs N`）:
+    - 既定（`--jobs 1`）は従来どおり同一プロセスで言語を順にレンダリングする。
+    - `--jobs N`（N >= 2）は言語ごとのレンダリングと CSP ハッシュ算出を最大 N 個の
+      ワーカープロセスで行う。Django の翻訳状態はスレッドローカルであり、テンプレートの
+      レンダリングは CPU 処理のため、スレッドではなくプロセスで並列化する。
+    - ワーカーは親プロセスで確定した設定（実行時に上書きされた値を含む）で
+      レンダリングするため、利用可能な環境では `fork` で起動する。`fork` が無い環境
+      では `spawn` で起動し、ワーカーの初期化時に `django.setup()` を行う。
+    - 結果は `settings.LANGUAGES` の順に集め、マニフェスト・統一 CSP は逐次実行と
+      同一になる。ルートの複製・統一 CSP・書き出しは親プロセスで行う。
+
+増分ビルド（`--cache-dir DIR`）:
+    - 言語別ページごとに入力（テンプレート・当該言語のコンパイル済みカタログ・
+      静的ファイルのマニフェスト・CSP ディレクティブ・対応言語・ページ生成コード・
+      `{% url %}` が解決に用いる URLconf と設定のモジュール・インストール済みアプリの
+      配布物の版・Django の版）の指紋を算出し、前回と一致する言語は `DIR` にキャッシュした
+      HTML とマニフェストエントリを再利用する（`_build_cache` モジュール）。
+      再レンダリングした言語と再利用した言語を報告する。`--force` はキャッシュを
+      読まずに全言語をレンダリングし、キャッシュを更新する。
+    - フォームトークンはビルドごとに変わるため、キャッシュには固定のプレース
+      ホルダで埋め込んだページを保存し、書き出す前に今回のトークンへ置換する。
+      置換後の出力は全言語を再レンダリングした場合とバイト単位で同一になる
+      （トークンはインライン script/style の外にのみ現れることを確認する）。
+    - キャッシュは全言語のレンダリングと書き出しの成功後にのみ更新する。
+    - 書き出しは内容が変わったファイルのみ行い（`--cache-dir` の有無によらない）、
+      変更の無いファイルの更新時刻を保つ（`aws s3 sync` が再アップロードしない）。
 
 フォールバック禁止（出典: principles.md 第三原則3、requirements.md R3-6）:
     - いずれかの言語でレンダリングに失敗した場合は `CommandError` を送出して
       非ゼロ終了し、ビルドを失敗させる。
     - 全言語＋ルートのレンダリングが成功して初めてファイルを書き出す
-      （二段階方式）。これにより部分的な出力を残さず、既存の配信状態を保全する
+      （二段階方式。`--jobs` の指定にかかわらず同じ）。これにより部分的な出力を残さず、既存の配信状態を保全する
       （部分同期しない、他言語での代替を行わない、R3-5, R3-6）。
     - CloudFront ドメインが設定されていない場合は握りつぶさず明示的に失敗させる
       （prod.py の `ImproperlyConfigured` パターンに整合、R6-7 の設計思想）。
 
 外部モジュール・ライセンス（出典: principles.md 第二原則6）:
-    - 標準ライブラリ（json, pathlib）と Django 標準機能（BaseCommand,
+    - 標準ライブラリ（concurrent.futures, importlib, json, multiprocessing, pathlib,
+      secrets, time）と Django 標準機能（staticfiles_storage, get_app_template_dirs を含む）（BaseCommand,
       render_to_string, translation）のみを使用し、追加の外部依存を導入しない。
     - CSP 生成は同一パッケージの `_csp_hash`（自作、Django 非依存の純粋関数群）を
-      利用する。
+      利用する。フォームトークンの発行は Contact_Function と共有する
+      `contact_function.form_token`（標準ライブラリのみ）を利用する。
 """
 
 import json
+import multiprocessing
+from importlib import import_module, metadata
+import secrets
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
+import django
+from django.apps import apps
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.core.management.base import BaseCommand, CommandError
 from django.template.loader import render_to_string
+from django.template.utils import get_app_template_dirs
+from django.urls import URLResolver, get_resolver
 from django.utils import translation
 
+from contact_function.form_token import issue_form_token
+from portfolio import forms as portfolio_forms
 from portfolio.forms import ContactForm
 
+# 増分ビルド用のキャッシュ（`_csp_hash` と同じく `_` 始まりの同一パッケージモジュール）。
+from ._build_cache import BuildCache, CachedPage, hash_files, page_fingerprint
+
 # 同一パッケージの CSP ハッシュ生成モジュール（サブタスク 4.1 実装済み）。
 # `_` 始まりのためコマンド自動探索の対象外であり、明示 import で利用する
 # （出典: portfolio/management/commands/_csp_hash.py の冒頭ドキュメント）。
-from ._csp_hash import (
-    InlineContents,
-    build_csp_directives,
-    compute_inline_hashes,
-    extract_inline_contents,
-    generate_csp_header,
-    render_csp_header_value,
-)
+from ._csp_hash import EXTRACTOR_HTMLPARSER, EXTRACTORS, CspPipeline, InlineHashes
 
 # 静的化対象ページのテンプレート名（出典: portfolio/views.py `Top.template_name`）。
 # `index.html` は `portfolio_base.html` を継承する（出典: portfolio/templates/index.html）。
@@ -74,6 +120,114 @@ _ROOT_PAGE_RELATIVE = "index.html"
 # 「マニフェスト（CSP ハッシュ・生成物一覧）を生成する」）。
 _MANIFEST_RELATIVE = "prerender_manifest.json"
 
+# フォームトークンの nonce のバイト数（URL 安全な Base64 で 16 文字）。
+_FORM_TOKEN_NONCE_BYTES = 12
+
+# 増分ビルドでキャッシュへ保存するページに埋め込むトークンのプレースホルダ
+# （HTML のエスケープ対象の文字を含まず、書き出す前に今回のトークンへ置換する）。
+_FORM_TOKEN_PLACEHOLDER = "__render_static_form_token__"
+
+
+def _initialize_worker() -> None:
+    """ワーカープロセスの初期化. `spawn` で起動した場合のみ Django を構成する.
+
+    `fork` で起動したワーカーは親プロセスの構成済みの状態を引き継ぐため何もしない。
+    """
+    if not apps.ready:
+        django.setup()
+
+
+def _render_language_job(
+    language: str,
+    form_token: str | None,
+    base_directives: dict,
+    cloudfront_domain: str,
+    extractor: str,
+) -> tuple[str, dict[str, object]]:
+    """ワーカープロセスで 1 言語をレンダリングし、マニフェストエントリを構築する.
+
+    プロセスプールへ渡すためモジュールレベルに置き、処理は逐次実行と同じ
+    `Command._render_and_describe` に委ねる。
+
+    Returns:
+        tuple[str, dict[str, object]]: レンダリング済み HTML とページメタ情報。
+
+    Raises:
+        CommandError: レンダリングに失敗した場合（失敗言語を明示する）。
+    """
+    return Command()._render_and_describe(
+        language, form_token, CspPipeline(base_directives, cloudfront_domain, extractor)
+    )
+
+
+def _write_if_changed(target: Path, text: str) -> None:
+    """内容が既存のファイルと異なる場合のみ UTF-8 で書き出す（親ディレクトリを作成）.
+
+    Raises:
+        OSError: 読み込み・書き出しに失敗した場合。
+    """
+    data = text.encode("utf-8")
+    if target.is_file() and target.read_bytes() == data:
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+
+
+def _inline_contains(pipeline: CspPipeline, html: str, text: str) -> bool:
+    """HTML のインライン script/style のいずれかが `text` を含むかを返す."""
+    contents = pipeline.inline_contents(html)
+    return any(text in content for content in contents.scripts + contents.styles)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """ワーカープロセスの起動方式を返す（`fork` が使える場合は `fork`）."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def _urlconf_files() -> list[Path]:
+    """ページの `{% url %}` が解決に用いる URLconf のモジュールを返す.
+
+    `ROOT_URLCONF` のパッケージ（設定モジュールを含む）と、`include` で取り込まれた
+    各 URLconf のモジュールファイルを対象とする（ルートの変更でキャッシュを再利用
+    しないため）。モジュールを持たない URLconf（admin 等）は Django の版で代表する。
+
+    Returns:
+        list[Path]: 重複を除き、パスの順に並べたファイル・ディレクトリ。
+    """
+    paths = {Path(import_module(settings.ROOT_URLCONF).__file__).parent}
+    pending = [get_resolver()]
+    while pending:
+        resolver = pending.pop()
+        module_file = getattr(resolver.urlconf_module, "__file__", None)
+        if module_file is not None:
+            paths.add(Path(module_file))
+        pending.extend(
+            pattern for pattern in resolver.url_patterns if isinstance(pattern, URLResolver)
+        )
+    return sorted(paths)
+
+
+def _installed_app_versions() -> list[list[str]]:
+    """インストール済みアプリごとに、提供する配布物の名前と版を返す.
+
+    プロジェクト内のアプリ（配布物を持たない）はソースの指紋で代表するため、
+    アプリ名のみとする。
+
+    Returns:
+        list[list[str]]: `[アプリ名, "配布物==版", ...]` の列（`INSTALLED_APPS` の順）。
+    """
+    distributions = metadata.packages_distributions()
+    versions = []
+    for app_config in apps.get_app_configs():
+        package = app_config.module.__name__.split(".")[0]
+        names = sorted(set(distributions.get(package, ())))
+        versions.append(
+            [app_config.name, *(f"{name}=={metadata.version(name)}" for name in names)]
+        )
+    return versions
+
 
 class Command(BaseCommand):
     """7 言語の表示ページを事前レンダリングし CSP マニフェストを生成するコマンド."""
@@ -85,18 +239,66 @@ class Command(BaseCommand):
         "STATIC_ROOT へ生成する（Static_Delivery_System 用）。"
     )
 
+    def add_arguments(self, parser):
+        """コマンドライン引数を定義する.
+
+        Args:
+            parser: Django が生成する引数パーサ。
+        """
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help=(
+                "言語ごとのレンダリングを行うワーカープロセス数（既定 1: 同一プロセスで"
+                "順にレンダリングする）。"
+            ),
+        )
+        parser.add_argument(
+            "--cache-dir",
+            default=None,
+            help=(
+                "増分ビルドのキャッシュディレクトリ。入力の指紋が前回と一致する言語は"
+                "キャッシュしたページを再利用する（既定: 全言語をレンダリングする）。"
+            ),
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="--cache-dir のキャッシュを読まずに全言語をレンダリングし、キャッシュを更新する。",
+        )
+        parser.add_argument(
+            "--html-extractor",
+            choices=EXTRACTORS,
+            default=EXTRACTOR_HTMLPARSER,
+            help=(
+                "CSP ハッシュのためのインライン script/style の抽出方式（結果は同一。"
+                "scanner は生テキスト要素のみを探す高速な走査器）。"
+            ),
+        )
+
     def handle(self, *args, **options):
         """コマンド本体. 7 言語＋ルートを生成し CSP マニフェストを書き出す.
 
         Args:
             *args: 位置引数（未使用）。
-            **options: オプション引数（未使用）。
+            **options: オプション引数（`jobs`: ワーカープロセス数、`cache_dir`: 増分
+                ビルドのキャッシュディレクトリ、`force`: キャッシュを読まない、
+                `html_extractor`: インライン内容の抽出方式）。
 
         Raises:
-            CommandError: 対応言語が未設定、CloudFront ドメインが未設定、
+            CommandError: `--jobs` が 1 未満、対応言語が未設定、CloudFront ドメインが
+                未設定、`--html-extractor scanner` を実行中の Python で使用できない、
                 いずれかの言語のレンダリングに失敗、または書き出しに失敗した場合
                 （フォールバック禁止・非ゼロ終了でビルドを失敗させる）。
         """
+        # ワーカープロセス数。1 未満は補正せず明示的に失敗させる。
+        jobs = options.get("jobs", 1)
+        if jobs < 1:
+            raise CommandError(
+                "--jobs は 1 以上である必要があります（指定値: {jobs}）。".format(jobs=jobs)
+            )
+
         # 出力先ルート（STATIC_ROOT）。collectstatic の成果物と同一ディレクトリ
         # （出典: base.py `STATIC_ROOT`、buildspec.yml の collectstatic→render_static）。
         output_root = Path(settings.STATIC_ROOT)
@@ -115,6 +317,21 @@ class Command(BaseCommand):
         # の場合もある）。generate_csp_header は冪等に扱う（出典: _csp_hash.py）。
         base_directives = self._resolve_base_directives()
 
+        # CSP 生成パイプライン（同一内容の HTML は 1 度だけ解析し、正規化済みの
+        # ディレクティブとインライン内容・ハッシュを再利用する。出典: _csp_hash.py）。
+        # `scanner` を実行中の Python で使用できない場合は、既定へ切り替えずに失敗させる。
+        try:
+            pipeline = CspPipeline(
+                base_directives,
+                cloudfront_domain,
+                options.get("html_extractor", EXTRACTOR_HTMLPARSER),
+            )
+        except RuntimeError as error:
+            raise CommandError(str(error)) from error
+
+        # 署名付きフォームトークン（鍵が未設定の場合は埋め込まない）。全言語で共有する。
+        form_token, form_token_record = self._issue_form_token()
+
         # --- 第 1 段階: 全言語＋ルートをメモリ上でレンダリングする ---
         # 途中失敗時にファイルを一切書き出さないため、先に全成果物を確定させる
         # （部分出力を残さない、R3-6・フォールバック禁止）。
@@ -123,36 +340,39 @@ class Command(BaseCommand):
         # マニフェスト用のページメタ情報一覧。
         page_entries: list[dict[str, object]] = []
 
-        for language in languages:
-            # 対象言語を有効化してレンダリングする。失敗時は CommandError で中断。
-            html = self._render_language_page(language)
-            relative_path = _LANG_PAGE_RELATIVE_FORMAT.format(lang=language)
-            rendered_pages[relative_path] = html
-            # 当該ページの CSP ヘッダ値とインラインハッシュを算出しメタ情報へ記録。
-            page_entries.append(
-                self._build_page_entry(
-                    language=language,
-                    relative_path=relative_path,
-                    role="language",
-                    html=html,
-                    base_directives=base_directives,
-                    cloudfront_domain=cloudfront_domain,
-                )
+        # 各言語をレンダリングし CSP ヘッダ値とインラインハッシュを算出する
+        # （`--jobs` に応じて逐次またはプロセスプール。結果は言語順）。
+        # `--cache-dir` 指定時は入力の指紋が一致する言語のキャッシュを再利用する。
+        # いずれかの言語の失敗時は CommandError で中断する。
+        cache_dir = options.get("cache_dir")
+        cache = BuildCache(Path(cache_dir)) if cache_dir else None
+        if cache is None:
+            rendered_languages = self._render_languages(
+                languages, form_token, base_directives, cloudfront_domain, jobs, pipeline
+            )
+            rebuilt_pages: dict[str, CachedPage] = {}
+        else:
+            rendered_languages, rebuilt_pages = self._render_with_cache(
+                cache,
+                languages,
+                form_token,
+                base_directives,
+                cloudfront_domain,
+                jobs,
+                pipeline,
+                force=options.get("force", False),
             )
+        for language, (html, entry) in zip(languages, rendered_languages):
+            rendered_pages[_LANG_PAGE_RELATIVE_FORMAT.format(lang=language)] = html
+            page_entries.append(entry)
 
         # ルート index.html は既定言語のフルページを複製する（同一内容を再利用）。
+        # 内容が同一のため、CSP・ハッシュも既定言語のエントリを再利用する（再解析しない）。
         default_relative = _LANG_PAGE_RELATIVE_FORMAT.format(lang=default_language)
-        root_html = rendered_pages[default_relative]
-        rendered_pages[_ROOT_PAGE_RELATIVE] = root_html
+        rendered_pages[_ROOT_PAGE_RELATIVE] = rendered_pages[default_relative]
+        default_entry = page_entries[languages.index(default_language)]
         page_entries.append(
-            self._build_page_entry(
-                language=default_language,
-                relative_path=_ROOT_PAGE_RELATIVE,
-                role="root",
-                html=root_html,
-                base_directives=base_directives,
-                cloudfront_domain=cloudfront_domain,
-            )
+            {**default_entry, "path": _ROOT_PAGE_RELATIVE, "role": "root"}
         )
 
         # 全ページ横断の統一 CSP を算出する（CloudFront ResponseHeadersPolicy は
@@ -160,11 +380,7 @@ class Command(BaseCommand):
         # インライン `'sha256-...'` の和集合を含む単一 CSP が必要。ページ間で言語別に
         # インライン内容が異なっても、和集合により全ページのインラインを許可する。
         # 出典: design.md C5/C6「CSP 文字列を CloudFront ResponseHeadersPolicy へ反映」、R7-2/R7-5）。
-        unified_csp = self._build_unified_csp(
-            rendered_html=list(rendered_pages.values()),
-            base_directives=base_directives,
-            cloudfront_domain=cloudfront_domain,
-        )
+        unified_csp = self._build_unified_csp(page_entries, pipeline)
 
         # マニフェスト（CSP ハッシュ・生成物一覧）を構築する（DM5）。
         # `content_security_policy`（トップレベル）は CloudFront ResponseHeadersPolicy の
@@ -176,6 +392,7 @@ class Command(BaseCommand):
             "root_object": _ROOT_PAGE_RELATIVE,
             "target_page": "/portfolio/top/",
             "content_security_policy": unified_csp,
+            "form_token": form_token_record,
             "pages": page_entries,
         }
 
@@ -183,6 +400,19 @@ class Command(BaseCommand):
         # ここに到達した時点で全言語のレンダリングが成功している。
         self._write_outputs(output_root, rendered_pages, manifest)
 
+        # 書き出しの成功後に、再レンダリングした言語のキャッシュを更新する。
+        if cache is not None:
+            self._store_cache(cache, rebuilt_pages)
+            self.stdout.write(
+                "Rebuilt pages: {rebuilt}; reused from cache: {reused}".format(
+                    rebuilt=", ".join(rebuilt_pages) or "(none)",
+                    reused=", ".join(
+                        language for language in languages if language not in rebuilt_pages
+                    )
+                    or "(none)",
+                )
+            )
+
         # 成功メッセージ（生成言語数とルートを明示）。
         self.stdout.write(
             self.style.SUCCESS(
@@ -282,7 +512,281 @@ class Command(BaseCommand):
             )
         return policy["DIRECTIVES"]
 
-    def _render_language_page(self, language: str) -> str:
+    def _issue_form_token(self) -> tuple[str | None, dict[str, object] | None]:
+        """ビルドごとの署名付きフォームトークンを発行する.
+
+        Returns:
+            tuple[str | None, dict[str, object] | None]: トークンと、マニフェストへ記録
+                する発行時刻・nonce。`settings.CONTACT_FORM_TOKEN_KEY` が空の場合は
+                (None, None)（トークンを埋め込まない）。
+        """
+        key = getattr(settings, "CONTACT_FORM_TOKEN_KEY", "")
+        if not key:
+            return None, None
+        issued_at = int(time.time())
+        nonce = secrets.token_urlsafe(_FORM_TOKEN_NONCE_BYTES)
+        token = issue_form_token(key.encode("utf-8"), issued_at, nonce)
+        return token, {"issued_at": issued_at, "nonce": nonce}
+
+    def _render_languages(
+        self,
+        languages: tuple[str, ...],
+        form_token: str | None,
+        base_directives: dict,
+        cloudfront_domain: str,
+        jobs: int,
+        pipeline: CspPipeline,
+    ) -> list[tuple[str, dict[str, object]]]:
+        """全言語をレンダリングし、HTML とマニフェストエントリを言語順に返す.
+
+        Args:
+            languages: 対応言語コード列。
+            form_token: フォームへ埋め込む署名付きトークン（None の場合は埋め込まない）。
+            base_directives: 現行 CSP ディレクティブ（出典。ワーカーへ渡す）。
+            cloudfront_domain: CloudFront 配信ドメイン（ワーカーへ渡す）。
+            jobs: ワーカープロセス数（1 の場合は同一プロセスで順にレンダリングする）。
+            pipeline: 同一プロセスでレンダリングする場合の CSP 生成パイプライン
+                （ワーカーはそれぞれのパイプラインを用いる）。
+
+        Returns:
+            list[tuple[str, dict[str, object]]]: 言語順の (HTML, ページメタ情報)。
+
+        Raises:
+            CommandError: いずれかの言語の処理に失敗した場合。失敗言語を明示する
+                （複数の言語が失敗した場合は言語順で最初の言語）。
+        """
+        if jobs == 1 or len(languages) == 1:
+            return [
+                self._render_and_describe(language, form_token, pipeline)
+                for language in languages
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(languages)),
+            mp_context=_pool_context(),
+            initializer=_initialize_worker,
+        ) as executor:
+            futures: list[Future] = [
+                executor.submit(
+                    _render_language_job,
+                    language,
+                    form_token,
+                    base_directives,
+                    cloudfront_domain,
+                    pipeline.extractor,
+                )
+                for language in languages
+            ]
+            results = []
+            for language, future in zip(languages, futures):
+                try:
+                    results.append(future.result())
+                except CommandError:
+                    # ワーカー内で失敗言語を明示済み。未着手の言語は取り消す。
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+                except BrokenProcessPool as exc:
+                    raise CommandError(
+                        "言語 '{lang}' の Prerendered_Page 生成中にワーカープロセスが"
+                        "異常終了しました: {exc}".format(lang=language, exc=exc)
+                    ) from exc
+                except Exception as exc:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise CommandError(
+                        "言語 '{lang}' の Prerendered_Page 生成に失敗しました: {exc}".format(
+                            lang=language, exc=exc
+                        )
+                    ) from exc
+        return results
+
+    def _render_with_cache(
+        self,
+        cache: BuildCache,
+        languages: tuple[str, ...],
+        form_token: str | None,
+        base_directives: dict,
+        cloudfront_domain: str,
+        jobs: int,
+        pipeline: CspPipeline,
+        force: bool,
+    ) -> tuple[list[tuple[str, dict[str, object]]], dict[str, CachedPage]]:
+        """入力の指紋が一致する言語はキャッシュを再利用し、残りをレンダリングする.
+
+        キャッシュのページはフォームトークンをプレースホルダで埋め込んでおり、
+        返す HTML では今回のトークンへ置換する。
+
+        Args:
+            cache: キャッシュディレクトリ。
+            languages: 対応言語コード列。
+            form_token: フォームへ埋め込む署名付きトークン（None の場合は埋め込まない）。
+            base_directives: 現行 CSP ディレクティブ（出典）。
+            cloudfront_domain: CloudFront 配信ドメイン。
+            jobs: ワーカープロセス数。
+            pipeline: CSP 生成パイプライン。
+            force: True の場合はキャッシュを読まずに全言語をレンダリングする。
+
+        Returns:
+            tuple: 言語順の (HTML, ページメタ情報) と、再レンダリングした言語 →
+                キャッシュへ保存するページ（言語順）。
+
+        Raises:
+            CommandError: いずれかの言語のレンダリングに失敗した場合、または
+                フォームトークンがインライン script/style に現れる場合（置換すると
+                CSP ハッシュが変わり、全言語の再レンダリングと同一にならないため）。
+        """
+        render_token = _FORM_TOKEN_PLACEHOLDER if form_token is not None else None
+        shared_inputs = self._shared_fingerprint_inputs(
+            base_directives, cloudfront_domain, render_token
+        )
+        pages: dict[str, CachedPage] = {}
+        for language in languages:
+            fingerprint = page_fingerprint(
+                {**shared_inputs, "language": language, "catalog": self._catalog_hash(language)}
+            )
+            cached = None if force else cache.load(language, fingerprint)
+            pages[language] = cached or CachedPage(fingerprint, "", {})
+
+        stale = tuple(language for language in languages if not pages[language].html)
+        rebuilt: dict[str, CachedPage] = {}
+        if stale:
+            rendered = self._render_languages(
+                stale, render_token, base_directives, cloudfront_domain, jobs, pipeline
+            )
+            for language, (html, entry) in zip(stale, rendered):
+                if render_token is not None and _inline_contains(
+                    pipeline, html, _FORM_TOKEN_PLACEHOLDER
+                ):
+                    raise CommandError(
+                        "言語 '{lang}' のページはフォームトークンをインライン script/style に"
+                        "含むため、--cache-dir による増分ビルドはできません。".format(
+                            lang=language
+                        )
+                    )
+                rebuilt[language] = pages[language] = CachedPage(
+                    pages[language].fingerprint, html, entry
+                )
+
+        results = []
+        for language in languages:
+            page = pages[language]
+            html = page.html
+            if form_token is not None:
+                html = html.replace(_FORM_TOKEN_PLACEHOLDER, form_token)
+            results.append((html, page.entry))
+        return results, rebuilt
+
+    def _shared_fingerprint_inputs(
+        self,
+        base_directives: dict,
+        cloudfront_domain: str,
+        render_token: str | None,
+    ) -> dict[str, object]:
+        """全言語に共通するページの入力（指紋の材料）を収集する.
+
+        Args:
+            base_directives: 現行 CSP ディレクティブ（出典）。
+            cloudfront_domain: CloudFront 配信ドメイン。
+            render_token: レンダリング時に埋め込むトークン（プレースホルダまたは None）。
+
+        Returns:
+            dict[str, object]: 入力の名前 → JSON で表せる値。
+        """
+        template_dirs = [
+            Path(directory)
+            for engine in settings.TEMPLATES
+            for directory in engine.get("DIRS", ())
+        ] + [Path(directory) for directory in get_app_template_dirs("templates")]
+        # ページの生成コード（アプリのフォーム・ビュー・URLconf 等と、本コマンド・
+        # CSP 生成・キャッシュ）。
+        app_dir = Path(portfolio_forms.__file__).parent
+        code_files = [*sorted(app_dir.glob("*.py")), Path(__file__).parent]
+        static_manifest = getattr(staticfiles_storage, "hashed_files", None) or {}
+        return {
+            "django": django.get_version(),
+            "templates": hash_files(template_dirs),
+            "code": hash_files(code_files, suffixes=(".py",)),
+            "urlconf": hash_files(_urlconf_files(), suffixes=(".py",)),
+            "apps": _installed_app_versions(),
+            "static_url": str(settings.STATIC_URL),
+            "static_manifest": sorted(static_manifest.items()),
+            "csp_directives": {name: list(sources) for name, sources in base_directives.items()},
+            "cloudfront_domain": cloudfront_domain,
+            "languages": [list(language) for language in settings.LANGUAGES],
+            "form_token": render_token,
+        }
+
+    def _catalog_hash(self, language: str) -> str:
+        """言語のコンパイル済みカタログ（`.mo`）の指紋を算出する.
+
+        `settings.LOCALE_PATHS` と各アプリの `locale` ディレクトリから、言語の
+        ロケール（例: zh-hans → zh_Hans）と基底言語（例: zh）のカタログを対象とする
+        （Django 同梱のカタログは Django の版で代表する）。
+
+        Args:
+            language: 言語コード。
+
+        Returns:
+            str: 16 進 SHA-256。
+        """
+        locales = dict.fromkeys(
+            (translation.to_locale(language), translation.to_locale(language.split("-")[0]))
+        )
+        locale_dirs = [Path(path) for path in settings.LOCALE_PATHS] + [
+            Path(directory) for directory in get_app_template_dirs("locale")
+        ]
+        return hash_files(
+            [directory / locale / "LC_MESSAGES" for directory in locale_dirs for locale in locales],
+            suffixes=(".mo",),
+        )
+
+    def _store_cache(self, cache: BuildCache, pages: dict[str, CachedPage]) -> None:
+        """再レンダリングしたページをキャッシュへ保存する.
+
+        Args:
+            cache: キャッシュディレクトリ。
+            pages: 言語 → 保存するページ。
+
+        Raises:
+            CommandError: 保存に失敗した場合（握りつぶさない）。
+        """
+        try:
+            for language, page in pages.items():
+                cache.store(language, page)
+        except OSError as exc:
+            raise CommandError(
+                "render_static のキャッシュの保存に失敗しました: {exc}".format(exc=exc)
+            ) from exc
+
+    def _render_and_describe(
+        self,
+        language: str,
+        form_token: str | None,
+        pipeline: CspPipeline,
+    ) -> tuple[str, dict[str, object]]:
+        """1 言語をレンダリングし、当該ページのマニフェストエントリを構築する.
+
+        Args:
+            language: レンダリングする言語コード。
+            form_token: フォームへ埋め込む署名付きトークン（None の場合は埋め込まない）。
+            pipeline: CSP 生成パイプライン。
+
+        Returns:
+            tuple[str, dict[str, object]]: レンダリング済み HTML とページメタ情報。
+
+        Raises:
+            CommandError: レンダリングに失敗した場合（失敗言語を明示する）。
+        """
+        html = self._render_language_page(language, form_token)
+        entry = self._build_page_entry(
+            language=language,
+            relative_path=_LANG_PAGE_RELATIVE_FORMAT.format(lang=language),
+            role="language",
+            html=html,
+            pipeline=pipeline,
+        )
+        return html, entry
+
+    def _render_language_page(self, language: str, form_token: str | None = None) -> str:
         """指定言語で表示ページテンプレートをレンダリングする.
 
         Top ビューが供給するコンテキスト（`form`）を再現し、対象言語を有効化して
@@ -290,6 +794,7 @@ class Command(BaseCommand):
 
         Args:
             language: 有効化する言語コード（例: 'ja'）。
+            form_token: フォームへ埋め込む署名付きトークン（None の場合は埋め込まない）。
 
         Returns:
             str: レンダリング済み HTML 文字列。
@@ -302,7 +807,7 @@ class Command(BaseCommand):
             # translation.override で対象言語のみ一時的に有効化し、確実に元へ戻す。
             with translation.override(language):
                 # Top ビューと同じコンテキスト（未束縛の ContactForm）を供給する。
-                context = {"form": ContactForm()}
+                context = {"form": ContactForm(), "form_token": form_token}
                 return render_to_string(_TARGET_TEMPLATE, context)
         except Exception as exc:
             # 失敗言語を明示してビルドを失敗させる（部分同期を防ぐ、R3-6）。
@@ -318,8 +823,7 @@ class Command(BaseCommand):
         relative_path: str,
         role: str,
         html: str,
-        base_directives: dict,
-        cloudfront_domain: str,
+        pipeline: CspPipeline,
     ) -> dict[str, object]:
         """1 ページ分のマニフェストエントリ（CSP・ハッシュ）を構築する.
 
@@ -328,19 +832,15 @@ class Command(BaseCommand):
             relative_path: STATIC_ROOT からの相対出力パス。
             role: 'language'（言語別ページ）または 'root'（ルート複製）。
             html: 当該ページの HTML。
-            base_directives: 現行 CSP ディレクティブ（出典）。
-            cloudfront_domain: CloudFront 配信ドメイン。
+            pipeline: CSP 生成パイプライン（HTML の解析は 1 度のみ）。
 
         Returns:
             dict[str, object]: マニフェストへ格納するページメタ情報。
         """
         # インライン script/style を抽出し、その `'sha256-...'` を算出する（DM5 記録用）。
-        contents = extract_inline_contents(html)
-        inline_hashes = compute_inline_hashes(contents)
+        inline_hashes = pipeline.inline_hashes(html)
         # ハッシュベース CSP ヘッダ値（nonce 除去済み・現行許可元＋CloudFront 包含）。
-        csp_header_value = generate_csp_header(
-            html, base_directives, cloudfront_domain
-        )
+        csp_header_value = pipeline.header_for(inline_hashes)
         return {
             "language": language,
             "path": relative_path,
@@ -352,45 +852,36 @@ class Command(BaseCommand):
 
     def _build_unified_csp(
         self,
-        rendered_html: list[str],
-        base_directives: dict,
-        cloudfront_domain: str,
+        page_entries: list[dict[str, object]],
+        pipeline: CspPipeline,
     ) -> str:
         """全 Prerendered_Page 横断の統一 CSP ヘッダ値を生成する.
 
         CloudFront ResponseHeadersPolicy は単一の Content-Security-Policy を全応答へ
-        付与するため、全ページのインライン script/style 内容を和集合として集約し、
-        その `'sha256-...'` を包含する 1 本の CSP を生成する（出典: design.md C5/C6、
+        付与するため、全ページのインライン script/style の `'sha256-...'` を和集合として
+        集約し、それを包含する 1 本の CSP を生成する（出典: design.md C5/C6、
         requirements.md R7-2/R7-5）。per-request nonce は含めず、現行許可元と
         CloudFront ドメインのみを包含する（新規緩和なし、R7-5）。
 
+        各ページのハッシュはマニフェストエントリに算出済みのため、HTML を再解析しない
+        （ワーカープロセス・キャッシュ由来のページも同様）。
+
         Args:
-            rendered_html: 全ページ（言語別＋ルート）の HTML 文字列一覧。
-            base_directives: 現行 CSP ディレクティブ（base.py 出典）。
-            cloudfront_domain: CloudFront 配信ドメイン（`https://` は付けない）。
+            page_entries: 全ページ（言語別＋ルート）のマニフェストエントリ（ページ順）。
+            pipeline: CSP 生成パイプライン。
 
         Returns:
             str: 全ページのインラインを許可する統一 Content-Security-Policy ヘッダ値。
         """
-        # 全ページのインライン内容を出現順に集約する（compute_inline_hashes が
-        # 重複を排除するため、集約結果は一意なハッシュ集合＝和集合になる）。
-        combined_scripts: list[str] = []
-        combined_styles: list[str] = []
-        for html in rendered_html:
-            contents = extract_inline_contents(html)
-            combined_scripts.extend(contents.scripts)
-            combined_styles.extend(contents.styles)
-        combined = InlineContents(
-            scripts=tuple(combined_scripts),
-            styles=tuple(combined_styles),
-        )
-        # 和集合のハッシュを算出し、現行許可元＋CloudFront ドメインを包含する
-        # ディレクティブを組み立ててヘッダ値へ整形する（nonce 不在, R7-2）。
-        inline_hashes = compute_inline_hashes(combined)
-        directives = build_csp_directives(
-            base_directives, cloudfront_domain, inline_hashes
+        # ページ順のハッシュを連結して重複を除く（全ページのインライン内容を出現順に
+        # 連結してハッシュ化した結果と同一の和集合になる）。
+        return pipeline.unified_header(
+            InlineHashes(
+                scripts=tuple(entry["inline_script_hashes"]),
+                styles=tuple(entry["inline_style_hashes"]),
+            )
+            for entry in page_entries
         )
-        return render_csp_header_value(directives)
 
     def _write_outputs(
         self,
@@ -402,6 +893,7 @@ class Command(BaseCommand):
 
         本メソッドは全言語のレンダリング成功後にのみ呼ばれる（二段階方式）。
         非 ASCII 文字（ja, ar, ru, zh-hans 等）を保持するため UTF-8 で書き出す。
+        内容が既存のファイルと同一の場合は書き出さない（更新時刻を保つ）。
 
         Args:
             output_root: 出力先ルート（STATIC_ROOT）。
@@ -414,16 +906,12 @@ class Command(BaseCommand):
         try:
             # 各 HTML を対応する相対パスへ書き出す（親ディレクトリを作成）。
             for relative_path, html in rendered_pages.items():
-                target = output_root / relative_path
-                target.parent.mkdir(parents=True, exist_ok=True)
-                target.write_text(html, encoding="utf-8")
+                _write_if_changed(output_root / relative_path, html)
 
             # マニフェストを UTF-8・非 ASCII 保持の整形 JSON で書き出す。
-            manifest_path = output_root / _MANIFEST_RELATIVE
-            manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            manifest_path.write_text(
+            _write_if_changed(
+                output_root / _MANIFEST_RELATIVE,
                 json.dumps(manifest, ensure_ascii=False, indent=2),
-                encoding="utf-8",
             )
         except OSError as exc:
             # 書き出し失敗を握りつぶさず明示的に失敗させる（フォールバック禁止）。
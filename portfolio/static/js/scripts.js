@@ -88,9 +88,17 @@ window.addEventListener('DOMContentLoaded', event => {
     const contactForm = document.getElementById('contactForm');
     const successMessage = document.getElementById('successMessage');
     const errorMessage = document.getElementById('errorMessage');
+    const submitButton = document.getElementById('submitButton');
+    // 送信中（応答待ち）かどうか。ダブルクリック等による同じ内容の再送を抑止する。
+    let submitting = false;
 
     contactForm.addEventListener('submit', async (event) => {
         event.preventDefault();
+        if (submitting) {
+            return;
+        }
+        submitting = true;
+        submitButton.disabled = true;
 
         const formData = new FormData(contactForm);
         // API Gatewayでは multipart/form-data の解析が正しく行われないため、
@@ -107,20 +115,37 @@ window.addEventListener('DOMContentLoaded', event => {
         if (csrfInput && csrfInput.value) {
             headers['X-CSRFToken'] = csrfInput.value;
         }
-        const response = await fetch(contactForm.action, {
-            method: 'POST',
-            body: new URLSearchParams(formData),
-            headers: headers,
-        });
-
-        if (response.ok) {
-            contactForm.reset();
-            successMessage.style.display = 'block';
-            errorMessage.style.display = 'none';
-        } else {
-            // エラーハンドリング
+        // 事前レンダリング時に埋め込まれた署名付きトークンと、ページの読み込みから
+        // 送信までの経過ミリ秒を送る（Contact_Function がボディ解析の前に自動投稿を拒否する）。
+        const formTokenInput = document.getElementById('formToken');
+        if (formTokenInput && formTokenInput.value) {
+            headers['X-Form-Token'] = formTokenInput.value;
+            headers['X-Form-Elapsed-Ms'] = String(Math.round(performance.now()));
+        }
+        try {
+            const response = await fetch(contactForm.action, {
+                method: 'POST',
+                body: new URLSearchParams(formData),
+                headers: headers,
+            });
+
+            if (response.ok) {
+                contactForm.reset();
+                successMessage.style.display = 'block';
+                errorMessage.style.display = 'none';
+            } else {
+                // エラーハンドリング
+                successMessage.style.display = 'none';
+                errorMessage.style.display = 'block';
+            }
+        } catch (error) {
+            // 通信エラー（応答なし）も失敗として表示する
             successMessage.style.display = 'none';
             errorMessage.style.display = 'block';
+        } finally {
+            // 応答（または通信エラー）を受け取ってから再送を許可する
+            submitting = false;
+            submitButton.disabled = false;
         }
     });
     
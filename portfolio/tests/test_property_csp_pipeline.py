@@ -0,0 +1,104 @@
+"""`_csp_hash.CspPipeline`（解析結果を再利用する CSP 生成）のプロパティベーステスト.
+
+検証プロパティ:
+    任意のページ列（重複ページを含む）について、`CspPipeline` が返す per-page の
+    インラインハッシュ・CSP ヘッダ値は純粋関数（`compute_inline_hashes` /
+    `generate_csp_header`）と同一であり、統一 CSP は全ページのインライン内容を
+    連結して算出した CSP（`render_static` の従来の算出方法）と同一である。
+    HTML の解析回数は相異なるページの数に等しい（同一内容は 1 度だけ解析する）。
+
+テスト方針:
+    - インライン内容・ドメイン・nonce ソースの生成は `test_property_csp_hash` の
+      戦略を再利用する。
+    - 最小 100 反復（@settings(max_examples=100)）。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest portfolio.tests.test_property_csp_pipeline -v
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from portfolio.management.commands._csp_hash import (
+    CspPipeline,
+    InlineContents,
+    build_csp_directives,
+    compute_inline_hashes,
+    extract_inline_contents,
+    generate_csp_header,
+    render_csp_header_value,
+)
+from portfolio.tests.test_property_csp_hash import (
+    _base_directives,
+    _build_html,
+    _cloudfront_domain,
+    _inline_text,
+    _nonce_source,
+)
+
+
+@st.composite
+def _pages(draw: st.DrawFn) -> list[str]:
+    """1〜8 ページの HTML 列を生成する（同一ページの重複・インライン無しを含む）."""
+    distinct = draw(
+        st.lists(
+            st.builds(
+                _build_html,
+                st.lists(_inline_text(), max_size=3),
+                st.lists(_inline_text(), max_size=3),
+            ),
+            min_size=1,
+            max_size=4,
+        )
+    )
+    return draw(st.lists(st.sampled_from(distinct), min_size=1, max_size=8))
+
+
+def _unified_from_contents(
+    pages: list[str], base_directives: dict, cloudfront_domain: str
+) -> str:
+    """全ページのインライン内容を連結して統一 CSP を算出する（従来の算出方法）."""
+    scripts: list[str] = []
+    styles: list[str] = []
+    for html in pages:
+        contents = extract_inline_contents(html)
+        scripts.extend(contents.scripts)
+        styles.extend(contents.styles)
+    inline_hashes = compute_inline_hashes(InlineContents(tuple(scripts), tuple(styles)))
+    return render_csp_header_value(
+        build_csp_directives(base_directives, cloudfront_domain, inline_hashes)
+    )
+
+
+class CspPipelineProperty(unittest.TestCase):
+    """`CspPipeline` と純粋関数の一致、および解析回数を検証する."""
+
+    @settings(max_examples=100, deadline=None)
+    @given(pages=_pages(), nonce_source=_nonce_source(), cloudfront_domain=_cloudfront_domain())
+    def test_pipeline_matches_pure_functions_and_parses_once(
+        self, pages: list[str], nonce_source: str, cloudfront_domain: str
+    ) -> None:
+        """per-page・統一 CSP が純粋関数と同一で、相異なるページのみを解析すること."""
+        base_directives = _base_directives(nonce_source)
+        pipeline = CspPipeline(base_directives, cloudfront_domain)
+        for html in pages:
+            self.assertEqual(
+                pipeline.inline_hashes(html), compute_inline_hashes(extract_inline_contents(html))
+            )
+            self.assertEqual(
+                pipeline.page_header(html),
+                generate_csp_header(html, base_directives, cloudfront_domain),
+            )
+        self.assertEqual(
+            pipeline.unified_header(pipeline.inline_hashes(html) for html in pages),
+            _unified_from_contents(pages, base_directives, cloudfront_domain),
+        )
+        self.assertEqual(pipeline.parse_count, len(set(pages)))
+
+
+if __name__ == "__main__":
+    unittest.main()
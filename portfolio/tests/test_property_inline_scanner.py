@@ -0,0 +1,166 @@
+"""インライン抽出の走査器バックエンド（`scanner`）と `html.parser` の差分プロパティテスト.
+
+検証プロパティ:
+    任意の HTML 断片の列（大小文字の混在した script/style・外部 script・自己終了タグ・
+    属性値内の `>`・コメント・未終端のコメントやタグ・DOCTYPE・処理命令・不正な宣言・
+    CDATA/条件付きマーク区間・単独の `<` `>`・任意の文字）について、
+    `extract_inline_contents(html, "scanner")` は `extract_inline_contents(html, "htmlparser")`
+    と同一の `InlineContents` を返す。`html.parser` が不正なマーク区間で例外
+    （`AssertionError`）を送出する入力では、走査器も `ValueError` を送出する。
+    走査器が用いる標準ライブラリの非公開名が無い Python では、`scanner` のみが
+    `RuntimeError` で失敗し、`htmlparser` は影響を受けない。
+
+テスト方針:
+    - 断片は `html.parser` の状態遷移（タグ開始・生テキスト・コメント・宣言）の境界を
+      狙って組み合わせ、断片の間に任意の文字を挟む。
+    - 最小 300 反復（@settings(max_examples=300)）。入力の分布が広いため他の
+      プロパティテストより多く実行する。
+
+実行コマンド（プロジェクトルートから、Django 非ロード）:
+    python -m unittest portfolio.tests.test_property_inline_scanner -v
+"""
+
+from __future__ import annotations
+
+import _markupbase
+import unittest
+from unittest.mock import patch
+
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+from portfolio.management.commands._csp_hash import (
+    EXTRACTOR_HTMLPARSER,
+    EXTRACTOR_SCANNER,
+    CspPipeline,
+    _scanner_patterns,
+    extract_inline_contents,
+)
+
+# `html.parser` の状態遷移の境界を狙う断片。
+_FRAGMENTS: tuple[str, ...] = (
+    "<script>",
+    "<SCRIPT>",
+    "<ScRiPt type='module'>",
+    "<script src='/a.js'>",
+    '<script SRC="/a.js" defer>',
+    "<script data-src='x'>",
+    "<script/>",
+    "<script src=/a.js />",
+    "<style>",
+    "<STYLE media=\"a>b\">",
+    "<style/>",
+    "</script>",
+    "</SCRIPT >",
+    "</script\n>",
+    "</scripts>",
+    "</style>",
+    "</StYlE foo>",
+    "<div class='a>b' id=x>",
+    "<p title=\"<script>\">",
+    "<a href=x?a=1&b=2>",
+    "<br/>",
+    "<img\n src=x\n/>",
+    "</div>",
+    "</>",
+    "</ p>",
+    "<!-- c -->",
+    "<!-- <script>x</script> -->",
+    "<!--",
+    "-->",
+    "--!>",
+    "<!---->",
+    "<!DOCTYPE html>",
+    "<!doctype",
+    "<?xml version='1.0'?>",
+    "<?",
+    "<!x>",
+    "<!>",
+    "<![CDATA[ a ]]>",
+    "<![if !IE]>",
+    "<![endif]>",
+    "<![",
+    "<!--[if IE]>",
+    "<!>-->",
+    "<",
+    ">",
+    "<<",
+    "< p>",
+    "<1>",
+    "<a",
+    "<a b='",
+    "'",
+    '"',
+    "=",
+    "&amp;",
+    "&#60;",
+    "/",
+    "\n",
+    " ",
+    "x",
+    "\t",
+)
+
+
+@st.composite
+def _html(draw: st.DrawFn) -> str:
+    """断片と任意の文字を組み合わせた HTML を生成する."""
+    pieces = draw(
+        st.lists(
+            st.one_of(
+                st.sampled_from(_FRAGMENTS),
+                st.text(alphabet="<>/!-?[]'\"=aAsScC \n", max_size=6),
+                st.text(max_size=4),
+            ),
+            max_size=24,
+        )
+    )
+    return "".join(pieces)
+
+
+def _extract(html: str, extractor: str) -> object:
+    """抽出結果、または送出された例外の種別を返す."""
+    try:
+        return extract_inline_contents(html, extractor)
+    except (AssertionError, ValueError):
+        return "error"
+
+
+class InlineScannerProperty(unittest.TestCase):
+    """走査器と `html.parser` バックエンドの抽出結果の一致を検証する."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(html=_html())
+    @example(html="<script>a<!--</script>b</script>")
+    @example(html="<style>x</style ><script src=a>y</script><script>z")
+    @example(html="<![if x]><script>1</script><![endif]>")
+    @example(html="<![foo x]><script>a</script>")
+    @example(html="<a b='>'<script>c</script>")
+    def test_scanner_matches_htmlparser(self, html: str) -> None:
+        """走査器の抽出結果（または例外）が `html.parser` と同一であること."""
+        self.assertEqual(
+            _extract(html, EXTRACTOR_SCANNER), _extract(html, EXTRACTOR_HTMLPARSER), repr(html)
+        )
+
+    def test_missing_private_name_fails_only_for_scanner(self) -> None:
+        """走査器の非公開名が無い場合、`scanner` のみが名前を示して `RuntimeError`."""
+        _scanner_patterns.cache_clear()
+        self.addCleanup(_scanner_patterns.cache_clear)
+        html = "<script>a</script><style>b</style>"
+        with patch.object(_markupbase, "_declname_match", new=None):
+            del _markupbase._declname_match
+            self.assertEqual(extract_inline_contents(html).scripts, ("a",))
+            CspPipeline({}, "d.cloudfront.net", EXTRACTOR_HTMLPARSER)
+            with self.assertRaisesRegex(RuntimeError, "_markupbase._declname_match"):
+                extract_inline_contents(html, EXTRACTOR_SCANNER)
+            with self.assertRaises(RuntimeError):
+                CspPipeline({}, "d.cloudfront.net", EXTRACTOR_SCANNER)
+
+    def test_unknown_extractor_fails(self) -> None:
+        """未知の抽出バックエンドは `ValueError`（フォールバック禁止）."""
+        with self.assertRaises(ValueError):
+            extract_inline_contents("<script>a</script>", "regex")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,17 @@
          が 4 項目のみで構成され、ハニーポットフィールドを属性として保持しない
          こと、(c) `ContactPayload` の型が 4 項目のみを持つことを検証する。
 
+    3. `render_static --jobs N`（プロセスプール）の成果物が逐次実行と同一であり、
+       1 言語の失敗で失敗言語を明示して何も書き出さないこと。
+
+    4. `render_static` が各言語ページの HTML を 1 度だけ解析し（ルート・統一 CSP は
+       算出済みのハッシュを再利用する）、統一 CSP が全ページのハッシュを含むこと。
+
+    5. `render_static --cache-dir DIR`（増分ビルド）が入力の指紋の一致する言語の
+       キャッシュを再利用し、出力が全言語の再レンダリングとバイト単位で同一で
+       あること。カタログの変更は当該言語のみを、`--force` は全言語を再レンダリング
+       すること。
+
 テスト方針（出典: design.md「Testing Strategy > 単体/例ベーステスト」、
 兄弟テスト portfolio/tests/test_regression.py の SimpleTestCase 様式）:
     - DB を要しないため `SimpleTestCase` を用いる。
@@ -42,7 +53,12 @@
 
 from __future__ import annotations
 
+import _markupbase
 import dataclasses
+import io
+import json
+import struct
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -54,7 +70,9 @@ from django.utils import translation
 
 from contact_function.domain.contact_payload import ContactPayload
 from contact_function.domain.ports import ConfigProvider, EmailSender
+from contact_function.form_token import FormTokenVerifier
 from contact_function.handler import handle_contact_request
+from portfolio.management.commands import _csp_hash
 
 # 失敗を注入する対象言語（settings.LANGUAGES の中間言語を選び、先行言語が
 # 成功済みでも部分出力が書き出されないことを確認する。出典: base.py LANGUAGES
@@ -221,6 +239,306 @@ class RenderStaticBuildInterruptionTests(SimpleTestCase):
             )
 
 
+class RenderStaticFormTokenTests(SimpleTestCase):
+    """`render_static` のフォームトークン埋め込みを検証する."""
+
+    def _render(self, key: str) -> tuple[list[object], dict]:
+        """描画関数を記録用に差し替えてコマンドを実行し、渡された文脈とマニフェストを返す."""
+        contexts: list[object] = []
+
+        def _record(template_name, context=None, *args, **kwargs):
+            contexts.append(context["form_token"])
+            return _DUMMY_HTML
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with override_settings(
+                STATIC_ROOT=temp_dir,
+                AWS_S3_CUSTOM_DOMAIN=_TEST_CLOUDFRONT_DOMAIN,
+                CONTACT_FORM_TOKEN_KEY=key,
+            ):
+                with patch(
+                    "portfolio.management.commands.render_static.render_to_string",
+                    side_effect=_record,
+                ):
+                    call_command("render_static", stdout=io.StringIO())
+            manifest = json.loads(
+                (Path(temp_dir) / "prerender_manifest.json").read_text(encoding="utf-8")
+            )
+        return contexts, manifest
+
+    def test_one_signed_token_is_shared_by_all_languages(self) -> None:
+        """鍵を設定した場合、全言語へ同じ署名付きトークンを渡し発行情報を記録すること."""
+        contexts, manifest = self._render("build-key")
+        self.assertEqual(len(set(contexts)), 1)
+        token = contexts[0]
+        record = manifest["form_token"]
+        self.assertEqual(token.split(".")[1:3], [str(record["issued_at"]), record["nonce"]])
+        # Contact_Function が同じ鍵で検証できること（署名・有効期限）。
+        verifier = FormTokenVerifier(b"build-key", 60.0, 0.0)
+        verifier.check(token, "0")
+
+    def test_token_is_omitted_without_key(self) -> None:
+        """鍵が未設定の場合はトークンを埋め込まないこと."""
+        contexts, manifest = self._render("")
+        self.assertEqual(set(contexts), {None})
+        self.assertIsNone(manifest["form_token"])
+
+
+def _render_language_marked_html(template_name, context=None, *args, **kwargs):
+    """言語ごとに異なるインライン script を含む HTML を返す `render_to_string` 差替関数.
+
+    ページごとの CSP ハッシュが言語で異なるため、並列時の結果の並び順の誤りを
+    マニフェスト・統一 CSP の差分として検出できる。
+    """
+    language = translation.get_language()
+    return (
+        "<!doctype html><html><head><script>var lang = '{lang}';</script></head>"
+        "<body>{lang}</body></html>".format(lang=language)
+    )
+
+
+class RenderStaticParallelTests(SimpleTestCase):
+    """`render_static --jobs N`（プロセスプールでの言語別レンダリング）を検証する.
+
+    差替関数・設定の上書きはワーカープロセスへ `fork` で引き継がれる
+    （出典: render_static._pool_context）。
+    """
+
+    def _build(self, output_root: Path, *args: str) -> dict[str, str]:
+        """コマンドを実行し、出力ファイルの相対パス → 内容を返す."""
+        with override_settings(
+            STATIC_ROOT=str(output_root),
+            AWS_S3_CUSTOM_DOMAIN=_TEST_CLOUDFRONT_DOMAIN,
+            CONTACT_FORM_TOKEN_KEY="",
+        ):
+            call_command("render_static", *args, stdout=io.StringIO())
+        return {
+            str(path.relative_to(output_root)): path.read_text(encoding="utf-8")
+            for path in sorted(output_root.rglob("*"))
+            if path.is_file()
+        }
+
+    def test_parallel_output_matches_serial(self) -> None:
+        """`--jobs 3` の成果物（HTML・マニフェスト・統一 CSP）が逐次実行と同一であること."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "portfolio.management.commands.render_static.render_to_string",
+                side_effect=_render_language_marked_html,
+            ):
+                serial = self._build(Path(temp_dir) / "serial")
+                parallel = self._build(Path(temp_dir) / "parallel", "--jobs", "3")
+        self.assertEqual(parallel, serial)
+        manifest = json.loads(serial["prerender_manifest.json"])
+        self.assertEqual(
+            [page["language"] for page in manifest["pages"][:-1]], manifest["languages"]
+        )
+
+    def test_parallel_failure_names_language_without_partial_output(self) -> None:
+        """`--jobs` 指定時も 1 言語の失敗で中断し、失敗言語を明示し何も書き出さないこと.
+
+        Validates: Requirements 3.6
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_root = Path(temp_dir)
+            with patch(
+                "portfolio.management.commands.render_static.render_to_string",
+                side_effect=_make_render_side_effect(_FAILING_LANGUAGE),
+            ):
+                with self.assertRaises(CommandError) as raised:
+                    self._build(output_root, "--jobs", "4")
+            self.assertIn(f"'{_FAILING_LANGUAGE}'", str(raised.exception))
+            self.assertEqual([p for p in output_root.rglob("*") if p.is_file()], [])
+
+    def test_scanner_extractor_output_matches_default(self) -> None:
+        """`--html-extractor scanner`（並列時を含む）の成果物が既定の抽出方式と同一であること."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "portfolio.management.commands.render_static.render_to_string",
+                side_effect=_render_language_marked_html,
+            ):
+                default = self._build(Path(temp_dir) / "default")
+                scanner = self._build(
+                    Path(temp_dir) / "scanner", "--html-extractor", "scanner", "--jobs", "2"
+                )
+        self.assertEqual(scanner, default)
+
+    def test_scanner_without_private_names_fails_only_when_selected(self) -> None:
+        """走査器の非公開名が無い Python では `scanner` のみ `CommandError` となること."""
+        _csp_hash._scanner_patterns.cache_clear()
+        self.addCleanup(_csp_hash._scanner_patterns.cache_clear)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch(
+                "portfolio.management.commands.render_static.render_to_string",
+                side_effect=_render_language_marked_html,
+            ), patch.object(_markupbase, "_declname_match", new=None):
+                del _markupbase._declname_match
+                self.assertIn("index.html", self._build(Path(temp_dir) / "default"))
+                with self.assertRaises(CommandError) as raised:
+                    self._build(Path(temp_dir) / "scanner", "--html-extractor", "scanner")
+            self.assertFalse((Path(temp_dir) / "scanner").exists())
+        self.assertIn("_markupbase._declname_match", str(raised.exception))
+
+    def test_jobs_below_one_is_rejected(self) -> None:
+        """`--jobs 0` は補正せず `CommandError` で失敗すること."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(CommandError):
+                self._build(Path(temp_dir), "--jobs", "0")
+
+
+class RenderStaticCspParseTests(SimpleTestCase):
+    """`render_static` が各言語ページの HTML を 1 度だけ解析することを検証する."""
+
+    def test_full_build_parses_each_language_page_once(self) -> None:
+        """7 言語の全ビルドで HTML の解析は 7 回（ルート・統一 CSP は再解析しない）."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with override_settings(
+                STATIC_ROOT=temp_dir, AWS_S3_CUSTOM_DOMAIN=_TEST_CLOUDFRONT_DOMAIN
+            ):
+                with patch(
+                    "portfolio.management.commands.render_static.render_to_string",
+                    side_effect=_render_language_marked_html,
+                ), patch(
+                    "portfolio.management.commands._csp_hash.extract_inline_contents",
+                    wraps=_csp_hash.extract_inline_contents,
+                ) as extract:
+                    call_command("render_static", stdout=io.StringIO())
+            manifest = json.loads(
+                (Path(temp_dir) / "prerender_manifest.json").read_text(encoding="utf-8")
+            )
+        self.assertEqual(extract.call_count, 7)
+        root = manifest["pages"][-1]
+        default = manifest["pages"][manifest["languages"].index(manifest["default_language"])]
+        self.assertEqual(
+            {**root, "path": default["path"], "role": default["role"]}, default
+        )
+        for entry in manifest["pages"]:
+            self.assertIn(entry["inline_script_hashes"][0], manifest["content_security_policy"])
+
+
+def _render_with_token(template_name, context=None, *args, **kwargs):
+    """言語別のインライン script と、属性に埋め込んだフォームトークンを含む HTML を返す."""
+    return (
+        "<!doctype html><html><head><script>var lang = '{lang}';</script></head>"
+        '<body><input type="hidden" value="{token}"></body></html>'.format(
+            lang=translation.get_language(), token=context["form_token"]
+        )
+    )
+
+
+class RenderStaticBuildCacheTests(SimpleTestCase):
+    """`render_static --cache-dir`（入力の指紋による増分ビルド）を検証する."""
+
+    def setUp(self) -> None:
+        """出力先・キャッシュ・ロケールを一時ディレクトリに置き、トークンの発行を固定する."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.locale_dir = self.root / "locale"
+        self.cache_dir = self.root / "cache"
+        for patcher in (
+            patch("time.time", return_value=1_700_000_000.0),
+            patch("secrets.token_urlsafe", return_value="fixed-nonce"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _build(self, name: str, *args: str, render=_render_with_token) -> tuple[dict, list, str]:
+        """コマンドを実行し、出力ファイル・描画した言語・標準出力を返す."""
+        output_root = self.root / name
+        rendered: list[str] = []
+
+        def _record(template_name, context=None, *a, **kw):
+            rendered.append(translation.get_language())
+            return render(template_name, context)
+
+        stdout = io.StringIO()
+        with override_settings(
+            STATIC_ROOT=str(output_root),
+            AWS_S3_CUSTOM_DOMAIN=_TEST_CLOUDFRONT_DOMAIN,
+            CONTACT_FORM_TOKEN_KEY="build-key",
+            LOCALE_PATHS=[str(self.locale_dir)],
+        ):
+            with patch(
+                "portfolio.management.commands.render_static.render_to_string",
+                side_effect=_record,
+            ):
+                call_command("render_static", *args, stdout=stdout)
+        files = {
+            str(path.relative_to(output_root)): path.read_bytes()
+            for path in output_root.rglob("*")
+            if path.is_file()
+        }
+        return files, rendered, stdout.getvalue()
+
+    def test_unchanged_inputs_reuse_cache_with_identical_output(self) -> None:
+        """2 回目は全言語をキャッシュから再利用し、出力が全言語の再レンダリングと同一."""
+        full, _, _ = self._build("full")
+        first, first_rendered, _ = self._build("first", "--cache-dir", str(self.cache_dir))
+        second, second_rendered, report = self._build(
+            "second", "--cache-dir", str(self.cache_dir)
+        )
+        self.assertEqual(len(first_rendered), 7)
+        self.assertEqual(second_rendered, [])
+        self.assertIn("Rebuilt pages: (none)", report)
+        self.assertEqual(first, full)
+        self.assertEqual(second, full)
+        self.assertNotIn(b"__render_static_form_token__", b"".join(second.values()))
+
+    def test_catalog_change_rebuilds_only_that_language(self) -> None:
+        """1 言語のコンパイル済みカタログの変更は当該言語のみを再レンダリングする."""
+        self._build("first", "--cache-dir", str(self.cache_dir))
+        catalog = self.locale_dir / "fr" / "LC_MESSAGES" / "django.mo"
+        catalog.parent.mkdir(parents=True)
+        # 項目を持たない有効な GNU gettext カタログ（マジック・版・件数・各オフセット）。
+        catalog.write_bytes(struct.pack("<7I", 0x950412DE, 0, 0, 28, 28, 0, 28))
+        _, rendered, report = self._build("second", "--cache-dir", str(self.cache_dir))
+        self.assertEqual(rendered, ["fr"])
+        self.assertIn("Rebuilt pages: fr;", report)
+
+    def test_urlconf_change_rebuilds_every_language(self) -> None:
+        """URLconf の変更（`{% url %}` の解決先）は全言語を再レンダリングする."""
+        package = self.root / "urlconf_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("", encoding="utf-8")
+        urls = package / "urls.py"
+        routes = (
+            "from django.urls import include, path\n"
+            "urlpatterns = [path('{prefix}/', include('portfolio.urls'))]\n"
+        )
+        urls.write_text(routes.format(prefix="portfolio"), encoding="utf-8")
+        sys.path.insert(0, str(self.root))
+        self.addCleanup(sys.path.remove, str(self.root))
+        self.addCleanup(sys.modules.pop, "urlconf_pkg.urls", None)
+        self.addCleanup(sys.modules.pop, "urlconf_pkg", None)
+        with override_settings(ROOT_URLCONF="urlconf_pkg.urls"):
+            self._build("first", "--cache-dir", str(self.cache_dir))
+            _, unchanged, _ = self._build("second", "--cache-dir", str(self.cache_dir))
+            urls.write_text(routes.format(prefix="works"), encoding="utf-8")
+            _, rendered, _ = self._build("third", "--cache-dir", str(self.cache_dir))
+        self.assertEqual(unchanged, [])
+        self.assertEqual(len(rendered), 7)
+
+    def test_force_bypasses_cache(self) -> None:
+        """`--force` はキャッシュを読まずに全言語をレンダリングする."""
+        self._build("first", "--cache-dir", str(self.cache_dir))
+        _, rendered, _ = self._build(
+            "second", "--cache-dir", str(self.cache_dir), "--force"
+        )
+        self.assertEqual(len(rendered), 7)
+
+    def test_token_inside_inline_script_is_rejected(self) -> None:
+        """トークンがインライン script に現れるページは増分ビルドせず失敗する."""
+
+        def _inline_token(template_name, context=None):
+            return "<html><head><script>var t = '{0}';</script></head></html>".format(
+                context["form_token"]
+            )
+
+        with self.assertRaises(CommandError):
+            self._build("first", "--cache-dir", str(self.cache_dir), render=_inline_token)
+        self.assertFalse(self.cache_dir.exists())
+
+
 class HoneypotNotCollectedTests(SimpleTestCase):
     """ハニーポット隠しフィールドが 4 項目に含まれず送信内容化しないことを検証する."""
 
@@ -0,0 +1,313 @@
+"""Contact_Function の最小デプロイ成果物を import 閉包から組み立てる.
+
+`template.yaml` の `ContactFunction` はかつて `CodeUri: ./`（リポジトリ全体）で
+あったため、Lambda の zip に Django・`portfolio` アプリ・静的画像・docs・tests が
+同梱されていた。本スクリプトはエントリモジュール（既定 `contact_function.handler` と
+`contact_function.worker`）から静的に import 閉包を求め、閉包に含まれるリポジトリ内
+モジュールだけを成果物ディレクトリへ配置し、サイズレポートを出力する。
+
+閉包の求め方:
+    - 各モジュールを標準ライブラリ `ast` で解析し、関数内の遅延 import を含む
+      すべての `import` / `from ... import` を辿る（相対 import も解決する）。
+    - 標準ライブラリ（`sys.stdlib_module_names`）は除外する。
+    - リポジトリ内に実体のあるモジュールは成果物に含め、親パッケージの
+      `__init__.py` も含める。
+    - それ以外（サードパーティ）は Lambda ランタイムが提供するもの
+      （`RUNTIME_PROVIDED`: boto3 / botocore）のみを許容する。
+
+失敗条件（フォールバック禁止。1 件でもあれば `ArtifactError` で中断する）:
+    - 閉包に `django`（および Django アプリ `portfolio` / 設定 `config`）が含まれる
+      （Django 非同梱、出典: requirements.md R4-1, R4-2）。
+    - ランタイム非提供のサードパーティ import が含まれる（同梱漏れで実行時に失敗するため）。
+    - エントリモジュールがリポジトリ内に存在しない。
+
+使い方（プロジェクトルートから）:
+    python -m scripts.build_contact_artifact
+    python -m scripts.build_contact_artifact --output-dir build/contact_function \\
+        --report build/contact_function_artifact_report.json
+
+外部依存: 標準ライブラリのみ（`ast` / `argparse` / `io` / `json` / `zipfile`）。
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import io
+import json
+import shutil
+import sys
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+# リポジトリルート（閉包の探索範囲）。
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+# 既定のエントリモジュール（`ContactFunction` / `ContactWorkerFunction` の Handler）。
+DEFAULT_ENTRY_MODULES: Final[tuple[str, ...]] = (
+    "contact_function.handler",
+    "contact_function.worker",
+)
+# 既定の成果物ディレクトリ（`template.yaml` の `ContactFunction.CodeUri`）。
+DEFAULT_OUTPUT_DIR: Final[Path] = REPO_ROOT / "build" / "contact_function"
+# Lambda の Python ランタイムが提供し、成果物に同梱しないサードパーティ。
+RUNTIME_PROVIDED: Final[frozenset[str]] = frozenset({"boto3", "botocore"})
+# 閉包に現れてはならないトップレベル名（Django 本体・Django アプリ・Django 設定）。
+FORBIDDEN_TOP_LEVEL: Final[frozenset[str]] = frozenset({"django", "portfolio", "config"})
+# zip の再現性のため全エントリに固定する更新時刻（zip 形式の最小値）。
+_ZIP_TIMESTAMP: Final[tuple[int, int, int, int, int, int]] = (1980, 1, 1, 0, 0, 0)
+
+
+class ArtifactError(Exception):
+    """成果物を安全に組み立てられないことを表す例外（Django 混入・同梱漏れ等）."""
+
+
+@dataclass(frozen=True)
+class ImportClosure:
+    """エントリモジュールからの import 閉包.
+
+    Attributes:
+        files: 成果物に含めるリポジトリ内ファイル（リポジトリルートからの相対パス、昇順）。
+        runtime_provided: 閉包が参照するランタイム提供のサードパーティ（昇順）。
+        stdlib: 閉包が参照する標準ライブラリのトップレベル名（昇順）。
+    """
+
+    files: tuple[Path, ...]
+    runtime_provided: tuple[str, ...]
+    stdlib: tuple[str, ...]
+
+
+def _module_file(module: str, root: Path) -> Path | None:
+    """モジュール名に対応するリポジトリ内のファイルを返す（無ければ None）."""
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _resolve_relative(module: str | None, level: int, current: str, is_package: bool) -> str:
+    """相対 import（`from .x import y`）を絶対モジュール名へ解決する."""
+    package_parts = current.split(".") if is_package else current.split(".")[:-1]
+    if level > 1:
+        package_parts = package_parts[: -(level - 1)]
+    base = ".".join(package_parts)
+    return f"{base}.{module}" if module else base
+
+
+def _imported_modules(path: Path, current: str) -> list[tuple[str, int]]:
+    """ファイル内のすべての import 対象を（モジュール名, 行番号）で返す.
+
+    `from pkg import name` は `pkg.name` がモジュールである可能性があるため、
+    `pkg` と `pkg.name` の両方を候補として返す（実在判定は呼び出し元で行う）。
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    is_package = path.name == "__init__.py"
+    found: list[tuple[str, int]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.extend((alias.name, node.lineno) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = _resolve_relative(node.module, node.level, current, is_package)
+            else:
+                base = node.module or ""
+            found.append((base, node.lineno))
+            found.extend(
+                (f"{base}.{alias.name}", node.lineno)
+                for alias in node.names
+                if alias.name != "*"
+            )
+    return found
+
+
+def compute_import_closure(
+    entry_modules: tuple[str, ...] = DEFAULT_ENTRY_MODULES, root: Path = REPO_ROOT
+) -> ImportClosure:
+    """エントリモジュールから静的な import 閉包を求める.
+
+    Args:
+        entry_modules: 起点となるモジュール名。
+        root: リポジトリルート。
+
+    Returns:
+        ImportClosure: 成果物に含めるファイルと参照する外部モジュール。
+
+    Raises:
+        ArtifactError: エントリモジュールが存在しない、Django が混入した、または
+            ランタイム非提供のサードパーティ import がある場合（違反をすべて列挙する）。
+    """
+    files: set[Path] = set()
+    runtime_provided: set[str] = set()
+    stdlib: set[str] = set()
+    violations: list[str] = []
+    visited: set[str] = set()
+    queue: list[tuple[str, str]] = []
+
+    for entry in entry_modules:
+        if _module_file(entry, root) is None:
+            raise ArtifactError(f"エントリモジュール '{entry}' がリポジトリ内に存在しません。")
+        queue.append((entry, "<entry>"))
+
+    while queue:
+        module, origin = queue.pop()
+        if module in visited:
+            continue
+        visited.add(module)
+        top_level = module.split(".")[0]
+        if top_level in FORBIDDEN_TOP_LEVEL:
+            violations.append(f"禁止モジュール '{module}' を import しています（{origin}）")
+            continue
+        path = _module_file(module, root)
+        if path is None:
+            if top_level in sys.stdlib_module_names:
+                stdlib.add(top_level)
+            elif _module_file(top_level, root) is not None:
+                # `from pkg import name` の `name` が属性（関数・クラス）だった場合。
+                continue
+            elif top_level in RUNTIME_PROVIDED:
+                runtime_provided.add(top_level)
+            else:
+                violations.append(
+                    f"ランタイム非提供のモジュール '{module}' を import しています（{origin}）"
+                )
+            continue
+
+        # 親パッケージの `__init__.py` も import 時に実行されるため閉包に含める。
+        parts = module.split(".")
+        for depth in range(1, len(parts)):
+            queue.append((".".join(parts[:depth]), origin))
+        files.add(path.relative_to(root))
+        relative = path.relative_to(root).as_posix()
+        for imported, lineno in _imported_modules(path, module):
+            if imported:
+                queue.append((imported, f"{relative}:{lineno}"))
+
+    if violations:
+        raise ArtifactError(
+            "Contact_Function の import 閉包に同梱できないモジュールがあります:\n  "
+            + "\n  ".join(sorted(violations))
+        )
+    return ImportClosure(
+        files=tuple(sorted(files)),
+        runtime_provided=tuple(sorted(runtime_provided)),
+        stdlib=tuple(sorted(stdlib)),
+    )
+
+
+def build_zip_bytes(files: tuple[Path, ...], root: Path = REPO_ROOT) -> bytes:
+    """閉包のファイルを再現可能な zip（固定時刻・昇順）として組み立てる.
+
+    Args:
+        files: リポジトリルートからの相対パス。
+        root: リポジトリルート。
+
+    Returns:
+        bytes: zip の内容。
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for relative in sorted(files):
+            info = zipfile.ZipInfo(relative.as_posix(), date_time=_ZIP_TIMESTAMP)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, (root / relative).read_bytes())
+    return buffer.getvalue()
+
+
+def build_artifact(
+    output_dir: Path,
+    entry_modules: tuple[str, ...] = DEFAULT_ENTRY_MODULES,
+    root: Path = REPO_ROOT,
+) -> dict[str, object]:
+    """成果物ディレクトリを作り直し、サイズレポートを返す.
+
+    Args:
+        output_dir: 成果物ディレクトリ（既存の内容は削除して作り直す）。
+        entry_modules: 起点となるモジュール名。
+        root: リポジトリルート。
+
+    Returns:
+        dict[str, object]: ファイルごとのサイズ・合計・zip サイズを含むレポート。
+
+    Raises:
+        ArtifactError: 閉包の計算に失敗した場合（成果物は作成しない）。
+    """
+    closure = compute_import_closure(entry_modules, root)
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    for relative in closure.files:
+        destination = output_dir / relative
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(root / relative, destination)
+
+    sizes = {relative.as_posix(): (root / relative).stat().st_size for relative in closure.files}
+    return {
+        "entry_modules": list(entry_modules),
+        "file_count": len(sizes),
+        "total_bytes": sum(sizes.values()),
+        "zip_bytes": len(build_zip_bytes(closure.files, root)),
+        "files": sizes,
+        "runtime_provided": list(closure.runtime_provided),
+        "stdlib": list(closure.stdlib),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI エントリポイント（成果物の組み立てとサイズレポート出力）.
+
+    Args:
+        argv: コマンドライン引数（省略時は `sys.argv[1:]` を使用）。
+
+    Returns:
+        int: 終了コード（0=成功、1=Django 混入・同梱漏れ等で中断）。
+    """
+    parser = argparse.ArgumentParser(
+        prog="build_contact_artifact",
+        description="Contact_Function の import 閉包から最小デプロイ成果物を組み立てる。",
+    )
+    parser.add_argument(
+        "--entry",
+        action="append",
+        default=None,
+        help="起点モジュール（複数指定可、既定 contact_function.handler と contact_function.worker）。",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=DEFAULT_OUTPUT_DIR,
+        help="成果物ディレクトリ（template.yaml の CodeUri）。",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="サイズレポート（JSON）の出力先。",
+    )
+    args = parser.parse_args(argv)
+    entry_modules = tuple(args.entry) if args.entry else DEFAULT_ENTRY_MODULES
+
+    try:
+        report = build_artifact(args.output_dir, entry_modules)
+    except ArtifactError as error:
+        print(f"[contact-artifact] {error}", file=sys.stderr)
+        return 1
+
+    if args.report is not None:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    print(
+        f"[contact-artifact] {report['file_count']} ファイル、"
+        f"{report['total_bytes']} bytes（zip {report['zip_bytes']} bytes）を "
+        f"{args.output_dir} に配置しました。"
+        f"ランタイム提供: {', '.join(report['runtime_provided']) or 'なし'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    # プロジェクトルートから `python -m scripts.build_contact_artifact` 実行。
+    raise SystemExit(main())
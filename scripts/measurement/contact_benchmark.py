@@ -0,0 +1,463 @@
+"""Contact_Function のホットパスのプロセス内マイクロベンチマーク.
+
+Lambda の実行時間（課金時間）のうち、ウォーム呼び出しで自前のコードが費やす部分
+（ヘッダ正規化・Origin 判定・ボディ解析・入力検証・応答生成）を、AWS への往復を
+除いて計測する。設定値プロバイダ・メール送信アダプタは固定値を返すスタブに
+置き換えるため、ネットワーク・認証情報なしにオフラインで再現できる。
+
+シナリオ（`SCENARIOS`）:
+    - `post_form`: リポジトリ直下の `event.json`（API Gateway プロキシ統合の
+      サンプルイベント）のヘッダ一式に、許可 Origin と form-encoded の正当な
+      4 項目を載せた POST（`handle_contact_request` 全体）。
+    - `post_base64_json`: 同じヘッダに Base64 符号化した JSON ボディを載せた POST。
+    - `preflight`: 許可 Origin からの OPTIONS。
+    - `rejected_origin`: 許可外 Origin からの POST（ボディを解析せずに拒否）。
+    - `parse_body`: Base64 符号化した JSON ボディの解析（`body_parser.parse_body`）。
+    - `validate_contact_input`: 正当な 4 項目の入力検証。
+    - `result_to_response`: 成功結果の HTTP 応答への変換（`handler._result_to_response`）。
+
+計測方法:
+    - 各シナリオを `warmup` 回実行した後、`inner` 回の連続実行を 1 サンプルとして
+      `rounds` サンプルを `time.perf_counter_ns` で計測する。1 回あたりの所要時間の
+      サンプル列から最近接順位法で p50 / p95 / p99 を求め（出典:
+      `scripts/measurement/cold_start_protocol.py` `percentile_nearest_rank`）、
+      総実行回数 / 総所要時間を ops/sec とする。
+    - 拒否のログ出力は I/O の費用であり自前の処理と切り分けるため、計測中は
+      `logging.disable` でログを無効化する。
+
+ベースラインと退行判定:
+    - `--update-baseline` で計測結果をベースライン
+      （`scripts/measurement/contact_benchmark_baseline.json`）へ保存する。
+    - `--check` はベースラインと比較し、ops/sec が許容幅（既定 25%、ベースラインの
+      `tolerance` または `--tolerance`）を超えて低下したシナリオがあれば終了コード 1
+      とする。計測値は実行環境（CPU・Python 版）に依存するため、ベースラインには
+      Python 版を記録し、比較は同じ環境で更新したベースラインに対して行う。
+
+使い方（プロジェクトルートから）:
+    python -m scripts.measurement.contact_benchmark
+    python -m scripts.measurement.contact_benchmark --check
+    python -m scripts.measurement.contact_benchmark --update-baseline
+    python -m scripts.measurement.contact_benchmark --scenario post_form --rounds 50
+
+外部依存: 標準ライブラリのみ。シナリオの期待ステータスと異なる応答は計測対象の
+取り違えであるため、推測補完せず `RuntimeError` で明示的に失敗させる（フォールバック禁止）。
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+from urllib.parse import urlencode
+
+from contact_function import handler, responses
+from contact_function.body_parser import parse_body
+from contact_function.domain.contact_payload import ContactPayload
+from contact_function.domain.ports import ConfigProvider, EmailSender
+from contact_function.domain.send_contact import Success
+from contact_function.domain.validators import validate_contact_input
+from scripts.measurement.cold_start_protocol import percentile_nearest_rank
+
+# リポジトリルート（`event.json` の配置先）。
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+# API Gateway プロキシ統合のサンプルイベント（ヘッダ一式の出典）。
+SAMPLE_EVENT_PATH: Final[Path] = REPO_ROOT / "event.json"
+# チェックイン済みのベースライン。
+DEFAULT_BASELINE_PATH: Final[Path] = Path(__file__).resolve().with_name(
+    "contact_benchmark_baseline.json"
+)
+# ベースラインに許容幅が無い場合の既定値（ops/sec の低下率）。
+DEFAULT_TOLERANCE: Final[float] = 0.25
+# 既定の計測回数。
+DEFAULT_WARMUP: Final[int] = 200
+DEFAULT_ROUNDS: Final[int] = 200
+DEFAULT_INNER: Final[int] = 50
+# レポートに載せるパーセンタイル。
+_PERCENTILES: Final[tuple[float, ...]] = (50.0, 95.0, 99.0)
+
+# スタブが返す設定値。
+_ALLOWED_ORIGIN: Final[str] = "https://serverless.portfolio.cobaemon.com"
+_REJECTED_ORIGIN: Final[str] = "https://attacker.example.net"
+_FROM_ADDRESS: Final[str] = "no-reply@example.com"
+_TO_ADDRESS: Final[str] = "owner@example.com"
+
+# 検証を通過する 4 項目（全シナリオで共通）。
+_VALID_FIELDS: Final[dict[str, str]] = {
+    "full_name": "山田 太郎",
+    "email": "taro@example.com",
+    "phone_number": "0312345678",
+    "message": "ポートフォリオを拝見しました。お仕事のご相談をさせてください。" * 4,
+}
+
+
+class StubConfigProvider(ConfigProvider):
+    """固定の設定値を返す設定プロバイダ（Parameter Store を呼ばない）."""
+
+    def get_from_address(self) -> str:
+        """送信元アドレスを返す."""
+        return _FROM_ADDRESS
+
+    def get_to_address(self) -> str:
+        """宛先アドレスを返す."""
+        return _TO_ADDRESS
+
+    def get_allowed_origins(self) -> tuple[str, ...]:
+        """許可 Origin を返す."""
+        return (_ALLOWED_ORIGIN,)
+
+
+class NullEmailSender(EmailSender):
+    """何も送信しないメール送信アダプタ（SES を呼ばない）."""
+
+    def send(self, payload: ContactPayload, from_addr: str, to_addr: str) -> str | None:
+        """送信を省略して同期送信の成功（None）を返す."""
+        return None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """1 つの計測シナリオ.
+
+    Attributes:
+        name: シナリオ名（ベースラインのキー）。
+        run: 1 回分の処理を実行する関数。
+        expected_status: 応答を返すシナリオの期待ステータス（応答を返さない場合は None）。
+    """
+
+    name: str
+    run: Callable[[], object]
+    expected_status: int | None = None
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """1 シナリオの計測結果.
+
+    Attributes:
+        name: シナリオ名。
+        operations: 計測した総実行回数。
+        ops_per_sec: 1 秒あたりの実行回数。
+        percentiles_us: パーセンタイル（`p50` 等）→ 1 回あたりの所要時間（マイクロ秒）。
+    """
+
+    name: str
+    operations: int
+    ops_per_sec: float
+    percentiles_us: dict[str, float]
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON 出力用の辞書へ変換する."""
+        return {
+            "operations": self.operations,
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            **{name: round(value, 3) for name, value in self.percentiles_us.items()},
+        }
+
+
+def _sample_event(
+    method: str, origin: str, body: str | None, content_type: str, is_base64: bool
+) -> dict[str, object]:
+    """`event.json` のヘッダ一式を用いた API Gateway プロキシ統合イベントを返す."""
+    event = json.loads(SAMPLE_EVENT_PATH.read_text(encoding="utf-8"))
+    event["httpMethod"] = method
+    event["headers"] = {**event["headers"], "Origin": origin, "Content-Type": content_type}
+    event["body"] = body
+    event["isBase64Encoded"] = is_base64
+    return event
+
+
+def _base64_json_body() -> str:
+    """正当な 4 項目の JSON を Base64 符号化したボディを返す."""
+    return base64.b64encode(json.dumps(_VALID_FIELDS).encode("utf-8")).decode("ascii")
+
+
+def build_scenarios() -> tuple[Scenario, ...]:
+    """全シナリオを組み立てる（イベント・スタブは計測の外で 1 度だけ生成する）.
+
+    Returns:
+        tuple[Scenario, ...]: シナリオ（`SCENARIOS` の順）。
+    """
+    config_provider = StubConfigProvider()
+    email_sender = NullEmailSender()
+    form = "application/x-www-form-urlencoded"
+    json_type = "application/json"
+    post_form = _sample_event("POST", _ALLOWED_ORIGIN, urlencode(_VALID_FIELDS), form, False)
+    post_json = _sample_event("POST", _ALLOWED_ORIGIN, _base64_json_body(), json_type, True)
+    preflight = _sample_event("OPTIONS", _ALLOWED_ORIGIN, None, form, False)
+    rejected = _sample_event("POST", _REJECTED_ORIGIN, urlencode(_VALID_FIELDS), form, False)
+    base64_body = _base64_json_body()
+    table = responses.ResponseTableCache().get((_ALLOWED_ORIGIN,))
+    success = Success()
+
+    def request(event: dict[str, object]) -> Callable[[], object]:
+        """イベントを `handle_contact_request` へ渡す関数を返す."""
+        return lambda: handler.handle_contact_request(event, config_provider, email_sender)
+
+    return (
+        Scenario("post_form", request(post_form), 200),
+        Scenario("post_base64_json", request(post_json), 200),
+        Scenario("preflight", request(preflight), 204),
+        Scenario("rejected_origin", request(rejected), 403),
+        Scenario("parse_body", lambda: parse_body(base64_body, True, json_type)),
+        Scenario("validate_contact_input", lambda: validate_contact_input(_VALID_FIELDS)),
+        Scenario(
+            "result_to_response",
+            lambda: handler._result_to_response(success, table, _ALLOWED_ORIGIN),
+            200,
+        ),
+    )
+
+
+# シナリオ名（表示・ベースラインの順序）。
+SCENARIOS: Final[tuple[str, ...]] = tuple(scenario.name for scenario in build_scenarios())
+
+
+def check_scenario(scenario: Scenario) -> None:
+    """シナリオを 1 回実行し、期待した経路を通ることを確かめる.
+
+    Raises:
+        RuntimeError: 応答のステータスが期待と異なる場合（計測対象の取り違え）。
+    """
+    result = scenario.run()
+    if scenario.expected_status is None:
+        return
+    status = result.get("statusCode") if isinstance(result, dict) else None
+    if status != scenario.expected_status:
+        raise RuntimeError(
+            f"シナリオ '{scenario.name}' の応答ステータスが {status} です"
+            f"（期待値 {scenario.expected_status}）。"
+        )
+
+
+def summarize(name: str, per_op_ns: list[float], inner: int) -> ScenarioResult:
+    """1 回あたりの所要時間（ナノ秒）のサンプル列から計測結果を組み立てる.
+
+    Args:
+        name: シナリオ名。
+        per_op_ns: サンプルごとの 1 回あたりの所要時間（ナノ秒）。
+        inner: 1 サンプルあたりの実行回数。
+
+    Returns:
+        ScenarioResult: ops/sec とパーセンタイル。
+
+    Raises:
+        ValueError: サンプルが空、または所要時間の合計が 0 の場合。
+    """
+    if not per_op_ns:
+        raise ValueError(f"シナリオ '{name}' のサンプルが 1 件もありません。")
+    total_ns = sum(per_op_ns) * inner
+    if total_ns <= 0:
+        raise ValueError(f"シナリオ '{name}' の所要時間の合計が 0 です。")
+    operations = len(per_op_ns) * inner
+    return ScenarioResult(
+        name=name,
+        operations=operations,
+        ops_per_sec=operations / (total_ns / 1e9),
+        percentiles_us={
+            f"p{int(percentile)}_us": percentile_nearest_rank(per_op_ns, percentile) / 1000.0
+            for percentile in _PERCENTILES
+        },
+    )
+
+
+def measure(
+    scenario: Scenario,
+    warmup: int = DEFAULT_WARMUP,
+    rounds: int = DEFAULT_ROUNDS,
+    inner: int = DEFAULT_INNER,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> ScenarioResult:
+    """シナリオを計測する（計測中はログ出力を無効化する）.
+
+    Args:
+        scenario: 計測するシナリオ。
+        warmup: 計測前の実行回数。
+        rounds: サンプル数。
+        inner: 1 サンプルあたりの実行回数。
+        clock: ナノ秒の単調時計（テスト用に注入可能）。
+
+    Returns:
+        ScenarioResult: 計測結果。
+
+    Raises:
+        ValueError: `rounds` / `inner` が 1 未満の場合。
+        RuntimeError: シナリオが期待した経路を通らない場合。
+    """
+    if rounds < 1 or inner < 1:
+        raise ValueError("rounds と inner は 1 以上である必要があります。")
+    run = scenario.run
+    logging.disable(logging.CRITICAL)
+    try:
+        check_scenario(scenario)
+        for _ in range(warmup):
+            run()
+        samples: list[float] = []
+        for _ in range(rounds):
+            started = clock()
+            for _ in range(inner):
+                run()
+            samples.append((clock() - started) / inner)
+    finally:
+        logging.disable(logging.NOTSET)
+    return summarize(scenario.name, samples, inner)
+
+
+def find_regressions(
+    results: dict[str, dict[str, object]],
+    baseline: dict[str, dict[str, object]],
+    tolerance: float,
+) -> list[str]:
+    """ベースラインより ops/sec が許容幅を超えて低下したシナリオを返す.
+
+    ベースラインに無いシナリオは比較しない（新規シナリオ）。
+
+    Args:
+        results: シナリオ名 → 計測結果（`ScenarioResult.to_dict`）。
+        baseline: シナリオ名 → ベースラインの計測結果。
+        tolerance: 許容する低下率（0〜1）。
+
+    Returns:
+        list[str]: 退行の説明（シナリオ順）。
+
+    Raises:
+        ValueError: 許容幅が 0〜1 の範囲外の場合。
+    """
+    if not 0.0 <= tolerance < 1.0:
+        raise ValueError("tolerance は 0 以上 1 未満である必要があります。")
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        current = float(result["ops_per_sec"])
+        expected = float(reference["ops_per_sec"])
+        if current < expected * (1.0 - tolerance):
+            regressions.append(
+                f"{name}: {current:.0f} ops/sec（ベースライン {expected:.0f}、"
+                f"{(1.0 - current / expected) * 100:.1f}% 低下）"
+            )
+    return regressions
+
+
+def load_baseline(path: Path) -> dict[str, object]:
+    """ベースライン（JSON）を読み込む.
+
+    Raises:
+        ValueError: `scenarios` の欠落・型不正の場合。
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("scenarios"), dict):
+        raise ValueError(f"ベースラインの形式が不正です: {path}")
+    return data
+
+
+def run_benchmarks(
+    names: tuple[str, ...], warmup: int, rounds: int, inner: int
+) -> dict[str, dict[str, object]]:
+    """指定シナリオを順に計測する.
+
+    Raises:
+        ValueError: 未知のシナリオ名が含まれる場合。
+    """
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        raise ValueError(f"未知のシナリオです: {', '.join(unknown)}")
+    return {
+        scenario.name: measure(scenario, warmup, rounds, inner).to_dict()
+        for scenario in build_scenarios()
+        if scenario.name in names
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI エントリポイント（計測・表示・ベースラインの更新と比較）.
+
+    Args:
+        argv: コマンドライン引数（省略時は `sys.argv[1:]` を使用）。
+
+    Returns:
+        int: 終了コード（0=退行なしまたは比較なし、1=`--check` 指定時の退行）。
+    """
+    parser = argparse.ArgumentParser(
+        prog="contact_benchmark",
+        description="Contact_Function のホットパスをスタブ依存でプロセス内計測する。",
+    )
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="計測対象（複数可）。"
+    )
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="計測前の実行回数。")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="サンプル数。")
+    parser.add_argument("--inner", type=int, default=DEFAULT_INNER, help="1 サンプルの実行回数。")
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="ベースラインのパス。"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=None, help="許容する ops/sec の低下率（0〜1）。"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="レポート（JSON）の出力先。")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true", help="退行があれば終了コード 1。")
+    mode.add_argument(
+        "--update-baseline", action="store_true", help="計測結果をベースラインへ保存する。"
+    )
+    args = parser.parse_args(argv)
+
+    names = tuple(args.scenario) if args.scenario else SCENARIOS
+    results = run_benchmarks(names, args.warmup, args.rounds, args.inner)
+    report: dict[str, object] = {
+        "python_version": sys.version.split()[0],
+        "warmup": args.warmup,
+        "rounds": args.rounds,
+        "inner": args.inner,
+        "scenarios": results,
+    }
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['ops_per_sec']:>12,.0f} ops/sec"
+            f"  p50 {result['p50_us']:>9.2f} us  p95 {result['p95_us']:>9.2f} us"
+            f"  p99 {result['p99_us']:>9.2f} us"
+        )
+
+    exit_code = 0
+    if args.check:
+        baseline = load_baseline(args.baseline)
+        tolerance = (
+            args.tolerance
+            if args.tolerance is not None
+            else float(baseline.get("tolerance", DEFAULT_TOLERANCE))
+        )
+        regressions = find_regressions(results, baseline["scenarios"], tolerance)
+        report["baseline_python_version"] = baseline.get("python_version")
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(f"[benchmark] 退行: {regression}", file=sys.stderr)
+        exit_code = 1 if regressions else 0
+    elif args.update_baseline:
+        # 一部のシナリオのみを計測した場合は、既存のベースラインの他のシナリオを保持する。
+        previous = load_baseline(args.baseline)["scenarios"] if args.baseline.exists() else {}
+        baseline_data = {
+            **report,
+            "scenarios": {**previous, **results},
+            "tolerance": args.tolerance if args.tolerance is not None else DEFAULT_TOLERANCE,
+        }
+        args.baseline.write_text(
+            json.dumps(baseline_data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    return exit_code
+
+
+if __name__ == "__main__":
+    # プロジェクトルートから `python -m scripts.measurement.contact_benchmark` 実行。
+    raise SystemExit(main())
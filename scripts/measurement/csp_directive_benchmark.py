@@ -0,0 +1,260 @@
+"""CSP ディレクティブ組み立て（`_csp_hash`）のスケーリングベンチマーク.
+
+`render_static` の統一 CSP は全ページのインライン script/style のハッシュソースを
+含むため、ページ・インライン要素・言語が増えるとソースが数百〜数千件になる。
+本スクリプトは、インライン要素数 N（既定 10 / 1,000 / 10,000）ごとに、統一 CSP の
+組み立て（`CspPipeline.unified_header`: ページ順のハッシュ列の重複排除 →
+`build_csp_directives` → `render_csp_header_value`）の所要時間を計測する。
+
+比較対象:
+    - `current`: 現行の `_csp_hash`（順序付き集合による重複判定。線形時間）。
+    - `list_reference`: 従来のリストの所属判定（`if source not in bucket`）による
+      組み立てを本スクリプト内に再現したもの（二乗時間）。計測の前に、両者の
+      ヘッダ値がバイト単位で同一であることを確認する（不一致は `RuntimeError`）。
+
+入力:
+    - インライン要素 i の内容は `block {i}` とし、偶数番目を script、奇数番目を
+      style とする。各要素は 2 ページに現れる（ページ順の連結で重複が生じる）。
+    - 出典ディレクティブは `config/settings/base.py` と同じ構成（nonce を含む）。
+
+計測方法:
+    - 各 N・各実装について `rounds` 回の所要時間を `time.perf_counter_ns` で計測し、
+      中央値と、要素 1 件あたりの所要時間（マイクロ秒）を報告する。線形であれば
+      要素あたりの所要時間は N によらずほぼ一定になる。
+
+使い方（プロジェクトルートから）:
+    python -m scripts.measurement.csp_directive_benchmark
+    python -m scripts.measurement.csp_directive_benchmark --sizes 10 100 1000 --rounds 3
+    python -m scripts.measurement.csp_directive_benchmark --skip-reference --sizes 100000
+
+外部依存: 標準ライブラリと `_csp_hash`（Django 非依存）のみ。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Final
+
+from portfolio.management.commands._csp_hash import (
+    _CLOUDFRONT_DOMAIN_DIRECTIVES,
+    _SCRIPT_DIRECTIVES,
+    _STYLE_DIRECTIVES,
+    CspPipeline,
+    InlineHashes,
+    _strip_nonce,
+    hash_source,
+    render_csp_header_value,
+)
+
+# 既定のインライン要素数（要求どおり 10 / 1,000 / 10,000）。
+DEFAULT_SIZES: Final[tuple[int, ...]] = (10, 1_000, 10_000)
+DEFAULT_ROUNDS: Final[int] = 3
+CLOUDFRONT_DOMAIN: Final[str] = "static.example.com"
+
+# `config/settings/base.py` と同じ構成の出典ディレクティブ（nonce は文字列で代替）。
+_CDN_SOURCES: Final[tuple[str, ...]] = (
+    "https://use.fontawesome.com",
+    "https://cdn.jsdelivr.net",
+    "https://cdn.startbootstrap.com",
+)
+BASE_DIRECTIVES: Final[dict[str, tuple[str, ...]]] = {
+    "default-src": ("'self'", "https:"),
+    "script-src": ("'self'", *_CDN_SOURCES, "'nonce-benchmark'"),
+    "script-src-elem": ("'self'", *_CDN_SOURCES, "'nonce-benchmark'"),
+    "style-src": ("'self'", "https://fonts.googleapis.com", *_CDN_SOURCES, "'nonce-benchmark'"),
+    "style-src-elem": (
+        "'self'",
+        "https://fonts.googleapis.com",
+        *_CDN_SOURCES,
+        "'nonce-benchmark'",
+    ),
+    "font-src": ("'self'", "https://fonts.gstatic.com", "https://use.fontawesome.com"),
+    "img-src": ("'self'", "data:"),
+    "frame-ancestors": ("'none'",),
+}
+
+
+def page_hashes(blocks: int) -> list[InlineHashes]:
+    """インライン要素数 `blocks` の入力（2 ページ分のハッシュソース）を返す.
+
+    Args:
+        blocks: インライン要素の数（1 以上）。
+
+    Returns:
+        list[InlineHashes]: 各要素を 2 ページに含む、ページ順のハッシュソース集合。
+
+    Raises:
+        ValueError: `blocks` が 1 未満の場合。
+    """
+    if blocks < 1:
+        raise ValueError("インライン要素の数は 1 以上である必要があります。")
+    sources = [hash_source(f"block {index}") for index in range(blocks)]
+    page = InlineHashes(scripts=tuple(sources[0::2]), styles=tuple(sources[1::2]))
+    return [page, page]
+
+
+def build_current(pages: Sequence[InlineHashes]) -> str:
+    """現行の `_csp_hash` で統一 CSP ヘッダ値を組み立てる（`render_static` と同じ経路）."""
+    return CspPipeline(BASE_DIRECTIVES, CLOUDFRONT_DOMAIN).unified_header(pages)
+
+
+def _list_dedupe(values: Sequence[str]) -> list[str]:
+    """リストの所属判定による重複排除（従来の実装）."""
+    seen: list[str] = []
+    for value in values:
+        if value not in seen:
+            seen.append(value)
+    return seen
+
+
+def _list_directives(
+    base_directives: Mapping[str, Sequence[object]], cloudfront_domain: str, hashes: InlineHashes
+) -> dict[str, tuple[str, ...]]:
+    """リストの所属判定による `build_csp_directives`（従来の実装。検証は省略）."""
+    cloudfront_source = f"https://{cloudfront_domain}"
+    directives = {name: _strip_nonce(sources) for name, sources in base_directives.items()}
+    targets = (
+        (_CLOUDFRONT_DOMAIN_DIRECTIVES, (cloudfront_source,)),
+        (_SCRIPT_DIRECTIVES, hashes.scripts),
+        (_STYLE_DIRECTIVES, hashes.styles),
+    )
+    for names, sources in targets:
+        for name in names:
+            bucket = directives.setdefault(name, [])
+            for source in sources:
+                if source not in bucket:
+                    bucket.append(source)
+    return {name: tuple(sources) for name, sources in directives.items()}
+
+
+def build_list_reference(pages: Sequence[InlineHashes]) -> str:
+    """従来のリストの所属判定で統一 CSP ヘッダ値を組み立てる（比較対象）."""
+    scripts = _list_dedupe([source for page in pages for source in page.scripts])
+    styles = _list_dedupe([source for page in pages for source in page.styles])
+    directives = _list_directives(
+        BASE_DIRECTIVES, CLOUDFRONT_DOMAIN, InlineHashes(tuple(scripts), tuple(styles))
+    )
+    return render_csp_header_value(directives)
+
+
+# 実装名 → 組み立て関数。
+IMPLEMENTATIONS: Final[dict[str, Callable[[Sequence[InlineHashes]], str]]] = {
+    "current": build_current,
+    "list_reference": build_list_reference,
+}
+
+
+def measure(
+    build: Callable[[Sequence[InlineHashes]], str],
+    pages: Sequence[InlineHashes],
+    rounds: int = DEFAULT_ROUNDS,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> float:
+    """組み立ての所要時間の中央値（ナノ秒）を返す.
+
+    Args:
+        build: 組み立て関数。
+        pages: 入力のハッシュソース集合。
+        rounds: 計測回数（1 以上）。
+        clock: ナノ秒の時計（テスト用に注入可能）。
+
+    Returns:
+        float: 中央値の所要時間（ナノ秒）。
+
+    Raises:
+        ValueError: `rounds` が 1 未満の場合。
+    """
+    if rounds < 1:
+        raise ValueError("計測回数は 1 以上である必要があります。")
+    samples: list[int] = []
+    for _ in range(rounds):
+        started = clock()
+        build(pages)
+        samples.append(clock() - started)
+    return float(statistics.median(samples))
+
+
+def run_benchmark(
+    sizes: Sequence[int], rounds: int, implementations: Sequence[str]
+) -> list[dict[str, object]]:
+    """各インライン要素数について、出力の同一性を確認したうえで各実装を計測する.
+
+    Args:
+        sizes: インライン要素数の列。
+        rounds: 計測回数。
+        implementations: 計測する実装名（`IMPLEMENTATIONS` のキー）。
+
+    Returns:
+        list[dict[str, object]]: 要素数ごとのヘッダ長と、実装ごとの所要時間。
+
+    Raises:
+        RuntimeError: 実装間でヘッダ値が異なる場合。
+    """
+    rows: list[dict[str, object]] = []
+    for blocks in sizes:
+        pages = page_hashes(blocks)
+        header = build_current(pages)
+        results: dict[str, dict[str, float]] = {}
+        for name in implementations:
+            build = IMPLEMENTATIONS[name]
+            if build(pages) != header:
+                raise RuntimeError(f"ヘッダ値が current と異なります: {name} (N={blocks})")
+            median_ns = measure(build, pages, rounds)
+            results[name] = {
+                "median_ms": round(median_ns / 1e6, 3),
+                "per_block_us": round(median_ns / blocks / 1e3, 3),
+            }
+        rows.append({"blocks": blocks, "header_length": len(header), "results": results})
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI エントリポイント（計測・表示）.
+
+    Args:
+        argv: コマンドライン引数（省略時は `sys.argv[1:]` を使用）。
+
+    Returns:
+        int: 終了コード（常に 0。出力の不一致は `RuntimeError`）。
+    """
+    parser = argparse.ArgumentParser(
+        prog="csp_directive_benchmark",
+        description="統一 CSP の組み立て時間をインライン要素数ごとに計測する。",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="インライン要素数。"
+    )
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="計測回数。")
+    parser.add_argument(
+        "--skip-reference",
+        action="store_true",
+        help="従来実装（二乗時間）を計測しない（大きな要素数の計測用）。",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="レポート（JSON）の出力先。")
+    args = parser.parse_args(argv)
+
+    implementations = ["current"] if args.skip_reference else list(IMPLEMENTATIONS)
+    rows = run_benchmark(args.sizes, args.rounds, implementations)
+    for row in rows:
+        for name, result in row["results"].items():
+            print(
+                f"N={row['blocks']:>7,}  {name:<15} {result['median_ms']:>10.3f} ms"
+                f"  {result['per_block_us']:>8.3f} us/block"
+            )
+    if args.output is not None:
+        report = {"python_version": sys.version.split()[0], "rounds": args.rounds, "rows": rows}
+        args.output.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    # プロジェクトルートから `python -m scripts.measurement.csp_directive_benchmark` 実行。
+    raise SystemExit(main())
@@ -0,0 +1,221 @@
+"""インライン script/style 抽出（`_csp_hash.extract_inline_contents`）のバックエンド比較.
+
+`render_static` が CSP ハッシュのために行うインライン内容の抽出について、
+`html.parser` による全トークン化（`htmlparser`）と生テキスト要素のみを探す走査器
+（`scanner`）のスループットを、大きなページで計測する。
+
+入力:
+    - 既定: 表示ページに近い構成（属性付きのタグ・実体参照を含むテキスト・コメント・
+      外部/インライン script・style）の節を `--sections` 回繰り返した合成ページ。
+    - `--html PATH`: 任意の HTML ファイル（例: `render_static` の出力
+      `staticfiles/ja/portfolio/top/index.html`）。
+
+計測方法:
+    - 計測の前に、全バックエンドの抽出結果が一致することを確認する（不一致は
+      計測対象の誤りであるため `RuntimeError` で明示的に失敗させる）。
+    - 各バックエンドを `warmup` 回実行した後、`rounds` 回の所要時間を
+      `time.perf_counter_ns` で計測し、中央値から MB/s（10^6 文字/秒）を求める。
+      `htmlparser` に対する速度比を併記する。
+
+使い方（プロジェクトルートから）:
+    python -m scripts.measurement.csp_extract_benchmark
+    python -m scripts.measurement.csp_extract_benchmark --sections 400 --rounds 20
+    python -m scripts.measurement.csp_extract_benchmark \
+        --html staticfiles/ja/portfolio/top/index.html
+
+外部依存: 標準ライブラリと `_csp_hash`（Django 非依存）のみ。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+from portfolio.management.commands._csp_hash import (
+    EXTRACTOR_HTMLPARSER,
+    EXTRACTORS,
+    extract_inline_contents,
+)
+
+# 既定の合成ページの節数（1 節は約 800 文字。既定で約 160,000 文字）。
+DEFAULT_SECTIONS: Final[int] = 200
+# 既定の計測回数。
+DEFAULT_WARMUP: Final[int] = 2
+DEFAULT_ROUNDS: Final[int] = 10
+
+# 合成ページの 1 節（`{index}` は節番号。インライン内容が節ごとに異なるようにする）。
+_SECTION: Final[str] = """
+<section id="work-{index}" class="portfolio-item col-md-6 col-lg-4" data-index="{index}">
+  <!-- 作品 {index}: <script>コメント内のタグは抽出しない</script> -->
+  <div class="card h-100 shadow-sm" style="--delay: {index}ms">
+    <img src="/static/assets/img/work-{index}.webp" alt="作品 {index}" loading="lazy"
+         width="640" height="360">
+    <div class="card-body">
+      <h3 class="card-title">作品 &amp; 事例 {index}</h3>
+      <p class="card-text">説明文 &lt;{index}&gt; &copy; 2024 &mdash; a &lt; b &amp;&amp; c &gt; d</p>
+      <a href="/portfolio/top/?work={index}&amp;lang=ja" class="btn btn-outline-primary"
+         title="詳細 &quot;{index}&quot;">詳細</a>
+    </div>
+  </div>
+  <script src="/static/js/work.js" defer></script>
+  <script>window.works = (window.works || []).concat([{index}]); if (1 < 2) {{}}</script>
+  <style>#work-{index} .card {{ border-color: #{index:06x}; }}</style>
+</section>
+"""
+
+
+def synthetic_page(sections: int) -> str:
+    """表示ページに近い構成の合成ページを返す.
+
+    Args:
+        sections: 節の数（1 以上）。
+
+    Returns:
+        str: HTML 文字列。
+
+    Raises:
+        ValueError: `sections` が 1 未満の場合。
+    """
+    if sections < 1:
+        raise ValueError("節の数は 1 以上である必要があります。")
+    body = "".join(_SECTION.format(index=index) for index in range(sections))
+    return (
+        '<!DOCTYPE html>\n<html lang="ja"><head><meta charset="utf-8">'
+        "<title>Portfolio</title></head><body>" + body + "</body></html>\n"
+    )
+
+
+def check_backends(html: str) -> int:
+    """全バックエンドの抽出結果が一致することを確認する.
+
+    Args:
+        html: 対象の HTML。
+
+    Returns:
+        int: 抽出したインライン要素の数。
+
+    Raises:
+        RuntimeError: バックエンド間で抽出結果が異なる場合。
+    """
+    reference = extract_inline_contents(html, EXTRACTOR_HTMLPARSER)
+    for extractor in EXTRACTORS:
+        if extract_inline_contents(html, extractor) != reference:
+            raise RuntimeError(f"抽出結果が {EXTRACTOR_HTMLPARSER} と異なります: {extractor}")
+    return len(reference.scripts) + len(reference.styles)
+
+
+def measure(
+    html: str,
+    extractor: str,
+    warmup: int = DEFAULT_WARMUP,
+    rounds: int = DEFAULT_ROUNDS,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> dict[str, float]:
+    """1 つのバックエンドの所要時間を計測する.
+
+    Args:
+        html: 対象の HTML。
+        extractor: 抽出バックエンド。
+        warmup: 計測前の実行回数。
+        rounds: 計測回数（1 以上）。
+        clock: ナノ秒の時計（テスト用に注入可能）。
+
+    Returns:
+        dict[str, float]: 中央値の所要時間（ミリ秒）と MB/s。
+
+    Raises:
+        ValueError: `rounds` が 1 未満の場合。
+    """
+    if rounds < 1:
+        raise ValueError("計測回数は 1 以上である必要があります。")
+    for _ in range(warmup):
+        extract_inline_contents(html, extractor)
+    samples: list[int] = []
+    for _ in range(rounds):
+        started = clock()
+        extract_inline_contents(html, extractor)
+        samples.append(clock() - started)
+    median_ns = max(statistics.median(samples), 1)
+    return {
+        "median_ms": round(median_ns / 1e6, 3),
+        "mb_per_sec": round(len(html) / (median_ns / 1e9) / 1e6, 2),
+    }
+
+
+def run_benchmark(html: str, warmup: int, rounds: int) -> dict[str, object]:
+    """全バックエンドを計測し、`htmlparser` に対する速度比を付けたレポートを返す.
+
+    Args:
+        html: 対象の HTML。
+        warmup: 計測前の実行回数。
+        rounds: 計測回数。
+
+    Returns:
+        dict[str, object]: 入力の大きさ・インライン要素数・バックエンドごとの結果。
+    """
+    inline_elements = check_backends(html)
+    results = {extractor: measure(html, extractor, warmup, rounds) for extractor in EXTRACTORS}
+    reference = results[EXTRACTOR_HTMLPARSER]["median_ms"]
+    for result in results.values():
+        result["speedup"] = round(reference / max(result["median_ms"], 1e-6), 2)
+    return {
+        "characters": len(html),
+        "inline_elements": inline_elements,
+        "backends": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI エントリポイント（計測・表示）.
+
+    Args:
+        argv: コマンドライン引数（省略時は `sys.argv[1:]` を使用）。
+
+    Returns:
+        int: 終了コード（常に 0。不一致は `RuntimeError`）。
+    """
+    parser = argparse.ArgumentParser(
+        prog="csp_extract_benchmark",
+        description="インライン script/style 抽出のバックエンドのスループットを比較する。",
+    )
+    parser.add_argument("--html", type=Path, default=None, help="計測する HTML ファイル。")
+    parser.add_argument(
+        "--sections", type=int, default=DEFAULT_SECTIONS, help="合成ページの節の数。"
+    )
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="計測前の実行回数。")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="計測回数。")
+    parser.add_argument("--output", type=Path, default=None, help="レポート（JSON）の出力先。")
+    args = parser.parse_args(argv)
+
+    html = (
+        args.html.read_text(encoding="utf-8")
+        if args.html is not None
+        else synthetic_page(args.sections)
+    )
+    report = {
+        "python_version": sys.version.split()[0],
+        "source": str(args.html) if args.html is not None else f"synthetic:{args.sections}",
+        **run_benchmark(html, args.warmup, args.rounds),
+    }
+    print(f"{report['characters']:,} characters, {report['inline_elements']} inline elements")
+    for extractor, result in report["backends"].items():
+        print(
+            f"{extractor:<12} {result['median_ms']:>10.3f} ms  {result['mb_per_sec']:>8.2f} MB/s"
+            f"  x{result['speedup']:.2f}"
+        )
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    # プロジェクトルートから `python -m scripts.measurement.csp_extract_benchmark` 実行。
+    raise SystemExit(main())
@@ -0,0 +1,393 @@
+"""Contact_Function の import 時間レポートと予算検査.
+
+Lambda のコールドスタートのうち、INIT フェーズの大半はハンドラモジュールの
+import に費やされる。本モジュールは `python -X importtime -c "import <module>"` を
+サブプロセスで複数回実行し、標準エラーへ出力される import 時間をモジュールの
+木構造へ解析したうえで、チェックイン済みの予算
+（`scripts/measurement/import_time_budget.json`）と照合する。
+
+予算の内容:
+    - `max_cumulative_us`: 対象モジュールの累積 import 時間（マイクロ秒、複数回
+      実行の中央値）の上限。
+    - `forbidden_prefixes`: 対象モジュールの import 時点でロードされてはならない
+      モジュール名の接頭辞（boto3 / botocore の遅延 import、Django 非同梱の担保）。
+
+開発記録（`docs/development-records/contact-function-import-time.json`）との照合:
+    `--check` は、計測した木に現れる対象パッケージ（`contact_function` 等）の
+    モジュールのうち、記録の木に無いものを列挙して失敗させる。handler の import 木に
+    モジュールを加えた変更が記録を再生成せずに取り込まれ、記録が実態を表さなくなる
+    ことを防ぐ（標準ライブラリのモジュールは Python 版で変わるため照合しない）。
+
+計測値は実行環境（CPU・Python 版・ファイルキャッシュ）に依存するため、レポートには
+Python 版と全試行の値を併記し、中央値は最近接順位法で選ぶ（出典:
+`scripts/measurement/cold_start_protocol.py` `percentile_nearest_rank`）。サブプロセスの
+失敗・対象モジュールの不在は推測補完せず例外で明示的に失敗させる（フォールバック禁止）。
+
+使い方（プロジェクトルートから）:
+    python -m scripts.measurement.import_time_report --check
+    python -m scripts.measurement.import_time_report --check \\
+        --output docs/development-records/contact-function-import-time.json
+
+外部依存: 標準ライブラリのみ（`argparse` / `dataclasses` / `json` / `subprocess`）。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from scripts.measurement.cold_start_protocol import percentile_nearest_rank
+
+# リポジトリルート（サブプロセスの作業ディレクトリ。`contact_function` を import 可能にする）。
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+# チェックイン済みの予算ファイル。
+DEFAULT_BUDGET_PATH: Final[Path] = Path(__file__).resolve().with_name(
+    "import_time_budget.json"
+)
+# チェックイン済みの import 時間の開発記録（`--output` で再生成する）。
+DEFAULT_RECORD_PATH: Final[Path] = (
+    REPO_ROOT / "docs" / "development-records" / "contact-function-import-time.json"
+)
+# 中央値として採用するパーセンタイル。
+_MEDIAN_PERCENTILE: Final[float] = 50.0
+# レポートに載せる自己時間上位モジュールの件数。
+_TOP_SELF_COUNT: Final[int] = 10
+
+# `-X importtime` の 1 行（`import time: <self> | <cumulative> | <indent><name>`）。
+# 名前の前の空白は 1 個 + 階層ごとに 2 個。
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\| (?P<indent>\s*)(?P<name>\S+)$"
+)
+
+
+@dataclass(frozen=True)
+class ImportNode:
+    """import 時間の木の 1 ノード（1 モジュール）.
+
+    Attributes:
+        name: モジュール名。
+        self_us: 当該モジュール自身の import 時間（マイクロ秒）。
+        cumulative_us: 子モジュールを含む累積 import 時間（マイクロ秒）。
+        children: 当該モジュールの import 中に初めてロードされたモジュール。
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: tuple[ImportNode, ...] = ()
+
+    def iter_nodes(self):
+        """自身と全子孫を前順で列挙する."""
+        yield self
+        for child in self.children:
+            yield from child.iter_nodes()
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON 出力用の入れ子の辞書へ変換する."""
+        return {
+            "name": self.name,
+            "self_us": self.self_us,
+            "cumulative_us": self.cumulative_us,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@dataclass(frozen=True)
+class ImportTimeBudget:
+    """import 時間の予算.
+
+    Attributes:
+        module: 計測対象のモジュール名。
+        max_cumulative_us: 累積 import 時間（中央値）の上限（マイクロ秒）。
+        forbidden_prefixes: ロードされてはならないモジュール名の接頭辞。
+        runs: 計測の試行回数。
+    """
+
+    module: str
+    max_cumulative_us: int
+    forbidden_prefixes: tuple[str, ...]
+    runs: int
+
+    @classmethod
+    def load(cls, path: Path) -> ImportTimeBudget:
+        """予算ファイル（JSON）を読み込む.
+
+        Args:
+            path: 予算ファイルのパス。
+
+        Returns:
+            ImportTimeBudget: 読み込んだ予算。
+
+        Raises:
+            ValueError: 必須キーの欠落・型不正・試行回数が 1 未満の場合。
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        try:
+            budget = cls(
+                module=str(data["module"]),
+                max_cumulative_us=int(data["max_cumulative_us"]),
+                forbidden_prefixes=tuple(str(p) for p in data["forbidden_prefixes"]),
+                runs=int(data["runs"]),
+            )
+        except (KeyError, TypeError) as error:
+            raise ValueError(f"予算ファイルの形式が不正です: {path}") from error
+        if budget.runs < 1:
+            raise ValueError(f"runs は 1 以上である必要があります: {path}")
+        return budget
+
+
+def parse_importtime(text: str) -> tuple[ImportNode, ...]:
+    """`-X importtime` の出力を木構造へ解析する.
+
+    出力は子が親より先に現れる後順であるため、階層ごとに未所属のノードを溜め、
+    親の行が現れた時点で 1 段深い階層のノードを子として取り込む。
+
+    Args:
+        text: `-X importtime` の標準エラー出力。
+
+    Returns:
+        tuple[ImportNode, ...]: 最上位でロードされたモジュールのノード（出力順）。
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            # 見出し行・対象外の出力は無視する。
+            continue
+        depth = len(match.group("indent")) // 2
+        node = ImportNode(
+            name=match.group("name"),
+            self_us=int(match.group("self")),
+            cumulative_us=int(match.group("cumulative")),
+            children=tuple(pending.pop(depth + 1, [])),
+        )
+        pending.setdefault(depth, []).append(node)
+    return tuple(pending.get(0, []))
+
+
+def find_module(roots: tuple[ImportNode, ...], module: str) -> ImportNode:
+    """木の中から指定モジュールのノードを探す.
+
+    Args:
+        roots: `parse_importtime` の結果。
+        module: モジュール名。
+
+    Returns:
+        ImportNode: 見つかったノード。
+
+    Raises:
+        LookupError: 指定モジュールが木に存在しない場合。
+    """
+    for root in roots:
+        for node in root.iter_nodes():
+            if node.name == module:
+                return node
+    raise LookupError(f"import 時間の出力にモジュール '{module}' が存在しません。")
+
+
+def measure_import(
+    module: str, runs: int, python_executable: str = sys.executable
+) -> list[tuple[ImportNode, ...]]:
+    """新しいインタプリタで `module` を import し、import 時間の木を `runs` 回取得する.
+
+    Args:
+        module: 計測対象のモジュール名。
+        runs: 試行回数。
+        python_executable: 使用する Python 実行ファイル。
+
+    Returns:
+        list[tuple[ImportNode, ...]]: 試行ごとの解析結果。
+
+    Raises:
+        RuntimeError: サブプロセスが非ゼロ終了した場合（import 失敗を明示する）。
+    """
+    samples: list[tuple[ImportNode, ...]] = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [python_executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(
+                f"'{module}' の import に失敗しました（終了コード {completed.returncode}）:\n"
+                f"{completed.stderr[-2000:]}"
+            )
+        samples.append(parse_importtime(completed.stderr))
+    return samples
+
+
+def build_report(
+    samples: list[tuple[ImportNode, ...]], budget: ImportTimeBudget
+) -> dict[str, object]:
+    """計測結果を予算と照合し、レポート（JSON 化可能な辞書）を組み立てる.
+
+    中央値に当たる試行の木をレポートに載せ、禁止モジュールは全試行の和集合で判定する。
+
+    Args:
+        samples: `measure_import` の結果（1 件以上）。
+        budget: 照合する予算。
+
+    Returns:
+        dict[str, object]: `within_budget`（予算内か）を含むレポート。
+
+    Raises:
+        ValueError: `samples` が空の場合。
+        LookupError: いずれかの試行に対象モジュールが存在しない場合。
+    """
+    if not samples:
+        raise ValueError("import 時間の試行結果が 1 件もありません。")
+    targets = [find_module(roots, budget.module) for roots in samples]
+    cumulative = [target.cumulative_us for target in targets]
+    median_us = int(percentile_nearest_rank([float(v) for v in cumulative], _MEDIAN_PERCENTILE))
+    median_target = targets[cumulative.index(median_us)]
+
+    forbidden_loaded = sorted(
+        {
+            node.name
+            for roots in samples
+            for root in roots
+            for node in root.iter_nodes()
+            if any(
+                node.name == prefix or node.name.startswith(prefix + ".")
+                for prefix in budget.forbidden_prefixes
+            )
+        }
+    )
+    top_self = sorted(median_target.iter_nodes(), key=lambda n: n.self_us, reverse=True)
+    return {
+        "module": budget.module,
+        "python_version": sys.version.split()[0],
+        "unit": "microseconds",
+        "runs": len(samples),
+        "cumulative_us_samples": cumulative,
+        "median_cumulative_us": median_us,
+        "max_cumulative_us": budget.max_cumulative_us,
+        "forbidden_prefixes": list(budget.forbidden_prefixes),
+        "forbidden_loaded": forbidden_loaded,
+        "within_budget": median_us <= budget.max_cumulative_us and not forbidden_loaded,
+        "top_self_us": [
+            {"name": node.name, "self_us": node.self_us}
+            for node in top_self[:_TOP_SELF_COUNT]
+        ],
+        "tree": median_target.to_dict(),
+    }
+
+
+def _tree_names(tree: dict[str, object]) -> set[str]:
+    """`ImportNode.to_dict` 形式の木に現れるモジュール名の集合を返す."""
+    names = {str(tree["name"])}
+    for child in tree["children"]:
+        names |= _tree_names(child)
+    return names
+
+
+def unrecorded_modules(report: dict[str, object], record: dict[str, object]) -> list[str]:
+    """計測した木に現れ、開発記録の木に無い対象パッケージのモジュールを返す.
+
+    Args:
+        report: `build_report` の結果。
+        record: チェックイン済みの開発記録（`build_report` の結果を JSON 化したもの）。
+
+    Returns:
+        list[str]: 記録に無いモジュール名（昇順）。記録が最新であれば空。
+
+    Raises:
+        ValueError: 記録の対象モジュールがレポートと異なる、または木が無い場合。
+    """
+    if record.get("module") != report["module"] or "tree" not in record:
+        raise ValueError(
+            f"開発記録の対象モジュールがレポートと一致しません: {record.get('module')!r}"
+        )
+    package = str(report["module"]).split(".")[0]
+    recorded = _tree_names(record["tree"])
+    return sorted(
+        name
+        for name in _tree_names(report["tree"]) - recorded
+        if name == package or name.startswith(package + ".")
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI エントリポイント（計測・レポート出力・予算検査）.
+
+    Args:
+        argv: コマンドライン引数（省略時は `sys.argv[1:]` を使用）。
+
+    Returns:
+        int: 終了コード（0=予算内または検査なし、1=`--check` 指定時の予算超過
+            または開発記録に無いモジュールの検出）。
+    """
+    parser = argparse.ArgumentParser(
+        prog="import_time_report",
+        description="Contact_Function の import 時間を -X importtime で計測し予算と照合する。",
+    )
+    parser.add_argument(
+        "--budget",
+        type=Path,
+        default=DEFAULT_BUDGET_PATH,
+        help="予算ファイル（JSON）のパス。",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="レポート（JSON）の出力先。省略時は要約を標準出力へ表示する。",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "予算超過・禁止モジュールのロード・開発記録に無いモジュールがあれば"
+            "終了コード 1 で失敗させる。"
+        ),
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=DEFAULT_RECORD_PATH,
+        help="`--check` で照合する開発記録（JSON）のパス。",
+    )
+    args = parser.parse_args(argv)
+
+    budget = ImportTimeBudget.load(args.budget)
+    report = build_report(measure_import(budget.module, budget.runs), budget)
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    print(
+        f"{report['module']}: 累積 import 時間（中央値）{report['median_cumulative_us']} us"
+        f" / 予算 {report['max_cumulative_us']} us、"
+        f"禁止モジュール {report['forbidden_loaded'] or 'なし'}"
+    )
+    if not args.check:
+        return 0
+    if not report["within_budget"]:
+        print("[import-time] 予算超過または禁止モジュールのロードを検出しました。", file=sys.stderr)
+        return 1
+    # `--output` で記録を再生成した場合は、書き出した記録と照合する（常に一致する）。
+    record = json.loads(args.record.read_text(encoding="utf-8"))
+    missing = unrecorded_modules(report, record)
+    if missing:
+        print(
+            f"[import-time] 開発記録 {args.record} に無いモジュールを検出しました: "
+            f"{', '.join(missing)}。--output {args.record} で記録を再生成してください。",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    # プロジェクトルートから `python -m scripts.measurement.import_time_report` 実行。
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""Contact_Function 最小成果物ビルダ（`scripts/build_contact_artifact.py`）の単体テスト.
+
+検証項目:
+    1. 実リポジトリの `contact_function.handler` の import 閉包が Django・tests・
+       静的ファイルを含まず、ランタイム提供以外のサードパーティを参照しない。
+    2. 関数内の遅延 import・相対 import・`from pkg import module` を閉包に含める。
+    3. Django の混入・ランタイム非提供モジュールは、すべての違反を列挙した
+       `ArtifactError` で失敗する（フォールバック禁止）。
+    4. 成果物ディレクトリとサイズレポートが閉包どおりに作成され、zip が再現可能。
+    5. `template.yaml` の `ContactFunction.CodeUri` が成果物ディレクトリを指す。
+
+実行コマンド（プロジェクトルートから）:
+    python -m unittest tests.iac.test_contact_artifact -v
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.build_contact_artifact import (
+    DEFAULT_OUTPUT_DIR,
+    REPO_ROOT,
+    ArtifactError,
+    build_artifact,
+    build_zip_bytes,
+    compute_import_closure,
+)
+
+
+def _write_tree(root: Path, files: dict[str, str]) -> None:
+    """相対パスと内容の対応から一時リポジトリを作る."""
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+class RepositoryClosureTests(unittest.TestCase):
+    """実リポジトリの handler の import 閉包の検証."""
+
+    def test_handler_closure_is_contact_function_only(self) -> None:
+        """閉包は contact_function 配下の実装のみで、tests を含まない."""
+        closure = compute_import_closure()
+        paths = [path.as_posix() for path in closure.files]
+        self.assertIn("contact_function/handler.py", paths)
+        self.assertIn("contact_function/__init__.py", paths)
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertTrue(path.startswith("contact_function/"))
+                self.assertNotIn("/tests/", path)
+        self.assertEqual(closure.runtime_provided, ("boto3", "botocore"))
+
+    def test_template_code_uri_points_to_artifact_directory(self) -> None:
+        """`ContactFunction.CodeUri` は成果物ディレクトリを指す."""
+        template = (REPO_ROOT / "template.yaml").read_text(encoding="utf-8")
+        expected = DEFAULT_OUTPUT_DIR.relative_to(REPO_ROOT).as_posix() + "/"
+        self.assertIn(f"CodeUri: {expected}", template)
+        self.assertNotIn("CodeUri: ./\n", template)
+
+
+class SyntheticClosureTests(unittest.TestCase):
+    """一時リポジトリによる閉包計算・失敗条件の検証."""
+
+    def setUp(self) -> None:
+        """一時ディレクトリを用意する."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_lazy_relative_and_submodule_imports_are_followed(self) -> None:
+        """遅延 import・相対 import・`from pkg import module` を辿る."""
+        _write_tree(
+            self.root,
+            {
+                "app/__init__.py": "",
+                "app/entry.py": (
+                    "import json\n"
+                    "from . import helpers\n"
+                    "def handler():\n"
+                    "    import boto3\n"
+                    "    from app.sub import lazy\n"
+                ),
+                "app/helpers.py": "from .sub.util import VALUE\n",
+                "app/sub/__init__.py": "",
+                "app/sub/util.py": "VALUE = 1\n",
+                "app/sub/lazy.py": "",
+                "app/unused.py": "import django\n",
+            },
+        )
+        closure = compute_import_closure(("app.entry",), self.root)
+        self.assertEqual(
+            [path.as_posix() for path in closure.files],
+            [
+                "app/__init__.py",
+                "app/entry.py",
+                "app/helpers.py",
+                "app/sub/__init__.py",
+                "app/sub/lazy.py",
+                "app/sub/util.py",
+            ],
+        )
+        self.assertEqual(closure.runtime_provided, ("boto3",))
+        self.assertIn("json", closure.stdlib)
+
+    def test_every_violation_is_reported(self) -> None:
+        """Django 混入とランタイム非提供モジュールをすべて列挙して失敗する."""
+        _write_tree(
+            self.root,
+            {
+                "app/__init__.py": "",
+                "app/entry.py": "import requests\nfrom app import views\n",
+                "app/views.py": "def render():\n    from django.conf import settings\n",
+            },
+        )
+        with self.assertRaises(ArtifactError) as context:
+            compute_import_closure(("app.entry",), self.root)
+        message = str(context.exception)
+        self.assertIn("'requests'", message)
+        self.assertIn("'django.conf'", message)
+        self.assertIn("app/views.py:2", message)
+
+    def test_missing_entry_module_fails(self) -> None:
+        """存在しないエントリモジュールは `ArtifactError`."""
+        with self.assertRaises(ArtifactError):
+            compute_import_closure(("absent.entry",), self.root)
+
+    def test_build_artifact_copies_closure_and_reports_sizes(self) -> None:
+        """成果物ディレクトリを作り直し、サイズと再現可能な zip を報告する."""
+        _write_tree(
+            self.root,
+            {"app/__init__.py": "", "app/entry.py": "import logging\n", "app/extra.py": ""},
+        )
+        output_dir = self.root / "build" / "app"
+        _write_tree(output_dir, {"stale.txt": "old"})
+        report = build_artifact(output_dir, ("app.entry",), self.root)
+        self.assertEqual(sorted(report["files"]), ["app/__init__.py", "app/entry.py"])
+        self.assertEqual(report["total_bytes"], len("import logging\n"))
+        self.assertFalse((output_dir / "stale.txt").exists())
+        self.assertTrue((output_dir / "app" / "entry.py").is_file())
+        closure = compute_import_closure(("app.entry",), self.root)
+        self.assertEqual(
+            build_zip_bytes(closure.files, self.root),
+            build_zip_bytes(closure.files, self.root),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
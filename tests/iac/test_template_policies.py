@@ -513,6 +513,31 @@ class SesLeastPrivilegeTests(unittest.TestCase):
                     ),
                 )
 
+    def test_ssm_read_scoped_to_contact_parameters(self) -> None:
+        """SSM 読み取りが個別/一括取得の 2 Action と 3 パラメータ ARN に限定されている.
+
+        `SsmConfigProvider.load_snapshot` は `ssm:GetParameters` で 3 パラメータを
+        一括取得するため、`ssm:GetParameter` に加えて同 Action を許可する。いずれも
+        DM4 の 3 パスに限定し、パス階層のワイルドカードは付与しない（R9-3）。
+        """
+        ssm_actions: set[str] = set()
+        ssm_resources: list[str] = []
+        for statement in self.statements:
+            if statement.get("Effect") != "Allow":
+                continue
+            actions = [_as_scalar(a) for a in _as_list(statement.get("Action", []))]
+            if any(action.startswith("ssm:") for action in actions):
+                ssm_actions.update(actions)
+                ssm_resources.extend(
+                    _as_scalar(r) for r in _as_list(statement.get("Resource", []))
+                )
+        self.assertEqual(ssm_actions, {"ssm:GetParameter", "ssm:GetParameters"})
+        self.assertEqual(len(ssm_resources), 3)
+        for resource in ssm_resources:
+            with self.subTest(resource=resource):
+                self.assertNotIn("*", resource)
+                self.assertIn("/portfolio/parameter/", resource)
+
 
 class S3OacOnlyTests(unittest.TestCase):
     """S3 OAC 経由のみ許可の検証（R9-2/R9-6、dependencies.yaml/bucketpolicy.yaml 整合）.
@@ -0,0 +1,142 @@
+"""ホットパスのマイクロベンチマーク（`scripts/measurement/contact_benchmark.py`）の単体テスト.
+
+検証項目:
+    1. 全シナリオが期待した経路（応答ステータス）を通り、取り違えは `RuntimeError`。
+    2. 計測結果は 1 回あたりの所要時間から ops/sec とパーセンタイルを算出する。
+    3. ベースラインとの比較は許容幅を超えた ops/sec の低下のみを退行とする。
+    4. CLI はベースラインの更新と比較（退行時は終了コード 1）を行う。
+    5. チェックイン済みのベースラインが全シナリオを含む。
+
+実行コマンド（プロジェクトルートから）:
+    python -m unittest tests.measurement.test_contact_benchmark -v
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.measurement.contact_benchmark import (
+    DEFAULT_BASELINE_PATH,
+    SCENARIOS,
+    Scenario,
+    build_scenarios,
+    check_scenario,
+    find_regressions,
+    load_baseline,
+    main,
+    measure,
+    summarize,
+)
+
+
+class ScenarioTests(unittest.TestCase):
+    """シナリオの検証."""
+
+    def test_all_scenarios_take_expected_path(self) -> None:
+        """全シナリオが期待したステータスの応答を返す（例外なし）."""
+        scenarios = build_scenarios()
+        self.assertEqual(tuple(scenario.name for scenario in scenarios), SCENARIOS)
+        for scenario in scenarios:
+            with self.subTest(scenario=scenario.name):
+                check_scenario(scenario)
+
+    def test_unexpected_status_fails(self) -> None:
+        """期待と異なるステータスは `RuntimeError`."""
+        scenario = Scenario("broken", lambda: {"statusCode": 500}, 200)
+        with self.assertRaises(RuntimeError):
+            check_scenario(scenario)
+
+
+class MeasureTests(unittest.TestCase):
+    """`summarize` / `measure` の検証."""
+
+    def test_summarize(self) -> None:
+        """ops/sec は総実行回数 / 総所要時間、パーセンタイルはマイクロ秒."""
+        result = summarize("x", [1000.0, 2000.0, 3000.0, 4000.0], inner=10)
+        self.assertEqual(result.operations, 40)
+        self.assertAlmostEqual(result.ops_per_sec, 40 / (100_000 / 1e9))
+        self.assertEqual(result.percentiles_us["p50_us"], 2.0)
+        self.assertEqual(result.percentiles_us["p99_us"], 4.0)
+
+    def test_measure_with_injected_clock(self) -> None:
+        """注入した時計の差分を 1 回あたりの所要時間とする."""
+        ticks = iter(range(0, 10_000, 100))
+        calls = []
+        result = measure(
+            Scenario("count", lambda: calls.append(1)),
+            warmup=2,
+            rounds=3,
+            inner=4,
+            clock=lambda: next(ticks),
+        )
+        self.assertEqual(len(calls), 1 + 2 + 3 * 4)
+        self.assertEqual(result.percentiles_us["p50_us"], 0.025)
+
+    def test_invalid_counts_fail(self) -> None:
+        """サンプル数・実行回数が 1 未満は `ValueError`."""
+        with self.assertRaises(ValueError):
+            measure(Scenario("x", lambda: None), rounds=0)
+        with self.assertRaises(ValueError):
+            summarize("x", [], inner=1)
+
+
+class RegressionTests(unittest.TestCase):
+    """`find_regressions` の検証."""
+
+    def test_only_drops_beyond_tolerance_are_regressions(self) -> None:
+        """許容幅内の低下・新規シナリオは退行としない."""
+        baseline = {"a": {"ops_per_sec": 1000.0}, "b": {"ops_per_sec": 1000.0}}
+        results = {
+            "a": {"ops_per_sec": 800.0},
+            "b": {"ops_per_sec": 700.0},
+            "new": {"ops_per_sec": 1.0},
+        }
+        regressions = find_regressions(results, baseline, tolerance=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b:"))
+        with self.assertRaises(ValueError):
+            find_regressions(results, baseline, tolerance=1.0)
+
+
+class CliTests(unittest.TestCase):
+    """CLI の検証（計測回数を最小にして実行する）."""
+
+    def _run(self, *argv: str) -> int:
+        """標準出力・標準エラーを捨てて CLI を実行する."""
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return main([*argv, "--warmup", "0", "--rounds", "1", "--inner", "1"])
+
+    def test_update_then_check(self) -> None:
+        """更新したベースラインを保持しつつ、大幅に速いベースラインには退行を返す."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            self.assertEqual(
+                self._run("--scenario", "preflight", "--update-baseline", "--baseline", str(path)),
+                0,
+            )
+            self.assertEqual(
+                self._run("--scenario", "parse_body", "--update-baseline", "--baseline", str(path)),
+                0,
+            )
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(set(data["scenarios"]), {"preflight", "parse_body"})
+
+            data["scenarios"]["preflight"]["ops_per_sec"] = 1e12
+            path.write_text(json.dumps(data), encoding="utf-8")
+            self.assertEqual(
+                self._run("--scenario", "preflight", "--check", "--baseline", str(path)), 1
+            )
+
+    def test_checked_in_baseline_covers_all_scenarios(self) -> None:
+        """チェックイン済みのベースラインが全シナリオを含む."""
+        baseline = load_baseline(DEFAULT_BASELINE_PATH)
+        self.assertEqual(set(baseline["scenarios"]), set(SCENARIOS))
+
+
+if __name__ == "__main__":
+    unittest.main()
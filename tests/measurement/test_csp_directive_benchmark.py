@@ -0,0 +1,117 @@
+"""CSP 組み立てのスケーリングベンチマーク（`scripts/measurement/csp_directive_benchmark.py`）の単体テスト.
+
+検証項目:
+    1. 現行の `build_csp_directives` は従来のリストの所属判定による実装とバイト単位で
+       同一の結果を返す（出典ディレクティブ内の重複ソースも保持する）。
+    2. 入力は各インライン要素を 2 ページに含み、統一 CSP は要素ごとに 1 度だけ含む。
+    3. 計測結果は中央値の所要時間と要素あたりの所要時間を報告する。
+    4. CLI は JSON レポートを出力し、`--skip-reference` で従来実装を計測しない。
+
+実行コマンド（プロジェクトルートから）:
+    python -m unittest tests.measurement.test_csp_directive_benchmark -v
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from portfolio.management.commands._csp_hash import (
+    InlineHashes,
+    build_csp_directives,
+    hash_source,
+)
+from scripts.measurement.csp_directive_benchmark import (
+    BASE_DIRECTIVES,
+    CLOUDFRONT_DOMAIN,
+    _list_directives,
+    build_current,
+    build_list_reference,
+    main,
+    measure,
+    page_hashes,
+    run_benchmark,
+)
+
+
+class EquivalenceTests(unittest.TestCase):
+    """現行実装と従来実装の同一性の検証."""
+
+    def test_directives_match_list_reference(self) -> None:
+        """重複ソース・nonce・既存ハッシュを含む出典でも従来実装と同一."""
+        existing = hash_source("a")
+        base = {
+            "script-src": ["'self'", "'self'", "'nonce-x'", existing, "https://cdn.example"],
+            "style-src-elem": ["'self'"],
+            "object-src": ["'none'"],
+        }
+        hashes = InlineHashes(
+            scripts=(hash_source("b"), existing, hash_source("c")),
+            styles=(hash_source("d"), hash_source("d")),
+        )
+        self.assertEqual(
+            build_csp_directives(base, CLOUDFRONT_DOMAIN, hashes),
+            _list_directives(base, CLOUDFRONT_DOMAIN, hashes),
+        )
+
+    def test_unified_header_contains_each_block_once(self) -> None:
+        """2 ページに現れる要素のハッシュは統一 CSP に 1 度だけ含まれる."""
+        pages = page_hashes(5)
+        self.assertEqual(len(pages), 2)
+        header = build_current(pages)
+        self.assertEqual(header, build_list_reference(pages))
+        self.assertEqual(header.count(hash_source("block 0")), 2)  # script-src(-elem)
+        self.assertNotIn("nonce-", header)
+        self.assertIn("frame-ancestors 'none'", header)
+        self.assertLessEqual(set(BASE_DIRECTIVES), set(header.split()))
+
+    def test_invalid_blocks_fail(self) -> None:
+        """インライン要素数が 1 未満は `ValueError`."""
+        with self.assertRaises(ValueError):
+            page_hashes(0)
+
+
+class MeasureTests(unittest.TestCase):
+    """`measure` / `run_benchmark` の検証."""
+
+    def test_measure_with_injected_clock(self) -> None:
+        """注入した時計の差分の中央値を返す."""
+        ticks = iter([0, 10, 10, 40, 40, 60])
+        median = measure(lambda pages: "", [], rounds=3, clock=lambda: next(ticks))
+        self.assertEqual(median, 20.0)
+        with self.assertRaises(ValueError):
+            measure(lambda pages: "", [], rounds=0)
+
+    def test_rows_per_size(self) -> None:
+        """要素数ごとに全実装の所要時間と要素あたりの所要時間を報告する."""
+        rows = run_benchmark([2, 20], rounds=1, implementations=["current", "list_reference"])
+        self.assertEqual([row["blocks"] for row in rows], [2, 20])
+        for row in rows:
+            self.assertEqual(set(row["results"]), {"current", "list_reference"})
+            self.assertIn("per_block_us", row["results"]["current"])
+
+
+class CliTests(unittest.TestCase):
+    """CLI の検証（小さな要素数で実行する）."""
+
+    def test_output_without_reference(self) -> None:
+        """`--skip-reference` では現行実装のみを計測し、JSON レポートを書き出す."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory) / "report.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = main(
+                    ["--sizes", "3", "30", "--rounds", "1", "--skip-reference"]
+                    + ["--output", str(output)]
+                )
+            self.assertEqual(status, 0)
+            report = json.loads(output.read_text(encoding="utf-8"))
+            self.assertEqual([row["blocks"] for row in report["rows"]], [3, 30])
+            self.assertEqual(set(report["rows"][0]["results"]), {"current"})
+
+
+if __name__ == "__main__":
+    unittest.main()
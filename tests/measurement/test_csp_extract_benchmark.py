@@ -0,0 +1,97 @@
+"""インライン抽出のベンチマーク（`scripts/measurement/csp_extract_benchmark.py`）の単体テスト.
+
+検証項目:
+    1. 合成ページは節ごとに異なるインライン script/style を含み、全バックエンドの
+       抽出結果が一致する。
+    2. 計測結果は中央値の所要時間から MB/s を算出し、`htmlparser` に対する速度比を付ける。
+    3. CLI は任意の HTML ファイルを計測し、JSON レポートを出力する。
+
+実行コマンド（プロジェクトルートから）:
+    python -m unittest tests.measurement.test_csp_extract_benchmark -v
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from portfolio.management.commands._csp_hash import EXTRACTORS, extract_inline_contents
+from scripts.measurement.csp_extract_benchmark import (
+    check_backends,
+    main,
+    measure,
+    run_benchmark,
+    synthetic_page,
+)
+
+
+class SyntheticPageTests(unittest.TestCase):
+    """合成ページの検証."""
+
+    def test_sections_have_distinct_inline_contents(self) -> None:
+        """1 節につき インライン script・style を 1 つずつ含み、全バックエンドが一致する."""
+        html = synthetic_page(3)
+        contents = extract_inline_contents(html)
+        self.assertEqual(len(set(contents.scripts)), 3)
+        self.assertEqual(len(set(contents.styles)), 3)
+        self.assertEqual(check_backends(html), 6)
+
+    def test_invalid_sections_fail(self) -> None:
+        """節の数が 1 未満は `ValueError`."""
+        with self.assertRaises(ValueError):
+            synthetic_page(0)
+
+
+class MeasureTests(unittest.TestCase):
+    """`measure` / `run_benchmark` の検証."""
+
+    def test_measure_with_injected_clock(self) -> None:
+        """注入した時計の差分の中央値から所要時間と MB/s を算出する."""
+        ticks = iter(range(0, 10_000_000, 1_000_000))
+        result = measure("x" * 1000, EXTRACTORS[0], warmup=0, rounds=3, clock=lambda: next(ticks))
+        self.assertEqual(result, {"median_ms": 1.0, "mb_per_sec": 1.0})
+        with self.assertRaises(ValueError):
+            measure("x", EXTRACTORS[0], rounds=0)
+
+    def test_report_has_all_backends(self) -> None:
+        """全バックエンドの結果と、`htmlparser` を 1 とした速度比を含む."""
+        report = run_benchmark(synthetic_page(2), warmup=0, rounds=1)
+        self.assertEqual(report["inline_elements"], 4)
+        self.assertEqual(set(report["backends"]), set(EXTRACTORS))
+        self.assertEqual(report["backends"]["htmlparser"]["speedup"], 1.0)
+
+
+class CliTests(unittest.TestCase):
+    """CLI の検証（計測回数を最小にして実行する）."""
+
+    def test_html_file_and_output(self) -> None:
+        """指定した HTML ファイルを計測し、JSON レポートを書き出す."""
+        with tempfile.TemporaryDirectory() as directory:
+            page = Path(directory) / "index.html"
+            page.write_text("<script>a</script><style>b</style>", encoding="utf-8")
+            output = Path(directory) / "report.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = main(
+                    [
+                        "--html",
+                        str(page),
+                        "--warmup",
+                        "0",
+                        "--rounds",
+                        "1",
+                        "--output",
+                        str(output),
+                    ]
+                )
+            self.assertEqual(status, 0)
+            report = json.loads(output.read_text(encoding="utf-8"))
+            self.assertEqual(report["source"], str(page))
+            self.assertEqual(report["inline_elements"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
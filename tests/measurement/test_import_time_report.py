@@ -0,0 +1,135 @@
+"""import 時間レポート（`scripts/measurement/import_time_report.py`）の単体テスト.
+
+検証項目:
+    1. `-X importtime` の後順出力が親子関係を保った木へ解析される。
+    2. レポートが中央値（最近接順位法）で予算を判定し、禁止モジュールのロードを
+       全試行の和集合で検出する。
+    3. チェックイン済みの予算ファイルが読み込め、実際に `contact_function.handler`
+       を import しても boto3 / botocore / django がロードされない（遅延 import の担保）。
+    4. 計測した木にあって開発記録の木に無い対象パッケージのモジュールが列挙され、
+       チェックイン済みの記録が現在の handler の import 木を網羅している。
+
+実行コマンド（プロジェクトルートから）:
+    python -m unittest tests.measurement.test_import_time_report -v
+"""
+
+from __future__ import annotations
+
+import json
+import unittest
+
+from scripts.measurement.import_time_report import (
+    DEFAULT_BUDGET_PATH,
+    DEFAULT_RECORD_PATH,
+    ImportTimeBudget,
+    build_report,
+    find_module,
+    measure_import,
+    parse_importtime,
+    unrecorded_modules,
+)
+
+# `python -X importtime -c "import pkg"` 形式の出力（子が親より先に現れる）。
+_SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:        10 |         10 | _io
+import time:         5 |          5 |     pkg.util
+import time:        20 |         20 |       botocore.session
+import time:         7 |         27 |     pkg.client
+import time:         3 |         35 |   pkg.core
+import time:        15 |         50 | pkg
+"""
+
+
+def _budget(max_cumulative_us: int = 100) -> ImportTimeBudget:
+    """テスト用の予算を返す."""
+    return ImportTimeBudget(
+        module="pkg",
+        max_cumulative_us=max_cumulative_us,
+        forbidden_prefixes=("botocore",),
+        runs=1,
+    )
+
+
+class ParseImportTimeTests(unittest.TestCase):
+    """`parse_importtime` の木構造解析の検証."""
+
+    def test_nested_children_are_attached_to_parent(self) -> None:
+        """インデントの階層に従い子ノードが親へ取り込まれる."""
+        roots = parse_importtime(_SAMPLE_OUTPUT)
+        self.assertEqual([root.name for root in roots], ["_io", "pkg"])
+        pkg = find_module(roots, "pkg")
+        self.assertEqual(pkg.cumulative_us, 50)
+        (core,) = pkg.children
+        self.assertEqual([child.name for child in core.children], ["pkg.util", "pkg.client"])
+        self.assertEqual(core.children[1].children[0].name, "botocore.session")
+
+    def test_missing_module_raises_lookup_error(self) -> None:
+        """存在しないモジュールの探索は `LookupError`."""
+        with self.assertRaises(LookupError):
+            find_module(parse_importtime(_SAMPLE_OUTPUT), "absent")
+
+
+class BuildReportTests(unittest.TestCase):
+    """`build_report` の予算判定の検証."""
+
+    def test_median_and_forbidden_modules_decide_budget(self) -> None:
+        """中央値が予算内でも禁止モジュールがロードされれば予算外."""
+        roots = parse_importtime(_SAMPLE_OUTPUT)
+        report = build_report([roots], _budget())
+        self.assertEqual(report["median_cumulative_us"], 50)
+        self.assertEqual(report["forbidden_loaded"], ["botocore.session"])
+        self.assertFalse(report["within_budget"])
+
+    def test_over_budget_median_is_rejected(self) -> None:
+        """中央値が上限を超えると予算外."""
+        clean = _SAMPLE_OUTPUT.replace("botocore.session", "pkg.session")
+        report = build_report([parse_importtime(clean)], _budget(max_cumulative_us=49))
+        self.assertEqual(report["forbidden_loaded"], [])
+        self.assertFalse(report["within_budget"])
+
+    def test_empty_samples_are_rejected(self) -> None:
+        """試行結果が空の場合は推測せず `ValueError`."""
+        with self.assertRaises(ValueError):
+            build_report([], _budget())
+
+
+class UnrecordedModulesTests(unittest.TestCase):
+    """`unrecorded_modules` の開発記録との照合の検証."""
+
+    def test_new_package_modules_are_reported(self) -> None:
+        """記録に無い対象パッケージのモジュールのみを列挙する（他パッケージは対象外）."""
+        report = build_report([parse_importtime(_SAMPLE_OUTPUT)], _budget())
+        record = json.loads(json.dumps(report))
+        self.assertEqual(unrecorded_modules(report, record), [])
+        core = record["tree"]["children"][0]
+        core["children"] = [
+            child for child in core["children"] if child["name"] != "pkg.client"
+        ]
+        # `pkg.client` とその子（対象外の `botocore.session`）が記録から消えた状態。
+        self.assertEqual(unrecorded_modules(report, record), ["pkg.client"])
+
+    def test_record_for_another_module_is_rejected(self) -> None:
+        """対象モジュールの異なる記録は照合せず `ValueError`."""
+        report = build_report([parse_importtime(_SAMPLE_OUTPUT)], _budget())
+        with self.assertRaises(ValueError):
+            unrecorded_modules(report, {**report, "module": "other"})
+
+
+class ContactHandlerImportTests(unittest.TestCase):
+    """チェックイン済み予算に対する実計測の検証（禁止モジュールのみ判定）."""
+
+    def test_handler_import_loads_no_forbidden_modules(self) -> None:
+        """handler の import で boto3 / botocore / django がロードされない."""
+        budget = ImportTimeBudget.load(DEFAULT_BUDGET_PATH)
+        self.assertEqual(budget.module, "contact_function.handler")
+        report = build_report(measure_import(budget.module, runs=1), budget)
+        # 時間は実行環境に依存するため、本テストでは禁止モジュールのみを判定する。
+        self.assertEqual(report["forbidden_loaded"], [])
+        # チェックイン済みの開発記録が現在の import 木を網羅している。
+        record = json.loads(DEFAULT_RECORD_PATH.read_text(encoding="utf-8"))
+        self.assertEqual(unrecorded_modules(report, record), [])
+
+
+if __name__ == "__main__":
+    unittest.main()